@@ -0,0 +1,29 @@
+"""add bot stats_version and trades (bot_id, executed_at) index
+
+Revision ID: 20261018_bot_stats_version
+Revises: 20260124_add_trade_id
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_bot_stats_version'
+down_revision = '20260124_add_trade_id'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Compare-and-set version for incremental bot stats
+    op.add_column('bots', sa.Column('stats_version', sa.Integer(), nullable=False, server_default='0', comment='Optimistic lock for incremental stats updates'))
+    
+    # Per-bot trade history in execution order (stats reconciliation)
+    op.create_index('idx_trades_bot_executed', 'trades', ['bot_id', 'executed_at'])
+
+
+def downgrade():
+    op.drop_index('idx_trades_bot_executed', table_name='trades')
+    op.drop_column('bots', 'stats_version')
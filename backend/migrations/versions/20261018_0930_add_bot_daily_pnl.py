@@ -0,0 +1,63 @@
+"""add bot_daily_pnl rollup
+
+Revision ID: 20261018_bot_daily_pnl
+Revises: 20261018_bot_stats_version
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_bot_daily_pnl'
+down_revision = '20261018_bot_stats_version'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'bot_daily_pnl',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False, comment='Auto-increment ID'),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('bot_id', postgresql.UUID(as_uuid=True), nullable=True, comment='NULL for trades not placed by a bot'),
+        sa.Column('day', sa.Date(), nullable=False, comment='UTC day of trade execution'),
+        sa.Column('pnl', sa.DECIMAL(precision=20, scale=8), nullable=False, server_default='0', comment='Realized P&L'),
+        sa.Column('trades', sa.Integer(), nullable=False, server_default='0', comment='Number of trades'),
+        sa.Column('wins', sa.Integer(), nullable=False, server_default='0', comment='Trades with P&L > 0'),
+        sa.Column('losses', sa.Integer(), nullable=False, server_default='0', comment='Trades with P&L < 0'),
+        sa.Column('breakeven', sa.Integer(), nullable=False, server_default='0', comment='Trades with P&L = 0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False, comment='Record creation timestamp (UTC)'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False, comment='Record last update timestamp (UTC)'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['bot_id'], ['bots.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        comment='Daily realized P&L rollup of trades'
+    )
+    # NULLS NOT DISTINCT (Postgres 15+): trades without a bot share one row per user/day
+    op.create_index('uq_bot_daily_pnl_user_bot_day', 'bot_daily_pnl', ['user_id', 'bot_id', 'day'],
+                    unique=True, postgresql_nulls_not_distinct=True)
+    op.create_index('idx_bot_daily_pnl_bot_day', 'bot_daily_pnl', ['bot_id', 'day'])
+    
+    # Backfill from existing trades
+    op.execute("""
+        INSERT INTO bot_daily_pnl (user_id, bot_id, day, pnl, trades, wins, losses, breakeven)
+        SELECT user_id,
+               bot_id,
+               date(timezone('UTC', executed_at)),
+               coalesce(sum(pnl), 0),
+               count(id),
+               count(*) FILTER (WHERE pnl > 0),
+               count(*) FILTER (WHERE pnl < 0),
+               count(*) FILTER (WHERE pnl = 0)
+        FROM trades
+        GROUP BY user_id, bot_id, date(timezone('UTC', executed_at))
+    """)
+
+
+def downgrade():
+    op.drop_index('idx_bot_daily_pnl_bot_day', table_name='bot_daily_pnl')
+    op.drop_index('uq_bot_daily_pnl_user_bot_day', table_name='bot_daily_pnl')
+    op.drop_table('bot_daily_pnl')
@@ -0,0 +1,45 @@
+"""add gross profit/loss to bot_daily_pnl
+
+Revision ID: 20261018_daily_pnl_gross
+Revises: 20261018_bot_daily_pnl
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_daily_pnl_gross'
+down_revision = '20261018_bot_daily_pnl'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Profit factor needs gross sums, not just net P&L
+    op.add_column('bot_daily_pnl', sa.Column('gross_profit', sa.DECIMAL(precision=20, scale=8), nullable=False, server_default='0', comment="Sum of winning trades' P&L"))
+    op.add_column('bot_daily_pnl', sa.Column('gross_loss', sa.DECIMAL(precision=20, scale=8), nullable=False, server_default='0', comment="Sum of losing trades' |P&L|"))
+    
+    op.execute("""
+        UPDATE bot_daily_pnl AS r
+        SET gross_profit = t.gross_profit,
+            gross_loss = t.gross_loss
+        FROM (
+            SELECT user_id,
+                   bot_id,
+                   date(timezone('UTC', executed_at)) AS day,
+                   coalesce(sum(pnl) FILTER (WHERE pnl > 0), 0) AS gross_profit,
+                   coalesce(-sum(pnl) FILTER (WHERE pnl < 0), 0) AS gross_loss
+            FROM trades
+            GROUP BY user_id, bot_id, date(timezone('UTC', executed_at))
+        ) AS t
+        WHERE r.user_id = t.user_id
+          AND r.bot_id IS NOT DISTINCT FROM t.bot_id
+          AND r.day = t.day
+    """)
+
+
+def downgrade():
+    op.drop_column('bot_daily_pnl', 'gross_loss')
+    op.drop_column('bot_daily_pnl', 'gross_profit')
@@ -0,0 +1,40 @@
+"""add equity_snapshots time series
+
+Revision ID: 20261018_equity_snapshots
+Revises: 20261018_daily_pnl_gross
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_equity_snapshots'
+down_revision = '20261018_daily_pnl_gross'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'equity_snapshots',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('resolution', sa.String(length=3), nullable=False, comment='Tier: 1m, 1h or 1d'),
+        sa.Column('ts', sa.DateTime(timezone=True), nullable=False, comment='Bucket start (UTC)'),
+        sa.Column('equity', sa.DECIMAL(precision=20, scale=8), nullable=False, comment='Balance + unrealized P&L'),
+        sa.Column('balance', sa.DECIMAL(precision=20, scale=8), nullable=False, comment='Allocated capital + realized P&L'),
+        sa.Column('unrealized_pnl', sa.DECIMAL(precision=20, scale=8), nullable=False, comment='Unrealized P&L of open positions'),
+        sa.Column('margin_used', sa.DECIMAL(precision=20, scale=8), nullable=False, comment='Margin held by open positions'),
+        sa.CheckConstraint("resolution IN ('1m', '1h', '1d')", name='ck_equity_snapshots_resolution'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'resolution', 'ts'),
+        comment='Account equity snapshots (1m -> 1h -> 1d tiers)'
+    )
+    op.create_index('idx_equity_snapshots_resolution_ts', 'equity_snapshots', ['resolution', 'ts'])
+
+
+def downgrade():
+    op.drop_index('idx_equity_snapshots_resolution_ts', table_name='equity_snapshots')
+    op.drop_table('equity_snapshots')
@@ -0,0 +1,47 @@
+"""add market_trades and market_quotes capture tables
+
+Revision ID: 20261018_market_trades
+Revises: 20261018_equity_snapshots
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_market_trades'
+down_revision = '20261018_equity_snapshots'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'market_trades',
+        sa.Column('symbol', sa.String(length=20), nullable=False, comment='Trading symbol'),
+        sa.Column('ts', sa.DateTime(timezone=True), nullable=False, comment='Trade time (UTC)'),
+        sa.Column('trade_id', sa.BigInteger(), nullable=False, comment='Aggregate trade ID'),
+        sa.Column('price', sa.DECIMAL(precision=20, scale=8), nullable=False, comment='Price'),
+        sa.Column('quantity', sa.DECIMAL(precision=20, scale=8), nullable=False, comment='Quantity in base asset'),
+        sa.Column('is_buyer_maker', sa.Boolean(), nullable=False, comment='True when the seller was the taker'),
+        sa.PrimaryKeyConstraint('symbol', 'ts', 'trade_id'),
+        comment='Aggregated trades (aggTrade stream), written in COPY batches'
+    )
+    op.create_table(
+        'market_quotes',
+        sa.Column('symbol', sa.String(length=20), nullable=False, comment='Trading symbol'),
+        sa.Column('ts', sa.DateTime(timezone=True), nullable=False, comment='Receive time (UTC)'),
+        sa.Column('update_id', sa.BigInteger(), nullable=False, comment='Order book update ID'),
+        sa.Column('bid_price', sa.DECIMAL(precision=20, scale=8), nullable=False, comment='Best bid price'),
+        sa.Column('bid_quantity', sa.DECIMAL(precision=20, scale=8), nullable=False, comment='Best bid quantity'),
+        sa.Column('ask_price', sa.DECIMAL(precision=20, scale=8), nullable=False, comment='Best ask price'),
+        sa.Column('ask_quantity', sa.DECIMAL(precision=20, scale=8), nullable=False, comment='Best ask quantity'),
+        sa.PrimaryKeyConstraint('symbol', 'ts', 'update_id'),
+        comment='Top of book (bookTicker stream), written in COPY batches'
+    )
+
+
+def downgrade():
+    op.drop_table('market_quotes')
+    op.drop_table('market_trades')
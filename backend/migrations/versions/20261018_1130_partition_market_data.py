@@ -0,0 +1,116 @@
+"""partition market data tables by month
+
+Revision ID: 20261018_partition_market_data
+Revises: 20261018_market_trades
+Create Date: 2026-10-18 11:30:00.000000
+
+market_prices, orderbook_snapshots, market_trades and market_quotes
+become RANGE partitioned by month on their timestamp. Partitions cover
+the existing rows and the next months; the partition maintenance job
+keeps creating them ahead and drops expired ones.
+"""
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_partition_market_data'
+down_revision = '20261018_market_trades'
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+
+# table -> (partition column, primary key, unpartitioned primary key, id sequence, [(index, columns, unique)])
+TABLES = {
+    'market_prices': (
+        'timestamp', ['id', 'timestamp'], ['id'], 'market_prices_id_seq',
+        [('idx_market_prices_symbol_interval_time', ['symbol', 'exchange_id', 'interval', 'timestamp'], True)],
+    ),
+    'orderbook_snapshots': (
+        'timestamp', ['id', 'timestamp'], ['id'], 'orderbook_snapshots_id_seq',
+        [('idx_orderbook_symbol_time', ['symbol', 'exchange_id', 'timestamp'], False)],
+    ),
+    'market_trades': ('ts', ['symbol', 'ts', 'trade_id'], ['symbol', 'ts', 'trade_id'], None, []),
+    'market_quotes': ('ts', ['symbol', 'ts', 'update_id'], ['symbol', 'ts', 'update_id'], None, []),
+}
+
+BRIN_INDEXES = {
+    'market_prices': 'idx_market_prices_timestamp_brin',
+    'orderbook_snapshots': 'idx_orderbook_timestamp_brin',
+    'market_trades': 'idx_market_trades_ts_brin',
+    'market_quotes': 'idx_market_quotes_ts_brin',
+}
+
+FOREIGN_KEYS = ('market_prices', 'orderbook_snapshots')
+
+
+def _month_start(moment):
+    moment = moment.astimezone(timezone.utc) if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def _restore_keys(table, primary_key, indexes):
+    op.create_primary_key(f'{table}_pkey', table, primary_key)
+    for name, columns, unique in indexes:
+        op.create_index(name, table, columns, unique=unique)
+    if table in FOREIGN_KEYS:
+        op.create_foreign_key(f'{table}_exchange_id_fkey', table, 'exchanges', ['exchange_id'], ['id'], ondelete='RESTRICT')
+
+
+def _swap(table, create_sql):
+    """Rename table away and create its replacement from create_sql."""
+    old = f'{table}_old'
+    op.execute(f'ALTER TABLE {table} RENAME TO {old}')
+    op.execute(create_sql.format(table=table, old=old))
+    return old
+
+
+def _finish_swap(table, old, sequence):
+    op.execute(f'INSERT INTO {table} SELECT * FROM {old}')
+    if sequence:
+        # The sequence belongs to the old table and would be dropped with it
+        op.execute(f'ALTER SEQUENCE {sequence} OWNED BY {table}.id')
+    op.execute(f'DROP TABLE {old}')
+
+
+def upgrade():
+    bind = op.get_bind()
+    current = _month_start(datetime.now(timezone.utc))
+
+    for table, (column, primary_key, _, sequence, indexes) in TABLES.items():
+        old = _swap(
+            table,
+            'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS) '
+            f'PARTITION BY RANGE ("{column}")',
+        )
+
+        oldest = bind.execute(sa.text(f'SELECT min("{column}") FROM {old}')).scalar()
+        month = _month_start(oldest) if oldest else current
+        while month <= _add_months(current, MONTHS_AHEAD):
+            op.execute(
+                f"CREATE TABLE {table}_{month:%Y%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+            )
+            month = _add_months(month, 1)
+
+        _finish_swap(table, old, sequence)
+        _restore_keys(table, primary_key, indexes)
+        op.execute(f'CREATE INDEX {BRIN_INDEXES[table]} ON {table} USING brin ("{column}")')
+
+
+def downgrade():
+    for table, (_, _, primary_key, sequence, indexes) in reversed(list(TABLES.items())):
+        old = _swap(
+            table,
+            'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS)',
+        )
+        _finish_swap(table, old, sequence)
+        _restore_keys(table, primary_key, indexes)
@@ -21,7 +21,8 @@ import asyncio
 import os
 from cryptography.fernet import Fernet
 
-from trading.infrastructure.persistence.models.core_models import APIConnectionModel, ExchangeModel
+from trading.infrastructure.persistence.models.core_models import APIConnectionModel
+from trading.infrastructure.repositories.exchange_metadata_repository import ExchangeMetadataRepository
 
 
 class ConnectionService:
@@ -125,9 +126,7 @@ class ConnectionService:
             Created connection data
         """
         # Kiểm tra exchange có tồn tại không
-        exchange_stmt = select(ExchangeModel).where(ExchangeModel.id == exchange_id)
-        exchange_result = await self._session.execute(exchange_stmt)
-        exchange = exchange_result.scalar_one_or_none()
+        exchange = await ExchangeMetadataRepository(self._session).find_by_id(exchange_id)
         
         if not exchange:
             raise ValueError(f"Exchange with ID {exchange_id} not found")
@@ -137,7 +136,7 @@ class ConnectionService:
             id=uuid.uuid4(),
             user_id=uuid.UUID(user_id),
             exchange_id=exchange_id,
-            name=name or f"{exchange.name} Connection",
+            name=name or f"{exchange['name']} Connection",
             api_key_encrypted=self._encrypt(api_key),
             secret_key_encrypted=self._encrypt(api_secret),
             passphrase_encrypted=self._encrypt(api_passphrase) if api_passphrase else None,
@@ -157,7 +156,7 @@ class ConnectionService:
         return {
             "id": str(connection.id),
             "exchange_id": connection.exchange_id,
-            "exchange_name": exchange.name,
+            "exchange_name": exchange["name"],
             "name": connection.name,
             "api_key": masked_key,
             "status": connection.status,
@@ -221,6 +220,7 @@ class ConnectionService:
         
         await self._session.commit()
         await self._session.refresh(connection)
+        await self._invalidate_pooled_credentials(connection_id)
         
         # Mask API key
         raw_key = api_key or (self._decrypt(connection.api_key_encrypted) if connection.api_key_encrypted else "")
@@ -286,6 +286,7 @@ class ConnectionService:
         connection.updated_at = datetime.utcnow()
         
         await self._session.commit()
+        await self._invalidate_pooled_credentials(connection_id)
         
         return {
             "message": f"Connection {connection.name} deleted successfully",
@@ -314,9 +315,7 @@ class ConnectionService:
             Test result with success status and balance (if successful)
         """
         # Get exchange info
-        exchange_stmt = select(ExchangeModel).where(ExchangeModel.id == exchange_id)
-        exchange_result = await self._session.execute(exchange_stmt)
-        exchange = exchange_result.scalar_one_or_none()
+        exchange = await ExchangeMetadataRepository(self._session).find_by_id(exchange_id)
         
         if not exchange:
             return {
@@ -327,8 +326,8 @@ class ConnectionService:
         # Try to connect and fetch balance (with timeout)
         try:
             # Use direct Binance API adapter instead of CCXT
-            if exchange.code == "BINANCE" or "BINANCE" in exchange.name.upper():
-                from src.trading.infrastructure.exchange.binance_adapter import BinanceAdapter
+            if exchange["code"] == "BINANCE" or "BINANCE" in exchange["name"].upper():
+                from trading.infrastructure.exchange.binance_adapter import BinanceAdapter
                 
                 # Select base URL based on testnet flag
                 base_url = "https://demo-fapi.binance.com" if is_testnet else "https://fapi.binance.com"
@@ -376,7 +375,7 @@ class ConnectionService:
             else:
                 return {
                     "success": False,
-                    "error": f"Exchange {exchange.name} is not supported yet"
+                    "error": f"Exchange {exchange['name']} is not supported yet"
                 }
             
         except asyncio.TimeoutError:
@@ -451,6 +450,12 @@ class ConnectionService:
             "updated_at": connection.updated_at.isoformat()
         }
 
+    async def _invalidate_pooled_credentials(self, connection_id: str) -> None:
+        """Drop cached credentials and pooled adapters after a rotation or delete."""
+        from trading.infrastructure.exchange.adapter_pool import exchange_adapter_pool
+        
+        await exchange_adapter_pool.invalidate(connection_id)
+
     async def get_connection_credentials(self, connection_id: str, user_id: str) -> Dict[str, Any]:
         """
         Get decrypted connection credentials for internal use.
@@ -6,7 +6,8 @@ Mục đích:
 - Phân tích returns hàng ngày/tháng, portfolio insights.
 
 Liên quan đến file nào:
-- Sử dụng models từ trading/infrastructure/persistence/models/core_models.py (BotModel, TradeModel, etc.).
+- Đọc bảng rollup bot_daily_pnl (BotDailyPnlModel) thay vì load toàn bộ trades.
+- Cache kết quả theo user trong trading/infrastructure/cache/analytics_cache.py.
 - Khi gặp bug: Kiểm tra data trong DB, verify calculations với pandas/numpy, hoặc log trong shared/exceptions/.
 """
 
@@ -16,19 +17,22 @@ Performance Analytics Service for trading platform.
 Provides comprehensive performance metrics, risk analysis, and portfolio insights
 for trading strategies and portfolios.
 """
-from datetime import datetime, timedelta
-from decimal import Decimal
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from itertools import groupby
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 import numpy as np
-import pandas as pd
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, desc
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, and_
 
-from trading.infrastructure.persistence.models.core_models import (
-    BotModel, TradeModel, PositionModel, UserModel
+from trading.infrastructure.persistence.models.bot_models import (
+    BotModel, BotDailyPnlModel, StrategyModel
 )
+from trading.infrastructure.cache.analytics_cache import AnalyticsCache, analytics_cache
+
+# Returns are P&L relative to a fixed notional capital (no equity history yet)
+BASE_CAPITAL = 10000.0
+PERIODS_PER_YEAR = 365
 
 
 @dataclass
@@ -36,11 +40,11 @@ class PerformanceOverview:
     """Performance overview data transfer object - DTO cho tổng quan hiệu suất."""
     total_return_pct: float  # Tổng return %
     sharpe_ratio: float  # Sharpe ratio (rủi ro điều chỉnh)
-    sortino_ratio: float  # Sortino ratio (chỉ downside risk)
+    sortino_ratio: Optional[float]  # Sortino ratio (chỉ downside risk); None khi vô hạn
     max_drawdown: float  # Max drawdown %
     calmar_ratio: float  # Calmar ratio (return/drawdown)
     win_rate: float  # Tỷ lệ thắng %
-    profit_factor: float  # Profit factor (profit/loss ratio)
+    profit_factor: Optional[float]  # Profit factor (profit/loss ratio); None khi vô hạn
 
 
 @dataclass
@@ -63,7 +67,7 @@ class MonthlyPerformance:
 @dataclass
 class BotPerformance:
     """Bot performance comparison data."""
-    bot_id: int
+    bot_id: str
     bot_name: str
     total_pnl: float
     win_rate: float
@@ -74,7 +78,7 @@ class BotPerformance:
 @dataclass
 class StrategyPerformance:
     """Strategy performance comparison data."""
-    strategy_id: int
+    strategy_id: str
     strategy_name: str
     total_pnl: float
     trades_count: int
@@ -92,16 +96,76 @@ class RiskMetrics:
     correlation_btc: Optional[float]
 
 
+def sharpe_ratio(returns: np.ndarray, risk_free_rate: float = 0.02) -> float:
+    """Annualized Sharpe ratio of a daily return series (in %)."""
+    if returns.size == 0:
+        return 0.0
+    std_return = returns.std()
+    if std_return == 0:
+        return 0.0
+    daily_rf_rate = risk_free_rate / PERIODS_PER_YEAR
+    return float((returns.mean() - daily_rf_rate) / std_return * np.sqrt(PERIODS_PER_YEAR))
+
+
+def sortino_ratio(returns: np.ndarray) -> float:
+    """Annualized Sortino ratio (downside deviation only)."""
+    if returns.size == 0:
+        return 0.0
+    mean_return = returns.mean()
+    negative_returns = returns[returns < 0]
+    if negative_returns.size == 0:
+        return float('inf') if mean_return > 0 else 0.0
+    downside_std = negative_returns.std()
+    if downside_std == 0:
+        return 0.0
+    return float(mean_return / downside_std * np.sqrt(PERIODS_PER_YEAR))
+
+
+def max_drawdown(returns: np.ndarray) -> float:
+    """Largest peak-to-trough fall of the equity curve, in % of the peak.
+    
+    Equity starts at 100% of ``BASE_CAPITAL`` and adds each day's return.
+    """
+    if returns.size == 0:
+        return 0.0
+    equity = 100.0 + np.cumsum(returns)
+    peaks = np.maximum.accumulate(np.concatenate(([100.0], equity)))[1:]
+    drawdowns = np.where(peaks > 0, (peaks - equity) / peaks, 0.0)
+    return float(max(drawdowns.max(), 0.0) * 100)
+
+
+def calmar_ratio(returns: np.ndarray, max_dd: float) -> float:
+    """Annualized return divided by max drawdown."""
+    if returns.size == 0 or max_dd == 0:
+        return 0.0
+    annual_return = returns.sum() * PERIODS_PER_YEAR / returns.size
+    return float(annual_return / (max_dd / 100))
+
+
+def profit_factor(gross_profit: float, gross_loss: float) -> float:
+    """Gross profit over gross loss."""
+    if gross_loss == 0:
+        return float('inf') if gross_profit > 0 else 0.0
+    return gross_profit / gross_loss
+
+
 class PerformanceAnalyticsService:
-    """Service for performance analytics and portfolio insights."""
+    """Service for performance analytics and portfolio insights.
+    
+    Reports are computed from the ``bot_daily_pnl`` rollup (one row per
+    bot per day) instead of loading trades, and cached per user and
+    parameters in ``AnalyticsCache``; the cache is invalidated whenever
+    one of the user's trades is recorded.
+    """
     
-    def __init__(self, db_session: AsyncSession):
+    def __init__(self, db_session: AsyncSession, cache: Optional[AnalyticsCache] = None):
         """Initialize the performance analytics service."""
         self.db = db_session
+        self.cache = cache or analytics_cache
     
     async def get_performance_overview(
         self, 
-        user_id: int,
+        user_id: Any,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> PerformanceOverview:
@@ -116,50 +180,19 @@ class PerformanceAnalyticsService:
         Returns:
             PerformanceOverview with key metrics
         """
-        if not start_date:
-            start_date = datetime.utcnow() - timedelta(days=30)
-        if not end_date:
-            end_date = datetime.utcnow()
-        
-        # Get all trades for the period
-        trades = await self._get_user_trades(user_id, start_date, end_date)
-        
-        if not trades:
-            return PerformanceOverview(
-                total_return_pct=0.0,
-                sharpe_ratio=0.0,
-                sortino_ratio=0.0,
-                max_drawdown=0.0,
-                calmar_ratio=0.0,
-                win_rate=0.0,
-                profit_factor=0.0
-            )
+        end_day = (end_date or datetime.utcnow()).date()
+        start_day = start_date.date() if start_date else end_day - timedelta(days=30)
         
-        # Calculate daily returns
-        daily_returns = await self._calculate_daily_returns(trades)
+        async def load() -> Dict[str, Any]:
+            series = await self._get_daily_series(user_id, start_day, end_day)
+            return asdict(self._overview_from_series(series))
         
-        # Calculate individual metrics
-        total_return_pct = self._calculate_total_return(daily_returns)
-        sharpe_ratio = self._calculate_sharpe_ratio(daily_returns)
-        sortino_ratio = self._calculate_sortino_ratio(daily_returns)
-        max_drawdown = self._calculate_max_drawdown(daily_returns)
-        calmar_ratio = self._calculate_calmar_ratio(daily_returns, max_drawdown)
-        win_rate = self._calculate_win_rate(trades)
-        profit_factor = self._calculate_profit_factor(trades)
-        
-        return PerformanceOverview(
-            total_return_pct=total_return_pct,
-            sharpe_ratio=sharpe_ratio,
-            sortino_ratio=sortino_ratio,
-            max_drawdown=max_drawdown,
-            calmar_ratio=calmar_ratio,
-            win_rate=win_rate,
-            profit_factor=profit_factor
-        )
+        data = await self._cached(user_id, "overview", {"start": start_day, "end": end_day}, load)
+        return PerformanceOverview(**data)
     
     async def get_daily_returns(
         self, 
-        user_id: int,
+        user_id: Any,
         days: int = 90
     ) -> List[DailyReturn]:
         """
@@ -172,28 +205,28 @@ class PerformanceAnalyticsService:
         Returns:
             List of DailyReturn objects
         """
-        start_date = datetime.utcnow() - timedelta(days=days)
-        end_date = datetime.utcnow()
-        
-        trades = await self._get_user_trades(user_id, start_date, end_date)
-        daily_returns = await self._calculate_daily_returns(trades)
-        
-        result = []
-        cumulative_return = 0.0
-        
-        for date, return_pct in daily_returns.items():
-            cumulative_return += return_pct
-            result.append(DailyReturn(
-                date=date.strftime('%Y-%m-%d'),
-                return_pct=round(return_pct, 4),
-                cumulative_return_pct=round(cumulative_return, 4)
-            ))
-        
-        return sorted(result, key=lambda x: x.date)
+        end_day = datetime.utcnow().date()
+        start_day = end_day - timedelta(days=days)
+        
+        async def load() -> List[Dict[str, Any]]:
+            series = await self._get_daily_series(user_id, start_day, end_day)
+            returns = series["pnl"] / BASE_CAPITAL * 100
+            cumulative = np.cumsum(returns)
+            return [
+                asdict(DailyReturn(
+                    date=day.strftime('%Y-%m-%d'),
+                    return_pct=round(float(return_pct), 4),
+                    cumulative_return_pct=round(float(total), 4)
+                ))
+                for day, return_pct, total in zip(series["period"], returns, cumulative)
+            ]
+        
+        data = await self._cached(user_id, "daily_returns", {"start": start_day, "end": end_day}, load)
+        return [DailyReturn(**item) for item in data]
     
     async def get_monthly_performance(
         self, 
-        user_id: int,
+        user_id: Any,
         months: int = 12
     ) -> List[MonthlyPerformance]:
         """
@@ -206,41 +239,32 @@ class PerformanceAnalyticsService:
         Returns:
             List of MonthlyPerformance objects
         """
-        start_date = datetime.utcnow() - timedelta(days=months * 30)
-        end_date = datetime.utcnow()
-        
-        trades = await self._get_user_trades(user_id, start_date, end_date)
-        
-        # Group trades by month
-        monthly_data = {}
-        for trade in trades:
-            month_key = trade.created_at.strftime('%Y-%m')
-            if month_key not in monthly_data:
-                monthly_data[month_key] = []
-            monthly_data[month_key].append(trade)
-        
-        result = []
-        for month, month_trades in monthly_data.items():
-            total_pnl = sum(float(trade.pnl) for trade in month_trades if trade.pnl)
-            trades_count = len(month_trades)
-            win_trades = len([t for t in month_trades if t.pnl and t.pnl > 0])
-            win_rate = (win_trades / trades_count * 100) if trades_count > 0 else 0
-            
-            # Calculate return percentage (simplified)
-            return_pct = (total_pnl / 10000) * 100 if total_pnl else 0  # Assuming 10k base
-            
-            result.append(MonthlyPerformance(
-                month=month,
-                return_pct=round(return_pct, 2),
-                trades_count=trades_count,
-                win_rate=round(win_rate, 1)
-            ))
-        
-        return sorted(result, key=lambda x: x.month)
+        end_day = datetime.utcnow().date()
+        start_day = end_day.replace(day=1)
+        for _ in range(months - 1):
+            start_day = (start_day - timedelta(days=1)).replace(day=1)
+        
+        async def load() -> List[Dict[str, Any]]:
+            series = await self._get_daily_series(user_id, start_day, end_day, period="month")
+            result = []
+            for month, pnl, trades, wins in zip(
+                series["period"], series["pnl"], series["trades"], series["wins"]
+            ):
+                win_rate = (wins / trades * 100) if trades > 0 else 0
+                result.append(asdict(MonthlyPerformance(
+                    month=month.strftime('%Y-%m'),
+                    return_pct=round(float(pnl / BASE_CAPITAL * 100), 2),
+                    trades_count=int(trades),
+                    win_rate=round(float(win_rate), 1)
+                )))
+            return result
+        
+        data = await self._cached(user_id, "monthly", {"start": start_day, "end": end_day}, load)
+        return [MonthlyPerformance(**item) for item in data]
     
     async def get_bot_performance_comparison(
         self, 
-        user_id: int
+        user_id: Any
     ) -> List[BotPerformance]:
         """
         Get performance comparison across all user's bots.
@@ -251,45 +275,48 @@ class PerformanceAnalyticsService:
         Returns:
             List of BotPerformance objects
         """
-        # Get all user's bots with their trades
-        stmt = (
-            select(BotModel)
-            .where(BotModel.user_id == user_id)
-            .options(selectinload(BotModel.trades))
-        )
-        result = await self.db.execute(stmt)
-        bots = result.scalars().all()
-        
-        performance_list = []
-        for bot in bots:
-            trades = bot.trades
-            
-            if not trades:
-                continue
-            
-            total_pnl = sum(float(trade.pnl) for trade in trades if trade.pnl)
-            trades_count = len(trades)
-            win_trades = len([t for t in trades if t.pnl and t.pnl > 0])
-            win_rate = (win_trades / trades_count * 100) if trades_count > 0 else 0
+        async def load() -> List[Dict[str, Any]]:
+            # One row per bot per day; Sharpe needs each bot's daily series
+            stmt = (
+                select(
+                    BotDailyPnlModel.bot_id,
+                    BotModel.name,
+                    BotDailyPnlModel.pnl,
+                    BotDailyPnlModel.trades,
+                    BotDailyPnlModel.wins,
+                )
+                .join(BotModel, BotDailyPnlModel.bot_id == BotModel.id)
+                .where(BotModel.user_id == user_id)
+                .order_by(BotDailyPnlModel.bot_id, BotDailyPnlModel.day)
+            )
+            result = await self.db.execute(stmt)
             
-            # Calculate daily returns for Sharpe ratio
-            daily_returns = await self._calculate_daily_returns(trades)
-            sharpe_ratio = self._calculate_sharpe_ratio(daily_returns)
+            performance_list = []
+            for (bot_id, bot_name), rows in groupby(result.all(), key=lambda row: (row.bot_id, row.name)):
+                rows = list(rows)
+                pnl = np.array([float(row.pnl) for row in rows])
+                trades_count = sum(row.trades for row in rows)
+                if trades_count == 0:
+                    continue
+                
+                win_trades = sum(row.wins for row in rows)
+                performance_list.append(asdict(BotPerformance(
+                    bot_id=str(bot_id),
+                    bot_name=bot_name,
+                    total_pnl=round(float(pnl.sum()), 2),
+                    win_rate=round(win_trades / trades_count * 100, 1),
+                    sharpe_ratio=round(sharpe_ratio(pnl / BASE_CAPITAL * 100), 3),
+                    trades_count=trades_count
+                )))
             
-            performance_list.append(BotPerformance(
-                bot_id=bot.id,
-                bot_name=bot.name,
-                total_pnl=round(total_pnl, 2),
-                win_rate=round(win_rate, 1),
-                sharpe_ratio=round(sharpe_ratio, 3),
-                trades_count=trades_count
-            ))
+            return sorted(performance_list, key=lambda x: x["total_pnl"], reverse=True)
         
-        return sorted(performance_list, key=lambda x: x.total_pnl, reverse=True)
+        data = await self._cached(user_id, "by_bot", {}, load)
+        return [BotPerformance(**item) for item in data]
     
     async def get_strategy_performance_comparison(
         self, 
-        user_id: int
+        user_id: Any
     ) -> List[StrategyPerformance]:
         """
         Get performance comparison by strategy.
@@ -300,40 +327,49 @@ class PerformanceAnalyticsService:
         Returns:
             List of StrategyPerformance objects
         """
-        # Get aggregated data by strategy
-        stmt = (
-            select(
-                BotModel.strategy_id,
-                func.count(TradeModel.id).label('trades_count'),
-                func.sum(TradeModel.pnl).label('total_pnl'),
-                func.avg(TradeModel.pnl).label('avg_profit'),
-                func.count(BotModel.id.distinct()).label('bots_count')
+        async def load() -> List[Dict[str, Any]]:
+            closed_trades = (
+                func.sum(BotDailyPnlModel.wins)
+                + func.sum(BotDailyPnlModel.losses)
+                + func.sum(BotDailyPnlModel.breakeven)
             )
-            .select_from(BotModel)
-            .join(TradeModel, BotModel.id == TradeModel.bot_id)
-            .where(BotModel.user_id == user_id)
-            .group_by(BotModel.strategy_id)
-        )
-        
-        result = await self.db.execute(stmt)
-        strategy_data = result.all()
-        
-        performance_list = []
-        for row in strategy_data:
-            performance_list.append(StrategyPerformance(
-                strategy_id=row.strategy_id,
-                strategy_name=f"Strategy {row.strategy_id}",  # Could join with strategy table
-                total_pnl=float(row.total_pnl or 0),
-                trades_count=row.trades_count,
-                avg_profit=float(row.avg_profit or 0),
-                bots_count=row.bots_count
-            ))
+            stmt = (
+                select(
+                    BotModel.strategy_id,
+                    StrategyModel.name.label('strategy_name'),
+                    func.sum(BotDailyPnlModel.trades).label('trades_count'),
+                    func.sum(BotDailyPnlModel.pnl).label('total_pnl'),
+                    closed_trades.label('closed_trades'),
+                    func.count(BotDailyPnlModel.bot_id.distinct()).label('bots_count')
+                )
+                .select_from(BotDailyPnlModel)
+                .join(BotModel, BotDailyPnlModel.bot_id == BotModel.id)
+                .join(StrategyModel, BotModel.strategy_id == StrategyModel.id)
+                .where(BotModel.user_id == user_id)
+                .group_by(BotModel.strategy_id, StrategyModel.name)
+            )
+            result = await self.db.execute(stmt)
+            
+            performance_list = []
+            for row in result.all():
+                total_pnl = float(row.total_pnl or 0)
+                performance_list.append(asdict(StrategyPerformance(
+                    strategy_id=str(row.strategy_id),
+                    strategy_name=row.strategy_name,
+                    total_pnl=total_pnl,
+                    trades_count=int(row.trades_count or 0),
+                    avg_profit=total_pnl / row.closed_trades if row.closed_trades else 0.0,
+                    bots_count=row.bots_count
+                )))
+            
+            return sorted(performance_list, key=lambda x: x["total_pnl"], reverse=True)
         
-        return sorted(performance_list, key=lambda x: x.total_pnl, reverse=True)
+        data = await self._cached(user_id, "by_strategy", {}, load)
+        return [StrategyPerformance(**item) for item in data]
     
     async def get_risk_metrics(
         self, 
-        user_id: int,
+        user_id: Any,
         days: int = 30
     ) -> RiskMetrics:
         """
@@ -346,197 +382,142 @@ class PerformanceAnalyticsService:
         Returns:
             RiskMetrics object with risk analysis
         """
-        start_date = datetime.utcnow() - timedelta(days=days)
-        trades = await self._get_user_trades(user_id, start_date)
+        end_day = datetime.utcnow().date()
+        start_day = end_day - timedelta(days=days)
         
-        if not trades:
-            return RiskMetrics(
-                var_95=0.0,
-                cvar_95=0.0,
-                volatility=0.0,
-                beta=0.0,
-                correlation_btc=None
-            )
-        
-        daily_returns = await self._calculate_daily_returns(trades)
-        returns_array = np.array(list(daily_returns.values()))
-        
-        # Calculate Value at Risk (95%)
-        var_95 = float(np.percentile(returns_array, 5))
-        
-        # Calculate Conditional VaR (95%) - average of losses below VaR
-        tail_returns = returns_array[returns_array <= var_95]
-        cvar_95 = float(np.mean(tail_returns)) if len(tail_returns) > 0 else 0.0
+        async def load() -> Dict[str, Any]:
+            series = await self._get_daily_series(user_id, start_day, end_day)
+            return asdict(self._risk_from_series(series))
         
-        # Calculate volatility (standard deviation)
-        volatility = float(np.std(returns_array))
-        
-        # Beta and correlation would require market data (placeholder)
-        beta = 1.0  # Would need market index data
-        correlation_btc = None  # Would need BTC price data
-        
-        return RiskMetrics(
-            var_95=round(var_95, 4),
-            cvar_95=round(cvar_95, 4),
-            volatility=round(volatility, 4),
-            beta=round(beta, 3),
-            correlation_btc=correlation_btc
-        )
+        data = await self._cached(user_id, "risk", {"start": start_day, "end": end_day}, load)
+        return RiskMetrics(**data)
     
     # Private helper methods
     
-    async def _get_user_trades(
-        self, 
-        user_id: int, 
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
-    ) -> List[TradeModel]:
-        """Get all trades for user in date range."""
-        conditions = [BotModel.user_id == user_id]
-        
-        if start_date:
-            conditions.append(TradeModel.created_at >= start_date)
-        if end_date:
-            conditions.append(TradeModel.created_at <= end_date)
+    async def _cached(
+        self,
+        user_id: Any,
+        report: str,
+        params: Dict[str, Any],
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Serve a report from the analytics cache, computing it on a miss."""
+        return await self.cache.get_or_compute(str(user_id), report, params, loader)
+    
+    async def _get_daily_series(
+        self,
+        user_id: Any,
+        start_day: date,
+        end_day: date,
+        period: str = "day",
+    ) -> Dict[str, Any]:
+        """Per-period totals of the user's bots from the daily rollup.
+        
+        Returns the periods (days, or month starts for ``period="month"``)
+        and NumPy arrays of pnl, trades, wins, closed trades (with a P&L),
+        gross profit and gross loss, aligned with the periods. Only
+        periods with trades are present.
+        """
+        if period == "day":
+            bucket = BotDailyPnlModel.day
+        else:
+            bucket = func.date_trunc(period, BotDailyPnlModel.day)
         
         stmt = (
-            select(TradeModel)
-            .join(BotModel, TradeModel.bot_id == BotModel.id)
-            .where(and_(*conditions))
-            .order_by(TradeModel.created_at)
+            select(
+                bucket.label("period"),
+                func.sum(BotDailyPnlModel.pnl).label("pnl"),
+                func.sum(BotDailyPnlModel.trades).label("trades"),
+                func.sum(BotDailyPnlModel.wins).label("wins"),
+                (
+                    func.sum(BotDailyPnlModel.wins)
+                    + func.sum(BotDailyPnlModel.losses)
+                    + func.sum(BotDailyPnlModel.breakeven)
+                ).label("closed"),
+                func.sum(BotDailyPnlModel.gross_profit).label("gross_profit"),
+                func.sum(BotDailyPnlModel.gross_loss).label("gross_loss"),
+            )
+            .where(
+                and_(
+                    BotDailyPnlModel.user_id == user_id,
+                    # Bot trades only, as the rest of the analytics
+                    BotDailyPnlModel.bot_id.isnot(None),
+                    BotDailyPnlModel.day >= start_day,
+                    BotDailyPnlModel.day <= end_day,
+                )
+            )
+            .group_by(bucket)
+            .order_by(bucket)
         )
-        
         result = await self.db.execute(stmt)
-        return result.scalars().all()
-    
-    async def _calculate_daily_returns(self, trades: List[TradeModel]) -> Dict[datetime, float]:
-        """Calculate daily returns from trades."""
-        daily_pnl = {}
-        
-        # Group trades by day
-        for trade in trades:
-            if not trade.pnl:
-                continue
-                
-            day = trade.created_at.date()
-            if day not in daily_pnl:
-                daily_pnl[day] = 0.0
-            daily_pnl[day] += float(trade.pnl)
-        
-        # Convert P&L to returns (simplified - assuming fixed capital)
-        base_capital = 10000.0  # Assuming $10,000 base
-        daily_returns = {}
-        
-        for day, pnl in daily_pnl.items():
-            return_pct = (pnl / base_capital) * 100
-            daily_returns[datetime.combine(day, datetime.min.time())] = return_pct
-        
-        return daily_returns
-    
-    def _calculate_total_return(self, daily_returns: Dict[datetime, float]) -> float:
-        """Calculate total return percentage."""
-        return sum(daily_returns.values())
-    
-    def _calculate_sharpe_ratio(
-        self, 
-        daily_returns: Dict[datetime, float], 
-        risk_free_rate: float = 0.02
-    ) -> float:
-        """Calculate Sharpe ratio."""
-        if not daily_returns:
-            return 0.0
-        
-        returns_array = np.array(list(daily_returns.values()))
-        mean_return = np.mean(returns_array)
-        std_return = np.std(returns_array)
-        
-        if std_return == 0:
-            return 0.0
-        
-        # Annualized Sharpe ratio
-        daily_rf_rate = risk_free_rate / 365
-        sharpe = (mean_return - daily_rf_rate) / std_return * np.sqrt(365)
-        
-        return float(sharpe)
+        rows = result.all()
+        
+        def column(name: str) -> np.ndarray:
+            return np.array([float(getattr(row, name) or 0) for row in rows], dtype=float)
+        
+        return {
+            "period": [row.period for row in rows],
+            "pnl": column("pnl"),
+            "trades": column("trades"),
+            "wins": column("wins"),
+            "closed": column("closed"),
+            "gross_profit": column("gross_profit"),
+            "gross_loss": column("gross_loss"),
+        }
     
-    def _calculate_sortino_ratio(self, daily_returns: Dict[datetime, float]) -> float:
-        """Calculate Sortino ratio (downside deviation only)."""
-        if not daily_returns:
-            return 0.0
-        
-        returns_array = np.array(list(daily_returns.values()))
-        mean_return = np.mean(returns_array)
-        
-        # Only consider negative returns for downside deviation
-        negative_returns = returns_array[returns_array < 0]
-        if len(negative_returns) == 0:
-            return float('inf') if mean_return > 0 else 0.0
-        
-        downside_std = np.std(negative_returns)
-        if downside_std == 0:
-            return 0.0
-        
-        sortino = mean_return / downside_std * np.sqrt(365)
-        return float(sortino)
-    
-    def _calculate_max_drawdown(self, daily_returns: Dict[datetime, float]) -> float:
-        """Calculate maximum drawdown."""
-        if not daily_returns:
-            return 0.0
-        
-        sorted_dates = sorted(daily_returns.keys())
-        equity_curve = []
-        cumulative = 0.0
-        
-        for date in sorted_dates:
-            cumulative += daily_returns[date]
-            equity_curve.append(cumulative)
-        
-        # Calculate drawdown at each point
-        running_max = equity_curve[0]
-        max_drawdown = 0.0
-        
-        for value in equity_curve:
-            if value > running_max:
-                running_max = value
-            
-            drawdown = (running_max - value) / running_max if running_max != 0 else 0
-            max_drawdown = max(max_drawdown, drawdown)
-        
-        return float(max_drawdown * 100)  # Return as percentage
-    
-    def _calculate_calmar_ratio(self, daily_returns: Dict[datetime, float], max_drawdown: float) -> float:
-        """Calculate Calmar ratio (annual return / max drawdown)."""
-        if not daily_returns or max_drawdown == 0:
-            return 0.0
-        
-        annual_return = sum(daily_returns.values()) * 365 / len(daily_returns)
-        calmar = annual_return / (max_drawdown / 100)  # Convert drawdown back to decimal
-        
-        return float(calmar)
-    
-    def _calculate_win_rate(self, trades: List[TradeModel]) -> float:
-        """Calculate win rate percentage."""
-        if not trades:
-            return 0.0
-        
-        profitable_trades = len([t for t in trades if t.pnl and t.pnl > 0])
-        total_trades = len([t for t in trades if t.pnl is not None])
+    @staticmethod
+    def _overview_from_series(series: Dict[str, Any]) -> PerformanceOverview:
+        """Portfolio metrics from a daily series."""
+        if series["trades"].sum() == 0:
+            return PerformanceOverview(
+                total_return_pct=0.0,
+                sharpe_ratio=0.0,
+                sortino_ratio=0.0,
+                max_drawdown=0.0,
+                calmar_ratio=0.0,
+                win_rate=0.0,
+                profit_factor=0.0
+            )
         
-        if total_trades == 0:
-            return 0.0
+        returns = series["pnl"] / BASE_CAPITAL * 100
+        max_dd = max_drawdown(returns)
+        closed = series["closed"].sum()
         
-        return (profitable_trades / total_trades) * 100
+        return PerformanceOverview(
+            total_return_pct=float(returns.sum()),
+            sharpe_ratio=sharpe_ratio(returns),
+            sortino_ratio=sortino_ratio(returns),
+            max_drawdown=max_dd,
+            calmar_ratio=calmar_ratio(returns, max_dd),
+            win_rate=float(series["wins"].sum() / closed * 100) if closed else 0.0,
+            profit_factor=profit_factor(
+                float(series["gross_profit"].sum()), float(series["gross_loss"].sum())
+            )
+        )
     
-    def _calculate_profit_factor(self, trades: List[TradeModel]) -> float:
-        """Calculate profit factor (gross profit / gross loss)."""
-        if not trades:
-            return 0.0
-        
-        gross_profit = sum(float(t.pnl) for t in trades if t.pnl and t.pnl > 0)
-        gross_loss = sum(abs(float(t.pnl)) for t in trades if t.pnl and t.pnl < 0)
+    @staticmethod
+    def _risk_from_series(series: Dict[str, Any]) -> RiskMetrics:
+        """VaR, CVaR and volatility from a daily series."""
+        returns = series["pnl"] / BASE_CAPITAL * 100
+        if returns.size == 0:
+            return RiskMetrics(
+                var_95=0.0,
+                cvar_95=0.0,
+                volatility=0.0,
+                beta=0.0,
+                correlation_btc=None
+            )
         
-        if gross_loss == 0:
-            return float('inf') if gross_profit > 0 else 0.0
+        # Value at Risk (95%) and the mean of the losses beyond it
+        var_95 = float(np.percentile(returns, 5))
+        tail_returns = returns[returns <= var_95]
+        cvar_95 = float(tail_returns.mean()) if tail_returns.size > 0 else 0.0
         
-        return gross_profit / gross_loss
\ No newline at end of file
+        # Beta and correlation would require market data (placeholder)
+        return RiskMetrics(
+            var_95=round(var_95, 4),
+            cvar_95=round(cvar_95, 4),
+            volatility=round(float(returns.std()), 4),
+            beta=1.0,
+            correlation_btc=None
+        )
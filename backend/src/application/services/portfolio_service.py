@@ -13,8 +13,9 @@ Liên quan đến file nào:
 
 """Portfolio Service for aggregating user portfolio data."""
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, desc
 from sqlalchemy.orm import selectinload
@@ -23,6 +24,10 @@ from trading.infrastructure.persistence.models.bot_models import BotModel
 from trading.infrastructure.persistence.models.trading_models import (
     PositionModel, TradeModel, OrderModel
 )
+from trading.infrastructure.persistence.repositories.daily_pnl_repository import DailyPnlRepository
+from trading.infrastructure.persistence.repositories.equity_snapshot_repository import (
+    EquitySnapshotRepository, resolution_for_range
+)
 from trading.infrastructure.cache.price_cache import PriceCache
 
 
@@ -178,40 +183,27 @@ class PortfolioService:
         Returns:
             List of daily P&L data
         """
-        start_date = datetime.utcnow() - timedelta(days=days)
+        today = datetime.utcnow().date()
         
-        # Query trades grouped by date
-        stmt = select(
-            func.date(TradeModel.created_at).label("date"),
-            func.sum(TradeModel.realized_pnl).label("daily_pnl"),
-            func.count(TradeModel.id).label("trades_count")
-        ).where(
-            and_(
-                TradeModel.user_id == user_id,
-                TradeModel.created_at >= start_date,
-                TradeModel.deleted_at.is_(None)
-            )
-        ).group_by(
-            func.date(TradeModel.created_at)
-        ).order_by(
-            func.date(TradeModel.created_at)
+        # Summed from the per bot, per UTC day rollup instead of the trades table
+        rows = await DailyPnlRepository(self._session).get_days(
+            start=today - timedelta(days=days),
+            end=today,
+            user_id=UUID(str(user_id)),
         )
         
-        result = await self._session.execute(stmt)
-        rows = result.all()
-        
         # Calculate cumulative P&L
         cumulative_pnl = Decimal("0")
         daily_data = []
         for row in rows:
-            daily_pnl = row.daily_pnl or Decimal("0")
+            daily_pnl = row["pnl"]
             cumulative_pnl += daily_pnl
             
             daily_data.append({
-                "date": row.date.isoformat(),
+                "date": row["day"].isoformat(),
                 "pnl": float(daily_pnl),
                 "cumulative_pnl": float(cumulative_pnl),
-                "trades_count": row.trades_count
+                "trades_count": row["trades"]
             })
         
         return daily_data
@@ -227,47 +219,26 @@ class PortfolioService:
         Returns:
             List of monthly P&L data
         """
-        start_date = datetime.utcnow() - timedelta(days=months * 30)
+        # Whole calendar months, current month included
+        start_month = datetime.utcnow().date().replace(day=1)
+        for _ in range(months - 1):
+            start_month = (start_month - timedelta(days=1)).replace(day=1)
         
-        # Query trades grouped by month
-        stmt = select(
-            func.date_trunc('month', TradeModel.created_at).label("month"),
-            func.sum(TradeModel.realized_pnl).label("total_pnl"),
-            func.count(TradeModel.id).label("total_trades"),
-            func.sum(
-                func.case((TradeModel.realized_pnl > 0, 1), else_=0)
-            ).label("win_trades"),
-            func.sum(
-                func.case((TradeModel.realized_pnl < 0, 1), else_=0)
-            ).label("loss_trades")
-        ).where(
-            and_(
-                TradeModel.user_id == user_id,
-                TradeModel.created_at >= start_date,
-                TradeModel.deleted_at.is_(None)
-            )
-        ).group_by(
-            func.date_trunc('month', TradeModel.created_at)
-        ).order_by(
-            func.date_trunc('month', TradeModel.created_at)
-        )
-        
-        result = await self._session.execute(stmt)
-        rows = result.all()
+        rows = await DailyPnlRepository(self._session).get_months(UUID(str(user_id)), start_month)
         
         monthly_data = []
         for row in rows:
-            total_pnl = row.total_pnl or Decimal("0")
-            win_trades = row.win_trades or 0
-            loss_trades = row.loss_trades or 0
-            total_trades = row.total_trades or 0
+            total_pnl = row["pnl"]
+            win_trades = row["wins"]
+            loss_trades = row["losses"]
+            total_trades = row["trades"]
             
             win_rate = Decimal("0")
             if total_trades > 0:
                 win_rate = (Decimal(win_trades) / Decimal(total_trades) * 100).quantize(Decimal("0.01"))
             
             monthly_data.append({
-                "month": row.month.strftime("%Y-%m"),
+                "month": row["month"].strftime("%Y-%m"),
                 "total_pnl": float(total_pnl),
                 "total_trades": total_trades,
                 "win_trades": win_trades,
@@ -341,57 +312,53 @@ class PortfolioService:
         
         return exposure_data
     
-    async def get_equity_curve(self, user_id: str, days: int = 30) -> List[Dict[str, Any]]:
+    async def get_equity_curve(
+        self,
+        user_id: str,
+        days: int = 30,
+        resolution: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get historical equity curve.
         
         Args:
             user_id: User UUID
             days: Number of days
+            resolution: Snapshot tier (1m, 1h, 1d); picked from days if omitted
             
         Returns:
             List of equity curve data points
         """
-        start_date = datetime.utcnow() - timedelta(days=days)
-        
-        # Get trades ordered by time
-        stmt = select(TradeModel).where(
-            and_(
-                TradeModel.user_id == user_id,
-                TradeModel.created_at >= start_date,
-                TradeModel.deleted_at.is_(None)
-            )
-        ).order_by(TradeModel.created_at)
-        
-        result = await self._session.execute(stmt)
-        trades = result.scalars().all()
+        span = timedelta(days=days)
+        resolution = resolution or resolution_for_range(span)
         
-        # Get initial equity (from portfolio summary)
-        summary = await self.get_portfolio_summary(user_id)
-        initial_equity = Decimal(str(summary["total_balance"]))
+        points = await self._equity_points(user_id, resolution, datetime.now(timezone.utc) - span)
+        return self._with_drawdown(points)
+    
+    async def _equity_points(self, user_id: str, finest: str, start: datetime) -> List[Dict[str, Any]]:
+        """Equity snapshots from ``finest`` back to start (coarser tiers for older stretches).
         
-        # Calculate equity at each trade
+        Equity already includes unrealized P&L. History from before a
+        user's first snapshot is backfilled by the snapshotter, not here.
+        """
+        repository = EquitySnapshotRepository(self._session)
+        return await repository.get_stitched_series(UUID(str(user_id)), finest, start)
+    
+    @staticmethod
+    def _with_drawdown(points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Curve points with the drawdown from the running peak."""
         equity_curve = []
-        current_equity = initial_equity
-        peak_equity = initial_equity
-        
-        for trade in trades:
-            realized_pnl = trade.realized_pnl or Decimal("0")
-            current_equity += realized_pnl
-            
-            # Track peak for drawdown calculation
-            if current_equity > peak_equity:
-                peak_equity = current_equity
-            
-            # Calculate drawdown
-            drawdown = Decimal("0")
-            if peak_equity > 0:
-                drawdown = ((peak_equity - current_equity) / peak_equity * 100).quantize(Decimal("0.01"))
+        peak_equity = 0.0
+        for point in points:
+            equity = float(point["equity"])
+            peak_equity = max(peak_equity, equity)
+            drawdown = (peak_equity - equity) / peak_equity * 100 if peak_equity > 0 else 0.0
             
             equity_curve.append({
-                "timestamp": trade.created_at.isoformat(),
-                "equity": float(current_equity),
-                "drawdown": float(drawdown)
+                "timestamp": point["ts"].isoformat(),
+                "equity": equity,
+                "unrealized_pnl": float(point["unrealized_pnl"]),
+                "drawdown": round(drawdown, 2)
             })
         
         return equity_curve
@@ -476,9 +443,9 @@ class PortfolioService:
         stmt = select(TradeModel).where(
             and_(
                 TradeModel.user_id == user_id,
-                TradeModel.deleted_at.is_(None)
+                TradeModel.status == "SUCCESS"
             )
-        ).order_by(TradeModel.created_at)
+        ).order_by(TradeModel.executed_at)
         
         result = await self._session.execute(stmt)
         trades = result.scalars().all()
@@ -493,7 +460,7 @@ class PortfolioService:
             }
         
         # Calculate metrics
-        returns = [float(t.realized_pnl or 0) for t in trades]
+        returns = [float(t.pnl or 0) for t in trades]
         positive_returns = [r for r in returns if r > 0]
         negative_returns = [r for r in returns if r < 0]
         
@@ -525,9 +492,10 @@ class PortfolioService:
         else:
             sortino_ratio = 0
         
-        # Max drawdown
-        equity_curve = await self.get_equity_curve(user_id, days=365)
-        max_drawdown = max([d["drawdown"] for d in equity_curve], default=0)
+        # Max drawdown over the finest data each stretch still has (intraday
+        # dips vanish from the daily tier, which keeps each day's last value)
+        points = await self._equity_points(user_id, "1m", datetime.now(timezone.utc) - timedelta(days=365))
+        max_drawdown = max([d["drawdown"] for d in self._with_drawdown(points)], default=0)
         
         return {
             "sharpe_ratio": round(sharpe_ratio, 2),
@@ -624,21 +592,26 @@ class PortfolioService:
         Returns:
             Drawdown curve data
         """
-        equity_curve = await self.get_equity_curve(user_id, days=days)
+        # Deepest drawdown of each day, from the finest tier still kept
+        points = await self._equity_points(user_id, "1m", datetime.now(timezone.utc) - timedelta(days=days))
+        daily: Dict[str, float] = {}
+        for point in self._with_drawdown(points):
+            day = point["timestamp"][:10]  # Extract date only
+            daily[day] = max(daily.get(day, 0.0), point["drawdown"])
         
         # Calculate underwater days
         drawdown_data = []
         underwater_days = 0
         
-        for point in equity_curve:
-            if point["drawdown"] > 0:
+        for day, drawdown in daily.items():
+            if drawdown > 0:
                 underwater_days += 1
             else:
                 underwater_days = 0
             
             drawdown_data.append({
-                "date": point["timestamp"][:10],  # Extract date only
-                "drawdown_pct": point["drawdown"],
+                "date": day,
+                "drawdown_pct": drawdown,
                 "underwater_days": underwater_days
             })
         
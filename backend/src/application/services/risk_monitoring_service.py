@@ -6,8 +6,8 @@ Mục đích:
 - Quản lý risk limits và alerts khẩn cấp.
 
 Liên quan đến file nào:
-- Sử dụng models từ trading/infrastructure/persistence/models/core_models.py (RiskLimitModel, etc.).
-- Sử dụng enums từ trading/domain/ (BotStatus, PositionSide).
+- Sử dụng models từ trading/infrastructure/persistence/models/ (RiskLimitModel, etc.).
+- Sử dụng enums từ trading/domain/ (BotStatus).
 - Khi gặp bug: Kiểm tra calculations với Decimal, verify DB queries, hoặc log trong shared/exceptions/.
 """
 
@@ -26,11 +26,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_, desc, update
 from sqlalchemy.orm import selectinload
 
-from trading.infrastructure.persistence.models.core_models import (
+from trading.infrastructure.persistence.models import (
     BotModel, PositionModel, UserModel, RiskLimitModel, RiskAlertModel
 )
-from trading.domain.bot.enums import BotStatus
-from trading.domain.portfolio.enums import PositionSide
+from trading.infrastructure.persistence.sqlalchemy.repositories.risk.risk_limit_repository import (
+    SqlAlchemyRiskLimitRepository
+)
+from trading.domain.bot import BotStatus
 
 
 class RiskStatus(str, Enum):
@@ -166,6 +168,7 @@ class RiskMonitoringService:
         # Calculate exposure for each asset
         exposure_breakdown = []
         total_portfolio_value = await self._get_portfolio_value(user_id)
+        exposure_limits = await self._get_asset_exposure_limits(user_id) if asset_exposure else {}
         
         for asset, asset_positions in asset_exposure.items():
             exposure_value = sum(
@@ -175,8 +178,8 @@ class RiskMonitoringService:
             
             exposure_pct = (exposure_value / total_portfolio_value * 100) if total_portfolio_value > 0 else 0
             
-            # Get asset exposure limit (default 25%)
-            exposure_limit = await self._get_asset_exposure_limit(user_id, asset)
+            # Asset exposure limit (default 25%)
+            exposure_limit = exposure_limits.get(asset.lower(), 25.0)
             
             # Determine risk status
             status = self._determine_exposure_status(exposure_pct, exposure_limit)
@@ -499,26 +502,14 @@ class RiskMonitoringService:
         # Simplified - would calculate from actual balance + positions value
         return 10000.0  # Placeholder
     
-    async def _get_asset_exposure_limit(self, user_id: int, asset: str) -> float:
-        """Get exposure limit for specific asset."""
-        # Check if user has custom limit for this asset
-        stmt = (
-            select(RiskLimitModel)
-            .where(
-                and_(
-                    RiskLimitModel.user_id == user_id,
-                    RiskLimitModel.limit_type == f"exposure_{asset.lower()}"
-                )
-            )
-        )
-        result = await self.db.execute(stmt)
-        limit = result.scalars().first()
-        
-        if limit and limit.max_value:
-            return float(limit.max_value)
-        
-        # Default asset exposure limit
-        return 25.0  # 25% default
+    async def _get_asset_exposure_limits(self, user_id: int) -> Dict[str, float]:
+        """Get the user's custom per-asset exposure limits, keyed by lowercase asset."""
+        limits = await SqlAlchemyRiskLimitRepository(self.db).find_exposure_limits_by_user(user_id)
+        # Same base asset extraction as the breakdown (BTC/USDT -> btc)
+        return {
+            symbol.split('/')[0].lower(): float(limit_value)
+            for symbol, limit_value in limits.items()
+        }
     
     def _determine_exposure_status(self, current_pct: float, limit_pct: float) -> RiskStatus:
         """Determine risk status based on exposure percentage."""
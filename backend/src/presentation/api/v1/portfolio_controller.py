@@ -139,9 +139,13 @@ async def get_equity_curve(
     Query Params:
         - days: Number of days (1-365, default 30)
     
+    Points come from equity snapshots: per minute for 1 day, hourly up to
+    31 days, daily beyond.
+    
     Returns list of equity points:
         - timestamp: Timestamp
         - equity: Equity value
+        - unrealized_pnl: Unrealized P&L at that time
         - drawdown: Drawdown percentage
     """
     user_id = str(current_user.id)
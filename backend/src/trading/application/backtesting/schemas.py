@@ -2,7 +2,7 @@
 
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 from uuid import UUID
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 import dataclasses
@@ -98,6 +98,10 @@ class BacktestConfigRequest(BaseModel):
         default="neutral",
         description="Conflict Resolution (TP/SL): neutral (SL first) | optimistic (TP first) | realistic (based on open)"
     )
+    intrabar_mode: Literal["off", "trades"] = Field(
+        default="off",
+        description="Intrabar exits: off (1m bars only) | trades (replay captured aggTrades in minutes that touch SL/TP)"
+    )
     
     # Spec-required Phase 2: Multi-timeframe settings
     # Spec-required Phase 2: data_timeframe is always 1m (hardcoded), only signal_timeframe is configurable
@@ -58,6 +58,7 @@ class RunBacktestUseCase:
         Returns:
             BacktestRun entity with execution tracking
         """
+        from ...infrastructure.jobs.job_queue import backtest_tag
         
         # Load existing or create new backtest run
         if backtest_run_id:
@@ -108,6 +109,7 @@ class RunBacktestUseCase:
                 max_wait_seconds=600,  # 10 minutes max wait
                 poll_interval_seconds=5,  # Check every 5 seconds
                 progress_callback=data_fetch_progress_callback,  # Pass progress callback
+                job_tags=[backtest_tag(backtest_run.id)],
             )
             
             if not candles or len(candles) == 0:
@@ -119,6 +121,14 @@ class RunBacktestUseCase:
             
             logger.info(f"Fetched {len(candles)} candles for backtest")
             
+            intrabar_path = None
+            if config.intrabar_mode == "trades":
+                from ...infrastructure.backtesting.intrabar import load_trade_path
+                intrabar_path = await load_trade_path(symbol, start_date, end_date)
+                if not len(intrabar_path):
+                    logger.warning(f"No captured trades for {symbol} in range, intrabar mode falls back to 1m bars")
+                    intrabar_path = None
+            
             # Create engine
             engine = BacktestEngine(
                 config=config,
@@ -131,6 +141,7 @@ class RunBacktestUseCase:
                     market_fill_policy=config.market_fill_policy,
                     limit_fill_policy=config.limit_fill_policy,
                 ),
+                intrabar_path=intrabar_path,
             )
             
             # Progress callback for backtest engine (scales 0-100% to 80-100% overall)
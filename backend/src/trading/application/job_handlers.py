@@ -1,35 +1,36 @@
 """Register background job handlers."""
 
 import logging
+from ..infrastructure.jobs.job_worker import JobWorker
 from ..infrastructure.jobs.fetch_missing_candles_job import FetchMissingCandlesJobV2
 
 logger = logging.getLogger(__name__)
 
 
-async def register_job_handlers(
-    binance_adapter,
-    candle_repository
+def register_job_handlers(
+    binance_adapter=None,
+    candle_repository=None
 ):
     """
-    Register all background job handlers.
+    Register job handlers that need constructed dependencies.
     
-    Call this during application startup.
+    Call this in every process that runs a ``JobWorker`` (the API
+    lifespan and the standalone worker); ``@job_handler`` tasks register
+    themselves on import.
     """
-    # Create job handler instance
+    if binance_adapter is None:
+        from ..infrastructure.exchange.binance_adapter import BinanceAdapter
+        # Public adapter for background fetching (empty keys for public API)
+        binance_adapter = BinanceAdapter(api_key="", api_secret="")
+    
     fetch_candles_job = FetchMissingCandlesJobV2(
         adapter=binance_adapter,
         candle_repo=candle_repository
     )
     
-    # Register handler
     JobWorker.register_handler(
         'fetch_missing_candles',
         fetch_candles_job.execute
     )
     
     logger.info("Registered fetch_missing_candles job handler")
-    
-    # Start job worker if not already running
-    if not job_worker._running:
-        await job_worker.start()
-        logger.info("Job worker started")
@@ -13,15 +13,15 @@ import uuid
 from typing import Dict, Optional, Any
 from datetime import datetime, timezone
 
-from src.trading.domain.bot import Bot, BotStatus
-from src.trading.domain.exchange import ExchangeType
-from src.trading.infrastructure.execution.bot_engine import BotEngine
-from src.trading.infrastructure.exchange.exchange_gateway import ExchangeGateway
-from src.trading.infrastructure.exchange.binance_adapter import BinanceAdapter
-from src.trading.infrastructure.persistence.repositories.bot_repository import BotRepository
-from src.trading.infrastructure.repositories.exchange_repository import ExchangeRepository
-from src.trading.strategies.registry import registry as strategy_registry
-from src.trading.strategies.base import StrategyBase
+from ...domain.bot import Bot, BotStatus
+from ...domain.exchange import ExchangeType
+from ...infrastructure.execution.bot_engine import BotEngine
+from ...infrastructure.exchange.exchange_gateway import ExchangeGateway
+from ...infrastructure.exchange.binance_adapter import BinanceAdapter
+from ...infrastructure.persistence.repositories.bot_repository import BotRepository
+from ...infrastructure.repositories.exchange_repository import ExchangeRepository
+from ...strategies.registry import registry as strategy_registry
+from ...strategies.base import StrategyBase
 
 logger = logging.getLogger(__name__)
 
@@ -296,8 +296,8 @@ class BotManager:
         """
         try:
             # Fetch strategy from database to get its name
-            from src.trading.infrastructure.persistence.repositories.bot_repository import StrategyRepository
-            strategy_repo = StrategyRepository(session)
+            from ...infrastructure.persistence.repositories.bot_repository import CachedStrategyRepository
+            strategy_repo = CachedStrategyRepository(session)
             strategy_entity = await strategy_repo.find_by_id(bot.strategy_id)
             
             if not strategy_entity:
@@ -1,137 +1,225 @@
-"""Bot Stats Service - Updates bot statistics on trade close events."""
+"""Bot Stats Service - Maintains bot statistics incrementally on trade close."""
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func, case
 import logging
 import uuid
 
 from ...infrastructure.persistence.models.bot_models import BotModel
+from ...infrastructure.persistence.models.trading_models import TradeModel
 
 
-
-print("DEBUG: BotStatsService module LOADED (patched version)")
 logger = logging.getLogger(__name__)
 
+# Bot columns derived from the bot's trades
+STAT_FIELDS = (
+    "total_trades",
+    "total_pnl",
+    "winning_trades",
+    "losing_trades",
+    "current_win_streak",
+    "current_loss_streak",
+    "max_win_streak",
+    "max_loss_streak",
+)
+
+
+def apply_trade(stats: Dict[str, Any], pnl: Optional[Decimal]) -> Dict[str, Any]:
+    """
+    Fold one closed trade into a bot's stats.
+    
+    Matches the aggregate definition used by reconciliation: every trade
+    counts towards total_trades, P&L > 0 is a win, P&L <= 0 a loss, and a
+    trade without P&L breaks a win streak without counting as a loss.
+    """
+    new = {field: stats.get(field) or 0 for field in STAT_FIELDS}
+    new["total_trades"] += 1
+    
+    if pnl is not None:
+        new["total_pnl"] = Decimal(str(new["total_pnl"])) + pnl
+    
+    if pnl is not None and pnl > 0:
+        new["winning_trades"] += 1
+        new["current_win_streak"] += 1
+        new["current_loss_streak"] = 0
+        new["max_win_streak"] = max(new["max_win_streak"], new["current_win_streak"])
+    else:
+        if pnl is not None:
+            new["losing_trades"] += 1
+        new["current_loss_streak"] += 1
+        new["current_win_streak"] = 0
+        new["max_loss_streak"] = max(new["max_loss_streak"], new["current_loss_streak"])
+    
+    return new
 
 
 class BotStatsService:
     """
-    Service to update bot cumulative statistics on trade close.
+    Service to maintain bot cumulative statistics.
     
-    Called when a position is closed (PositionClosedEvent).
-    Updates:
+    Each closed trade is folded into the bot row in O(1) (``apply_trade``).
+    The write is a compare-and-set on ``stats_version``, retried on
+    conflict, so concurrent closes for one bot never lose an update.
+    ``reconcile`` recomputes from the trades table and repairs any drift;
+    it runs as a periodic background job. Reads never recompute.
+    
+    Maintains:
         - total_pnl
         - total_trades
         - winning_trades / losing_trades
         - win/loss streaks
     """
     
+    MAX_CAS_RETRIES = 5
+    
     def __init__(self, session: AsyncSession):
         self._session = session
     
     async def update_stats_on_trade_close(
         self, 
         bot_id: str, 
-        realized_pnl: Decimal
+        realized_pnl: Optional[Decimal],
+        commit: bool = True,
     ) -> bool:
         """
-        Update bot stats when a trade (position) is closed.
+        Fold one closed trade into the bot's stats.
+        
+        Must be called exactly once per trade row (TradeRepository.create
+        does so in the same transaction as the insert).
         
         Args:
             bot_id: Bot UUID as string
             realized_pnl: Realized P&L from the closed trade
+            commit: Commit the session after a successful update
             
         Returns:
             True if update was successful, False otherwise
         """
         try:
-            # Find bot
-            bot_uuid = uuid.UUID(bot_id)
-            result = await self._session.execute(
-                select(BotModel).where(BotModel.id == bot_uuid)
-            )
-            bot = result.scalar_one_or_none()
-            
-            if not bot:
-                logger.warning(f"Bot not found for stats update: {bot_id}")
-                return False
+            bot_uuid = uuid.UUID(str(bot_id))
             
-            # Determine if trade is winning or losing
-            is_winning = realized_pnl > 0
-            
-            # --- SELF-HEALING: Recalculate from Trade History ---
-            # Instead of incrementing, we re-aggregate to ensure consistency
-            from ...infrastructure.persistence.models.trading_models import TradeModel
-            from sqlalchemy import func, case
-            
-            stats_stmt = select(
-                func.count(TradeModel.id).label("total_trades"),
-                func.sum(TradeModel.pnl).label("total_pnl"),
-                func.sum(case((TradeModel.pnl > 0, 1), else_=0)).label("winning_trades"),
-                func.sum(case((TradeModel.pnl <= 0, 1), else_=0)).label("losing_trades")
-            ).where(TradeModel.bot_id == bot_uuid)
+            for _ in range(self.MAX_CAS_RETRIES):
+                current = await self._load_stats(bot_uuid)
+                if current is None:
+                    logger.warning(f"Bot not found for stats update: {bot_id}")
+                    return False
+                
+                version = current.pop("stats_version") or 0
+                if await self._compare_and_set(bot_uuid, version, apply_trade(current, realized_pnl)):
+                    if commit:
+                        await self._session.commit()
+                    return True
             
-            stats_result = await self._session.execute(stats_stmt)
-            stats_row = stats_result.one()
+            logger.warning(f"Bot stats update for {bot_id} lost {self.MAX_CAS_RETRIES} races, leaving it to reconciliation")
+            return False
             
-            # Update cumulative stats with REAL values from DB
-            bot.total_trades = stats_row.total_trades or 0
-            bot.total_pnl = stats_row.total_pnl or Decimal("0")
-            bot.winning_trades = stats_row.winning_trades or 0
-            bot.losing_trades = stats_row.losing_trades or 0
+        except Exception as e:
+            logger.error(f"Failed to update bot stats for {bot_id}: {e}")
+            return False
+    
+    async def recalculate_stats(self, bot_id: str, commit: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Recompute a bot's stats from its full trade history and store them.
+        
+        O(trades of the bot); used by reconciliation, not on the request path.
+        Returns the stored stats, or None if the bot does not exist.
+        """
+        bot_uuid = uuid.UUID(str(bot_id))
+        
+        for _ in range(self.MAX_CAS_RETRIES):
+            current = await self._load_stats(bot_uuid)
+            if current is None:
+                return None
             
-            # --- CALCULATE STREAKS FROM TRADE HISTORY ---
-            # Get all trades ordered by execution time to calculate accurate streaks
             trades_stmt = select(TradeModel.pnl).where(
                 TradeModel.bot_id == bot_uuid
             ).order_by(TradeModel.executed_at.asc())
+            pnls = (await self._session.execute(trades_stmt)).scalars().all()
             
-            trades_result = await self._session.execute(trades_stmt)
-            all_trades = trades_result.scalars().all()
-            
-            # Calculate current and max streaks from trade history
-            current_win_streak = 0
-            current_loss_streak = 0
-            max_win_streak = 0
-            max_loss_streak = 0
-            
-            for pnl in all_trades:
-                if pnl and pnl > 0:
-                    # Winning trade
-                    current_win_streak += 1
-                    current_loss_streak = 0
-                    if current_win_streak > max_win_streak:
-                        max_win_streak = current_win_streak
-                else:
-                    # Losing trade (including zero)
-                    current_loss_streak += 1
-                    current_win_streak = 0
-                    if current_loss_streak > max_loss_streak:
-                        max_loss_streak = current_loss_streak
-            
-            # Update bot with calculated streaks
-            bot.current_win_streak = current_win_streak
-            bot.current_loss_streak = current_loss_streak
-            bot.max_win_streak = max_win_streak
-            bot.max_loss_streak = max_loss_streak
-            
-            # Flush changes
-            await self._session.commit()
+            stats = {field: 0 for field in STAT_FIELDS}
+            stats["total_pnl"] = Decimal("0")
+            for pnl in pnls:
+                stats = apply_trade(stats, pnl)
             
-            logger.info(
-                f"Updated bot stats for {bot_id} (Recalculated): "
-                f"total_pnl={bot.total_pnl}, "
-                f"total_trades={bot.total_trades}, "
-                f"win_rate={self._calculate_win_rate(bot.winning_trades, bot.total_trades)}%, "
-                f"streak={current_win_streak}W/{current_loss_streak}L"
+            if await self._compare_and_set(bot_uuid, current["stats_version"] or 0, stats):
+                if commit:
+                    await self._session.commit()
+                return stats
+        
+        logger.warning(f"Bot stats recalculation for {bot_id} kept conflicting, will retry next run")
+        return None
+    
+    async def reconcile(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Detect and repair drift between bot rows and the trades table.
+        
+        Counters and P&L of every bot are checked with one grouped query;
+        only drifted bots have their history replayed. ``full`` also
+        replays bots whose counters agree, to repair streaks (e.g. after
+        trades were recorded out of execution order).
+        """
+        totals_stmt = select(
+            TradeModel.bot_id,
+            func.count(TradeModel.id).label("total_trades"),
+            func.coalesce(func.sum(TradeModel.pnl), 0).label("total_pnl"),
+            func.coalesce(func.sum(case((TradeModel.pnl > 0, 1), else_=0)), 0).label("winning_trades"),
+            func.coalesce(func.sum(case((TradeModel.pnl <= 0, 1), else_=0)), 0).label("losing_trades"),
+        ).where(TradeModel.bot_id.is_not(None)).group_by(TradeModel.bot_id)
+        expected = {row.bot_id: row for row in (await self._session.execute(totals_stmt)).all()}
+        
+        bots_stmt = select(
+            BotModel.id,
+            BotModel.total_trades,
+            BotModel.total_pnl,
+            BotModel.winning_trades,
+            BotModel.losing_trades,
+        ).where(BotModel.deleted_at.is_(None))
+        bots = (await self._session.execute(bots_stmt)).all()
+        
+        drifted: List[str] = []
+        for bot in bots:
+            truth = expected.get(bot.id)
+            actual = (
+                bot.total_trades or 0,
+                Decimal(str(bot.total_pnl or 0)),
+                bot.winning_trades or 0,
+                bot.losing_trades or 0,
             )
+            wanted = (
+                int(truth.total_trades),
+                Decimal(str(truth.total_pnl)),
+                int(truth.winning_trades),
+                int(truth.losing_trades),
+            ) if truth else (0, Decimal("0"), 0, 0)
             
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to update bot stats for {bot_id}: {e}")
-            return False
+            if full or actual != wanted:
+                if actual != wanted:
+                    logger.warning(f"Bot stats drift for {bot.id}: stored={actual} expected={wanted}")
+                    drifted.append(str(bot.id))
+                await self.recalculate_stats(str(bot.id), commit=False)
+        
+        await self._session.commit()
+        return {"bots_checked": len(bots), "drifted": drifted}
+    
+    async def _load_stats(self, bot_uuid: uuid.UUID) -> Optional[Dict[str, Any]]:
+        """Current stats and version of a bot (read fresh, not from the identity map)."""
+        stmt = select(
+            BotModel.stats_version,
+            *(getattr(BotModel, field) for field in STAT_FIELDS),
+        ).where(BotModel.id == bot_uuid)
+        row = (await self._session.execute(stmt)).one_or_none()
+        return dict(row._mapping) if row is not None else None
+    
+    async def _compare_and_set(self, bot_uuid: uuid.UUID, version: int, stats: Dict[str, Any]) -> bool:
+        """Write stats only if nobody else has since ``version``."""
+        stmt = (
+            update(BotModel)
+            .where(BotModel.id == bot_uuid, BotModel.stats_version == version)
+            .values(stats_version=version + 1, **stats)
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount == 1
     
     def _calculate_win_rate(self, winning_trades: int, total_trades: int) -> float:
         """Calculate win rate as percentage (0-100)."""
@@ -148,7 +236,9 @@ class BotStatsService:
         try:
             bot_uuid = uuid.UUID(bot_id)
             result = await self._session.execute(
-                select(BotModel).where(BotModel.id == bot_uuid)
+                select(BotModel)
+                .where(BotModel.id == bot_uuid)
+                .execution_options(populate_existing=True)
             )
             bot = result.scalar_one_or_none()
             
@@ -186,66 +276,47 @@ class BotStatsService:
         - losses: Number of losing trades (P&L <= 0)
         
         Periods: today, yesterday, this_week, last_week, this_month, last_month
+        
+        Every period is a run of whole UTC days, so all six are summed from
+        one read of at most ~62 ``bot_daily_pnl`` rows.
         """
         from datetime import datetime, timedelta
-        from sqlalchemy import func, case, and_
-        from ...infrastructure.persistence.models.trading_models import TradeModel
+        from ...infrastructure.persistence.repositories.daily_pnl_repository import DailyPnlRepository
         
         try:
             bot_uuid = uuid.UUID(bot_id)
             
-            # Get current date boundaries (using UTC for consistency)
-            now = datetime.utcnow()
-            today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            yesterday_start = today_start - timedelta(days=1)
-            
-            # Week boundaries (Monday = 0)
-            days_since_monday = now.weekday()
-            this_week_start = today_start - timedelta(days=days_since_monday)
+            # Day boundaries (UTC); end is exclusive
+            today = datetime.utcnow().date()
+            tomorrow = today + timedelta(days=1)
+            this_week_start = today - timedelta(days=today.weekday())  # Monday
             last_week_start = this_week_start - timedelta(days=7)
-            last_week_end = this_week_start
-            
-            # Month boundaries
-            this_month_start = today_start.replace(day=1)
-            # Last month: go back to first of current month, then subtract 1 day to get last month, then get first of that month
-            last_month_end = this_month_start
+            this_month_start = today.replace(day=1)
             last_month_start = (this_month_start - timedelta(days=1)).replace(day=1)
             
-            # Define period boundaries
             periods = {
-                "today": (today_start, now),
-                "yesterday": (yesterday_start, today_start),
-                "this_week": (this_week_start, now),
-                "last_week": (last_week_start, last_week_end),
-                "this_month": (this_month_start, now),
-                "last_month": (last_month_start, last_month_end),
+                "today": (today, tomorrow),
+                "yesterday": (today - timedelta(days=1), today),
+                "this_week": (this_week_start, tomorrow),
+                "last_week": (last_week_start, this_week_start),
+                "this_month": (this_month_start, tomorrow),
+                "last_month": (last_month_start, this_month_start),
             }
             
-            result = {}
+            days = await DailyPnlRepository(self._session).get_days(
+                start=min(start for start, _ in periods.values()),
+                end=today,
+                bot_id=bot_uuid,
+            )
             
-            for period_name, (start_time, end_time) in periods.items():
-                # Query trades for this period
-                stmt = select(
-                    func.coalesce(func.sum(TradeModel.pnl), 0).label("total_pnl"),
-                    func.count(TradeModel.id).label("total_trades"),
-                    func.coalesce(func.sum(case((TradeModel.pnl > 0, 1), else_=0)), 0).label("wins"),
-                    func.coalesce(func.sum(case((TradeModel.pnl <= 0, 1), else_=0)), 0).label("losses"),
-                ).where(
-                    and_(
-                        TradeModel.bot_id == bot_uuid,
-                        TradeModel.executed_at >= start_time,
-                        TradeModel.executed_at < end_time,
-                    )
-                )
-                
-                query_result = await self._session.execute(stmt)
-                row = query_result.one()
-                
+            result = {}
+            for period_name, (start_day, end_day) in periods.items():
+                rows = [row for row in days if start_day <= row["day"] < end_day]
                 result[period_name] = {
-                    "pnl": float(row.total_pnl or 0),
-                    "trades": int(row.total_trades or 0),
-                    "wins": int(row.wins or 0),
-                    "losses": int(row.losses or 0),
+                    "pnl": float(sum((row["pnl"] for row in rows), Decimal("0"))),
+                    "trades": sum(row["trades"] for row in rows),
+                    "wins": sum(row["wins"] for row in rows),
+                    "losses": sum(row["losses"] + row["breakeven"] for row in rows),
                 }
             
             logger.debug(f"Period stats for bot {bot_id}: {result}")
@@ -254,4 +325,36 @@ class BotStatsService:
         except Exception as e:
             logger.error(f"Failed to get period stats for {bot_id}: {e}")
             return None
-
+    
+    async def get_daily_stats(self, bot_id: str, user_id: str, days: int = 90) -> Optional[List[dict]]:
+        """
+        Get per-day P&L for calendars and heatmaps (days with trades only).
+        
+        Scoped to ``user_id`` so a bot id alone does not expose another
+        user's results.
+        """
+        from datetime import datetime, timedelta
+        from ...infrastructure.persistence.repositories.daily_pnl_repository import DailyPnlRepository
+        
+        try:
+            today = datetime.utcnow().date()
+            rows = await DailyPnlRepository(self._session).get_days(
+                start=today - timedelta(days=days - 1),
+                end=today,
+                bot_id=uuid.UUID(bot_id),
+                user_id=uuid.UUID(str(user_id)),
+            )
+            return [
+                {
+                    "date": row["day"].isoformat(),
+                    "pnl": float(row["pnl"]),
+                    "trades": row["trades"],
+                    "wins": row["wins"],
+                    "losses": row["losses"] + row["breakeven"],
+                }
+                for row in rows
+            ]
+            
+        except Exception as e:
+            logger.error(f"Failed to get daily stats for {bot_id}: {e}")
+            return None
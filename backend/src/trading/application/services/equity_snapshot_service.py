@@ -0,0 +1,198 @@
+"""
+Equity Snapshot Service - periodic account equity snapshots per user.
+
+Equity is computed for every user with bots or open positions in three
+set-based queries plus one price cache lookup per traded symbol, and
+written as ``1m`` rows of the ``equity_snapshots`` time series.
+"""
+from collections import defaultdict
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+import logging
+
+from sqlalchemy import select, func, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...infrastructure.cache.price_cache import PriceCache, price_cache
+from ...infrastructure.persistence.models.bot_models import BotModel, BotDailyPnlModel
+from ...infrastructure.persistence.models.trading_models import PositionModel
+from ...infrastructure.persistence.repositories.equity_snapshot_repository import (
+    EquitySnapshotRepository,
+    RESOLUTIONS,
+    bucket_start,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def position_unrealized_pnl(side: str, entry_price: Decimal, quantity: Decimal, price: Decimal) -> Decimal:
+    """Unrealized P&L of a position at price."""
+    quantity = abs(quantity)
+    if side == "SHORT":
+        return (entry_price - price) * quantity
+    return (price - entry_price) * quantity
+
+
+class EquitySnapshotService:
+    """Compute and record account equity for all users.
+
+    balance = capital allocated to bots + realized P&L (daily rollup)
+    equity  = balance + unrealized P&L of open positions
+
+    Unrealized P&L is marked at the cached last price of each symbol and
+    falls back to the position's stored value when no price is cached.
+    """
+
+    def __init__(self, session: AsyncSession, prices: Optional[PriceCache] = None):
+        self._session = session
+        self._prices = prices or price_cache
+        self._repository = EquitySnapshotRepository(session)
+
+    async def allocated_capital(self, user_id: Optional[Any] = None) -> Dict[Any, Decimal]:
+        """Capital allocated to bots per user (one user if given)."""
+        zero = Decimal("0")
+        capital: Dict[Any, Decimal] = defaultdict(lambda: zero)
+        stmt = select(BotModel.user_id, BotModel.configuration).where(BotModel.deleted_at.is_(None))
+        if user_id is not None:
+            stmt = stmt.where(BotModel.user_id == user_id)
+        bots = await self._session.execute(stmt)
+        for bot_user_id, configuration in bots.all():
+            # Same allocation rule as the portfolio summary
+            if configuration and "quote_quantity" in configuration:
+                capital[bot_user_id] += Decimal(str(configuration["quote_quantity"]))
+        return capital
+
+    async def collect(self) -> List[Dict[str, Any]]:
+        """Current equity, balance, unrealized P&L and margin per user."""
+        zero = Decimal("0")
+        capital = await self.allocated_capital()
+        realized: Dict[Any, Decimal] = defaultdict(lambda: zero)
+        unrealized: Dict[Any, Decimal] = defaultdict(lambda: zero)
+        margin: Dict[Any, Decimal] = defaultdict(lambda: zero)
+
+        pnl = await self._session.execute(
+            select(BotDailyPnlModel.user_id, func.sum(BotDailyPnlModel.pnl))
+            .group_by(BotDailyPnlModel.user_id)
+        )
+        for user_id, total in pnl.all():
+            realized[user_id] = total or zero
+
+        positions = (await self._session.execute(
+            select(
+                PositionModel.user_id,
+                PositionModel.symbol,
+                PositionModel.side,
+                PositionModel.entry_price,
+                PositionModel.quantity,
+                PositionModel.unrealized_pnl,
+                PositionModel.margin_used,
+            ).where(
+                and_(
+                    PositionModel.status == "OPEN",
+                    PositionModel.deleted_at.is_(None),
+                )
+            )
+        )).all()
+
+        prices = await self._prices.get_current_prices(sorted({position.symbol for position in positions}))
+        for position in positions:
+            quote = prices.get(position.symbol)
+            if quote and quote.get("price"):
+                unrealized[position.user_id] += position_unrealized_pnl(
+                    position.side,
+                    position.entry_price,
+                    position.quantity,
+                    Decimal(str(quote["price"])),
+                )
+            else:
+                unrealized[position.user_id] += position.unrealized_pnl or zero
+            margin[position.user_id] += position.margin_used or zero
+
+        snapshots = []
+        for user_id in set(capital) | set(realized) | set(unrealized):
+            balance = capital[user_id] + realized[user_id]
+            snapshots.append({
+                "user_id": user_id,
+                "equity": balance + unrealized[user_id],
+                "balance": balance,
+                "unrealized_pnl": unrealized[user_id],
+                "margin_used": margin[user_id],
+            })
+        return snapshots
+
+    async def snapshot(self, now: Optional[datetime] = None) -> int:
+        """Record a ``1m`` snapshot for every user; returns users recorded.
+
+        Users seen for the first time get their history before this
+        snapshot ``backfill``ed in the same transaction, so readers never
+        have to.
+        """
+        now = now or datetime.now(timezone.utc)
+        snapshots = await self.collect()
+        new_users = await self._repository.without_points([snapshot["user_id"] for snapshot in snapshots])
+        recorded = await self._repository.record(snapshots, now)
+        for user_id in new_users:
+            await self.backfill(user_id)
+        await self._session.commit()
+        return recorded
+
+    async def backfill(self, user_id: Any) -> int:
+        """Write ``1d`` rows from the daily P&L rollup for days before the user's first snapshot.
+
+        Users that predate the snapshotter otherwise have no curve. Balance
+        follows the snapshot rule (current allocated capital + realized P&L
+        to date); unrealized P&L of those days is unknown and left at 0.
+        Returns the rows written; the caller commits.
+        """
+        zero = Decimal("0")
+        first = await self._repository.first_timestamp(user_id)
+        first_day = bucket_start(first, "1d") if first is not None else None
+        capital = (await self.allocated_capital(user_id)).get(user_id, zero)
+
+        days = await self._session.execute(
+            select(BotDailyPnlModel.day, func.sum(BotDailyPnlModel.pnl))
+            .where(BotDailyPnlModel.user_id == user_id)
+            .group_by(BotDailyPnlModel.day)
+            .order_by(BotDailyPnlModel.day)
+        )
+        realized = zero
+        snapshots = []
+        for day, pnl in days.all():
+            ts = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+            if first_day is not None and ts >= first_day:
+                break
+            realized += pnl or zero
+            balance = capital + realized
+            snapshots.append({
+                "user_id": user_id,
+                "ts": ts,
+                "equity": balance,
+                "balance": balance,
+                "unrealized_pnl": zero,
+                "margin_used": zero,
+            })
+        return await self._repository.insert_missing(snapshots, "1d")
+
+    async def downsample(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Rebuild ``1h``/``1d`` buckets since the last one written and apply retention.
+
+        Starting from the last written bucket (itself rebuilt, it may have
+        been partial) catches up on buckets missed while the job was not
+        running; the previous bucket is always refreshed so its last
+        minutes are folded in.
+        """
+        now = now or datetime.now(timezone.utc)
+        result = {}
+        # Coarse tiers are built in order, each from the one below
+        for resolution in ("1h", "1d"):
+            since = now - RESOLUTIONS[resolution]
+            last = await self._repository.last_bucket(resolution)
+            if last is None:
+                since = None  # first run: everything the source tier still holds
+            elif last < since:
+                since = last
+            result[resolution] = await self._repository.downsample(resolution, since)
+        result["purged"] = await self._repository.purge_expired(now)
+        await self._session.commit()
+        return result
@@ -4,6 +4,8 @@ from typing import Dict, Any, Optional
 import logging
 from dataclasses import dataclass
 
+from ...infrastructure.exchange.symbol_registry import SymbolFilters, SymbolRegistry, symbol_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,70 +17,50 @@ class SymbolInfo:
     quantity_precision: int
     price_precision: int
     min_notional: Decimal  # Minimum order value (price * quantity)
+    filters: Optional[SymbolFilters] = None  # Step/tick quantizers when known
+
+
+def _exchange_of(exchange_client) -> str:
+    """Registry key of a client: its API base URL, else its class."""
+    return getattr(exchange_client, 'base_url', None) or exchange_client.__class__.__name__
 
 
 class OrderValidator:
     """
     Service for validating orders against exchange symbol constraints.
     
-    Caches symbol info to avoid repeated API calls.
+    Symbol filters come from the process-wide symbol registry, so every
+    validator shares one indexed copy of each exchange's info.
     """
     
-    def __init__(self):
-        self._symbol_cache: Dict[str, SymbolInfo] = {}
+    def __init__(self, registry: Optional[SymbolRegistry] = None):
+        self._registry = registry or symbol_registry
     
     async def get_symbol_info(self, exchange_client, symbol: str) -> SymbolInfo:
         """
         Get symbol trading constraints from exchange.
-        
-        Caches results to avoid repeated API calls.
         """
-        # Check cache first
-        cache_key = f"{exchange_client.__class__.__name__}_{symbol}"
-        if cache_key in self._symbol_cache:
-            return self._symbol_cache[cache_key]
-        
         try:
-            # Fetch from exchange
-            exchange_info = await exchange_client.get_exchange_info()
-            
-            # Find symbol info
-            symbol_data = next(
-                (s for s in exchange_info.get('symbols', []) if s['symbol'] == symbol),
-                None
-            )
-            
-            if not symbol_data:
-                # Default constraints if symbol not found
-                logger.warning(f"Symbol {symbol} not found in exchange info, using defaults")
-                return self._get_default_symbol_info()
-            
-            # Parse filters
-            filters = {f['filterType']: f for f in symbol_data.get('filters', [])}
-            
-            # Extract constraints
-            lot_size = filters.get('LOT_SIZE', {})
-            price_filter = filters.get('PRICE_FILTER', {})
-            min_notional_filter = filters.get('MIN_NOTIONAL', {})
-            
-            symbol_info = SymbolInfo(
-                min_quantity=Decimal(lot_size.get('minQty', '0.001')),
-                max_quantity=Decimal(lot_size.get('maxQty', '9000')),
-                quantity_precision=symbol_data.get('quantityPrecision', 8),
-                price_precision=symbol_data.get('pricePrecision', 2),
-                min_notional=Decimal(min_notional_filter.get('minNotional', '5')),
+            filters = await self._registry.get(
+                _exchange_of(exchange_client), symbol, exchange_client.get_exchange_info
             )
-            
-            # Cache it
-            self._symbol_cache[cache_key] = symbol_info
-            logger.info(f"Cached symbol info for {symbol}: min_qty={symbol_info.min_quantity}, "
-                       f"price_precision={symbol_info.price_precision}")
-            
-            return symbol_info
-            
         except Exception as e:
             logger.error(f"Failed to fetch symbol info for {symbol}: {e}")
             return self._get_default_symbol_info()
+        
+        if not filters:
+            # Default constraints if symbol not found
+            logger.warning(f"Symbol {symbol} not found in exchange info, using defaults")
+            return self._get_default_symbol_info()
+        
+        return SymbolInfo(
+            min_quantity=filters.min_qty,
+            max_quantity=filters.max_qty,
+            quantity_precision=filters.quantity_precision,
+            price_precision=filters.price_precision,
+            min_notional=filters.min_notional,
+            filters=filters,
+        )
     
     def _get_default_symbol_info(self) -> SymbolInfo:
         """Return sensible defaults when symbol info unavailable."""
@@ -101,9 +83,12 @@ class OrderValidator:
         Raises:
             ValueError: If quantity is below minimum after adjustment
         """
-        # Round to correct precision
-        precision = Decimal('0.1') ** symbol_info.quantity_precision
-        adjusted_qty = quantity.quantize(precision, rounding=ROUND_DOWN)
+        # Round down to the lot step (precision when the step is unknown)
+        if symbol_info.filters:
+            adjusted_qty = symbol_info.filters.round_quantity(quantity)
+        else:
+            precision = Decimal('0.1') ** symbol_info.quantity_precision
+            adjusted_qty = quantity.quantize(precision, rounding=ROUND_DOWN)
         
         # Check minimum
         if adjusted_qty < symbol_info.min_quantity:
@@ -132,9 +117,12 @@ class OrderValidator:
         if price is None:
             return None
         
-        # Round to correct precision
-        precision = Decimal('0.1') ** symbol_info.price_precision
-        adjusted_price = price.quantize(precision, rounding=ROUND_DOWN)
+        # Round down to the tick size (precision when the tick is unknown)
+        if symbol_info.filters:
+            adjusted_price = symbol_info.filters.round_price(price, ROUND_DOWN)
+        else:
+            precision = Decimal('0.1') ** symbol_info.price_precision
+            adjusted_price = price.quantize(precision, rounding=ROUND_DOWN)
         
         if adjusted_price <= 0:
             raise ValueError(f"Price {price} must be positive")
@@ -197,14 +185,6 @@ class OrderValidator:
             'stop_price': adjusted_stop_price,
         }
     
-    def clear_cache(self, symbol: Optional[str] = None):
-        """Clear symbol info cache."""
-        if symbol:
-            # Clear specific symbol
-            self._symbol_cache = {
-                k: v for k, v in self._symbol_cache.items() 
-                if not k.endswith(f"_{symbol}")
-            }
-        else:
-            # Clear all
-            self._symbol_cache.clear()
+    async def clear_cache(self, exchange_client):
+        """Reload the exchange's symbol info on next use (e.g. after a filter rejection)."""
+        await self._registry.invalidate(_exchange_of(exchange_client))
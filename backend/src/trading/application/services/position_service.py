@@ -12,8 +12,8 @@ from trading.infrastructure.persistence.models.trading_models import PositionMod
 from trading.infrastructure.persistence.models.bot_models import BotModel
 from trading.infrastructure.persistence.repositories.bot_repository import BotRepository
 from trading.infrastructure.persistence.repositories.order_repository import OrderRepository
-from src.application.services.connection_service import ConnectionService
-from trading.infrastructure.exchange.binance_adapter import BinanceAdapter
+from application.services.connection_service import ConnectionService
+from trading.infrastructure.exchange.adapter_pool import exchange_adapter_pool
 from trading.domain.order import (
     Order, OrderSide, OrderType, OrderStatus, TimeInForce,
     PositionSide, OrderQuantity, OrderPrice, WorkingType
@@ -38,6 +38,17 @@ class PositionService:
         self.order_repository = order_repository
         self.update_order_status_use_case = update_order_status_use_case
 
+    async def _get_credentials(self, bot: Any) -> Dict[str, Any]:
+        """Get decrypted connection credentials, cached in the adapter pool."""
+        return await exchange_adapter_pool.get_credentials(
+            bot.exchange_connection_id,
+            bot.user_id,
+            lambda: self.connection_service.get_connection_credentials(
+                str(bot.exchange_connection_id),
+                bot.user_id
+            )
+        )
+
     async def get_live_positions(self, bot_id: uuid.UUID) -> Dict[str, Any]:
         """
         Fetch live positions from Exchange, sync to DB, and return.
@@ -57,30 +68,17 @@ class PositionService:
             raise ValueError(f"Bot {bot_id} has no exchange connection")
 
         # 2. Get Credentials
-        creds = await self.connection_service.get_connection_credentials(
-            str(bot.exchange_connection_id), 
-            bot.user_id
-        )
+        creds = await self._get_credentials(bot)
         
         # 3. Fetch from Exchange
         positions_from_exchange = []
         try:
-            # Determine base URL
-            base_url = "https://demo-fapi.binance.com" if creds["is_testnet"] else "https://fapi.binance.com"
-            
-            adapter = BinanceAdapter(
-                api_key=creds["api_key"],
-                api_secret=creds["api_secret"],
-                base_url=base_url,
-                testnet=creds["is_testnet"]
-            )
-            
-            # Fetch account info (positions included)
-            account_info = await asyncio.wait_for(
-                adapter.get_account_info(),
-                timeout=10.0
-            )
-            await adapter.close()
+            # Fetch account info (positions included) on the pooled adapter
+            async with exchange_adapter_pool.lease(bot.exchange_connection_id, creds) as adapter:
+                account_info = await asyncio.wait_for(
+                    adapter.get_account_info(),
+                    timeout=10.0
+                )
             
             # Filter positions for this symbol (Bot usually runs on one symbol)
             # Or if Bot supports multi-symbol, filter by Bot's configuration?
@@ -235,10 +233,7 @@ class PositionService:
             raise ValueError(f"Bot {bot_id} has no exchange connection")
 
         # 2. Get Credentials
-        creds = await self.connection_service.get_connection_credentials(
-            str(bot.exchange_connection_id),
-            bot.user_id
-        )
+        creds = await self._get_credentials(bot)
 
         # 2.5 Force Sync to ensure DB is up to date
         await self.get_live_positions(bot_id)
@@ -311,29 +306,18 @@ class PositionService:
         
         try:
             # 5. Execute on Exchange
-            base_url = "https://demo-fapi.binance.com" if creds["is_testnet"] else "https://fapi.binance.com"
-            adapter = BinanceAdapter(
-                api_key=creds["api_key"],
-                api_secret=creds["api_secret"],
-                base_url=base_url,
-                testnet=creds["is_testnet"]
-            )
-            
-            # NOTE: adapter.create_order expects specific args. 
-            # We use common args mapping.
-            exchange_response = await adapter.create_order(
-                symbol=symbol,
-                side=order_side.value,
-                type=OrderType.MARKET.value,
-                quantity=float(quantity),
-                newClientOrderId=client_order_id, # Passed to Exchange
-                # Hedge Mode params (CamalCase for API)
-                positionSide=position_side.value
-            )
-            
-
-            await adapter.close()
-
+            async with exchange_adapter_pool.lease(bot.exchange_connection_id, creds) as adapter:
+                # NOTE: adapter.create_order expects specific args. 
+                # We use common args mapping.
+                exchange_response = await adapter.create_order(
+                    symbol=symbol,
+                    side=order_side.value,
+                    type=OrderType.MARKET.value,
+                    quantity=float(quantity),
+                    newClientOrderId=client_order_id, # Passed to Exchange
+                    # Hedge Mode params (CamalCase for API)
+                    positionSide=position_side.value
+                )
             
             # 6. Update Order with Exchange Info
             saved_order.exchange_order_id = str(exchange_response.get("orderId"))
@@ -0,0 +1,678 @@
+"""
+Risk Engine - resident, event-driven evaluation of user risk limits.
+
+Positions, enabled limits and the latest mark per symbol live in memory.
+Every fill or mark price updates the affected account's running totals in
+constant time and re-evaluates only the limits that event can move, so
+alerts and ``CriticalRiskBreachEvent``s go out as the event is handled
+instead of on the next poll. ``resync`` reloads everything from the
+database (limit changes, drift repair). Every process has its own engine,
+so each process that feeds it events runs the resync loop itself
+(``start``, called by the Binance user stream service).
+"""
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+import asyncio
+import contextlib
+import logging
+import uuid
+
+from sqlalchemy import select, func, case, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...domain.risk import (
+    AlertType,
+    CriticalRiskBreachEvent,
+    RiskAlert,
+    RiskLimit,
+    RiskLimitType,
+    RiskLimitViolatedEvent,
+    RiskStatus,
+)
+from ...infrastructure.cache.price_cache import PriceCache, price_cache
+from ...infrastructure.persistence.database import get_db_context
+from ...infrastructure.persistence.models.bot_models import BotModel, BotDailyPnlModel
+from ...infrastructure.persistence.models.risk_models import RiskAlertModel
+from ...infrastructure.persistence.models.trading_models import EquitySnapshotModel, PositionModel
+from ...infrastructure.persistence.sqlalchemy.repositories.risk.risk_alert_repository import (
+    SqlAlchemyRiskAlertRepository,
+)
+from ...infrastructure.persistence.sqlalchemy.repositories.risk.risk_limit_repository import (
+    SqlAlchemyRiskLimitRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+ZERO = Decimal("0")
+HUNDRED = Decimal("100")
+
+# Severity order for edge detection
+_LEVELS = {RiskStatus.NORMAL: 0, RiskStatus.WARNING: 1, RiskStatus.CRITICAL: 2, RiskStatus.BREACHED: 3}
+
+# Seconds between resyncs from the database
+RESYNC_INTERVAL = 60.0
+
+# violation_percentage is DECIMAL(6, 2)
+_MAX_PERCENTAGE = Decimal("9999.99")
+
+_ALERT_TYPES = {
+    (RiskLimitType.DAILY_LOSS, False): AlertType.DAILY_LOSS_LIMIT_APPROACHED,
+    (RiskLimitType.DAILY_LOSS, True): AlertType.DAILY_LOSS_LIMIT_EXCEEDED,
+    (RiskLimitType.POSITION_SIZE, False): AlertType.POSITION_LIMIT_APPROACHED,
+    (RiskLimitType.POSITION_SIZE, True): AlertType.POSITION_LIMIT_EXCEEDED,
+    (RiskLimitType.DRAWDOWN, False): AlertType.DRAWDOWN_LIMIT_APPROACHED,
+    (RiskLimitType.DRAWDOWN, True): AlertType.DRAWDOWN_LIMIT_EXCEEDED,
+    (RiskLimitType.LEVERAGE, False): AlertType.LIQUIDATION_WARNING,
+    (RiskLimitType.LEVERAGE, True): AlertType.MARGIN_CALL,
+}
+
+
+LevelKey = Tuple[UUID, Optional[str]]  # limit id, symbol for per-position limits
+
+
+def normalize_symbol(symbol: str) -> str:
+    """Exchange symbol form used as the engine key (BTC/USDT -> BTCUSDT)."""
+    return symbol.replace("/", "").upper()
+
+
+def limit_level(current: Decimal, limit: RiskLimit) -> RiskStatus:
+    """Severity of current against a limit and its warning/critical thresholds."""
+    utilization = current / limit.limit_value * HUNDRED
+    if utilization >= HUNDRED:
+        return RiskStatus.BREACHED
+    if utilization >= limit.threshold.critical_threshold:
+        return RiskStatus.CRITICAL
+    if utilization >= limit.threshold.warning_threshold:
+        return RiskStatus.WARNING
+    return RiskStatus.NORMAL
+
+
+@dataclass
+class PositionState:
+    """Net position in one symbol; quantity is signed (negative = short)."""
+
+    quantity: Decimal
+    entry_price: Decimal
+    mark: Decimal
+    margin_used: Decimal = ZERO
+
+    @property
+    def notional(self) -> Decimal:
+        return abs(self.quantity) * self.mark
+
+    @property
+    def unrealized_pnl(self) -> Decimal:
+        return (self.mark - self.entry_price) * self.quantity
+
+
+@dataclass
+class AccountState:
+    """One user's positions, limits and running totals.
+
+    ``exposure``, ``unrealized_pnl`` and ``margin_used`` are kept equal to
+    the sums over ``positions`` by applying per-position deltas.
+    """
+
+    user_id: UUID
+    balance: Decimal = ZERO
+    realized_today: Decimal = ZERO
+    day: Optional[date] = None
+    peak_equity: Decimal = ZERO
+    positions: Dict[str, PositionState] = field(default_factory=dict)
+    exposure: Decimal = ZERO
+    unrealized_pnl: Decimal = ZERO
+    margin_used: Decimal = ZERO
+    # symbol -> limits; None holds the account-wide limits
+    limits: Dict[Optional[str], List[RiskLimit]] = field(default_factory=lambda: defaultdict(list))
+    # last alerted level per limit
+    levels: Dict[LevelKey, RiskStatus] = field(default_factory=dict)
+
+    @property
+    def equity(self) -> Decimal:
+        return self.balance + self.unrealized_pnl
+
+    def remove(self, symbol: str) -> Optional[PositionState]:
+        position = self.positions.pop(symbol, None)
+        if position is not None:
+            self.exposure -= position.notional
+            self.unrealized_pnl -= position.unrealized_pnl
+            self.margin_used -= position.margin_used
+        return position
+
+    def put(self, symbol: str, position: PositionState) -> None:
+        self.positions[symbol] = position
+        self.exposure += position.notional
+        self.unrealized_pnl += position.unrealized_pnl
+        self.margin_used += position.margin_used
+
+    def roll_day(self, today: date) -> None:
+        if self.day != today:
+            self.day = today
+            self.realized_today = ZERO
+
+
+class RiskEngine:
+    """In-memory risk limit evaluation driven by fills and mark prices.
+
+    Per event only the account-wide limits and the limits of the event's
+    symbol are evaluated. Percentage limits on other symbols follow their
+    own marks and the periodic ``resync``.
+
+    Alerts are edge-triggered: a limit alerts when its level rises
+    (warning -> critical -> breached) and re-arms once it falls back.
+    Listeners receive ``RiskLimitViolatedEvent`` for every alert and
+    ``CriticalRiskBreachEvent`` from the critical level up; alerts are
+    persisted in the background through ``session_factory``.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        prices: Optional[PriceCache] = None,
+    ):
+        self._session_factory = session_factory
+        self._prices = prices or price_cache
+        self._accounts: Dict[UUID, AccountState] = {}
+        self._holders: Dict[str, Set[UUID]] = defaultdict(set)
+        self._marks: Dict[str, Decimal] = {}
+        self._listeners: List[Callable[[Any], None]] = []
+        self._outbox: Deque[RiskAlert] = deque()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._resync_task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # Subscriptions and state access
+    # ------------------------------------------------------------------
+
+    def subscribe(self, listener: Callable[[Any], None]) -> None:
+        """Call listener with every risk domain event the engine emits."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[Any], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def get_account(self, user_id: UUID) -> Optional[AccountState]:
+        return self._accounts.get(user_id)
+
+    @property
+    def pending_alerts(self) -> List[RiskAlert]:
+        """Alerts emitted but not yet persisted."""
+        return list(self._outbox)
+
+    def load_account(
+        self,
+        user_id: UUID,
+        limits: List[RiskLimit],
+        positions: Dict[str, PositionState],
+        balance: Decimal = ZERO,
+        realized_today: Decimal = ZERO,
+        peak_equity: Decimal = ZERO,
+        today: Optional[date] = None,
+        levels: Optional[Dict[LevelKey, RiskStatus]] = None,
+    ) -> AccountState:
+        """Replace one user's state, keeping alert levels and the equity peak.
+
+        levels seeds the alert levels of an account this engine has not
+        loaded yet (the levels already alerted on before a restart).
+        """
+        previous = self._accounts.get(user_id)
+        account = AccountState(
+            user_id=user_id,
+            balance=balance,
+            realized_today=realized_today,
+            day=today or datetime.now(timezone.utc).date(),
+        )
+        for limit in limits:
+            if limit.enabled:
+                account.limits[normalize_symbol(limit.symbol) if limit.symbol else None].append(limit)
+
+        if previous is not None:
+            for symbol in previous.positions:
+                self._holders[symbol].discard(user_id)
+            active = {limit.id for limit in limits}
+            account.levels = {key: level for key, level in previous.levels.items() if key[0] in active}
+            peak_equity = max(peak_equity, previous.peak_equity)
+        elif levels:
+            active = {limit.id for limit in limits}
+            account.levels = {key: level for key, level in levels.items() if key[0] in active}
+
+        for symbol, position in positions.items():
+            symbol = normalize_symbol(symbol)
+            account.put(symbol, position)
+            self._holders[symbol].add(user_id)
+
+        account.peak_equity = max(peak_equity, account.equity)
+        self._accounts[user_id] = account
+        return account
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    def on_fill(
+        self,
+        user_id: UUID,
+        symbol: str,
+        side: str,
+        quantity: Decimal,
+        price: Decimal,
+        fee: Decimal = ZERO,
+        now: Optional[datetime] = None,
+    ) -> List[RiskAlert]:
+        """Apply an execution to the user's net position and check limits."""
+        if quantity <= 0 or price <= 0:
+            return []
+        now = now or datetime.now(timezone.utc)
+        symbol = normalize_symbol(symbol)
+        account = self._accounts.get(user_id)
+        if account is None:
+            account = self.load_account(user_id, [], {}, today=now.date())
+        account.roll_day(now.date())
+
+        signed = quantity if side.upper() in ("BUY", "LONG") else -quantity
+        mark = self._marks.get(symbol, price)
+        position = account.remove(symbol)
+        realized = -fee
+
+        if position is None or position.quantity == 0:
+            position = PositionState(quantity=signed, entry_price=price, mark=mark)
+        elif (position.quantity > 0) == (signed > 0):
+            total = position.quantity + signed
+            if position.margin_used and position.entry_price:
+                # The added quantity is margined at the position's current rate
+                position.margin_used += position.margin_used * price * quantity / (
+                    position.entry_price * abs(position.quantity)
+                )
+            position.entry_price = (
+                position.entry_price * abs(position.quantity) + price * quantity
+            ) / abs(total)
+            position.quantity = total
+        else:
+            closed = min(quantity, abs(position.quantity))
+            direction = 1 if position.quantity > 0 else -1
+            realized += (price - position.entry_price) * closed * direction
+            remaining = position.quantity + signed
+            if remaining != 0 and (remaining > 0) != (position.quantity > 0):
+                # Flipped through flat: the rest opens at the fill price
+                position.entry_price = price
+            if remaining == 0:
+                position.margin_used = ZERO
+            else:
+                position.margin_used = position.margin_used * abs(remaining) / abs(position.quantity)
+            position.quantity = remaining
+
+        account.balance += realized
+        account.realized_today += realized
+
+        if position.quantity == 0:
+            self._holders[symbol].discard(user_id)
+        else:
+            account.put(symbol, position)
+            self._holders[symbol].add(user_id)
+
+        return self._evaluate(account, symbol, now)
+
+    def on_mark_price(self, symbol: str, price: Decimal, now: Optional[datetime] = None) -> List[RiskAlert]:
+        """Re-mark every holder of symbol and check their limits."""
+        if price <= 0:
+            return []
+        now = now or datetime.now(timezone.utc)
+        symbol = normalize_symbol(symbol)
+        self._marks[symbol] = price
+
+        alerts: List[RiskAlert] = []
+        for user_id in tuple(self._holders.get(symbol, ())):
+            account = self._accounts[user_id]
+            position = account.remove(symbol)
+            if position is None:
+                continue
+            position.mark = price
+            account.put(symbol, position)
+            account.roll_day(now.date())
+            alerts.extend(self._evaluate(account, symbol, now))
+        return alerts
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def _current_value(self, account: AccountState, limit: RiskLimit, symbol: Optional[str]) -> Optional[Decimal]:
+        """Value a limit is measured against, or None when undefined."""
+        position = account.positions.get(symbol) if symbol else None
+        equity = account.equity
+
+        if limit.limit_type == RiskLimitType.DAILY_LOSS:
+            pnl = account.realized_today + account.unrealized_pnl
+            return -pnl if pnl < 0 else ZERO
+        if limit.limit_type == RiskLimitType.DRAWDOWN:
+            if account.peak_equity <= 0:
+                return None
+            return max(account.peak_equity - equity, ZERO) / account.peak_equity * HUNDRED
+        if limit.limit_type == RiskLimitType.POSITION_SIZE:
+            # Notional of a single position; account-wide limits cap every position
+            if symbol is None:
+                return None
+            return position.notional if position is not None else ZERO
+        if equity <= 0:
+            return None
+        if limit.limit_type == RiskLimitType.EXPOSURE:
+            exposure = account.exposure if limit.symbol is None else (position.notional if position else ZERO)
+            return exposure / equity * HUNDRED
+        if limit.limit_type == RiskLimitType.LEVERAGE:
+            return account.margin_used / equity * HUNDRED
+        return None
+
+    def _evaluate(self, account: AccountState, symbol: Optional[str], now: datetime) -> List[RiskAlert]:
+        """Check the account-wide limits and those of symbol."""
+        account.peak_equity = max(account.peak_equity, account.equity)
+        limits = account.limits.get(None, [])
+        if symbol is not None and symbol in account.limits:
+            limits = limits + account.limits[symbol]
+
+        alerts = []
+        for limit in limits:
+            current = self._current_value(account, limit, symbol)
+            if current is None:
+                continue
+            key = (limit.id, symbol if limit.limit_type == RiskLimitType.POSITION_SIZE else None)
+            level = limit_level(current, limit)
+            previous = account.levels.get(key, RiskStatus.NORMAL)
+            if level == previous:
+                continue
+            account.levels[key] = level
+            if _LEVELS[level] > _LEVELS[previous]:
+                alerts.append(self._emit(account.user_id, limit, symbol, current, level, now))
+        return alerts
+
+    def _emit(
+        self,
+        user_id: UUID,
+        limit: RiskLimit,
+        symbol: Optional[str],
+        current: Decimal,
+        level: RiskStatus,
+        now: datetime,
+    ) -> RiskAlert:
+        breached = level == RiskStatus.BREACHED
+        percentage = min(current / limit.limit_value * HUNDRED, _MAX_PERCENTAGE).quantize(Decimal("0.01"))
+        alert_symbol = limit.symbol or (symbol if limit.limit_type == RiskLimitType.POSITION_SIZE else None)
+        alert_type = _ALERT_TYPES.get((limit.limit_type, breached))
+        symbol_text = f" for {alert_symbol}" if alert_symbol else ""
+
+        alert = RiskAlert(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            risk_limit_id=limit.id,
+            alert_type=alert_type.value if alert_type else "RISK_LIMIT_VIOLATION",
+            message=(
+                f"{limit.limit_type.value} limit {'exceeded' if breached else 'approached'}{symbol_text}. "
+                f"Current: {current:.2f}, Limit: {limit.limit_value} ({percentage:.1f}%)"
+            ),
+            severity=level,
+            symbol=alert_symbol,
+            current_value=current,
+            limit_value=limit.limit_value,
+            violation_percentage=percentage,
+            acknowledged=False,
+            created_at=now,
+        )
+
+        events: List[Any] = [RiskLimitViolatedEvent(
+            user_id=user_id,
+            risk_limit_id=limit.id,
+            limit_type=limit.limit_type.value,
+            symbol=alert_symbol,
+            current_value=current,
+            limit_value=limit.limit_value,
+            violation_percentage=percentage,
+            severity=level.value,
+            occurred_at=now,
+        )]
+        if alert.is_critical:
+            events.append(CriticalRiskBreachEvent(
+                user_id=user_id,
+                risk_limit_id=limit.id,
+                limit_type=limit.limit_type.value,
+                symbol=alert_symbol,
+                current_value=current,
+                limit_value=limit.limit_value,
+                violation_percentage=percentage,
+                requires_immediate_action=breached,
+                occurred_at=now,
+            ))
+        for event in events:
+            for listener in tuple(self._listeners):
+                try:
+                    listener(event)
+                except Exception as e:
+                    logger.error(f"Risk event listener failed: {e}")
+
+        self._outbox.append(alert)
+        self._schedule_flush()
+        return alert
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _schedule_flush(self) -> None:
+        if self._session_factory is None:
+            return
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._flush_task = loop.create_task(self.flush_alerts())
+
+    async def flush_alerts(self) -> int:
+        """Persist queued alerts; failed batches are kept for the next flush."""
+        if self._session_factory is None:
+            return 0
+        written = 0
+        while self._outbox:
+            batch = list(self._outbox)
+            self._outbox.clear()
+            try:
+                async with self._session_factory() as session:
+                    await SqlAlchemyRiskAlertRepository(session).save_many(batch)
+            except Exception as e:
+                logger.error(f"Failed to persist {len(batch)} risk alerts: {e}")
+                self._outbox.extendleft(reversed(batch))
+                break
+            written += len(batch)
+        return written
+
+    async def resync(self, session: AsyncSession, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Reload limits, positions and balances and re-evaluate every limit."""
+        now = now or datetime.now(timezone.utc)
+        today = now.date()
+
+        limits: Dict[UUID, List[RiskLimit]] = defaultdict(list)
+        for limit in await SqlAlchemyRiskLimitRepository(session).find_enabled():
+            limits[limit.user_id].append(limit)
+
+        capital: Dict[UUID, Decimal] = defaultdict(lambda: ZERO)
+        bots = await session.execute(
+            select(BotModel.user_id, BotModel.configuration).where(BotModel.deleted_at.is_(None))
+        )
+        for user_id, configuration in bots.all():
+            # Same allocation rule as the portfolio summary and equity snapshots
+            if configuration and "quote_quantity" in configuration:
+                capital[user_id] += Decimal(str(configuration["quote_quantity"]))
+
+        realized: Dict[UUID, Tuple[Decimal, Decimal]] = {}
+        pnl = await session.execute(
+            select(
+                BotDailyPnlModel.user_id,
+                func.sum(BotDailyPnlModel.pnl),
+                func.sum(case((BotDailyPnlModel.day == today, BotDailyPnlModel.pnl), else_=0)),
+            ).group_by(BotDailyPnlModel.user_id)
+        )
+        for user_id, total, day_total in pnl.all():
+            realized[user_id] = (total or ZERO, day_total or ZERO)
+
+        peaks = await session.execute(
+            select(EquitySnapshotModel.user_id, func.max(EquitySnapshotModel.equity))
+            .where(EquitySnapshotModel.resolution == "1d")
+            .group_by(EquitySnapshotModel.user_id)
+        )
+        peak: Dict[UUID, Decimal] = {user_id: value or ZERO for user_id, value in peaks.all()}
+
+        rows = (await session.execute(
+            select(
+                PositionModel.user_id,
+                PositionModel.symbol,
+                PositionModel.side,
+                PositionModel.quantity,
+                PositionModel.entry_price,
+                PositionModel.margin_used,
+            ).where(
+                and_(
+                    PositionModel.status == "OPEN",
+                    PositionModel.deleted_at.is_(None),
+                )
+            )
+        )).all()
+
+        missing = sorted({row.symbol for row in rows if normalize_symbol(row.symbol) not in self._marks})
+        quotes = await self._prices.get_current_prices(missing) if missing else {}
+
+        positions: Dict[UUID, Dict[str, PositionState]] = defaultdict(dict)
+        for row in rows:
+            symbol = normalize_symbol(row.symbol)
+            quote = quotes.get(row.symbol)
+            mark = self._marks.get(symbol)
+            if mark is None:
+                mark = Decimal(str(quote["price"])) if quote and quote.get("price") else row.entry_price
+            quantity = abs(row.quantity) if row.side != "SHORT" else -abs(row.quantity)
+            held = positions[row.user_id].get(symbol)
+            if held is not None:
+                # Several bots on one symbol net into one position
+                total = held.quantity + quantity
+                if total != 0 and (held.quantity > 0) == (quantity > 0):
+                    held.entry_price = (
+                        held.entry_price * abs(held.quantity) + row.entry_price * abs(quantity)
+                    ) / abs(total)
+                held.quantity = total
+                held.margin_used += row.margin_used or ZERO
+            else:
+                positions[row.user_id][symbol] = PositionState(
+                    quantity=quantity,
+                    entry_price=row.entry_price,
+                    mark=mark,
+                    margin_used=row.margin_used or ZERO,
+                )
+
+        users = set(limits) | set(positions) | set(capital) | set(realized)
+        alerted = await self._alerted_levels(session, users - set(self._accounts), limits)
+        evaluated = 0
+        for user_id in users:
+            total, day_total = realized.get(user_id, (ZERO, ZERO))
+            account = self.load_account(
+                user_id,
+                limits.get(user_id, []),
+                {symbol: position for symbol, position in positions.get(user_id, {}).items() if position.quantity != 0},
+                balance=capital[user_id] + total,
+                realized_today=day_total,
+                peak_equity=peak.get(user_id, ZERO),
+                today=today,
+                levels=alerted.get(user_id),
+            )
+            self._evaluate(account, None, now)
+            for symbol in set(account.positions) | {symbol for symbol in account.limits if symbol is not None}:
+                self._evaluate(account, symbol, now)
+            evaluated += sum(len(items) for items in account.limits.values())
+
+        for user_id in set(self._accounts) - users:
+            for symbol in self._accounts.pop(user_id).positions:
+                self._holders[symbol].discard(user_id)
+
+        await self.flush_alerts()
+        violations = sum(
+            1
+            for account in self._accounts.values()
+            for level in account.levels.values()
+            if level == RiskStatus.BREACHED
+        )
+        return {
+            "users_checked": len(users),
+            "limits_evaluated": evaluated,
+            "violations_found": violations,
+        }
+
+    async def _alerted_levels(
+        self,
+        session: AsyncSession,
+        user_ids: Set[UUID],
+        limits: Dict[UUID, List[RiskLimit]],
+    ) -> Dict[UUID, Dict[LevelKey, RiskStatus]]:
+        """Level of the latest unacknowledged alert per limit, for accounts not loaded yet.
+
+        Alert levels only live in memory, so without this every process
+        would alert again on each limit that is still breached when it starts.
+        """
+        kinds = {limit.id: limit.limit_type for user_id in user_ids for limit in limits.get(user_id, [])}
+        if not kinds:
+            return {}
+        result = await session.execute(
+            select(
+                RiskAlertModel.user_id,
+                RiskAlertModel.risk_limit_id,
+                RiskAlertModel.symbol,
+                RiskAlertModel.severity,
+            )
+            .where(
+                and_(
+                    RiskAlertModel.risk_limit_id.in_(list(kinds)),
+                    RiskAlertModel.acknowledged.is_(False),
+                )
+            )
+            .order_by(RiskAlertModel.created_at)
+        )
+        levels: Dict[UUID, Dict[LevelKey, RiskStatus]] = defaultdict(dict)
+        for user_id, limit_id, symbol, severity in result.all():
+            per_position = kinds[limit_id] == RiskLimitType.POSITION_SIZE and symbol
+            levels[user_id][(limit_id, normalize_symbol(symbol) if per_position else None)] = RiskStatus(severity)
+        return levels
+
+    # ------------------------------------------------------------------
+    # Periodic resync
+    # ------------------------------------------------------------------
+
+    def start(self, interval: float = RESYNC_INTERVAL) -> None:
+        """Resync from the database now and then every interval seconds."""
+        if self._session_factory is None:
+            return
+        if self._resync_task is not None and not self._resync_task.done():
+            return
+        self._resync_task = asyncio.get_running_loop().create_task(self._resync_loop(interval))
+
+    async def stop(self) -> None:
+        """Stop the resync loop and persist queued alerts."""
+        task, self._resync_task = self._resync_task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.flush_alerts()
+
+    async def _resync_loop(self, interval: float) -> None:
+        while True:
+            try:
+                async with self._session_factory() as session:
+                    result = await self.resync(session)
+                logger.debug(f"Risk engine resynced: {result}")
+            except Exception as e:
+                logger.error(f"Risk engine resync failed: {e}")
+            await asyncio.sleep(interval)
+
+
+# Global instance
+risk_engine = RiskEngine(session_factory=get_db_context)
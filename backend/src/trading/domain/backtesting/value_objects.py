@@ -153,6 +153,7 @@ class BacktestConfig:
     market_fill_policy: str = "close"  # close | low | high
     limit_fill_policy: str = "cross"  # touch | cross | cross_volume
     price_path_assumption: str = "neutral"  # neutral | optimistic | realistic
+    intrabar_mode: str = "off"  # off | trades (replay captured aggTrades in minutes that touch SL/TP/liquidation)
     
     # Spec-required Phase 2: Multi-timeframe
     data_timeframe: str = "1m"  # Always 1m for spec compliance
@@ -4,6 +4,7 @@ from datetime import datetime as dt, timezone as dt_timezone
 from enum import Enum
 from typing import Optional, List, Dict, Any
 from decimal import Decimal
+from itertools import takewhile
 import uuid
 
 
@@ -213,11 +214,12 @@ class OrderBook:
     
     def get_bid_depth(self, price: Decimal) -> Decimal:
         """Get total bid quantity at or above given price."""
-        return sum(level.quantity for level in self.bids if level.price >= price)
+        # Levels are sorted best first, so stop at the first one past price
+        return sum(level.quantity for level in takewhile(lambda level: level.price >= price, self.bids))
     
     def get_ask_depth(self, price: Decimal) -> Decimal:
         """Get total ask quantity at or below given price."""
-        return sum(level.quantity for level in self.asks if level.price <= price)
+        return sum(level.quantity for level in takewhile(lambda level: level.price <= price, self.asks))
 
 
 @dataclass(frozen=True)
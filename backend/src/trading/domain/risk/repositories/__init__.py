@@ -1,7 +1,8 @@
 """Risk repository interfaces module."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from decimal import Decimal
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from ..entities import RiskLimit, RiskAlert
@@ -41,6 +42,16 @@ class IRiskLimitRepository(ABC):
         """Find all enabled risk limits for a user."""
         pass
     
+    @abstractmethod
+    async def find_enabled(self) -> List[RiskLimit]:
+        """Find all enabled risk limits of all users."""
+        pass
+    
+    @abstractmethod
+    async def find_exposure_limits_by_user(self, user_id: UUID) -> Dict[str, Decimal]:
+        """Find a user's enabled per-symbol exposure limits, keyed by symbol."""
+        pass
+    
     @abstractmethod
     async def update(self, risk_limit: RiskLimit) -> RiskLimit:
         """Update a risk limit."""
@@ -60,6 +71,11 @@ class IRiskAlertRepository(ABC):
         """Save a risk alert."""
         pass
     
+    @abstractmethod
+    async def save_many(self, alerts: List[RiskAlert]) -> None:
+        """Save several risk alerts in one transaction."""
+        pass
+    
     @abstractmethod
     async def find_by_id(self, alert_id: UUID) -> Optional[RiskAlert]:
         """Find risk alert by ID."""
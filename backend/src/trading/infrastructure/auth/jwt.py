@@ -1,8 +1,10 @@
 """JWT Authentication utilities."""
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from jose import JWTError, jwt
 import os
+import time
 import uuid
 
 # JWT Settings from environment
@@ -11,6 +13,10 @@ ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "7"))
 
+# Verified access tokens: token -> (user_id, exp timestamp), LRU-bounded
+TOKEN_MEMO_MAX_SIZE = int(os.getenv("JWT_TOKEN_MEMO_MAX_SIZE", "10000"))
+_verified_access_tokens: "OrderedDict[str, Tuple[uuid.UUID, float]]" = OrderedDict()
+
 
 class TokenPayload:
     """JWT token payload."""
@@ -152,13 +158,29 @@ def verify_access_token(token: str) -> uuid.UUID:
     
     Raises:
         JWTError: If token is invalid or not an access token
+    
+    Successful verifications are memoized until the token expires, so a
+    token seen before costs a dict lookup instead of a signature check.
     """
+    memo = _verified_access_tokens.get(token)
+    if memo is not None:
+        user_id, expires_at = memo
+        if expires_at > time.time():
+            _verified_access_tokens.move_to_end(token)
+            return user_id
+        del _verified_access_tokens[token]
+    
     payload = decode_token(token)
     
     if payload.token_type != "access":
         raise JWTError("Token is not an access token")
     
-    return uuid.UUID(payload.sub)
+    user_id = uuid.UUID(payload.sub)
+    _verified_access_tokens[token] = (user_id, payload.exp.timestamp())
+    while len(_verified_access_tokens) > TOKEN_MEMO_MAX_SIZE:
+        _verified_access_tokens.popitem(last=False)
+    
+    return user_id
 
 
 def verify_refresh_token(token: str) -> uuid.UUID:
@@ -10,5 +10,16 @@ __all__ = [
     "MetricsCalculator",
     "MarketSimulator",
     "OrderFill",
+    "IntrabarPath",
+    "DailyIntrabarPath",
+    "load_trade_path",
     "BacktestRepository",
 ]
+
+
+def __getattr__(name: str):
+    # The trade path pulls in numpy; import it when intrabar mode is used
+    if name in ("IntrabarPath", "DailyIntrabarPath", "load_trade_path"):
+        from . import intrabar
+        return getattr(intrabar, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,7 +2,7 @@
 
 import logging
 from decimal import Decimal
-from typing import List, Dict, Optional, Callable, Union, Any
+from typing import TYPE_CHECKING, List, Dict, Optional, Callable, Union, Any
 from datetime import datetime, timedelta
 from uuid import UUID
 import asyncio
@@ -26,6 +26,10 @@ from .metrics_calculator import MetricsCalculator
 from .market_simulator import MarketSimulator
 from .timeframe_utils import resample_candles_to_htf, get_candles_in_htf_window, get_next_htf_window_candles, MultiTimeframeContext
 
+if TYPE_CHECKING:
+    # numpy is only needed once a trade path is set
+    from .intrabar import DailyIntrabarPath, IntrabarPath
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,8 +41,13 @@ class BacktestEngine:
         config: BacktestConfig,
         metrics_calculator: Optional[MetricsCalculator] = None,
         market_simulator: Optional[MarketSimulator] = None,
+        intrabar_path: Optional[Union["IntrabarPath", "DailyIntrabarPath"]] = None,
     ):
-        """Initialize backtesting engine."""
+        """Initialize backtesting engine.
+        
+        intrabar_path: trade path used to order SL/TP/liquidation hits in
+        minutes whose bar reaches one of those levels (see ``_check_exit``).
+        """
         # Ensure numeric config fields are Decimal for calculation safety
         self.config = self._ensure_decimal_config(config)
         
@@ -53,6 +62,8 @@ class BacktestEngine:
             market_fill_policy=self.config.market_fill_policy,
             limit_fill_policy=self.config.limit_fill_policy,
         )
+        self.intrabar_path = intrabar_path
+        self.intrabar_resolved_bars = 0
         logger.info(f"ENGINE INITIALIZED: Leverage: {self.config.leverage}, HTF: {self.config.signal_timeframe}")
 
         # State
@@ -380,26 +391,23 @@ class BacktestEngine:
                         # Update trailing stop
                         self.current_position.update_trailing_stop(candle_high, candle_low)
                         
-                        # Liquidation Check
-                        liquidation_result = self._check_liquidation(candle_high, candle_low)
-                        if liquidation_result:
-                            close_price, reason = liquidation_result
+                        # Liquidation / SL / TP Check
+                        exit_result = self._check_exit(candle_high, candle_low, candle_open, m1_timestamp)
+                        if exit_result and exit_result[1] == "LIQUIDATION":
+                            close_price, reason = exit_result
                             logger.warning(f"LIQUIDATION Triggered: {reason}")
                             self._close_position(price=close_price, timestamp=m1_candle["timestamp"], reason=reason)
-                        else:
-                            # SL/TP Check
-                            sl_tp_result = self._check_sl_tp_trailing_with_high_low(candle_high, candle_low, candle_open)
-                            if sl_tp_result:
-                                close_price, reason = sl_tp_result
-                                logger.debug(f"SL/TP HIT: {reason}")
-                                self._close_position(
-                                    price=close_price,
-                                    timestamp=m1_candle["timestamp"],
-                                    reason=reason,
-                                    candle_high=candle_high,
-                                    candle_low=candle_low,
-                                    candle_open=candle_open,
-                                )
+                        elif exit_result:
+                            close_price, reason = exit_result
+                            logger.debug(f"SL/TP HIT: {reason}")
+                            self._close_position(
+                                price=close_price,
+                                timestamp=m1_candle["timestamp"],
+                                reason=reason,
+                                candle_high=candle_high,
+                                candle_low=candle_low,
+                                candle_open=candle_open,
+                            )
                     
                     # Update Equity Curve
                     # OPTIMIZATION: Downsample to hourly resolution to save ~25% runtime
@@ -548,9 +556,11 @@ class BacktestEngine:
             
             # Check SL/TP/Trailing with High/Low
             # Priority 0: Liquidation Check (Before SL/TP)
-            liquidation_result = self._check_liquidation(candle_high, candle_low)
-            if liquidation_result:
-                close_price, reason = liquidation_result
+            # Spec-required: Pass candle_open for realistic price path assumption
+            candle_open = Decimal(str(candle.get("open", candle["close"])))
+            exit_result = self._check_exit(candle_high, candle_low, candle_open, candle["timestamp"])
+            if exit_result and exit_result[1] == "LIQUIDATION":
+                close_price, reason = exit_result
                 logger.warning(f"LIQUIDATION Triggered at {close_price} ({reason})")
                 self._close_position(
                     price=close_price,
@@ -559,12 +569,8 @@ class BacktestEngine:
                 )
                 return
 
-            # Spec-required: Pass candle_open for realistic price path assumption
-            candle_open = Decimal(str(candle.get("open", candle["close"])))
-            sl_tp_result = self._check_sl_tp_trailing_with_high_low(candle_high, candle_low, candle_open)
-            
-            if sl_tp_result:
-                close_price, reason = sl_tp_result
+            if exit_result:
+                close_price, reason = exit_result
                 self._close_position(
                     price=close_price,
                     timestamp=candle["timestamp"],
@@ -1536,6 +1542,68 @@ class BacktestEngine:
                 
         return None
 
+    def _check_exit(
+        self,
+        candle_high: Decimal,
+        candle_low: Decimal,
+        candle_open: Decimal,
+        timestamp: datetime,
+    ) -> Optional[tuple]:
+        """
+        Exit of the current position in this bar, as (close_price, reason).
+        
+        Liquidation takes precedence, then SL/TP/trailing with the price
+        path assumption. When an intrabar path is set, minutes in which the
+        bar reached any level are replayed from the trades instead, so the
+        level actually hit first wins. Minutes that reach nothing never
+        touch the path, which keeps the run at bar speed.
+        """
+        result = self._check_liquidation(candle_high, candle_low) or \
+            self._check_sl_tp_trailing_with_high_low(candle_high, candle_low, candle_open)
+        if result and self.intrabar_path is not None:
+            result = self._resolve_exit_intrabar(timestamp, result)
+        return result
+    
+    def _resolve_exit_intrabar(self, timestamp: datetime, bar_result: tuple) -> tuple:
+        """First level reached by the minute's trades; bar_result without trade data."""
+        from .intrabar import first_reach
+        
+        prices = self.intrabar_path.window(timestamp)
+        if not len(prices):
+            return bar_result
+        
+        position = self.current_position
+        is_long = position.direction == TradeDirection.LONG
+        strict = self.config.limit_fill_policy in ("cross", "cross_volume")
+        # (level, reason, reached from above, strict); ties go to the earlier entry
+        levels = (
+            (position.liquidation_price, "LIQUIDATION", is_long, False),
+            (position.stop_loss, "Stop Loss", is_long, strict),
+            (position.trailing_stop_price, "Trailing Stop", is_long, strict),
+            (position.take_profit, "Take Profit", not is_long, strict),
+        )
+        first = None
+        for level, reason, below, level_strict in levels:
+            if not level:
+                continue
+            index = first_reach(prices, level, below, level_strict)
+            if index is not None and (first is None or index < first[0]):
+                first = (index, level, reason)
+        
+        if first is None:
+            # Captured trades miss the bar's extreme: keep the bar decision
+            return bar_result
+        self.intrabar_resolved_bars += 1
+        index, level, reason = first
+        if reason != bar_result[1]:
+            logger.debug(f"Intrabar path at {timestamp}: {reason} before {bar_result[1]}")
+        if reason != "Take Profit":
+            # Stops and liquidation fill at market: a print through the
+            # level fills there, never better than the level
+            traded = Decimal(str(float(prices[index])))
+            level = min(level, traded) if is_long else max(level, traded)
+        return (level, reason)
+    
     def _check_sl_tp_trailing_with_high_low(
         self, 
         candle_high: Decimal, 
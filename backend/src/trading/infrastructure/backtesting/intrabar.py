@@ -0,0 +1,176 @@
+"""Sub-minute price paths for intrabar fill resolution in backtests."""
+
+import logging
+import os
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+from ..config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+MINUTE_MS = 60_000
+DAY = timedelta(days=1)
+
+
+def to_ms(moment: datetime) -> int:
+    """Unix milliseconds of a datetime (naive ones are UTC)."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp() * 1000)
+
+
+class IntrabarPath:
+    """
+    Columnar trade path: ``ts`` (unix ms, int64) and ``price`` (float64)
+    sorted by time.
+
+    The engine only asks for the minutes in which a bar already touched a
+    pending level, so arrays saved with ``save`` are reopened memory
+    mapped and only the pages of those minutes are ever read.
+    """
+
+    def __init__(self, ts: np.ndarray, price: np.ndarray):
+        if len(ts) != len(price):
+            raise ValueError("ts and price columns differ in length")
+        self.ts = ts
+        self.price = price
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[datetime, Union[Decimal, float]]]) -> "IntrabarPath":
+        """Build from (timestamp, price) rows ordered by time."""
+        ts, price = [], []
+        for moment, value in rows:
+            ts.append(to_ms(moment))
+            price.append(float(value))
+        return cls(np.asarray(ts, dtype=np.int64), np.asarray(price, dtype=np.float64))
+
+    def save(self, directory: Union[str, Path]):
+        """Write the columns as .npy files (atomically replaced)."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, column in (("ts", self.ts), ("price", self.price)):
+            partial = directory / f"{name}.partial.npy"
+            np.save(partial, column)
+            os.replace(partial, directory / f"{name}.npy")
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], mmap: bool = True) -> "IntrabarPath":
+        """Open columns written by ``save``, memory mapped by default."""
+        directory = Path(directory)
+        mode = "r" if mmap else None
+        return cls(np.load(directory / "ts.npy", mmap_mode=mode), np.load(directory / "price.npy", mmap_mode=mode))
+
+    def window(self, start: datetime, length_ms: int = MINUTE_MS) -> np.ndarray:
+        """Prices traded in [start, start + length), in order."""
+        start_ms = to_ms(start)
+        lo, hi = np.searchsorted(self.ts, [start_ms, start_ms + length_ms])
+        return self.price[lo:hi]
+
+
+def first_reach(prices: np.ndarray, level: Decimal, below: bool, strict: bool = False) -> Optional[int]:
+    """Index of the first price at or through a level, None if never reached.
+
+    ``below`` looks for prices under the level (long stops, short take
+    profits); ``strict`` requires trading through it rather than touching.
+    """
+    level = float(level)
+    if below:
+        reached = prices < level if strict else prices <= level
+    else:
+        reached = prices > level if strict else prices >= level
+    if not reached.any():
+        return None
+    return int(reached.argmax())
+
+
+class DailyIntrabarPath:
+    """
+    Trade path kept as one ``IntrabarPath`` per UTC day.
+
+    Minute windows never straddle midnight, so ``window`` only opens the
+    day of ``start``; cached days stay memory mapped instead of being
+    concatenated.
+    """
+
+    def __init__(self, days: Dict[date, IntrabarPath]):
+        self.days = days
+
+    def __len__(self) -> int:
+        return sum(len(path) for path in self.days.values())
+
+    def window(self, start: datetime, length_ms: int = MINUTE_MS) -> np.ndarray:
+        """Prices traded in [start, start + length), in order."""
+        moment = start if start.tzinfo else start.replace(tzinfo=timezone.utc)
+        path = self.days.get(moment.astimezone(timezone.utc).date())
+        if path is None:
+            return np.empty(0, dtype=np.float64)
+        return path.window(start, length_ms)
+
+
+def cache_dir(symbol: str, day: date) -> Path:
+    """Cache directory of one symbol's trades on one UTC day."""
+    root = Path(settings.BACKTEST_INTRABAR_CACHE_DIR or os.path.join(tempfile.gettempdir(), "trading-intrabar"))
+    return root / symbol.upper() / day.isoformat()
+
+
+async def _read_path(session, symbol: str, start: datetime, end: datetime) -> IntrabarPath:
+    from ..persistence.repositories.market_data_repository import TickRepository
+
+    ts_chunks, price_chunks = [], []
+    async for rows in TickRepository(session).stream_prices(symbol.upper(), start, end):
+        chunk = IntrabarPath.from_rows(rows)
+        ts_chunks.append(chunk.ts)
+        price_chunks.append(chunk.price)
+    return IntrabarPath(
+        np.concatenate(ts_chunks) if ts_chunks else np.empty(0, dtype=np.int64),
+        np.concatenate(price_chunks) if price_chunks else np.empty(0, dtype=np.float64),
+    )
+
+
+async def load_trade_path(symbol: str, start: datetime, end: datetime) -> DailyIntrabarPath:
+    """Captured aggTrades of a range, one ``IntrabarPath`` per UTC day.
+
+    Days that ended over an hour ago are complete, so they are cached on
+    disk whole (one directory per symbol and day, shared by every range
+    that covers it) and reopened memory mapped on later runs.
+    """
+    from ..persistence.database import AsyncSessionLocal
+
+    start_utc = start if start.tzinfo else start.replace(tzinfo=timezone.utc)
+    end_utc = end if end.tzinfo else end.replace(tzinfo=timezone.utc)
+    complete_before = datetime.now(timezone.utc) - timedelta(hours=1)
+
+    days: Dict[date, IntrabarPath] = {}
+    day = start_utc.astimezone(timezone.utc).date()
+    async with AsyncSessionLocal() as session:
+        while day <= end_utc.astimezone(timezone.utc).date():
+            day_start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+            day_end = day_start + DAY
+            directory = cache_dir(symbol, day)
+            if (directory / "price.npy").exists():
+                days[day] = IntrabarPath.load(directory)
+            elif day_end < complete_before:
+                path = await _read_path(session, symbol, day_start, day_end - timedelta(microseconds=1))
+                try:
+                    path.save(directory)
+                    path = IntrabarPath.load(directory)
+                except OSError as e:
+                    logger.warning(f"Could not cache intrabar path in {directory}: {e}")
+                days[day] = path
+            else:
+                days[day] = await _read_path(session, symbol, max(day_start, start_utc), min(day_end, end_utc))
+            day += DAY
+
+    path = DailyIntrabarPath(days)
+    logger.info(f"Loaded {len(path)} trades of {symbol} for intrabar fills")
+    return path
@@ -4,9 +4,11 @@ import hashlib
 import time
 from typing import Dict, Any, Optional, List
 from decimal import Decimal
-import httpx
 from urllib.parse import urlencode
 
+from ..exchange.rate_limiter import get_rate_limiter
+from ...performance.http.async_pool import get_http_pool
+
 
 class BinanceClient:
     """Binance Futures API client."""
@@ -36,11 +38,10 @@ class BinanceClient:
         self.base_url = self.TESTNET_BASE_URL if testnet else self.MAINNET_BASE_URL
         self.timeout = timeout
         
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=timeout,
-            headers={"X-MBX-APIKEY": api_key},
-        )
+        # Shared keep-alive pool and per-host weight limiter
+        self.http = get_http_pool()
+        self.limiter = get_rate_limiter(self.base_url)
+        self.headers = {"X-MBX-APIKEY": api_key}
         # Debug: print base_url and masked api key (never print secret)
         try:
             masked = self.api_key[:6] + "..." + self.api_key[-4:] if self.api_key and len(self.api_key) > 10 else "(masked)"
@@ -84,7 +85,11 @@ class BinanceClient:
         """
         params = params or {}
         
-        if signed:
+        if method not in ("GET", "POST", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        def sign(params: Dict[str, Any]) -> Dict[str, Any]:
+            # Signed after rate limiting, so the timestamp is fresh on every attempt
             params = self._add_timestamp(params)
             # Debug: show signed request keys and timestamp (do not print secret or raw signature)
             try:
@@ -94,16 +99,18 @@ class BinanceClient:
             except Exception:
                 pass
             params["signature"] = self._generate_signature(params)
-        
-        if method == "GET":
-            response = await self.client.get(endpoint, params=params)
-        elif method == "POST":
-            response = await self.client.post(endpoint, params=params)
-        elif method == "DELETE":
-            response = await self.client.delete(endpoint, params=params)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-        
+            return params
+        
+        response = await self.http.request(
+            method,
+            f"{self.base_url}{endpoint}",
+            params=params,
+            headers=self.headers,
+            limiter=self.limiter,
+            account=self.api_key or None,
+            sign=sign if signed else None,
+            timeout=self.timeout,
+        )
         response.raise_for_status()
         return response.json()
     
@@ -305,8 +312,7 @@ class BinanceClient:
         return await self._request("GET", "/fapi/v1/time")
     
     async def close(self) -> None:
-        """Close HTTP client."""
-        await self.client.aclose()
+        """Release the client; the shared HTTP pool stays open."""
     
     async def __aenter__(self):
         """Context manager entry."""
@@ -8,6 +8,10 @@ from .price_cache import PriceCache, price_cache
 from .cache_service import CacheService, cache_service
 from .middleware import CacheMiddleware, cache_response
 from .cached_repository import CachedRepository, cached_repository, CacheInvalidationMixin
+from .local_cache import LocalCache, SingleFlight, get_local_cache, get_local_cache_stats
+from .invalidation import CacheInvalidationListener, invalidation_listener
+from .user_principal_cache import UserPrincipalCache, user_principal_cache
+from .analytics_cache import AnalyticsCache, analytics_cache
 
 __all__ = [
     "redis_client",
@@ -25,4 +29,14 @@ __all__ = [
     "CachedRepository",
     "cached_repository",
     "CacheInvalidationMixin",
+    "LocalCache",
+    "SingleFlight",
+    "get_local_cache",
+    "get_local_cache_stats",
+    "CacheInvalidationListener",
+    "invalidation_listener",
+    "UserPrincipalCache",
+    "user_principal_cache",
+    "AnalyticsCache",
+    "analytics_cache",
 ]
\ No newline at end of file
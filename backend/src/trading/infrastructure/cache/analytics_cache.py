@@ -0,0 +1,72 @@
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ...performance.json.codec import replace_non_finite
+from .base_cache import BaseCache
+from .cached_repository import INDEX_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+
+class AnalyticsCache(BaseCache):
+    """Per-user cache of computed performance analytics.
+
+    Entries are keyed by user, report name and the report's parameters
+    (date range, period count, ...). Every key a user gets is listed in a
+    per-user index set, so ``invalidate`` drops all of that user's reports
+    when one of their trades closes. ``default_ttl`` bounds how long a
+    report computed concurrently with an invalidation can stay stale.
+    """
+
+    NAMESPACE = "analytics"
+
+    def __init__(self, default_ttl: int = 300):
+        super().__init__(prefix=self.NAMESPACE, default_ttl=default_ttl)
+
+    def _index_key(self, user_id: Any) -> str:
+        return self._make_key(f"user:{user_id}:{INDEX_SUFFIX}")
+
+    @staticmethod
+    def _params_digest(params: Dict[str, Any]) -> str:
+        encoded = json.dumps(params, default=str, sort_keys=True)
+        return hashlib.md5(encoded.encode()).hexdigest()[:12]
+
+    async def get_or_compute(
+        self,
+        user_id: Any,
+        report: str,
+        params: Dict[str, Any],
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+    ) -> Any:
+        """Return the cached report, computing and storing it on a miss.
+
+        ``loader`` must return JSON-serializable data. NaN and infinite
+        floats (a profit factor without losses) are returned as None, as
+        they read back from the cache, so a hit and a miss agree.
+        """
+        key = f"user:{user_id}:{report}:{self._params_digest(params)}"
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+
+        value = replace_non_finite(await loader())
+        ttl = ttl or self.default_ttl
+        # Index before storing so an invalidation in between cannot miss the key
+        if await self.redis.index_add(self._index_key(user_id), self._make_key(key), ttl):
+            await self.set(key, value, ttl=ttl)
+        return value
+
+    async def invalidate(self, user_id: Any) -> int:
+        """Drop every cached report of a user."""
+        try:
+            return await self.redis.delete_indexed(self._index_key(user_id))
+        except Exception as e:
+            logger.error(f"Error invalidating analytics for user {user_id}: {e}")
+            return 0
+
+
+# Global analytics cache instance
+analytics_cache = AnalyticsCache()
@@ -1,11 +1,12 @@
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional, Any, Dict, List, Union
+from typing import Optional, Any, Dict, List, Union, AsyncIterator
 from datetime import datetime, timedelta
-import json
 
 from .redis_client import redis_client
+from ..config.settings import get_settings
+from ...performance.json.codec import decode_value, get_codec, json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,7 @@ class BaseCache(ABC):
         self.prefix = prefix
         self.default_ttl = default_ttl
         self.redis = redis_client
+        self.codec = get_codec(get_settings().CACHE_VALUE_CODEC)
     
     def _make_key(self, key: str) -> str:
         """Generate cache key with prefix."""
@@ -28,7 +30,7 @@ class BaseCache(ABC):
         """Get value from cache."""
         cache_key = self._make_key(key)
         try:
-            data = await self.redis.get(cache_key)
+            data = await self._read_raw(cache_key)
             if data is None:
                 return None
             return self._deserialize(data)
@@ -36,6 +38,12 @@ class BaseCache(ABC):
             logger.error(f"Cache GET error for key {cache_key}: {e}")
             return None
     
+    async def _read_raw(self, cache_key: str) -> Optional[Union[str, bytes]]:
+        """Stored value of a full key, undecoded when the codec is binary."""
+        if self.codec.binary:
+            return await self.redis.get_bytes(cache_key)
+        return await self.redis.get(cache_key)
+    
     async def set(
         self, 
         key: str, 
@@ -47,7 +55,7 @@ class BaseCache(ABC):
         ttl = ttl or self.default_ttl
         
         try:
-            serialized = self._serialize(value)
+            serialized = value if isinstance(value, str) else self.codec.encode(value)
             return await self.redis.set(cache_key, serialized, ex=ttl)
         except Exception as e:
             logger.error(f"Cache SET error for key {cache_key}: {e}")
@@ -139,47 +147,49 @@ class BaseCache(ABC):
             results[key] = await self.delete(key)
         return results
     
+    async def iter_keys(self, pattern: str = "*") -> AsyncIterator[str]:
+        """Iterate full keys matching pattern within prefix using SCAN."""
+        async for key in self.redis.scan_iter(match=self._make_key(pattern)):
+            yield key
+    
     async def clear_prefix(self, pattern: str = "*") -> int:
         """Clear all keys matching pattern within prefix."""
         search_pattern = self._make_key(pattern)
         try:
-            keys = await self.redis.keys(search_pattern)
-            if keys:
-                return await self.redis.delete(*keys)
-            return 0
+            return await self.redis.delete_pattern(search_pattern)
         except Exception as e:
             logger.error(f"Cache CLEAR_PREFIX error for pattern {search_pattern}: {e}")
             return 0
     
     def _serialize(self, value: Any) -> str:
-        """Serialize value for storage."""
+        """Serialize value as text, for lists, sorted sets and other non-``set`` storage."""
         if isinstance(value, str):
             return value
-        return json.dumps(value, default=str)
+        return json_dumps(value)
     
-    def _deserialize(self, value: str) -> Any:
-        """Deserialize value from storage."""
-        try:
-            return json.loads(value)
-        except (json.JSONDecodeError, TypeError):
-            return value
+    def _deserialize(self, value: Union[str, bytes]) -> Any:
+        """Deserialize value from storage (JSON, msgpack or plain text)."""
+        return decode_value(value)
     
     async def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         try:
-            pattern = self._make_key("*")
-            keys = await self.redis.keys(pattern)
-            
             stats = {
-                "total_keys": len(keys),
+                "total_keys": 0,
                 "prefix": self.prefix,
                 "default_ttl": self.default_ttl,
                 "keys_with_ttl": 0,
                 "keys_without_ttl": 0,
             }
             
-            # Check TTL for each key
-            for key in keys[:100]:  # Limit to prevent performance issues
+            sample = []
+            async for key in self.iter_keys():
+                stats["total_keys"] += 1
+                if len(sample) < 100:  # Limit to prevent performance issues
+                    sample.append(key)
+            
+            # Check TTL for a sample of keys
+            for key in sample:
                 ttl = await self.redis.ttl(key)
                 if ttl > 0:
                     stats["keys_with_ttl"] += 1
@@ -7,6 +7,8 @@ from .redis_client import redis_client
 from .market_data_cache import market_data_cache
 from .user_session_cache import user_session_cache
 from .price_cache import price_cache
+from .local_cache import get_local_cache_stats
+from .invalidation import invalidation_listener
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,7 @@ class CacheService:
         self.market_data = market_data_cache
         self.user_session = user_session_cache
         self.price = price_cache
+        self.invalidation = invalidation_listener
         self.is_running = False
     
     async def start(self):
@@ -36,6 +39,9 @@ class CacheService:
             # Test cache operations
             await self._test_cache_operations()
             
+            # Subscribe to L1 invalidations from other processes
+            await self.invalidation.start()
+            
             self.is_running = True
             logger.info("Cache service started successfully")
             
@@ -51,6 +57,8 @@ class CacheService:
         try:
             logger.info("Stopping cache service...")
             
+            await self.invalidation.stop()
+            
             # Disconnect from Redis
             await self.redis_client.disconnect()
             
@@ -86,6 +94,8 @@ class CacheService:
                     "uptime": redis_info.get("uptime_in_seconds", 0)
                 },
                 "cache_stats": stats,
+                "local_cache_stats": get_local_cache_stats(),
+                "invalidation_listener": self.invalidation.is_running,
                 "is_running": self.is_running
             }
         except Exception as e:
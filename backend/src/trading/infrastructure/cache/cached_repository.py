@@ -4,28 +4,56 @@ from datetime import datetime, timedelta
 import hashlib
 import json
 
+from ...performance.json.codec import decode_value, json_dumps
 from .base_cache import BaseCache
 from .cache_service import cache_service
+from .local_cache import LocalCache, SingleFlight, get_local_cache
+from .invalidation import invalidation_listener
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+INDEX_SUFFIX = "__keys__"
+
+
+def cache_index_key(cache_prefix: str) -> Optional[str]:
+    """Tag set listing every Redis key cached under a repository prefix."""
+    if not cache_prefix:
+        return None
+    return f"{cache_prefix}:{INDEX_SUFFIX}"
+
+# Shared by all repositories so a cold key only reaches the database once
+_single_flight = SingleFlight()
+
 
 class CachedRepository(Generic[T]):
-    """Wrapper for repositories to add caching functionality."""
+    """Wrapper for repositories to add caching functionality.
+    
+    With ``local_cache_size > 0`` an in-process LRU/TTL tier (L1) sits in
+    front of Redis (L2). L1 is shared per ``cache_prefix`` within the
+    process and kept coherent across processes by pub/sub invalidation;
+    ``local_cache_ttl`` bounds staleness if a message is missed.
+    """
     
     def __init__(
         self, 
         repository: Any,
         cache: Optional[BaseCache] = None,
         default_ttl: int = 300,
-        cache_prefix: str = ""
+        cache_prefix: str = "",
+        local_cache_size: int = 0,
+        local_cache_ttl: int = 30
     ):
         self.repository = repository
         self.cache = cache or cache_service.redis_client
         self.default_ttl = default_ttl
         self.cache_prefix = cache_prefix
+        self.local_cache: Optional[LocalCache] = None
+        if local_cache_size > 0:
+            self.local_cache = get_local_cache(
+                cache_prefix, max_size=local_cache_size, default_ttl=local_cache_ttl
+            )
     
     def _make_cache_key(self, method: str, *args, **kwargs) -> str:
         """Generate cache key for method call."""
@@ -65,6 +93,31 @@ class CachedRepository(Generic[T]):
         ttl = ttl or self.default_ttl
         cache_key = cache_key_override or self._make_cache_key(method_name, *args, **kwargs)
         
+        if not force_refresh and self.local_cache is not None:
+            local_result = self.local_cache.get(cache_key)
+            if local_result is not None:
+                logger.debug(f"L1 cache HIT for {cache_key}")
+                return local_result
+        
+        async def load() -> Any:
+            return await self._load(method_name, cache_key, ttl, force_refresh, *args, **kwargs)
+        
+        if force_refresh:
+            return await load()
+        return await _single_flight.do(cache_key, load)
+    
+    async def _load(
+        self,
+        method_name: str,
+        cache_key: str,
+        ttl: int,
+        force_refresh: bool,
+        *args,
+        **kwargs
+    ) -> Any:
+        """Read through Redis to the repository, populating both tiers."""
+        generation = self.local_cache.generation if self.local_cache is not None else None
+        
         # Check cache first (unless force refresh)
         if not force_refresh:
             try:
@@ -75,7 +128,10 @@ class CachedRepository(Generic[T]):
                 
                 if cached_result is not None:
                     logger.debug(f"Cache HIT for {cache_key}")
-                    return self._deserialize_result(cached_result)
+                    result = self._deserialize_result(cached_result)
+                    if self.local_cache is not None:
+                        self.local_cache.set(cache_key, result, ttl, generation=generation)
+                    return result
             except Exception as e:
                 logger.error(f"Cache GET error for {cache_key}: {e}")
         
@@ -93,6 +149,19 @@ class CachedRepository(Generic[T]):
                     else:
                         await cache_service.redis_client.set(cache_key, serialized_result, ex=ttl)
                     
+                    index_key = self._index_key()
+                    if index_key:
+                        await cache_service.redis_client.index_add(index_key, cache_key, ttl)
+                    
+                    if self.local_cache is not None:
+                        # Store what a Redis hit would return, not the live object
+                        self.local_cache.set(
+                            cache_key,
+                            self._deserialize_result(serialized_result),
+                            ttl,
+                            generation=generation,
+                        )
+                    
                     logger.debug(f"Cache SET for {cache_key}")
                 except Exception as e:
                     logger.error(f"Cache SET error for {cache_key}: {e}")
@@ -107,35 +176,45 @@ class CachedRepository(Generic[T]):
         """Serialize result for caching."""
         if hasattr(result, 'dict'):
             # Pydantic model
-            return json.dumps(result.dict(), default=str)
+            return json_dumps(result.dict())
         elif hasattr(result, '__dict__'):
             # Object with attributes
-            return json.dumps(result.__dict__, default=str)
+            return json_dumps(result.__dict__)
         elif isinstance(result, (list, dict)):
-            return json.dumps(result, default=str)
+            return json_dumps(result)
         else:
             return str(result)
     
     def _deserialize_result(self, cached_data: str) -> Any:
         """Deserialize cached result."""
-        try:
-            return json.loads(cached_data)
-        except (json.JSONDecodeError, TypeError):
-            return cached_data
+        return decode_value(cached_data)
+    
+    def _index_key(self) -> Optional[str]:
+        """Tag set for this repository, when results are stored directly in Redis.
+        
+        BaseCache instances prefix keys themselves and keep their own index.
+        """
+        if hasattr(self.cache, 'clear_prefix'):
+            return None
+        return cache_index_key(self.cache_prefix)
     
     async def invalidate_cache(self, pattern: str = "*"):
         """Invalidate cache entries matching pattern."""
         try:
+            if self.local_cache is not None:
+                await invalidation_listener.publish(self.cache_prefix)
+            
+            index_key = self._index_key()
+            if pattern == "*" and index_key:
+                return await cache_service.redis_client.delete_indexed(index_key)
+            
             if self.cache_prefix:
                 pattern = f"{self.cache_prefix}:{pattern}"
             
             if hasattr(self.cache, 'clear_prefix'):
                 return await self.cache.clear_prefix(pattern)
             else:
-                keys = await cache_service.redis_client.keys(pattern)
-                if keys:
-                    return await cache_service.redis_client.delete(*keys)
-                return 0
+                return await cache_service.redis_client.delete_pattern(pattern)
         except Exception as e:
             logger.error(f"Error invalidating cache: {e}")
             return 0
@@ -169,22 +248,19 @@ class CacheInvalidationMixin:
         self._cache_prefix = getattr(self, 'cache_prefix', '')
     
     async def _invalidate_cache_after_write(self, entity_id: Any = None):
-        """Invalidate relevant cache entries after write operations."""
+        """Invalidate relevant cache entries after write operations.
+        
+        Every cached read for the prefix (get_by_id, find, get_all) may
+        include the written entity, so the whole tag set is dropped.
+        """
         try:
-            patterns = [f"{self._cache_prefix}:*"]
-            
-            if entity_id:
-                patterns.extend([
-                    f"{self._cache_prefix}:get_by_id:*{entity_id}*",
-                    f"{self._cache_prefix}:find:*",
-                    f"{self._cache_prefix}:get_all:*"
-                ])
+            index_key = cache_index_key(self._cache_prefix)
+            if index_key:
+                deleted = await cache_service.redis_client.delete_indexed(index_key)
+                logger.debug(f"Invalidated {deleted} cache entries for {self._cache_prefix}")
             
-            for pattern in patterns:
-                keys = await cache_service.redis_client.keys(pattern)
-                if keys:
-                    await cache_service.redis_client.delete(*keys)
-                    logger.debug(f"Invalidated {len(keys)} cache entries for pattern {pattern}")
+            # Drop L1 copies here and in every other process
+            await invalidation_listener.publish(self._cache_prefix)
                     
         except Exception as e:
             logger.error(f"Error invalidating cache: {e}")
@@ -211,7 +287,9 @@ class CacheInvalidationMixin:
 def cached_repository(
     cache_prefix: str = "",
     default_ttl: int = 300,
-    cache_instance: Optional[BaseCache] = None
+    cache_instance: Optional[BaseCache] = None,
+    local_cache_size: int = 0,
+    local_cache_ttl: int = 30
 ):
     """Decorator to wrap repository with caching functionality."""
     def decorator(repository_class):
@@ -219,11 +297,14 @@ def cached_repository(
             def __init__(self, *args, **kwargs):
                 super().__init__(*args, **kwargs)
                 self.cache_prefix = cache_prefix
+                self._cache_prefix = cache_prefix
                 self._cached_repo = CachedRepository(
                     repository=self,
                     cache=cache_instance,
                     default_ttl=default_ttl,
-                    cache_prefix=cache_prefix
+                    cache_prefix=cache_prefix,
+                    local_cache_size=local_cache_size,
+                    local_cache_ttl=local_cache_ttl
                 )
             
             async def get_by_id(self, id: Any, use_cache: bool = True, ttl: int = None):
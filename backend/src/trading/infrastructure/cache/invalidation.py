@@ -0,0 +1,101 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Optional
+
+from .redis_client import redis_client
+from .local_cache import invalidate_local
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+
+class CacheInvalidationListener:
+    """Keeps L1 caches coherent across processes via Redis pub/sub.
+
+    Writers publish ``{"namespace": ..., "key": ..., "origin": ...}`` on
+    ``INVALIDATION_CHANNEL``; every process clears that key, or its whole
+    L1 cache for the namespace when ``key`` is null. The writing process clears its own L1 synchronously and
+    ignores its own messages.
+    """
+
+    def __init__(self, channel: str = INVALIDATION_CHANNEL):
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self.redis = redis_client
+        self._task: Optional[asyncio.Task] = None
+        self._pubsub = None
+        self.messages_received = 0
+
+    async def publish(self, namespace: str, key: Optional[str] = None) -> int:
+        """Invalidate namespace (or one key) locally and broadcast to other processes."""
+        invalidate_local(namespace, key)
+        message = json.dumps({"namespace": namespace, "key": key, "origin": self.origin})
+        return await self.redis.publish(self.channel, message)
+
+    async def start(self):
+        """Subscribe to the invalidation channel."""
+        if self._task is not None:
+            return
+
+        self._pubsub = await self.redis.pubsub()
+        await self._pubsub.subscribe(self.channel)
+        self._task = asyncio.create_task(self._listen())
+        logger.info(f"Cache invalidation listener subscribed to {self.channel}")
+
+    async def stop(self):
+        """Unsubscribe and stop listening."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe(self.channel)
+                await self._pubsub.aclose()
+            except Exception as e:
+                logger.error(f"Error closing invalidation subscription: {e}")
+            self._pubsub = None
+
+    def handle_message(self, data: str) -> None:
+        """Apply an invalidation message to local caches."""
+        try:
+            payload = json.loads(data)
+        except (json.JSONDecodeError, TypeError):
+            logger.warning(f"Ignoring malformed invalidation message: {data!r}")
+            return
+
+        if payload.get("origin") == self.origin:
+            return
+
+        namespace = payload.get("namespace")
+        if namespace is not None:
+            self.messages_received += 1
+            invalidate_local(namespace, payload.get("key"))
+
+    async def _listen(self):
+        """Listener loop."""
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    if message.get("type") == "message":
+                        self.handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Cache invalidation listener error: {e}")
+                await asyncio.sleep(1)
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+
+# Global invalidation listener instance
+invalidation_listener = CacheInvalidationListener()
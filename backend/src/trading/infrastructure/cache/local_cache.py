@@ -0,0 +1,173 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional, Any, Dict, Tuple, Callable, Awaitable
+
+logger = logging.getLogger(__name__)
+
+
+class LocalCache:
+    """In-process LRU cache with per-entry TTL.
+
+    Used as an L1 tier in front of Redis for tiny, very hot entries.
+    Values are returned as stored, so callers must treat them as read-only.
+    """
+
+    def __init__(self, namespace: str = "", max_size: int = 1024, default_ttl: float = 30.0):
+        self.namespace = namespace
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every invalidation.
+
+        Loaders capture it before going to Redis/DB and pass it back to
+        ``set`` so a value read before an invalidation is never cached
+        after it.
+        """
+        return self._generation
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value, or None on miss or expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None
+    ) -> bool:
+        """Store value; skipped if the cache was invalidated since ``generation``."""
+        if generation is not None and generation != self._generation:
+            return False
+
+        ttl = self.default_ttl if ttl is None else min(ttl, self.default_ttl)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return True
+
+    def delete(self, key: str) -> bool:
+        """Delete a single entry."""
+        self._generation += 1
+        return self._entries.pop(key, None) is not None
+
+    def clear(self) -> int:
+        """Drop every entry."""
+        count = len(self._entries)
+        self._entries.clear()
+        self._generation += 1
+        self.invalidations += 1
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "default_ttl": self.default_ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlight:
+    """Collapse concurrent loads of the same key into one call.
+
+    The first caller for a key runs the loader; callers arriving while it is
+    in flight await the same future and get the same result or exception.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Run loader for key unless a load is already in flight."""
+        future = self._inflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await loader()
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unobserved failure does not log a warning
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+# Process-wide L1 caches, one per namespace (repository cache prefix)
+_local_caches: Dict[str, LocalCache] = {}
+
+
+def get_local_cache(namespace: str, max_size: int = 1024, default_ttl: float = 30.0) -> LocalCache:
+    """Get or create the L1 cache for a namespace."""
+    cache = _local_caches.get(namespace)
+    if cache is None:
+        cache = LocalCache(namespace=namespace, max_size=max_size, default_ttl=default_ttl)
+        _local_caches[namespace] = cache
+    return cache
+
+
+def invalidate_local(namespace: str, key: Optional[str] = None) -> int:
+    """Clear the L1 cache for a namespace in this process (one ``key`` if given)."""
+    cache = _local_caches.get(namespace)
+    if cache is None:
+        return 0
+    if key is not None:
+        return int(cache.delete(key))
+    return cache.clear()
+
+
+def get_local_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Get statistics for every registered L1 cache."""
+    return {namespace: cache.get_stats() for namespace, cache in _local_caches.items()}
@@ -200,9 +200,8 @@ class MarketDataCache(BaseCache):
     async def get_all_symbols(self) -> List[str]:
         """Get list of all cached symbols."""
         try:
-            price_keys = await self.redis.keys(self._make_key("price:*"))
             symbols = []
-            for key in price_keys:
+            async for key in self.redis.scan_iter(match=self._make_key("price:*")):
                 # Extract symbol from key like "market:price:BTCUSDT"
                 symbol = key.split(":")[-1]
                 symbols.append(symbol)
@@ -237,9 +236,8 @@ class MarketDataCache(BaseCache):
             # Clean expired price data (older than 5 minutes)
             cutoff_time = datetime.utcnow() - timedelta(minutes=5)
             
-            price_keys = await self.redis.keys(self._make_key("price:*"))
-            for key in price_keys:
-                data = await self.redis.get(key)
+            async for key in self.redis.scan_iter(match=self._make_key("price:*")):
+                data = await self._read_raw(key)
                 if data:
                     parsed_data = self._deserialize(data)
                     if isinstance(parsed_data, dict) and "timestamp" in parsed_data:
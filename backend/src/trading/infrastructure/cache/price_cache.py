@@ -1,4 +1,7 @@
+import bisect
 import logging
+import time
+from collections import OrderedDict
 from typing import Optional, Dict, List, Any, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -7,12 +10,76 @@ from .base_cache import BaseCache
 
 logger = logging.getLogger(__name__)
 
+ALERT_CONDITIONS = ("above", "below")
 
-class PriceCache(BaseCache):
-    """Specialized cache for price data with time-series support."""
+
+def _target_price(entry: Tuple[float, str]) -> float:
+    return entry[0]
+
+
+class _SymbolAlertBook:
+    """In-process mirror of one symbol's alert index.
+    
+    Each side is a list of ``(target_price, alert_id)`` kept sorted by price,
+    so the alerts crossed by a tick are a contiguous slice found by bisection.
+    """
+    
+    __slots__ = ("above", "below", "loaded_at")
     
     def __init__(self):
+        self.above: List[Tuple[float, str]] = []
+        self.below: List[Tuple[float, str]] = []
+        self.loaded_at = time.monotonic()
+    
+    def add(self, condition: str, target_price: float, alert_id: str) -> None:
+        side = self.above if condition == "above" else self.below
+        entry = (float(target_price), alert_id)
+        index = bisect.bisect_left(side, entry)
+        if index == len(side) or side[index] != entry:
+            side.insert(index, entry)
+    
+    def remove(self, condition: str, target_price: float, alert_id: str) -> None:
+        side = self.above if condition == "above" else self.below
+        entry = (float(target_price), alert_id)
+        index = bisect.bisect_left(side, entry)
+        if index < len(side) and side[index] == entry:
+            del side[index]
+    
+    def crossed(self, current_price: float) -> List[Tuple[str, float, str]]:
+        """Return ``(condition, target_price, alert_id)`` for every crossed alert."""
+        # 'above' fires when price >= target: all targets up to current price
+        above_end = bisect.bisect_right(self.above, current_price, key=_target_price)
+        # 'below' fires when price <= target: all targets from current price up
+        below_start = bisect.bisect_left(self.below, current_price, key=_target_price)
+        
+        crossed = [("above", price, alert_id) for price, alert_id in self.above[:above_end]]
+        crossed.extend(("below", price, alert_id) for price, alert_id in self.below[below_start:])
+        return crossed
+
+
+class PriceCache(BaseCache):
+    """Specialized cache for price data with time-series support.
+    
+    Price alerts are indexed in two sorted sets per symbol
+    (``alert_index:{symbol}:above`` / ``alert_index:{symbol}:below``) scored
+    by target price, so a tick only range-queries the alerts it crosses.
+    The most recently checked symbols are additionally mirrored in process
+    and refreshed from Redis every ``alert_mirror_refresh`` seconds; a tick
+    that crosses nothing in the mirror does not touch Redis at all.
+    Alerts stored before the index existed are indexed the first time their
+    symbol is checked.
+    """
+    
+    def __init__(
+        self,
+        alert_mirror_size: int = 64,
+        alert_mirror_refresh: float = 2.0,
+    ):
         super().__init__(prefix="price", default_ttl=300)  # 5 minutes default
+        self.alert_mirror_size = alert_mirror_size
+        self.alert_mirror_refresh = alert_mirror_refresh
+        self._alert_mirror: "OrderedDict[str, _SymbolAlertBook]" = OrderedDict()
+        self._indexed_symbols: set = set()
     
     async def set_current_price(
         self, 
@@ -186,8 +253,16 @@ class PriceCache(BaseCache):
         if success:
             # Add to user's alerts index
             user_alerts_key = self._make_key(f"user_alerts:{user_id}")
-            await self.redis.sadd(user_alerts_key, alert_id)
-            await self.redis.expire(user_alerts_key, ttl)
+            await self.redis.index_add(user_alerts_key, alert_id, ttl)
+
+            # Add to the symbol's trigger index, scored by target price; a
+            # shorter-lived alert must not expire the index under longer ones
+            index_key = self._alert_index_key(symbol, condition)
+            await self.redis.sorted_index_add(index_key, {alert_id: float(target_price)}, ttl)
+            
+            book = self._alert_mirror.get(symbol)
+            if book is not None:
+                book.add(condition, target_price, alert_id)
         
         return alert_id if success else None
     
@@ -215,48 +290,139 @@ class PriceCache(BaseCache):
             logger.error(f"Error getting alerts for user {user_id}: {e}")
             return []
     
+    def _alert_index_key(self, symbol: str, condition: str) -> str:
+        """Sorted set of alert IDs for symbol/condition, scored by target price."""
+        return self._make_key(f"alert_index:{symbol}:{condition}")
+    
+    async def _backfill_alert_index(self, symbol: str) -> None:
+        """Index a symbol's alerts written before the trigger index existed.
+        
+        Runs once per symbol: a marker key tells every process the backfill
+        was done, and each process remembers symbols it has seen.
+        """
+        if symbol in self._indexed_symbols:
+            return
+        marker = self._make_key(f"alert_index_backfilled:{symbol}")
+        if not await self.redis.exists(marker):
+            alert_prefix = self._make_key("alert:")
+            backfilled = 0
+            async for key in self.redis.scan_iter(match=f"{alert_prefix}*:{symbol}:*"):
+                alert_data = await self._read_raw(key)
+                alert = self._deserialize(alert_data) if alert_data else None
+                if not isinstance(alert, dict) or alert.get("symbol") != symbol or alert.get("triggered"):
+                    continue
+                ttl = await self.redis.ttl(key)
+                if ttl == -2:
+                    continue  # expired meanwhile
+                await self.redis.sorted_index_add(
+                    self._alert_index_key(symbol, alert["condition"]),
+                    {key[len(alert_prefix):]: float(alert["target_price"])},
+                    ttl if ttl > 0 else 86400,
+                )
+                backfilled += 1
+            await self.redis.set(marker, "1")
+            if backfilled:
+                logger.info(f"Indexed {backfilled} existing price alerts for {symbol}")
+        self._indexed_symbols.add(symbol)
+    
+    async def _load_alert_book(self, symbol: str) -> _SymbolAlertBook:
+        """Load (or refresh) the in-process mirror for a symbol."""
+        book = _SymbolAlertBook()
+        for condition in ALERT_CONDITIONS:
+            entries = await self.redis.zrange(
+                self._alert_index_key(symbol, condition), 0, -1, withscores=True
+            )
+            side = book.above if condition == "above" else book.below
+            side.extend((float(score), alert_id) for alert_id, score in entries)
+            side.sort()
+        
+        self._alert_mirror[symbol] = book
+        self._alert_mirror.move_to_end(symbol)
+        while len(self._alert_mirror) > self.alert_mirror_size:
+            self._alert_mirror.popitem(last=False)
+        return book
+    
+    async def _get_alert_book(self, symbol: str) -> Optional[_SymbolAlertBook]:
+        """Return a fresh mirror for symbol, or None when mirroring is disabled."""
+        if self.alert_mirror_size <= 0:
+            return None
+        
+        book = self._alert_mirror.get(symbol)
+        if book is None or time.monotonic() - book.loaded_at >= self.alert_mirror_refresh:
+            return await self._load_alert_book(symbol)
+        
+        self._alert_mirror.move_to_end(symbol)
+        return book
+    
+    async def _crossed_alerts(
+        self, 
+        symbol: str, 
+        current_price: float
+    ) -> List[Tuple[str, float, str]]:
+        """Range-query the trigger index for alerts crossed by current_price."""
+        await self._backfill_alert_index(symbol)
+        book = await self._get_alert_book(symbol)
+        if book is not None:
+            return book.crossed(current_price)
+        
+        crossed = []
+        above = await self.redis.zrangebyscore(
+            self._alert_index_key(symbol, "above"), "-inf", current_price, withscores=True
+        )
+        crossed.extend(("above", float(score), alert_id) for alert_id, score in above)
+        below = await self.redis.zrangebyscore(
+            self._alert_index_key(symbol, "below"), current_price, "+inf", withscores=True
+        )
+        crossed.extend(("below", float(score), alert_id) for alert_id, score in below)
+        return crossed
+    
     async def check_price_alerts(self, symbol: str, current_price: float) -> List[str]:
-        """Check and trigger price alerts for symbol."""
-        pattern = self._make_key(f"alert:*:{symbol}:*")
+        """Check and trigger price alerts for symbol.
+        
+        Cost is O(log n + triggered): only alerts whose target price was
+        crossed are read. Each triggered alert is claimed by removing it from
+        the index, so concurrent checkers never trigger the same alert twice.
+        """
         triggered_alerts = []
+        current_price = float(current_price)
         
         try:
-            alert_keys = await self.redis.keys(pattern)
+            crossed = await self._crossed_alerts(symbol, current_price)
+            book = self._alert_mirror.get(symbol)
             
-            for key in alert_keys:
-                alert_data = await self.redis.get(key)
+            for condition, target_price, alert_id in crossed:
+                if book is not None:
+                    book.remove(condition, target_price, alert_id)
+                
+                # Claim the alert; another process may already have fired it
+                claimed = await self.redis.zrem(
+                    self._alert_index_key(symbol, condition), alert_id
+                )
+                if not claimed:
+                    continue
+                
+                key = self._make_key(f"alert:{alert_id}")
+                alert_data = await self._read_raw(key)
                 if not alert_data:
+                    # Alert expired; its index entry is now gone as well
                     continue
                 
                 alert = self._deserialize(alert_data)
                 if not isinstance(alert, dict) or alert.get("triggered"):
                     continue
                 
-                target_price = alert["target_price"]
-                condition = alert["condition"]
+                # Mark as triggered
+                alert["triggered"] = True
+                alert["triggered_at"] = datetime.utcnow().isoformat()
+                alert["triggered_price"] = current_price
                 
-                triggered = False
-                if condition == "above" and current_price >= target_price:
-                    triggered = True
-                elif condition == "below" and current_price <= target_price:
-                    triggered = True
-                
-                if triggered:
-                    # Mark as triggered
-                    alert["triggered"] = True
-                    alert["triggered_at"] = datetime.utcnow().isoformat()
-                    alert["triggered_price"] = current_price
-                    
-                    await self.redis.set(key, self._serialize(alert), ex=3600)
-                    
-                    # Extract alert ID from key
-                    alert_id = key.replace(self._make_key("alert:"), "")
-                    triggered_alerts.append(alert_id)
+                await self.redis.set(key, self._serialize(alert), ex=3600)
+                triggered_alerts.append(alert_id)
             
             return triggered_alerts
         except Exception as e:
             logger.error(f"Error checking price alerts for {symbol}: {e}")
-            return []
+            return triggered_alerts
     
     async def delete_price_alert(self, alert_id: str) -> bool:
         """Delete price alert."""
@@ -270,10 +436,18 @@ class PriceCache(BaseCache):
         key = f"alert:{alert_id}"
         success = await self.delete(key)
         
-        # Remove from user's alerts
+        # Remove from user's alerts and the trigger index
         if success:
             user_alerts_key = self._make_key(f"user_alerts:{user_id}")
             await self.redis.srem(user_alerts_key, alert_id)
+            
+            symbol = alert["symbol"]
+            condition = alert["condition"]
+            await self.redis.zrem(self._alert_index_key(symbol, condition), alert_id)
+            
+            book = self._alert_mirror.get(symbol)
+            if book is not None:
+                book.remove(condition, alert["target_price"], alert_id)
         
         return success
     
@@ -319,15 +493,13 @@ class PriceCache(BaseCache):
         
         try:
             # Clean price series
-            series_keys = await self.redis.keys(self._make_key("series:*"))
-            for key in series_keys:
+            async for key in self.redis.scan_iter(match=self._make_key("series:*")):
                 removed = await self.redis.zremrangebyscore(key, 0, cutoff_score)
                 cleaned["series_points"] += removed
             
             # Clean old alerts
-            alert_keys = await self.redis.keys(self._make_key("alert:*"))
-            for key in alert_keys:
-                data = await self.redis.get(key)
+            async for key in self.redis.scan_iter(match=self._make_key("alert:*")):
+                data = await self._read_raw(key)
                 if data:
                     alert = self._deserialize(data)
                     if isinstance(alert, dict) and "created_at" in alert:
@@ -335,6 +507,11 @@ class PriceCache(BaseCache):
                             created_time = datetime.fromisoformat(alert["created_at"])
                             if created_time < cutoff_time:
                                 await self.redis.delete(key)
+                                alert_id = key.replace(self._make_key("alert:"), "", 1)
+                                await self.redis.zrem(
+                                    self._alert_index_key(alert["symbol"], alert["condition"]),
+                                    alert_id,
+                                )
                                 cleaned["alerts"] += 1
                         except (ValueError, TypeError):
                             continue
@@ -1,11 +1,12 @@
 import asyncio
 import logging
-from typing import Optional, Any, Dict, List, Union
+from typing import Optional, Any, Dict, List, Union, AsyncIterator
 import redis.asyncio as redis
-import json
+from redis.client import NEVER_DECODE
 from datetime import datetime, timedelta
 
 from ..config.settings import get_settings
+from ...performance.json.codec import decode_value, json_dumps
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -18,49 +19,54 @@ class RedisClient:
         self._redis: Optional[redis.Redis] = None
         self._connection_pool: Optional[redis.ConnectionPool] = None
         self._is_connected = False
+        self._scripts: Dict[str, Any] = {}
+        # Startup services connect concurrently; only one may build the pool
+        self._connect_lock = asyncio.Lock()
         
     async def connect(self):
         """Establish Redis connection."""
-        if self._is_connected:
-            return
+        async with self._connect_lock:
+            if self._is_connected:
+                return
         
-        try:
-            # Create connection pool
-            logger.info(f"Connecting to Redis at {settings.REDIS_HOST}:{settings.REDIS_PORT} db={settings.REDIS_DB}")
-            self._connection_pool = redis.ConnectionPool(
-                host=settings.REDIS_HOST,
-                port=settings.REDIS_PORT,
-                db=settings.REDIS_DB,
-                password=settings.REDIS_PASSWORD,
-                decode_responses=True,
-                max_connections=settings.REDIS_MAX_CONNECTIONS,
-                retry_on_timeout=True,
-                health_check_interval=30,
-            )
+            try:
+                # Create connection pool
+                logger.info(f"Connecting to Redis at {settings.REDIS_HOST}:{settings.REDIS_PORT} db={settings.REDIS_DB}")
+                self._connection_pool = redis.ConnectionPool(
+                    host=settings.REDIS_HOST,
+                    port=settings.REDIS_PORT,
+                    db=settings.REDIS_DB,
+                    password=settings.REDIS_PASSWORD,
+                    decode_responses=True,
+                    max_connections=settings.REDIS_MAX_CONNECTIONS,
+                    retry_on_timeout=True,
+                    health_check_interval=30,
+                )
             
-            # Create Redis client
-            self._redis = redis.Redis(
-                connection_pool=self._connection_pool,
-                socket_connect_timeout=5,
-                socket_timeout=5,
-            )
+                # Create Redis client
+                self._redis = redis.Redis(
+                    connection_pool=self._connection_pool,
+                    socket_connect_timeout=5,
+                    socket_timeout=5,
+                )
             
-            # Test connection
-            await self._redis.ping()
-            self._is_connected = True
+                # Test connection
+                await self._redis.ping()
+                self._is_connected = True
             
-            logger.info("Redis connected successfully")
+                logger.info("Redis connected successfully")
             
-        except Exception as e:
-            logger.error(f"Failed to connect to Redis: {e!r} (str={e})")
-            self._is_connected = False
-            raise
+            except Exception as e:
+                logger.error(f"Failed to connect to Redis: {e!r} (str={e})")
+                self._is_connected = False
+                raise
     
     async def disconnect(self):
         """Close Redis connection."""
         if self._redis:
             await self._redis.aclose()
             self._redis = None
+        self._scripts.clear()
         
         if self._connection_pool:
             await self._connection_pool.aclose()
@@ -154,6 +160,26 @@ class RedisClient:
             logger.error(f"Redis GET error for key {key}: {e}")
             return None
     
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """Get a value undecoded (binary codecs such as msgpack)."""
+        await self.ensure_connected()
+        try:
+            return await self._redis.execute_command("GET", key, **{NEVER_DECODE: []})
+        except Exception as e:
+            logger.error(f"Redis GET error for key {key}: {e}")
+            return None
+    
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Get several values in one round trip (None for missing keys)."""
+        if not keys:
+            return []
+        await self.ensure_connected()
+        try:
+            return await self._redis.mget(keys)
+        except Exception as e:
+            logger.error(f"Redis MGET error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+    
     async def set(
         self, 
         key: str, 
@@ -349,8 +375,153 @@ class RedisClient:
             logger.error(f"Redis ZREM error for sorted set {name}: {e}")
             return 0
     
+    async def scard(self, name: str) -> int:
+        """Get cardinality of set."""
+        await self.ensure_connected()
+        try:
+            return await self._redis.scard(name)
+        except Exception as e:
+            logger.error(f"Redis SCARD error for set {name}: {e}")
+            return 0
+    
+    async def zremrangebyscore(self, name: str, min_score: Union[float, str], max_score: Union[float, str]) -> int:
+        """Remove sorted set members within score range."""
+        await self.ensure_connected()
+        try:
+            return await self._redis.zremrangebyscore(name, min_score, max_score)
+        except Exception as e:
+            logger.error(f"Redis ZREMRANGEBYSCORE error for sorted set {name}: {e}")
+            return 0
+    
+    async def unlink(self, *keys: str) -> int:
+        """Delete keys, reclaiming memory in a background thread on the server."""
+        await self.ensure_connected()
+        try:
+            return await self._redis.unlink(*keys)
+        except Exception as e:
+            logger.error(f"Redis UNLINK error for {len(keys)} keys: {e}")
+            return 0
+    
+    async def scan_iter(self, match: str = "*", count: int = 1000) -> AsyncIterator[str]:
+        """Iterate keys matching pattern with SCAN.
+        
+        Unlike KEYS this never blocks the server for the whole keyspace;
+        each step returns roughly ``count`` keys.
+        """
+        await self.ensure_connected()
+        try:
+            async for key in self._redis.scan_iter(match=match, count=count):
+                yield key
+        except Exception as e:
+            logger.error(f"Redis SCAN error for pattern {match}: {e}")
+    
+    async def sscan_iter(self, name: str, match: Optional[str] = None, count: int = 1000) -> AsyncIterator[str]:
+        """Iterate members of a set with SSCAN."""
+        await self.ensure_connected()
+        try:
+            async for member in self._redis.sscan_iter(name, match=match, count=count):
+                yield member
+        except Exception as e:
+            logger.error(f"Redis SSCAN error for set {name}: {e}")
+    
+    async def delete_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """Delete all keys matching pattern using SCAN + batched UNLINK."""
+        deleted = 0
+        batch: List[str] = []
+        async for key in self.scan_iter(match=pattern, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted += await self.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await self.unlink(*batch)
+        return deleted
+    
+    async def delete_indexed(self, index_key: str, batch_size: int = 500) -> int:
+        """Delete every key listed in an index set, then the index itself."""
+        deleted = 0
+        batch: List[str] = []
+        async for key in self.sscan_iter(index_key, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted += await self.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await self.unlink(*batch)
+        await self.unlink(index_key)
+        return deleted
+    
+    async def index_add(self, index_key: str, member: str, ttl: int) -> bool:
+        """Add member to an index set whose TTL never drops below ttl.
+        
+        The index outlives every key it lists, so invalidating through it
+        cannot miss a live key.
+        """
+        await self.ensure_connected()
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.sadd(index_key, member)
+            pipe.expire(index_key, ttl, nx=True)
+            pipe.expire(index_key, ttl, gt=True)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis index add error for set {index_key}: {e}")
+            return False
+
+    async def sorted_index_add(self, index_key: str, mapping: Dict[str, float], ttl: int) -> bool:
+        """Add scored members to an index sorted set whose TTL never drops below ttl.
+
+        Sorted-set counterpart of index_add.
+        """
+        await self.ensure_connected()
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.zadd(index_key, mapping)
+            pipe.expire(index_key, ttl, nx=True)
+            pipe.expire(index_key, ttl, gt=True)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis index add error for sorted set {index_key}: {e}")
+            return False
+
+    async def blpop(self, keys: List[str], timeout: float = 0) -> Optional[tuple]:
+        """Pop from the first non-empty list, blocking up to timeout seconds.
+        
+        Holds a pool connection while blocked; share one waiter per process
+        rather than blocking from every coroutine.
+        """
+        await self.ensure_connected()
+        try:
+            return await self._redis.blpop(keys, timeout=timeout)
+        except Exception as e:
+            logger.error(f"Redis BLPOP error for keys {keys}: {e}")
+            return None
+    
+    async def run_script(self, script: str, keys: List[str], args: List[Any]) -> Any:
+        """Run a Lua script atomically.
+        
+        Scripts are registered once and invoked by SHA (EVALSHA), falling
+        back to EVAL transparently when the server's script cache is empty.
+        """
+        await self.ensure_connected()
+        try:
+            registered = self._scripts.get(script)
+            if registered is None:
+                registered = self._redis.register_script(script)
+                self._scripts[script] = registered
+            return await registered(keys=keys, args=args)
+        except Exception as e:
+            logger.error(f"Redis script error for keys {keys}: {e}")
+            return None
+    
     async def keys(self, pattern: str = "*") -> List[str]:
-        """Get keys matching pattern."""
+        """Get keys matching pattern.
+        
+        KEYS is O(total keyspace) and blocks the server; prefer
+        ``scan_iter`` or a maintained index set.
+        """
         await self.ensure_connected()
         try:
             return await self._redis.keys(pattern)
@@ -358,6 +529,20 @@ class RedisClient:
             logger.error(f"Redis KEYS error for pattern {pattern}: {e}")
             return []
     
+    async def publish(self, channel: str, message: str) -> int:
+        """Publish message to channel."""
+        await self.ensure_connected()
+        try:
+            return await self._redis.publish(channel, message)
+        except Exception as e:
+            logger.error(f"Redis PUBLISH error for channel {channel}: {e}")
+            return 0
+
+    async def pubsub(self) -> redis.client.PubSub:
+        """Create a PubSub object sharing the client's connection pool."""
+        await self.ensure_connected()
+        return self._redis.pubsub(ignore_subscribe_messages=True)
+
     async def flushdb(self) -> bool:
         """Clear current database."""
         await self.ensure_connected()
@@ -388,14 +573,11 @@ class RedisClient:
     
     def get_json(self, data: Any) -> str:
         """Serialize data to JSON string."""
-        return json.dumps(data, default=str)
+        return json_dumps(data)
     
     def parse_json(self, data: str) -> Any:
         """Parse JSON string to data."""
-        try:
-            return json.loads(data)
-        except (json.JSONDecodeError, TypeError):
-            return data
+        return decode_value(data)
     
     @property
     def is_connected(self) -> bool:
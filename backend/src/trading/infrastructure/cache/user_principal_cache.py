@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime
+from typing import Optional, Dict, Any, Set
+
+from sqlalchemy import event
+
+from .base_cache import BaseCache
+from .local_cache import get_local_cache
+from .invalidation import invalidation_listener
+
+logger = logging.getLogger(__name__)
+
+# Session.info entry holding user ids to invalidate once the transaction commits
+_PENDING_KEY = "principal_invalidations"
+
+
+class UserPrincipalCache(BaseCache):
+    """Short-TTL cache of authenticated users for request authentication.
+
+    Two tiers keyed by user id: an in-process L1 (``local_ttl`` seconds)
+    in front of Redis (``default_ttl`` seconds). Entries are plain dicts and
+    every lookup builds a fresh ``User``, so endpoints that mutate the
+    current user never touch the cached copy. Writers call
+    ``invalidate_after_commit`` whenever a principal field changes.
+
+    The password hash is never cached: cached users carry an empty hash,
+    which verifies nothing and which ``UserRepository.save`` does not write.
+    ``last_login_at`` is cached but may lag by up to the TTL, since logins
+    do not invalidate.
+
+    Keyed by user id rather than by token: invalidation has to reach every
+    entry of a user, and tokens are already memoized by
+    ``verify_access_token``.
+    """
+
+    NAMESPACE = "principal"
+
+    def __init__(self, default_ttl: int = 60, local_ttl: int = 10, local_size: int = 10000):
+        super().__init__(prefix=self.NAMESPACE, default_ttl=default_ttl)
+        self.local = get_local_cache(self.NAMESPACE, max_size=local_size, default_ttl=local_ttl)
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get_user(self, user_id: uuid.UUID) -> Optional[Any]:
+        """Get cached user entity, or None on miss."""
+        key = f"user:{user_id}"
+
+        data = self.local.get(key)
+        if data is None:
+            generation = self.local.generation
+            data = await self.get(key)
+            if not isinstance(data, dict):
+                return None
+            self.local.set(key, data, generation=generation)
+
+        try:
+            return self._to_entity(data)
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning(f"Discarding malformed principal for user {user_id}: {e}")
+            self.local.delete(key)
+            return None
+
+    async def set_user(self, user: Any) -> bool:
+        """Cache user entity in both tiers."""
+        key = f"user:{user.id}"
+        data = self._to_dict(user)
+        generation = self.local.generation
+        success = await self.set(key, data)
+        self.local.set(key, data, generation=generation)
+        return success
+
+    async def invalidate(self, user_id: uuid.UUID) -> bool:
+        """Drop a user from every tier in every process."""
+        key = f"user:{user_id}"
+        self.local.delete(key)
+        try:
+            deleted = await self.delete(key)
+            await invalidation_listener.publish(self.NAMESPACE, key)
+            return deleted
+        except Exception as e:
+            logger.error(f"Error invalidating principal for user {user_id}: {e}")
+            return False
+
+    def invalidate_after_commit(self, session: Any, user_id: uuid.UUID) -> None:
+        """Invalidate a user once ``session`` commits.
+
+        Invalidating before the commit would let a concurrent request
+        re-cache the old row for the full TTL.
+        """
+        sync_session = getattr(session, "sync_session", session)
+        pending = sync_session.info.setdefault(_PENDING_KEY, set())
+        if not pending:
+            event.listen(sync_session, "after_commit", self._on_commit, once=True)
+        pending.add(user_id)
+
+    def _on_commit(self, sync_session: Any) -> None:
+        for user_id in sync_session.info.pop(_PENDING_KEY, ()):
+            # L1 right away; Redis and other processes from a task (commit hooks are sync)
+            self.local.delete(f"user:{user_id}")
+            task = asyncio.get_running_loop().create_task(self.invalidate(user_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    def _to_dict(user: Any) -> Dict[str, Any]:
+        return {
+            "id": str(user.id),
+            "email": user.email.value,
+            "full_name": user.full_name,
+            "timezone": user.timezone,
+            "is_active": user.is_active,
+            "preferences": user.preferences,
+            "created_at": user.created_at.isoformat() if user.created_at else None,
+            "last_login_at": user.last_login_at.isoformat() if user.last_login_at else None,
+        }
+
+    @staticmethod
+    def _to_entity(data: Dict[str, Any]) -> Any:
+        from ...domain.user import User, Email, HashedPassword
+
+        return User(
+            id=uuid.UUID(data["id"]),
+            email=Email(data["email"]),
+            password=HashedPassword(value=""),
+            full_name=data.get("full_name"),
+            timezone=data.get("timezone") or "UTC",
+            is_active=data["is_active"],
+            preferences=dict(data.get("preferences") or {}),
+            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
+            last_login_at=datetime.fromisoformat(data["last_login_at"]) if data.get("last_login_at") else None,
+        )
+
+
+# Global user principal cache instance
+user_principal_cache = UserPrincipalCache()
@@ -128,13 +128,12 @@ class UserSessionCache(BaseCache):
         try:
             # Get all session keys
             pattern = self._make_key("user:*:*")
-            session_keys = await self.redis.keys(pattern)
             
             cleaned_count = 0
             cutoff_time = datetime.utcnow() - timedelta(hours=24)  # 24 hours
             
-            for key in session_keys:
-                data = await self.redis.get(key)
+            async for key in self.redis.scan_iter(match=pattern):
+                data = await self._read_raw(key)
                 if data:
                     session_data = self._deserialize(data)
                     if isinstance(session_data, dict) and "last_activity" in session_data:
@@ -195,7 +194,13 @@ class UserSessionCache(BaseCache):
             "created_at": datetime.utcnow().isoformat()
         }
         
-        return await self.set(key, sub_data, ttl)
+        success = await self.set(key, sub_data, ttl)
+        if success:
+            # Index subscription types per user so lookups avoid key scans
+            await self.redis.index_add(
+                self._make_key(f"subscriptions:{user_id}"), subscription_type, ttl
+            )
+        return success
     
     async def get_user_subscription(
         self, 
@@ -208,17 +213,21 @@ class UserSessionCache(BaseCache):
     
     async def get_user_subscriptions(self, user_id: str) -> Dict[str, Dict[str, Any]]:
         """Get all user subscriptions."""
-        pattern = self._make_key(f"subscription:{user_id}:*")
+        index_key = self._make_key(f"subscriptions:{user_id}")
         try:
-            keys = await self.redis.keys(pattern)
+            sub_types = await self.redis.smembers(index_key)
             subscriptions = {}
+            expired = []
             
-            for key in keys:
-                # Extract subscription type from key
-                sub_type = key.split(":")[-1]
-                data = await self.redis.get(key)
+            for sub_type in sub_types:
+                data = await self.get_user_subscription(user_id, sub_type)
                 if data:
-                    subscriptions[sub_type] = self._deserialize(data)
+                    subscriptions[sub_type] = data
+                else:
+                    expired.append(sub_type)
+            
+            if expired:
+                await self.redis.srem(index_key, *expired)
             
             return subscriptions
         except Exception as e:
@@ -232,6 +241,7 @@ class UserSessionCache(BaseCache):
     ) -> bool:
         """Delete user subscription."""
         key = f"subscription:{user_id}:{subscription_type}"
+        await self.redis.srem(self._make_key(f"subscriptions:{user_id}"), subscription_type)
         return await self.delete(key)
     
     async def set_rate_limit(
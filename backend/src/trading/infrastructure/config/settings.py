@@ -50,6 +50,12 @@ class Settings(BaseSettings):
     REDIS_PASSWORD: str = os.getenv("REDIS_PASSWORD", "")
     REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "20"))
     REDIS_CACHE_TTL: int = 300  # 5 minutes
+    # Codec of cache values: "json" or "msgpack" (needs the msgpack package)
+    CACHE_VALUE_CODEC: str = os.getenv("CACHE_VALUE_CODEC", "json")
+    # In-process (L1) tier of read-mostly repositories (strategies, exchange metadata).
+    # Pub/sub invalidation keeps it coherent; the TTL bounds staleness if a message is missed
+    REPOSITORY_L1_CACHE_SIZE: int = int(os.getenv("REPOSITORY_L1_CACHE_SIZE", "1024"))
+    REPOSITORY_L1_CACHE_TTL: int = int(os.getenv("REPOSITORY_L1_CACHE_TTL", "30"))
     
     # JWT
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "dev-jwt-secret-change-in-production")
@@ -83,11 +89,38 @@ class Settings(BaseSettings):
     # WebSocket
     WS_HEARTBEAT_INTERVAL: int = 30  # seconds
     WS_MAX_CONNECTIONS: int = 1000
+    ORDERBOOK_PUBLISH_INTERVAL: float = 0.25  # seconds between book snapshots to subscribers
+    ORDERBOOK_PUBLISH_LEVELS: int = 20
+
+    # Trade capture (aggTrade/bookTicker -> market_trades/market_quotes); empty = off
+    TRADE_CAPTURE_SYMBOLS: str = os.getenv("TRADE_CAPTURE_SYMBOLS", "")
+    TRADE_CAPTURE_FLUSH_ROWS: int = 5000
+    TRADE_CAPTURE_FLUSH_INTERVAL: float = 1.0  # seconds
+    TRADE_CAPTURE_MAX_PENDING_BATCHES: int = 20
+
+    # Market data retention in whole months (monthly partitions are dropped); 0 = keep
+    CANDLE_RETENTION_MONTHS: int = int(os.getenv("CANDLE_RETENTION_MONTHS", "0"))
+    ORDERBOOK_RETENTION_MONTHS: int = int(os.getenv("ORDERBOOK_RETENTION_MONTHS", "3"))
+    TICK_RETENTION_MONTHS: int = int(os.getenv("TICK_RETENTION_MONTHS", "3"))
+
+    # Intrabar backtest fills: on-disk cache of trade paths (empty = system temp dir)
+    BACKTEST_INTRABAR_CACHE_DIR: str = os.getenv("BACKTEST_INTRABAR_CACHE_DIR", "")
     
     # Performance
     MAX_WORKERS: int = 4
+    # Live path latency histograms served on /metrics
+    LATENCY_METRICS_ENABLED: bool = True
+    # Bearer token for /metrics; without one it is only served in development
+    METRICS_TOKEN: str = os.getenv("METRICS_TOKEN", "")
     BATCH_SIZE: int = 100
     
+    # Background jobs
+    # Queues consumed by the API process's in-process worker; set to "default"
+    # when standalone workers (python -m trading.interfaces.workers) run the rest
+    JOB_WORKER_QUEUES: str = os.getenv("JOB_WORKER_QUEUES", "default,marketdata")
+    WORKER_METRICS_PORT: int = int(os.getenv("WORKER_METRICS_PORT", "9100"))
+    WORKER_DRAIN_TIMEOUT: float = float(os.getenv("WORKER_DRAIN_TIMEOUT", "30"))
+    
     class Config:
         """Pydantic config."""
         env_file = ".env"
@@ -0,0 +1,253 @@
+"""Pooled, long-lived exchange adapters keyed by exchange connection id"""
+import asyncio
+import hashlib
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set
+
+from sqlalchemy import event
+
+from .binance_adapter import BinanceAdapter
+from ..cache.local_cache import SingleFlight, get_local_cache
+from ..cache.invalidation import invalidation_listener
+from ...performance.concurrency.async_tools import AsyncRateLimiter
+
+logger = logging.getLogger(__name__)
+
+CREDENTIALS_NAMESPACE = "exchange_credentials"
+
+# Session.info entry holding connection ids to invalidate once the transaction commits
+_PENDING_KEY = "exchange_credential_invalidations"
+
+BINANCE_FUTURES_URL = "https://fapi.binance.com"
+BINANCE_FUTURES_DEMO_URL = "https://demo-fapi.binance.com"
+
+
+def _fingerprint(credentials: Dict[str, Any]) -> str:
+    """Identify a credential set without keeping another copy of the secret."""
+    material = "\x00".join([
+        str(credentials.get("api_key") or ""),
+        str(credentials.get("api_secret") or ""),
+        str(credentials.get("api_passphrase") or ""),
+        str(bool(credentials.get("is_testnet"))),
+    ])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _default_adapter_factory(credentials: Dict[str, Any]) -> BinanceAdapter:
+    is_testnet = bool(credentials.get("is_testnet"))
+    return BinanceAdapter(
+        api_key=credentials["api_key"],
+        api_secret=credentials["api_secret"],
+        base_url=BINANCE_FUTURES_DEMO_URL if is_testnet else BINANCE_FUTURES_URL,
+        testnet=is_testnet,
+    )
+
+
+class _PooledAdapter:
+    """One adapter plus the limits that apply to its account."""
+
+    def __init__(self, adapter: Any, fingerprint: str, max_concurrency: int,
+                 rate_limit: int, rate_period: float):
+        self.adapter = adapter
+        self.fingerprint = fingerprint
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.limiter = AsyncRateLimiter(max_calls=rate_limit, period=rate_period)
+        self.in_flight = 0
+        self.last_used = time.monotonic()
+        self.retired = False
+
+
+class ExchangeAdapterPool:
+    """Long-lived exchange adapters shared per exchange connection.
+
+    Decrypted credentials are held in an in-process cache for
+    ``credentials_ttl`` seconds. ``invalidate`` drops them in this process
+    and broadcasts to others, so a rotated or deleted key stops being used
+    straight away. If a lease brings different credentials than the pooled
+    adapter was built with, the adapter is retired and a fresh one is built.
+
+    Adapters keep their HTTP session open between requests. Every lease
+    counts against a per-connection concurrency cap and rate limit.
+    Retired and idle adapters are closed once no lease holds them.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 5,
+        rate_limit: int = 20,
+        rate_period: float = 1.0,
+        idle_ttl: float = 300.0,
+        credentials_ttl: int = 300,
+        adapter_factory: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.rate_limit = rate_limit
+        self.rate_period = rate_period
+        self.idle_ttl = idle_ttl
+        self.credentials = get_local_cache(
+            CREDENTIALS_NAMESPACE, max_size=10000, default_ttl=credentials_ttl
+        )
+        self._adapter_factory = adapter_factory or _default_adapter_factory
+        self._entries: Dict[str, _PooledAdapter] = {}
+        self._loads = SingleFlight()
+        self._last_sweep = time.monotonic()
+        self._tasks: Set[asyncio.Task] = set()
+        self.adapters_created = 0
+
+    async def get_credentials(
+        self,
+        connection_id: Any,
+        user_id: Any,
+        loader: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Get decrypted credentials, calling ``loader`` only on a miss.
+
+        Cached entries are bound to the owning user; a lookup by anyone else
+        falls through to ``loader``, which enforces ownership.
+        """
+        key = str(connection_id)
+        entry = self.credentials.get(key)
+        if entry is not None and entry["user_id"] == str(user_id):
+            return entry["credentials"]
+
+        async def load() -> Dict[str, Any]:
+            generation = self.credentials.generation
+            credentials = await loader()
+            self.credentials.set(
+                key,
+                {"user_id": str(user_id), "credentials": credentials},
+                generation=generation,
+            )
+            return credentials
+
+        return await self._loads.do(f"{key}:{user_id}", load)
+
+    @asynccontextmanager
+    async def lease(self, connection_id: Any, credentials: Dict[str, Any]) -> AsyncIterator[Any]:
+        """Borrow the pooled adapter for a connection.
+
+        Waits for a concurrency slot and the rate limiter. The adapter must
+        not be closed by the caller.
+        """
+        entry = self._get_entry(str(connection_id), credentials)
+        entry.in_flight += 1
+        try:
+            async with entry.semaphore:
+                async with entry.limiter:
+                    entry.last_used = time.monotonic()
+                    yield entry.adapter
+        finally:
+            entry.in_flight -= 1
+            entry.last_used = time.monotonic()
+            if entry.retired and entry.in_flight == 0:
+                await self._close_adapter(entry)
+
+    async def invalidate(self, connection_id: Any) -> None:
+        """Forget credentials and adapter for a connection in every process."""
+        key = str(connection_id)
+        self.credentials.delete(key)
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            await self._retire(entry)
+        try:
+            await invalidation_listener.publish(CREDENTIALS_NAMESPACE)
+        except Exception as e:
+            logger.error(f"Error broadcasting credential invalidation for {key}: {e}")
+
+    def invalidate_after_commit(self, session: Any, connection_id: Any) -> None:
+        """Invalidate a connection once ``session`` commits.
+
+        Invalidating before the commit would let a concurrent lease reload
+        the old keys for the full TTL.
+        """
+        sync_session = getattr(session, "sync_session", session)
+        pending = sync_session.info.setdefault(_PENDING_KEY, set())
+        if not pending:
+            event.listen(sync_session, "after_commit", self._on_commit, once=True)
+        pending.add(str(connection_id))
+
+    def _on_commit(self, sync_session: Any) -> None:
+        for key in sync_session.info.pop(_PENDING_KEY, ()):
+            # Cached keys right away; adapters and other processes from a task (commit hooks are sync)
+            self.credentials.delete(key)
+            task = asyncio.get_running_loop().create_task(self.invalidate(key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def close_all(self) -> None:
+        """Close every pooled adapter (application shutdown)."""
+        entries = list(self._entries.values())
+        self._entries.clear()
+        self.credentials.clear()
+        for entry in entries:
+            await self._close_adapter(entry)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            "adapters": len(self._entries),
+            "in_flight": sum(e.in_flight for e in self._entries.values()),
+            "adapters_created": self.adapters_created,
+            "credentials": self.credentials.get_stats(),
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_entry(self, key: str, credentials: Dict[str, Any]) -> _PooledAdapter:
+        self._sweep_idle()
+
+        fingerprint = _fingerprint(credentials)
+        entry = self._entries.get(key)
+        if entry is not None and entry.fingerprint == fingerprint:
+            return entry
+
+        if entry is not None:
+            logger.info(f"Credentials for connection {key} changed, replacing adapter")
+            self._schedule_retire(entry)
+
+        entry = _PooledAdapter(
+            adapter=self._adapter_factory(credentials),
+            fingerprint=fingerprint,
+            max_concurrency=self.max_concurrency,
+            rate_limit=self.rate_limit,
+            rate_period=self.rate_period,
+        )
+        self._entries[key] = entry
+        self.adapters_created += 1
+        return entry
+
+    def _sweep_idle(self) -> None:
+        """Retire adapters nobody has leased for ``idle_ttl`` seconds."""
+        now = time.monotonic()
+        if now - self._last_sweep < min(self.idle_ttl, 60.0):
+            return
+        self._last_sweep = now
+
+        for key, entry in list(self._entries.items()):
+            if entry.in_flight == 0 and now - entry.last_used >= self.idle_ttl:
+                del self._entries[key]
+                self._schedule_retire(entry)
+
+    def _schedule_retire(self, entry: _PooledAdapter) -> None:
+        entry.retired = True
+        if entry.in_flight == 0:
+            asyncio.create_task(self._close_adapter(entry))
+
+    async def _retire(self, entry: _PooledAdapter) -> None:
+        entry.retired = True
+        if entry.in_flight == 0:
+            await self._close_adapter(entry)
+
+    @staticmethod
+    async def _close_adapter(entry: _PooledAdapter) -> None:
+        try:
+            await entry.adapter.close()
+        except Exception as e:
+            logger.error(f"Error closing pooled exchange adapter: {e}")
+
+
+# Global exchange adapter pool instance
+exchange_adapter_pool = ExchangeAdapterPool()
@@ -1,9 +1,10 @@
 """Binance Futures adapter implementation"""
+import logging
 import time
 import hmac
 import hashlib
 from typing import Dict, Any, List, Optional
-from decimal import Decimal
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR
 
 from .exchange_gateway import (
     ExchangeGateway,
@@ -11,8 +12,14 @@ from .exchange_gateway import (
     BalanceData,
     PositionData
 )
+from .rate_limiter import get_rate_limiter
+from .symbol_registry import symbol_registry, is_filter_error
+from ...performance.http.async_pool import get_http_pool
+from ...performance.profiling.latency_histogram import latency_registry
 from src.trading.shared.errors.infrastructure_errors import ExternalAPIError as ExchangeAPIError
 
+logger = logging.getLogger(__name__)
+
 
 class BinanceAdapter(ExchangeGateway):
     """
@@ -33,15 +40,15 @@ class BinanceAdapter(ExchangeGateway):
         self._base_url = base_url
         self._testnet = testnet
         
-        # Use performance-optimized HTTP client if available
-        try:
-            from src.trading.performance.http_pool import HTTPPoolManager
-            self._http = HTTPPoolManager(pool_size=10)
-        except ImportError:
-            # Fallback to basic implementation
-            import aiohttp
-            self._session = None
+        # Connections and request weight are shared by every adapter in
+        # the process; order counts are tracked per API key
+        self._http = get_http_pool()
+        self._limiter = get_rate_limiter(base_url)
             
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+    
     def _normalize_symbol(self, symbol: str) -> str:
         """Convert BTC/USDT to BTCUSDT"""
         if not symbol:
@@ -124,10 +131,10 @@ class BinanceAdapter(ExchangeGateway):
             
         response = await self._signed_request("GET", "/fapi/v2/positionRisk", params)
         
-        # Debug: Print raw response to see all fields from Binance
-        if response:
-            for pos in response[:2]:  # Print first 2 only to not flood logs
-                print(f"DEBUG [Position Risk] Raw: {pos}")
+        # Raw response shows all fields from Binance
+        if response and logger.isEnabledFor(logging.DEBUG):
+            for pos in response[:2]:  # First 2 only to not flood logs
+                logger.debug("Position risk raw: %s", pos)
         
         return response
 
@@ -161,6 +168,21 @@ class BinanceAdapter(ExchangeGateway):
         **kwargs
     ) -> Dict[str, Any]:
         """Create new order"""
+        # Snap quantity and prices to the symbol's lot step and tick size;
+        # prices move away from the market (BUY down, SELL up)
+        try:
+            filters = await symbol_registry.get(self._base_url, symbol, self.get_exchange_info)
+        except Exception as e:
+            logger.warning(f"Symbol filters unavailable for {symbol}, sending order unrounded: {e}")
+            filters = None
+        if filters:
+            quantity = filters.round_quantity(Decimal(str(quantity)), market=type == "MARKET")
+            rounding = ROUND_FLOOR if side == "BUY" else ROUND_CEILING
+            if price:
+                price = filters.round_price(Decimal(str(price)), rounding)
+            if kwargs.get("stopPrice"):
+                kwargs["stopPrice"] = str(filters.round_price(Decimal(str(kwargs["stopPrice"]))))
+        
         params = {
             "symbol": self._normalize_symbol(symbol),
             "side": side,
@@ -182,8 +204,17 @@ class BinanceAdapter(ExchangeGateway):
             if type == "LIMIT" and "timeInForce" not in params:
                 params["timeInForce"] = "GTC"
             
-        print(f"DEBUG [BinanceAdapter]: Sending order params: {params}")
-        return await self._signed_request("POST", "/fapi/v1/order", params)
+        logger.debug("Sending order params: %s", params)
+        sent = latency_registry.mark_submit(params["symbol"])
+        try:
+            response = await self._signed_request("POST", "/fapi/v1/order", params)
+        except ExchangeAPIError as e:
+            # Filters may have changed on the exchange: reload before the next order
+            if is_filter_error(str(e)):
+                await symbol_registry.invalidate(self._base_url)
+            raise
+        latency_registry.mark_ack(sent, params["symbol"], response.get("orderId"))
+        return response
 
     async def cancel_order(self, symbol: str, order_id: str) -> Dict[str, Any]:
         """Cancel an order"""
@@ -251,6 +282,10 @@ class BinanceAdapter(ExchangeGateway):
         response = await self._request("GET", "/fapi/v1/ticker/price", params)
         return Decimal(response["price"])
 
+    async def get_exchange_info(self) -> Dict[str, Any]:
+        """Get exchange trading rules and symbol filters"""
+        return await self._request("GET", "/fapi/v1/exchangeInfo")
+
     async def get_earliest_valid_timestamp(self, symbol: str, interval: str) -> int:
         """Get earliest valid timestamp for symbol"""
         # Fetch first available candle by requesting from start_time=0
@@ -271,67 +306,49 @@ class BinanceAdapter(ExchangeGateway):
     
     async def _request(self, method: str, endpoint: str, params: Dict = None) -> Dict[str, Any]:
         """Make unsigned request"""
-        url = f"{self._base_url}{endpoint}"
-        
-        # Use optimized HTTP client if available
-        if hasattr(self, '_http'):
-            response = await self._http.get(url, params=params)
-            return response
-        else:
-            # Fallback to aiohttp
-            if self._session is None:
-                import aiohttp
-                self._session = aiohttp.ClientSession()
-            
-            async with self._session.request(method, url, params=params) as response:
-                response.raise_for_status()
-                return await response.json()
+        return await self._send(method, endpoint, params)
     
     async def _signed_request(self, method: str, endpoint: str, params: Dict = None) -> Dict[str, Any]:
         """Make signed request (requires authentication)"""
-        from urllib.parse import urlencode
+        # Add API key to headers
+        headers = {"X-MBX-APIKEY": self._api_key}
         
-        if params is None:
-            params = {}
+        logger.debug("%s %s%s params (without signature): %s",
+                     method, self._base_url, endpoint, list((params or {}).keys()))
+        
+        return await self._send(method, endpoint, params, headers=headers, sign=self._sign)
+    
+    def _sign(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Add timestamp and signature; runs again on every retry."""
+        from urllib.parse import urlencode
         
-        # Add timestamp
         params["timestamp"] = int(time.time() * 1000)
         
         # Create signature - Binance requires UNSORTED params with urlencode
         query_string = urlencode(params)
-        signature = hmac.new(
+        params["signature"] = hmac.new(
             self._api_secret.encode("utf-8"),
             query_string.encode("utf-8"),
             hashlib.sha256
         ).hexdigest()
-        
-        params["signature"] = signature
-        
-        # Add API key to headers
-        headers = {"X-MBX-APIKEY": self._api_key}
-        
-        # Make request
-        url = f"{self._base_url}{endpoint}"
-        print(f"DEBUG [BinanceAdapter]: {method} {url}")
-        print(f"DEBUG [BinanceAdapter]: Params (without signature): {list(params.keys())}")
-        
-        if hasattr(self, '_http'):
-            response = await self._http.get(url, params=params, headers=headers)
-            return response
-        else:
-            if self._session is None:
-                import aiohttp
-                self._session = aiohttp.ClientSession()
-            
-            async with self._session.request(
-                method, url, params=params, headers=headers
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise ExchangeAPIError(
-                        f"Binance API error {response.status}: {error_text}"
-                    )
-                return await response.json()
+        return params
+    
+    async def _send(self, method: str, endpoint: str, params: Dict = None, headers: Dict = None, sign=None) -> Any:
+        """Send through the shared pool and rate limiter"""
+        response = await self._http.request(
+            method,
+            f"{self._base_url}{endpoint}",
+            params=params,
+            headers=headers,
+            limiter=self._limiter,
+            account=self._api_key or None,
+            sign=sign,
+        )
+        if response.status_code != 200:
+            raise ExchangeAPIError(
+                f"Binance API error {response.status_code}: {response.text}"
+            )
+        return response.json()
     
     async def start_user_data_stream(self) -> str:
         """
@@ -357,6 +374,4 @@ class BinanceAdapter(ExchangeGateway):
         await self._signed_request("DELETE", "/fapi/v1/listenKey", params)
 
     async def close(self):
-        """Close HTTP session"""
-        if hasattr(self, '_session') and self._session:
-            await self._session.close()
+        """Release the adapter; the shared HTTP pool stays open"""
@@ -0,0 +1,181 @@
+"""Binance REST rate limiting driven by request weights and usage headers"""
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# USDⓈ-M futures limits (GET /fapi/v1/exchangeInfo rateLimits)
+REQUEST_WEIGHT_PER_MINUTE = 2400
+ORDERS_PER_10_SECONDS = 300
+ORDERS_PER_MINUTE = 1200
+
+_INTERVAL_SECONDS = {"S": 1, "M": 60, "H": 3600, "D": 86400}
+_USAGE_HEADER = re.compile(r"^x-mbx-(used-weight|order-count)-(\d+)([smhd])$")
+
+# Weight of endpoints that do not cost 1
+_ENDPOINT_WEIGHTS: Dict[Tuple[str, str], int] = {
+    ("GET", "/fapi/v2/account"): 5,
+    ("GET", "/fapi/v2/balance"): 5,
+    ("GET", "/fapi/v2/positionRisk"): 5,
+    ("GET", "/fapi/v3/account"): 5,
+    ("GET", "/fapi/v3/balance"): 5,
+    ("GET", "/fapi/v3/positionRisk"): 5,
+    ("POST", "/fapi/v1/order"): 0,
+    ("POST", "/fapi/v1/batchOrders"): 5,
+    ("GET", "/fapi/v1/userTrades"): 5,
+    ("GET", "/fapi/v1/allOrders"): 5,
+}
+
+# Endpoints much heavier when called for every symbol
+_ALL_SYMBOLS_WEIGHTS: Dict[str, int] = {
+    "/fapi/v1/openOrders": 40,
+    "/fapi/v1/ticker/24hr": 40,
+    "/fapi/v1/ticker/price": 2,
+    "/fapi/v1/ticker/bookTicker": 5,
+    "/fapi/v2/ticker/price": 2,
+}
+
+_ORDER_ENDPOINTS = frozenset({("POST", "/fapi/v1/order"), ("POST", "/fapi/v1/batchOrders")})
+
+
+def _kline_weight(limit: int) -> int:
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+def request_weight(method: str, path: str, params: Optional[Dict[str, Any]] = None) -> int:
+    """Request weight Binance charges for one call."""
+    params = params or {}
+    if path in ("/fapi/v1/klines", "/fapi/v1/continuousKlines", "/fapi/v1/markPriceKlines", "/fapi/v1/indexPriceKlines"):
+        return _kline_weight(int(params.get("limit", 500)))
+    if path == "/fapi/v1/depth":
+        limit = int(params.get("limit", 500))
+        return 2 if limit <= 50 else 5 if limit <= 100 else 10 if limit <= 500 else 20
+    if path in _ALL_SYMBOLS_WEIGHTS and "symbol" not in params:
+        return _ALL_SYMBOLS_WEIGHTS[path]
+    return _ENDPOINT_WEIGHTS.get((method, path), 1)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously to ``capacity`` per ``period``."""
+
+    def __init__(self, capacity: float, period: float):
+        self.capacity = capacity
+        self.period = period
+        self.rate = capacity / period
+        self.tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay_for(self, cost: float) -> float:
+        """Seconds until ``cost`` tokens are available."""
+        self._refill(time.monotonic())
+        return max(0.0, (cost - self.tokens) / self.rate)
+
+    async def acquire(self, cost: float = 1.0):
+        """Wait for and take ``cost`` tokens (FIFO across waiters)."""
+        cost = min(cost, self.capacity)
+        async with self._lock:
+            delay = self.delay_for(cost)
+            if delay > 0:
+                await asyncio.sleep(delay)
+                self._refill(time.monotonic())
+            self.tokens -= cost
+
+    def observe_used(self, used: float):
+        """Align with usage reported by the server (never adds tokens)."""
+        self._refill(time.monotonic())
+        self.tokens = min(self.tokens, self.capacity - used)
+
+
+class BinanceRateLimiter:
+    """Proactive limiter for one Binance REST host.
+
+    Request weight is limited per IP, so one limiter is shared by every
+    adapter talking to the host; order counts are limited per account.
+    Each bucket keeps ``headroom`` of the exchange limit and is pulled
+    down to the usage reported in ``X-MBX-USED-WEIGHT-*`` and
+    ``X-MBX-ORDER-COUNT-*`` headers, so traffic from other processes on
+    the same IP is accounted for. A 429 or 418 stops every request until
+    ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        weight_per_minute: int = REQUEST_WEIGHT_PER_MINUTE,
+        orders_per_10s: int = ORDERS_PER_10_SECONDS,
+        orders_per_minute: int = ORDERS_PER_MINUTE,
+        headroom: float = 0.9,
+    ):
+        self.headroom = headroom
+        self.weight = {60: TokenBucket(weight_per_minute * headroom, 60.0)}
+        self._order_limits = {10: orders_per_10s * headroom, 60: orders_per_minute * headroom}
+        self._orders: Dict[Optional[str], Dict[int, TokenBucket]] = {}
+        self.blocked_until = 0.0
+
+    def order_buckets(self, account: Optional[str]) -> Dict[int, TokenBucket]:
+        buckets = self._orders.get(account)
+        if buckets is None:
+            buckets = {period: TokenBucket(limit, float(period)) for period, limit in self._order_limits.items()}
+            self._orders[account] = buckets
+        return buckets
+
+    async def acquire(self, method: str, path: str, params: Dict[str, Any], account: Optional[str] = None):
+        """Wait until the request fits every limit."""
+        wait = self.blocked_until - time.monotonic()
+        if wait > 0:
+            logger.warning(f"Binance requests paused for {wait:.1f}s after a rate limit response")
+            await asyncio.sleep(wait)
+
+        weight = request_weight(method, path, params)
+        if weight:
+            for bucket in self.weight.values():
+                await bucket.acquire(weight)
+        if (method, path) in _ORDER_ENDPOINTS:
+            for bucket in self.order_buckets(account).values():
+                await bucket.acquire(1)
+
+    def update(self, response: httpx.Response, account: Optional[str] = None):
+        """Read usage headers and back-off instructions from a response."""
+        for name, value in response.headers.items():
+            match = _USAGE_HEADER.match(name.lower())
+            if not match:
+                continue
+            kind, count, unit = match.groups()
+            period = int(count) * _INTERVAL_SECONDS[unit.upper()]
+            buckets = self.weight if kind == "used-weight" else self.order_buckets(account)
+            bucket = buckets.get(period)
+            if bucket is not None:
+                bucket.observe_used(float(value))
+
+        if response.status_code in (418, 429):
+            retry_after = float(response.headers.get("Retry-After") or 60)
+            self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+            logger.error(f"Binance returned {response.status_code}; pausing requests for {retry_after:.0f}s")
+
+
+_limiters: Dict[str, BinanceRateLimiter] = {}
+
+
+def get_rate_limiter(base_url: str) -> BinanceRateLimiter:
+    """Process-wide limiter of a Binance REST host."""
+    host = urlsplit(base_url).netloc or base_url
+    limiter = _limiters.get(host)
+    if limiter is None:
+        limiter = _limiters[host] = BinanceRateLimiter()
+    return limiter
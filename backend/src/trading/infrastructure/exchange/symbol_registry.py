@@ -0,0 +1,246 @@
+"""Process-wide exchange info registry with per-symbol filters and quantizers"""
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_FLOOR, ROUND_HALF_EVEN
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+from ..cache.local_cache import SingleFlight
+from ..cache.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "exchange_info:"
+DEFAULT_TTL = 3600
+
+# Order rejections caused by filters the registry may have stale
+# (-1111 precision, -1013 filter failure, -4014 tick size, -4023 step size, -4164 min notional)
+FILTER_ERROR_CODES = frozenset({-1111, -1013, -4014, -4023, -4164})
+_ERROR_CODE = re.compile(r'"code"\s*:\s*(-?\d+)')
+
+ExchangeInfoLoader = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+def is_filter_error(message: str) -> bool:
+    """Whether an exchange error message carries a filter rejection code."""
+    match = _ERROR_CODE.search(message or "")
+    return bool(match) and int(match.group(1)) in FILTER_ERROR_CODES
+
+
+@dataclass(frozen=True)
+class Quantizer:
+    """Rounds to multiples of ``step`` with integer arithmetic.
+
+    A step of 0.005 is held as ``units=5, scale=3``; values are rounded
+    to a whole number of steps and rebuilt from that integer, so results
+    carry exactly the step's decimals.
+    """
+    units: int
+    scale: int
+
+    @classmethod
+    def from_step(cls, step: Any) -> "Quantizer":
+        step = Decimal(str(step)).normalize()
+        if step <= 0:
+            # No filter: keep 8 decimals, Binance's wire precision
+            return cls(units=1, scale=8)
+        scale = max(0, -step.as_tuple().exponent)
+        return cls(units=int(step.scaleb(scale)), scale=scale)
+
+    @property
+    def step(self) -> Decimal:
+        return Decimal(self.units).scaleb(-self.scale)
+
+    def ticks(self, value: Decimal, rounding: str = ROUND_FLOOR) -> int:
+        """Value as a whole number of steps."""
+        return int((Decimal(value).scaleb(self.scale) / self.units).to_integral_value(rounding=rounding))
+
+    def quantize(self, value: Decimal, rounding: str = ROUND_FLOOR) -> Decimal:
+        """Value rounded to a multiple of the step."""
+        return Decimal(self.ticks(value, rounding) * self.units).scaleb(-self.scale)
+
+
+@dataclass
+class SymbolFilters:
+    """Trading filters of one symbol, parsed from exchange info."""
+    symbol: str
+    status: str
+    quantity_precision: int
+    price_precision: int
+    min_qty: Decimal
+    max_qty: Decimal
+    step_size: Decimal
+    market_min_qty: Decimal
+    market_max_qty: Decimal
+    market_step_size: Decimal
+    min_price: Decimal
+    max_price: Decimal
+    tick_size: Decimal
+    min_notional: Decimal
+    quantity: Quantizer = field(init=False, repr=False)
+    market_quantity: Quantizer = field(init=False, repr=False)
+    price: Quantizer = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.quantity = Quantizer.from_step(self.step_size)
+        self.market_quantity = Quantizer.from_step(self.market_step_size)
+        self.price = Quantizer.from_step(self.tick_size)
+
+    @classmethod
+    def from_exchange(cls, data: Dict[str, Any]) -> "SymbolFilters":
+        """Build from one entry of exchange info ``symbols``."""
+        filters = {f["filterType"]: f for f in data.get("filters", [])}
+        lot_size = filters.get("LOT_SIZE", {})
+        market_lot_size = filters.get("MARKET_LOT_SIZE") or lot_size
+        price_filter = filters.get("PRICE_FILTER", {})
+        min_notional = filters.get("MIN_NOTIONAL", {})
+        return cls(
+            symbol=data["symbol"],
+            status=data.get("status", "TRADING"),
+            quantity_precision=int(data.get("quantityPrecision", 8)),
+            price_precision=int(data.get("pricePrecision", 8)),
+            min_qty=Decimal(lot_size.get("minQty", "0")),
+            max_qty=Decimal(lot_size.get("maxQty", "0")),
+            step_size=Decimal(lot_size.get("stepSize", "0")),
+            market_min_qty=Decimal(market_lot_size.get("minQty", "0")),
+            market_max_qty=Decimal(market_lot_size.get("maxQty", "0")),
+            market_step_size=Decimal(market_lot_size.get("stepSize", "0")),
+            min_price=Decimal(price_filter.get("minPrice", "0")),
+            max_price=Decimal(price_filter.get("maxPrice", "0")),
+            tick_size=Decimal(price_filter.get("tickSize", "0")),
+            # Spot calls it minNotional, futures notional
+            min_notional=Decimal(min_notional.get("notional", min_notional.get("minNotional", "0"))),
+        )
+
+    def to_exchange(self) -> Dict[str, Any]:
+        """Inverse of ``from_exchange`` (for persistence)."""
+        return {
+            "symbol": self.symbol,
+            "status": self.status,
+            "quantityPrecision": self.quantity_precision,
+            "pricePrecision": self.price_precision,
+            "filters": [
+                {"filterType": "LOT_SIZE", "minQty": str(self.min_qty), "maxQty": str(self.max_qty),
+                 "stepSize": str(self.step_size)},
+                {"filterType": "MARKET_LOT_SIZE", "minQty": str(self.market_min_qty),
+                 "maxQty": str(self.market_max_qty), "stepSize": str(self.market_step_size)},
+                {"filterType": "PRICE_FILTER", "minPrice": str(self.min_price), "maxPrice": str(self.max_price),
+                 "tickSize": str(self.tick_size)},
+                {"filterType": "MIN_NOTIONAL", "notional": str(self.min_notional)},
+            ],
+        }
+
+    def round_quantity(self, quantity: Decimal, market: bool = False) -> Decimal:
+        """Quantity rounded down to the (market) lot step."""
+        quantizer = self.market_quantity if market else self.quantity
+        return quantizer.quantize(quantity, ROUND_FLOOR)
+
+    def round_price(self, price: Decimal, rounding: str = ROUND_HALF_EVEN) -> Decimal:
+        """Price rounded to the tick size."""
+        return self.price.quantize(price, rounding)
+
+
+@dataclass
+class _ExchangeSymbols:
+    symbols: Dict[str, SymbolFilters]
+    loaded_at: float
+
+
+def _normalize(symbol: str) -> str:
+    return symbol.replace("/", "").upper()
+
+
+def exchange_key(base_url: str) -> str:
+    """Registry key of an exchange API: its host."""
+    return urlsplit(base_url).netloc or base_url
+
+
+class SymbolRegistry:
+    """Symbol filters of every exchange API the process talks to.
+
+    The whole exchange info is loaded once per ``ttl`` and indexed by
+    symbol. Loads are shared through Redis (``exchange_info:<host>``) so
+    one process downloads it for all, and concurrent misses in a process
+    collapse into one load. ``invalidate`` drops both copies, e.g. after
+    an order was rejected by a filter that may have changed.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, redis=None):
+        self.ttl = ttl
+        self.redis = redis or redis_client
+        self._exchanges: Dict[str, _ExchangeSymbols] = {}
+        self._single_flight = SingleFlight()
+
+    async def get(self, base_url: str, symbol: str, loader: ExchangeInfoLoader) -> Optional[SymbolFilters]:
+        """Filters of symbol on the exchange at base_url (None if unlisted)."""
+        symbols = await self.symbols(base_url, loader)
+        return symbols.get(_normalize(symbol))
+
+    async def symbols(self, base_url: str, loader: ExchangeInfoLoader) -> Dict[str, SymbolFilters]:
+        """All symbols of an exchange, loading them if missing or expired."""
+        key = exchange_key(base_url)
+        entry = self._exchanges.get(key)
+        if entry is None or time.time() - entry.loaded_at >= self.ttl:
+            entry = await self._single_flight.do(key, lambda: self._load(key, loader))
+        return entry.symbols
+
+    async def invalidate(self, base_url: str):
+        """Forget an exchange's filters here and in Redis."""
+        key = exchange_key(base_url)
+        self._exchanges.pop(key, None)
+        try:
+            await self.redis.delete(f"{REDIS_KEY_PREFIX}{key}")
+        except Exception as e:
+            logger.warning(f"Could not drop shared exchange info for {key}: {e}")
+        logger.info(f"Invalidated exchange info for {key}")
+
+    async def _load(self, key: str, loader: ExchangeInfoLoader) -> _ExchangeSymbols:
+        redis_key = f"{REDIS_KEY_PREFIX}{key}"
+        try:
+            cached = await self.redis.get(redis_key)
+        except Exception as e:
+            logger.warning(f"Could not read shared exchange info for {key}: {e}")
+            cached = None
+
+        if cached:
+            payload = json.loads(cached)
+            if time.time() - payload["loaded_at"] < self.ttl:
+                entry = self._index(payload["symbols"], payload["loaded_at"])
+                self._exchanges[key] = entry
+                return entry
+
+        exchange_info = await loader()
+        entry = self._index(exchange_info.get("symbols", []), time.time())
+        self._exchanges[key] = entry
+        try:
+            await self.redis.set(
+                redis_key,
+                json.dumps({
+                    "loaded_at": entry.loaded_at,
+                    "symbols": [filters.to_exchange() for filters in entry.symbols.values()],
+                }),
+                ex=int(self.ttl),
+            )
+        except Exception as e:
+            logger.warning(f"Could not share exchange info for {key}: {e}")
+        logger.info(f"Loaded {len(entry.symbols)} symbols for {key}")
+        return entry
+
+    @staticmethod
+    def _index(symbols: Any, loaded_at: float) -> _ExchangeSymbols:
+        indexed = {}
+        for data in symbols:
+            try:
+                filters = SymbolFilters.from_exchange(data)
+            except (KeyError, ValueError, ArithmeticError) as e:
+                logger.warning(f"Skipping malformed symbol entry {data.get('symbol')}: {e}")
+                continue
+            indexed[filters.symbol] = filters
+        return _ExchangeSymbols(symbols=indexed, loaded_at=loaded_at)
+
+
+# Global symbol registry
+symbol_registry = SymbolRegistry()
@@ -1,14 +1,16 @@
 import asyncio
 import logging
+import time
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
 import uuid
 from sqlalchemy import select
 
-from src.trading.domain.bot import Bot, BotStatus
-from src.trading.strategies.base import StrategyBase
-from src.trading.infrastructure.exchange.exchange_gateway import ExchangeGateway, ExchangeAPIError
-from src.trading.infrastructure.persistence.repositories.bot_repository import BotRepository
+from ...domain.bot import Bot, BotStatus
+from ...strategies.base import StrategyBase
+from ..exchange.exchange_gateway import ExchangeGateway, ExchangeAPIError
+from ..persistence.repositories.bot_repository import BotRepository
+from ...performance.profiling.latency_histogram import latency_registry
 
 logger = logging.getLogger(__name__)
 
@@ -87,7 +89,7 @@ class BotEngine:
                 
                 # Fetch exchange_id (Integer) from the connection
                 print(f"[BotEngine] Importing APIConnectionModel...")
-                from src.trading.infrastructure.persistence.models.core_models import APIConnectionModel
+                from ..persistence.models.core_models import APIConnectionModel
                 
                 print(f"[BotEngine] Querying exchange_id for connection {bot.exchange_connection_id}...")
                 stmt = select(APIConnectionModel.exchange_id).where(APIConnectionModel.id == bot.exchange_connection_id)
@@ -131,8 +133,8 @@ class BotEngine:
     async def _on_order(self, order_data: Dict[str, Any]):
         """Callback to persist order execution."""
         try:
-            from src.trading.infrastructure.persistence.models.trading_models import OrderModel
-            from src.trading.infrastructure.persistence.repositories.order_repository import OrderRepository
+            from ..persistence.models.trading_models import OrderModel
+            from ..persistence.repositories.order_repository import OrderRepository
             
             async with self.session_factory() as session:
                 repo = OrderRepository(session)
@@ -198,6 +200,7 @@ class BotEngine:
                     interval=interval,
                     limit=100
                 )
+                received_at = time.time()
                 print(f"[BotEngine] Got {len(candles) if candles else 0} candles")
                 
                 # 2. Execute Strategy
@@ -205,7 +208,13 @@ class BotEngine:
                 # StrategyBase.on_tick expects 'market_data'
                 # We pass the raw candles list for now.
                 # TODO: Parse into Candle objects if Strategy expects objects
-                await self.strategy.on_tick(candles)
+                # Decision latency is measured from when the klines arrived; the
+                # last candle is still forming, so its open time is no origin
+                trace = latency_registry.begin_trace(self.bot_id, symbol.replace("/", "").upper(), received_at)
+                try:
+                    await self.strategy.on_tick(candles)
+                finally:
+                    latency_registry.end_trace(trace)
                 print(f"[BotEngine] strategy.on_tick() completed")
                 
                 # 3. Update Last Run Time
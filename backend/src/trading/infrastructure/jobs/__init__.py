@@ -6,6 +6,10 @@ from .job_queue import (
     Job,
     JobStatus,
     JobPriority,
+    DEFAULT_QUEUE,
+    JOB_ROUTES,
+    backtest_tag,
+    candles_tag,
 )
 from .job_scheduler import (
     JobScheduler,
@@ -19,6 +23,7 @@ from .job_scheduler import (
     daily_at,
     cron,
 )
+from .leader_election import LeaderElection
 from .job_worker import (
     JobWorker,
     job_worker,
@@ -26,6 +31,7 @@ from .job_worker import (
     worker_pool,
     WorkerStatus,
     job_handler,
+    parse_queue_spec,
 )
 from .job_service import JobService, job_service
 from .tasks import (
@@ -35,10 +41,15 @@ from .tasks import (
     evaluate_risk_limits_task,
     cleanup_data_task,
     vacuum_database_task,
+    maintain_partitions_task,
     check_price_alerts_task,
     send_price_notification_task,
     bot_health_check_task,
     restart_unhealthy_bots_task,
+    reconcile_bot_stats_task,
+    rebuild_daily_pnl_task,
+    snapshot_equity_task,
+    downsample_equity_task,
     fetch_market_data_task,
     update_24h_stats_task,
     generate_daily_report_task,
@@ -53,6 +64,10 @@ __all__ = [
     "Job",
     "JobStatus",
     "JobPriority",
+    "DEFAULT_QUEUE",
+    "JOB_ROUTES",
+    "backtest_tag",
+    "candles_tag",
     # Scheduler
     "JobScheduler",
     "job_scheduler",
@@ -64,6 +79,7 @@ __all__ = [
     "every_hours",
     "daily_at",
     "cron",
+    "LeaderElection",
     # Worker
     "JobWorker",
     "job_worker",
@@ -71,6 +87,7 @@ __all__ = [
     "worker_pool",
     "WorkerStatus",
     "job_handler",
+    "parse_queue_spec",
     # Service
     "JobService",
     "job_service",
@@ -81,10 +98,15 @@ __all__ = [
     "evaluate_risk_limits_task",
     "cleanup_data_task",
     "vacuum_database_task",
+    "maintain_partitions_task",
     "check_price_alerts_task",
     "send_price_notification_task",
     "bot_health_check_task",
     "restart_unhealthy_bots_task",
+    "reconcile_bot_stats_task",
+    "rebuild_daily_pnl_task",
+    "snapshot_equity_task",
+    "downsample_equity_task",
     "fetch_market_data_task",
     "update_24h_stats_task",
     "generate_daily_report_task",
@@ -0,0 +1,170 @@
+"""Compiled cron expressions with closed-form next-run computation."""
+
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional, Tuple
+import calendar
+
+# (min, max) per field: minute hour day month weekday
+_FIELD_BOUNDS: Tuple[Tuple[int, int], ...] = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+_ALIASES = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+# Years searched before giving up on an expression that never fires
+# (e.g. "0 0 30 2 *"); 28 years covers every leap-year/weekday pairing.
+_MAX_YEARS = 28
+
+
+def parse_cron_field(spec: str, low: int, high: int) -> int:
+    """Parse one cron field into a bitset of allowed values.
+
+    Supports ``*``, values, ranges ``a-b``, steps ``*/n`` and ``a-b/n``,
+    and comma-separated lists of those.
+    """
+    mask = 0
+    for part in spec.split(","):
+        range_part, _, step_part = part.partition("/")
+        step = int(step_part) if step_part else 1
+        if step < 1:
+            raise ValueError(f"Invalid step in cron field: {spec}")
+
+        if range_part == "*":
+            start, end = low, high
+        elif "-" in range_part:
+            start_str, end_str = range_part.split("-", 1)
+            start, end = int(start_str), int(end_str)
+        else:
+            start = int(range_part)
+            end = high if step_part else start
+
+        if start < low or end > high or start > end:
+            raise ValueError(f"Cron field out of range [{low}-{high}]: {spec}")
+
+        for value in range(start, end + 1, step):
+            mask |= 1 << value
+    return mask
+
+
+def _next_bit(mask: int, value: int) -> int:
+    """Smallest set bit position >= value, or -1."""
+    remaining = mask >> value
+    if not remaining:
+        return -1
+    return value + (remaining & -remaining).bit_length() - 1
+
+
+class CronExpression:
+    """A five-field cron expression compiled to per-field bitsets.
+
+    Fields are ``minute hour day month weekday`` with standard semantics:
+    weekday 0 and 7 are Sunday, and when both day and weekday are
+    restricted a time matches if *either* does. ``next_after`` walks
+    month -> day -> hour -> minute, jumping straight to the next allowed
+    value of each field instead of stepping minute by minute.
+    """
+
+    __slots__ = ("expression", "minutes", "hours", "days", "months", "weekdays",
+                 "_day_restricted", "_weekday_restricted")
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        fields = _ALIASES.get(expression.strip(), expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Invalid cron expression: {expression}")
+
+        minute, hour, day, month, weekday = fields
+        self.minutes = parse_cron_field(minute, *_FIELD_BOUNDS[0])
+        self.hours = parse_cron_field(hour, *_FIELD_BOUNDS[1])
+        self.days = parse_cron_field(day, *_FIELD_BOUNDS[2])
+        self.months = parse_cron_field(month, *_FIELD_BOUNDS[3])
+        weekdays = parse_cron_field(weekday, *_FIELD_BOUNDS[4])
+        if weekdays & (1 << 7):
+            weekdays = (weekdays | 1) & ~(1 << 7)
+        self.weekdays = weekdays
+        self._day_restricted = not day.startswith("*")
+        self._weekday_restricted = not weekday.startswith("*")
+
+    def _days_in_month(self, year: int, month: int) -> int:
+        """Bitset of matching days for one month."""
+        first_weekday, length = calendar.monthrange(year, month)
+        valid = ((1 << (length + 1)) - 1) & ~1
+        day_mask = self.days & valid
+
+        # Weekday of day d is (first + d - 1) mod 7, Monday=0; cron Sunday=0
+        first_cron = (first_weekday + 1) % 7
+        weekday_mask = 0
+        for day in range(1, length + 1):
+            if self.weekdays >> ((first_cron + day - 1) % 7) & 1:
+                weekday_mask |= 1 << day
+
+        if self._day_restricted and self._weekday_restricted:
+            return day_mask | weekday_mask
+        if self._day_restricted:
+            return day_mask
+        if self._weekday_restricted:
+            return weekday_mask
+        return day_mask
+
+    def matches(self, moment: datetime) -> bool:
+        """Whether moment (to the minute) matches the expression."""
+        return (
+            bool(self.minutes >> moment.minute & 1)
+            and bool(self.hours >> moment.hour & 1)
+            and bool(self.months >> moment.month & 1)
+            and bool(self._days_in_month(moment.year, moment.month) >> moment.day & 1)
+        )
+
+    def next_after(self, moment: datetime) -> Optional[datetime]:
+        """First matching minute strictly after moment, or None."""
+        start = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        year, month, day = start.year, start.month, start.day
+        hour, minute = start.hour, start.minute
+
+        while year <= start.year + _MAX_YEARS:
+            next_month = _next_bit(self.months, month)
+            if next_month == -1:
+                year, month, day, hour, minute = year + 1, 1, 1, 0, 0
+                continue
+            if next_month != month:
+                month, day, hour, minute = next_month, 1, 0, 0
+
+            next_day = _next_bit(self._days_in_month(year, month), day)
+            if next_day == -1:
+                month, day, hour, minute = month + 1, 1, 0, 0
+                if month > 12:
+                    year, month = year + 1, 1
+                continue
+            if next_day != day:
+                day, hour, minute = next_day, 0, 0
+
+            next_hour = _next_bit(self.hours, hour)
+            if next_hour == -1:
+                day, hour, minute = day + 1, 0, 0
+                continue
+            if next_hour != hour:
+                hour, minute = next_hour, 0
+
+            next_minute = _next_bit(self.minutes, minute)
+            if next_minute == -1:
+                hour, minute = hour + 1, 0
+                if hour > 23:
+                    day, hour = day + 1, 0
+                continue
+
+            return start.replace(year=year, month=month, day=day, hour=hour, minute=next_minute)
+
+        return None
+
+
+@lru_cache(maxsize=1024)
+def compile_cron(expression: str) -> CronExpression:
+    """Compile (and cache) a cron expression; raises ValueError if invalid."""
+    return CronExpression(expression)
@@ -198,8 +198,10 @@ class FetchMissingCandlesJobV2:
                             'chunk_start': next_chunk_start.isoformat(),
                             'chunk_end': next_chunk_end.isoformat(),
                             'total_end': total_end.isoformat(),
-                            'chunk_number': chunk_number + 1
-                        }
+                            'chunk_number': chunk_number + 1,
+                            'tags': params.get('tags'),
+                        },
+                        tags=params.get('tags'),
                     )
                     
                     print(f"DEBUG [FetchJob]: <<< CHUNK #{chunk_number} DONE - Next job queued: {next_job_id}")
@@ -1,18 +1,217 @@
 """Redis-based job queue implementation."""
 
 import asyncio
-import json
 import logging
 import uuid
 from typing import Optional, Dict, List, Any, Callable
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 
 from ..cache import redis_client
+from ...performance.json.codec import json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
+# Max wake-up tokens kept in the signal list; waiters only need to know
+# that *something* arrived, they then drain the queues themselves.
+SIGNAL_DEPTH = 16
+
+# Job data lives this long; tag sets are refreshed to the same TTL so a
+# tag never outlives the last job added to it by more than this.
+JOB_TTL = 86400 * 7
+
+# Jobs cancelled per script call in bulk cancellation.
+CANCEL_BATCH_SIZE = 500
+
+# Queue a job lands in unless routed elsewhere. Its Redis keys keep the
+# pre-routing names (``<prefix>:queue:<priority>``, ``<prefix>:signal``);
+# other queues use ``<prefix>:queue:<queue>:<priority>`` and
+# ``<prefix>:signal:<queue>``.
+DEFAULT_QUEUE = "default"
+
+# Job name -> queue. Heavy job types get their own queue so standalone
+# workers (``python -m trading.interfaces.workers``) can run them with
+# their own concurrency, away from the API process.
+JOB_ROUTES: Dict[str, str] = {
+    "fetch_missing_candles": "marketdata",
+}
+
+# Lua snippet: target queue key suffix of a decoded job ('<priority>' or
+# '<queue>:<priority>') and its signal list suffix ('' or ':<queue>').
+_QUEUE_OF_JOB = """
+local function queue_of(ok, job)
+  local priority, suffix = 'normal', ''
+  if ok and type(job) == 'table' then
+    if type(job['priority']) == 'string' then
+      priority = job['priority']
+    end
+    if type(job['queue']) == 'string' and job['queue'] ~= '%s' then
+      suffix = ':' .. job['queue']
+      return job['queue'] .. ':' .. priority, suffix
+    end
+  end
+  return priority, suffix
+end
+""" % DEFAULT_QUEUE
+
+# Atomically pop the highest-priority job of the worker's queues into its
+# in-flight list and lease it for the job's timeout plus grace. Priority
+# wins over queue order. Ids whose data has expired, or that were
+# cancelled or already finished (a requeued id whose late ack won), are
+# dropped. When every queue is empty, leftover wake-up
+# tokens are cleared so idle workers do not wake spuriously.
+# Returns {job_id, job_json} or nil.
+# KEYS: critical, high, normal, low of each of N queues, inflight list,
+#       processing set, leases zset, lease owners hash, N signal lists
+# ARGV: job data prefix, default lease seconds, grace seconds, N
+_DEQUEUE_SCRIPT = """
+local now = tonumber(redis.call('TIME')[1])
+local n = tonumber(ARGV[4])
+local base = 4 * n
+for p = 1, 4 do
+  for q = 0, n - 1 do
+    while true do
+      local job_id = redis.call('LPOP', KEYS[4 * q + p])
+      if not job_id then break end
+      local data = redis.call('GET', ARGV[1] .. ':' .. job_id)
+      local ok, job = false, nil
+      if data then
+        ok, job = pcall(cjson.decode, data)
+      end
+      local status = ok and type(job) == 'table' and job['status']
+      if data and status ~= 'cancelled' and status ~= 'completed' and status ~= 'failed' then
+        local lease = tonumber(ARGV[2])
+        if ok and type(job) == 'table' and tonumber(job['timeout']) then
+          lease = tonumber(job['timeout'])
+        end
+        redis.call('RPUSH', KEYS[base + 1], job_id)
+        redis.call('SADD', KEYS[base + 2], job_id)
+        redis.call('ZADD', KEYS[base + 3], now + lease + tonumber(ARGV[3]), job_id)
+        redis.call('HSET', KEYS[base + 4], job_id, KEYS[base + 1])
+        return {job_id, data}
+      end
+    end
+  end
+end
+for q = 1, n do
+  redis.call('DEL', KEYS[base + 4 + q])
+end
+return nil
+"""
+
+# Release a job's lease and store its record, but only if the caller still
+# owns the lease: once it expired the job was requeued (and maybe leased
+# again), so a late ack must neither release it nor record an outcome.
+# KEYS: lease owners hash, leases zset, processing set
+# ARGV: job id, inflight list of the caller[, job key, job json, ttl seconds]
+_ACK_SCRIPT = """
+if redis.call('HGET', KEYS[1], ARGV[1]) ~= ARGV[2] then
+  return 0
+end
+redis.call('LREM', ARGV[2], 1, ARGV[1])
+redis.call('HDEL', KEYS[1], ARGV[1])
+redis.call('ZREM', KEYS[2], ARGV[1])
+redis.call('SREM', KEYS[3], ARGV[1])
+if ARGV[3] then
+  redis.call('SET', ARGV[3], ARGV[4], 'EX', tonumber(ARGV[5]))
+end
+return 1
+"""
+
+# Append a job id to a priority queue and wake blocked workers.
+# KEYS: queue, signal list
+# ARGV: job id, signal depth
+_PUSH_SCRIPT = """
+redis.call('RPUSH', KEYS[1], ARGV[1])
+redis.call('LPUSH', KEYS[2], '1')
+redis.call('LTRIM', KEYS[2], 0, tonumber(ARGV[2]) - 1)
+return 1
+"""
+
+# Add a job id to its tag sets and refresh their TTL.
+# KEYS: tag sets
+# ARGV: job id, ttl seconds
+_TAG_SCRIPT = """
+for _, key in ipairs(KEYS) do
+  redis.call('SADD', key, ARGV[1])
+  redis.call('EXPIRE', key, tonumber(ARGV[2]))
+end
+return #KEYS
+"""
+
+# Withdraw jobs from their queue and the scheduled set and store
+# their cancelled record. A job is skipped if it was leased, or left the
+# pending/retrying states, since the caller read it. Returns the ids
+# actually cancelled.
+# KEYS: scheduled zset, processing set
+# ARGV: queue key prefix, job data prefix,
+#       then (job id, queue key suffix, cancelled job json) triples
+_CANCEL_SCRIPT = """
+local cancelled = {}
+for i = 3, #ARGV, 3 do
+  local job_id = ARGV[i]
+  local job_key = ARGV[2] .. ':' .. job_id
+  local data = redis.call('GET', job_key)
+  if data and redis.call('SISMEMBER', KEYS[2], job_id) == 0 then
+    local ok, job = pcall(cjson.decode, data)
+    if ok and type(job) == 'table' and (job['status'] == 'pending' or job['status'] == 'retrying') then
+      redis.call('LREM', ARGV[1] .. ARGV[i + 1], 1, job_id)
+      redis.call('ZREM', KEYS[1], job_id)
+      redis.call('SET', job_key, ARGV[i + 2], 'KEEPTTL')
+      cancelled[#cancelled + 1] = job_id
+    end
+  end
+end
+return cancelled
+"""
+
+# Move up to N due scheduled jobs to the tail of their queue and wake
+# that queue's workers. Returns the number moved.
+# KEYS: scheduled zset, default signal list
+# ARGV: now (epoch seconds), limit, queue key prefix, job data prefix,
+#       signal depth
+_PROMOTE_SCRIPT = _QUEUE_OF_JOB + """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+for _, job_id in ipairs(due) do
+  redis.call('ZREM', KEYS[1], job_id)
+  local data = redis.call('GET', ARGV[4] .. ':' .. job_id)
+  if data then
+    local target, signal = queue_of(pcall(cjson.decode, data))
+    redis.call('RPUSH', ARGV[3] .. target, job_id)
+    redis.call('LPUSH', KEYS[2] .. signal, '1')
+    redis.call('LTRIM', KEYS[2] .. signal, 0, tonumber(ARGV[5]) - 1)
+  end
+end
+return #due
+"""
+
+# Requeue up to N jobs whose lease expired (their worker died or hung)
+# at the head of their queue. Returns the requeued ids.
+# KEYS: leases zset, lease owners hash, processing set, default signal list
+# ARGV: limit, queue key prefix, job data prefix, signal depth
+_REAP_SCRIPT = _QUEUE_OF_JOB + """
+local now = tonumber(redis.call('TIME')[1])
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now, 'LIMIT', 0, tonumber(ARGV[1]))
+for _, job_id in ipairs(expired) do
+  local owner = redis.call('HGET', KEYS[2], job_id)
+  if owner then
+    redis.call('LREM', owner, 1, job_id)
+  end
+  redis.call('HDEL', KEYS[2], job_id)
+  redis.call('ZREM', KEYS[1], job_id)
+  redis.call('SREM', KEYS[3], job_id)
+  local data = redis.call('GET', ARGV[3] .. ':' .. job_id)
+  if data then
+    local target, signal = queue_of(pcall(cjson.decode, data))
+    redis.call('LPUSH', ARGV[2] .. target, job_id)
+    redis.call('LPUSH', KEYS[4] .. signal, '1')
+    redis.call('LTRIM', KEYS[4] .. signal, 0, tonumber(ARGV[4]) - 1)
+  end
+end
+return expired
+"""
+
 
 class JobStatus(str, Enum):
     """Job execution status."""
@@ -50,6 +249,9 @@ class Job:
     max_retries: int = 3
     timeout: int = 300  # 5 minutes default
     user_id: Optional[str] = None
+    worker_id: Optional[str] = None  # In-flight list holding the lease
+    tags: List[str] = field(default_factory=list)
+    queue: str = DEFAULT_QUEUE
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert job to dictionary."""
@@ -63,30 +265,64 @@ class Job:
         return cls(**data)
     
     def to_json(self) -> str:
-        """Convert job to JSON string."""
-        return json.dumps(self.to_dict(), default=str)
+        """Convert job to JSON string (kept JSON: the queue scripts decode it)."""
+        return json_dumps(self.to_dict())
     
     @classmethod
     def from_json(cls, json_str: str) -> "Job":
         """Create job from JSON string."""
-        data = json.loads(json_str)
+        data = json_loads(json_str)
         return cls.from_dict(data)
 
 
+def backtest_tag(backtest_id: Any) -> str:
+    """Tag for jobs fetching data on behalf of a backtest."""
+    return f"backtest:{backtest_id}"
+
+
+def candles_tag(symbol: str, interval: str) -> str:
+    """Tag for candle backfill jobs of one symbol and interval."""
+    return f"candles:{symbol}:{interval}"
+
+
 class JobQueue:
-    """Redis-based job queue for background task processing."""
+    """Redis-based job queue for background task processing.
+    
+    Delivery is at-least-once. ``dequeue`` atomically moves a job id from
+    the highest non-empty priority queue into the worker's in-flight list
+    and leases it for the job's timeout plus ``lease_grace`` seconds.
+    ``complete_job``/``fail_job`` release the lease; ``reap_expired_leases``
+    puts jobs whose worker died back at the head of their queue.
+    
+    Idle workers block on a signal list pushed on every enqueue instead of
+    polling; only one blocking call per process is outstanding.
     
-    def __init__(self, prefix: str = "jobs"):
+    Each job goes to a named queue (``JOB_ROUTES`` by job name, else
+    ``default``) and workers lease from the queues they are given, so job
+    types can be run by separate worker processes.
+    
+    Jobs may carry tags (e.g. ``backtest:<id>``). Each tag is a Redis set
+    of job ids written at enqueue time, so lookup, progress and bulk
+    cancellation per tag cost O(jobs with that tag) rather than a scan of
+    every queue.
+    """
+    
+    def __init__(
+        self,
+        prefix: str = "jobs",
+        lease_grace: int = 30,
+        maintenance_interval: float = 5.0,
+    ):
         self.prefix = prefix
         self.redis = redis_client
+        self.lease_grace = lease_grace
+        self.maintenance_interval = maintenance_interval
+        self._last_maintenance = 0.0
         
-        # Queue names for different priorities
-        self.queues = {
-            JobPriority.CRITICAL: f"{prefix}:queue:critical",
-            JobPriority.HIGH: f"{prefix}:queue:high",
-            JobPriority.NORMAL: f"{prefix}:queue:normal",
-            JobPriority.LOW: f"{prefix}:queue:low",
-        }
+        # Queue names for different priorities (default queue)
+        self.queues = self.queue_keys(DEFAULT_QUEUE)
+        self.routes: Dict[str, str] = dict(JOB_ROUTES)
+        self._signal_waiters: Dict[tuple, asyncio.Task] = {}
         
         # Other key prefixes
         self.job_data_prefix = f"{prefix}:job"
@@ -94,6 +330,47 @@ class JobQueue:
         self.processing_set = f"{prefix}:processing"
         self.dead_letter_queue = f"{prefix}:dlq"
         self.results_prefix = f"{prefix}:results"
+        self.queue_prefix = f"{prefix}:queue:"
+        self.inflight_prefix = f"{prefix}:inflight"
+        self.leases_set = f"{prefix}:leases"
+        self.lease_owners = f"{prefix}:lease_owners"
+        self.signal_key = f"{prefix}:signal"
+        self.tag_prefix = f"{prefix}:tag"
+    
+    def queue_keys(self, queue: str = DEFAULT_QUEUE) -> Dict[JobPriority, str]:
+        """Priority list keys of a queue, highest priority first."""
+        base = f"{self.prefix}:queue:" if queue == DEFAULT_QUEUE else f"{self.prefix}:queue:{queue}:"
+        return {
+            priority: f"{base}{priority.value}"
+            for priority in (JobPriority.CRITICAL, JobPriority.HIGH, JobPriority.NORMAL, JobPriority.LOW)
+        }
+    
+    def queue_signal(self, queue: str = DEFAULT_QUEUE) -> str:
+        """Wake-up list of a queue's idle workers."""
+        return self.signal_key if queue == DEFAULT_QUEUE else f"{self.signal_key}:{queue}"
+    
+    def queue_for(self, name: str) -> str:
+        """Queue a job type is routed to."""
+        return self.routes.get(name, DEFAULT_QUEUE)
+    
+    def known_queues(self) -> List[str]:
+        """The default queue and every routed queue."""
+        return list(dict.fromkeys([DEFAULT_QUEUE, *self.routes.values()]))
+    
+    @staticmethod
+    def _queue_suffix(job: "Job") -> str:
+        """Key suffix of a job's list under ``queue_prefix``."""
+        if job.queue == DEFAULT_QUEUE:
+            return job.priority.value
+        return f"{job.queue}:{job.priority.value}"
+    
+    def inflight_list(self, worker_id: str) -> str:
+        """Key of a worker's in-flight list."""
+        return f"{self.inflight_prefix}:{worker_id}"
+    
+    def tag_key(self, tag: str) -> str:
+        """Key of the set of job ids carrying a tag."""
+        return f"{self.tag_prefix}:{tag}"
     
     async def enqueue(
         self,
@@ -104,8 +381,10 @@ class JobQueue:
         max_retries: int = 3,
         timeout: int = 300,
         user_id: str = None,
+        tags: List[str] = None,
+        queue: str = None,
     ) -> str:
-        """Add a job to the queue."""
+        """Add a job to its queue (``queue`` overrides the route)."""
         job_id = str(uuid.uuid4())
         
         job = Job(
@@ -119,12 +398,22 @@ class JobQueue:
             max_retries=max_retries,
             timeout=timeout,
             user_id=user_id,
+            tags=list(dict.fromkeys(tags or [])),
+            queue=queue or self.queue_for(name),
         )
         
         try:
             # Store job data
             job_key = f"{self.job_data_prefix}:{job_id}"
-            await self.redis.set(job_key, job.to_json(), ex=86400 * 7)  # 7 days TTL
+            await self.redis.set(job_key, job.to_json(), ex=JOB_TTL)
+            
+            # Index tags before the job becomes visible to workers
+            if job.tags:
+                await self.redis.run_script(
+                    _TAG_SCRIPT,
+                    keys=[self.tag_key(tag) for tag in job.tags],
+                    args=[job_id, JOB_TTL],
+                )
             
             if scheduled_at and scheduled_at > datetime.utcnow():
                 # Add to scheduled set with score as timestamp
@@ -134,10 +423,9 @@ class JobQueue:
                 )
             else:
                 # Add to immediate queue
-                queue_key = self.queues[priority]
-                await self.redis.rpush(queue_key, job_id)
+                await self._push(priority, job_id, job.queue)
             
-            logger.info(f"Job {job_id} ({name}) enqueued with priority {priority.value}")
+            logger.info(f"Job {job_id} ({name}) enqueued to {job.queue} with priority {priority.value}")
             return job_id
             
         except Exception as e:
@@ -146,61 +434,162 @@ class JobQueue:
             logger.error(traceback.format_exc())
             raise
     
-    async def dequeue(self, timeout: int = 5) -> Optional[Job]:
-        """Get next job from queue (priority ordered)."""
+    async def _push(self, priority: JobPriority, job_id: str, queue: str = DEFAULT_QUEUE):
+        """Append job id to its queue and wake that queue's blocked workers."""
+        await self.redis.run_script(
+            _PUSH_SCRIPT,
+            keys=[self.queue_keys(queue)[priority], self.queue_signal(queue)],
+            args=[job_id, SIGNAL_DEPTH],
+        )
+    
+    async def dequeue(
+        self,
+        worker_id: str = "default",
+        timeout: float = 0,
+        queues: List[str] = None,
+    ) -> Optional[Job]:
+        """Lease the next job (priority ordered) from ``queues`` to a worker.
+        
+        With ``timeout`` > 0, blocks up to that many seconds for new work
+        when every queue is empty.
+        """
+        queues = queues or [DEFAULT_QUEUE]
         try:
-            # First, move scheduled jobs that are ready
-            await self._move_scheduled_jobs()
-            
-            # Try queues in priority order
-            for priority in [JobPriority.CRITICAL, JobPriority.HIGH, 
-                           JobPriority.NORMAL, JobPriority.LOW]:
-                queue_key = self.queues[priority]
-                
-                # Pop job ID from queue
-                job_id = await self.redis.lpop(queue_key)
-                
-                if job_id:
-                    job = await self.get_job(job_id)
-                    if job:
-                        # Mark as processing
-                        await self.redis.sadd(self.processing_set, job_id)
-                        job.status = JobStatus.RUNNING
-                        job.started_at = datetime.utcnow().isoformat()
-                        await self._save_job(job)
-                        
-                        return job
-            
-            return None
+            job = await self._lease_next(worker_id, queues)
+            if job is None and timeout > 0:
+                await self._wait_for_signal(timeout, queues)
+                job = await self._lease_next(worker_id, queues)
+            return job
             
         except Exception as e:
             logger.error(f"Error dequeuing job: {e}")
             return None
     
-    async def _move_scheduled_jobs(self):
-        """Move scheduled jobs that are ready to the main queue."""
+    async def _lease_next(self, worker_id: str, queues: List[str] = None) -> Optional[Job]:
+        """Run the dequeue script and mark the leased job as running."""
+        queues = queues or [DEFAULT_QUEUE]
+        inflight = self.inflight_list(worker_id)
+        leased = await self.redis.run_script(
+            _DEQUEUE_SCRIPT,
+            keys=[
+                *[key for queue in queues for key in self.queue_keys(queue).values()],
+                inflight,
+                self.processing_set,
+                self.leases_set,
+                self.lease_owners,
+                *[self.queue_signal(queue) for queue in queues],
+            ],
+            # 300 = Job.timeout default
+            args=[self.job_data_prefix, 300, self.lease_grace, len(queues)],
+        )
+        if not leased:
+            return None
+        
+        job_id, job_data = leased
         try:
+            job = Job.from_json(job_data)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error(f"Discarding malformed job {job_id}: {e}")
+            await self._release(job_id, inflight)
+            return None
+        
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.utcnow().isoformat()
+        job.worker_id = worker_id
+        await self._save_job(job)
+        return job
+    
+    async def _wait_for_signal(self, timeout: float, queues: List[str] = None):
+        """Block until a job is pushed to one of ``queues`` or timeout expires.
+        
+        All waiters on the same queues in the process share one BLPOP so
+        idle workers hold one pool connection per queue set; cancelling a
+        waiter leaves it running.
+        """
+        signals = tuple(self.queue_signal(queue) for queue in (queues or [DEFAULT_QUEUE]))
+        waiter = self._signal_waiters.get(signals)
+        if waiter is None or waiter.done():
+            waiter = asyncio.create_task(self.redis.blpop(list(signals), timeout=timeout))
+            self._signal_waiters[signals] = waiter
+        await asyncio.shield(waiter)
+    
+    async def _release(self, job_id: str, inflight: str, record: Optional[Job] = None) -> bool:
+        """Release a job's lease if ``inflight`` still owns it, saving ``record`` with it."""
+        args = [job_id, inflight]
+        if record is not None:
+            args += [f"{self.job_data_prefix}:{job_id}", record.to_json(), JOB_TTL]
+        released = await self.redis.run_script(
+            _ACK_SCRIPT,
+            keys=[self.lease_owners, self.leases_set, self.processing_set],
+            args=args,
+        )
+        if not released:
+            logger.warning(f"Lease for job {job_id} was no longer held by {inflight}")
+        return bool(released)
+    
+    async def _ack(self, job: Job) -> bool:
+        """Release the lease taken by ``dequeue`` and save the job's outcome.
+        
+        False when the lease expired and the job was requeued: the outcome
+        is then discarded and the job runs again.
+        """
+        return await self._release(job.id, self.inflight_list(job.worker_id or "default"), job)
+    
+    async def reap_expired_leases(self, limit: int = 100) -> List[str]:
+        """Requeue jobs whose lease expired without an ack."""
+        try:
+            requeued = await self.redis.run_script(
+                _REAP_SCRIPT,
+                keys=[self.leases_set, self.lease_owners, self.processing_set, self.signal_key],
+                args=[limit, self.queue_prefix, self.job_data_prefix, SIGNAL_DEPTH],
+            ) or []
+            for job_id in requeued:
+                logger.warning(f"Lease expired for job {job_id}, requeued")
+            return list(requeued)
+        except Exception as e:
+            logger.error(f"Error reaping expired leases: {e}")
+            return []
+    
+    async def maintain(self, force: bool = False):
+        """Promote due scheduled jobs and reap expired leases.
+        
+        Runs at most once per ``maintenance_interval`` per process however
+        many workers call it.
+        """
+        now = asyncio.get_running_loop().time()
+        if not force and now - self._last_maintenance < self.maintenance_interval:
+            return
+        self._last_maintenance = now
+        await self._move_scheduled_jobs()
+        await self.reap_expired_leases()
+    
+    async def _move_scheduled_jobs(self, batch_size: int = 100, max_batches: int = 10) -> int:
+        """Move scheduled jobs that are ready to the main queue.
+        
+        Each batch is one atomic script call, so concurrent callers in
+        different processes never promote the same job twice.
+        """
+        moved = 0
+        try:
+            # Scores are written with utcnow().timestamp() in enqueue/fail_job
             now = datetime.utcnow().timestamp()
+            for _ in range(max_batches):
+                count = await self.redis.run_script(
+                    _PROMOTE_SCRIPT,
+                    keys=[self.scheduled_set, self.signal_key],
+                    args=[now, batch_size, self.queue_prefix, self.job_data_prefix, SIGNAL_DEPTH],
+                ) or 0
+                moved += count
+                if count < batch_size:
+                    break
             
-            # Get jobs that are ready (score <= now)
-            ready_jobs = await self.redis.zrangebyscore(
-                self.scheduled_set, 0, now, withscores=False
-            )
-            
-            for job_id in ready_jobs:
-                job = await self.get_job(job_id)
-                if job:
-                    # Add to appropriate queue
-                    queue_key = self.queues[job.priority]
-                    await self.redis.rpush(queue_key, job_id)
-                    
-                    # Remove from scheduled set
-                    await self.redis.zrem(self.scheduled_set, job_id)
-                    
-                    logger.debug(f"Moved scheduled job {job_id} to queue")
+            if moved:
+                logger.debug(f"Moved {moved} scheduled jobs to queue")
+            return moved
                     
         except Exception as e:
             logger.error(f"Error moving scheduled jobs: {e}")
+            return moved
     
     async def get_job(self, job_id: str) -> Optional[Job]:
         """Get job by ID."""
@@ -219,7 +608,7 @@ class JobQueue:
     async def _save_job(self, job: Job):
         """Save job data."""
         job_key = f"{self.job_data_prefix}:{job.id}"
-        await self.redis.set(job_key, job.to_json(), ex=86400 * 7)
+        await self.redis.set(job_key, job.to_json(), ex=JOB_TTL)
     
     async def complete_job(self, job: Job, result: Any = None):
         """Mark job as completed."""
@@ -228,15 +617,14 @@ class JobQueue:
             job.completed_at = datetime.utcnow().isoformat()
             job.result = result
             
-            await self._save_job(job)
-            
-            # Remove from processing set
-            await self.redis.srem(self.processing_set, job.id)
+            # Release lease and save the record, unless the lease was lost
+            if not await self._ack(job):
+                return
             
             # Store result separately if provided
             if result:
                 result_key = f"{self.results_prefix}:{job.id}"
-                await self.redis.set(result_key, json.dumps(result, default=str), ex=86400)
+                await self.redis.set(result_key, json_dumps(result), ex=86400)
             
             logger.info(f"Job {job.id} ({job.name}) completed successfully")
             
@@ -252,7 +640,9 @@ class JobQueue:
                 job.retry_count += 1
                 job.error = error
                 
-                await self._save_job(job)
+                # Release lease and save the record, unless the lease was lost
+                if not await self._ack(job):
+                    return
                 
                 # Re-queue with exponential backoff
                 delay = min(60 * (2 ** job.retry_count), 3600)  # Max 1 hour
@@ -263,9 +653,6 @@ class JobQueue:
                     {job.id: scheduled_at.timestamp()}
                 )
                 
-                # Remove from processing set
-                await self.redis.srem(self.processing_set, job.id)
-                
                 logger.warning(
                     f"Job {job.id} ({job.name}) failed, retry {job.retry_count}/{job.max_retries} "
                     f"scheduled in {delay}s: {error}"
@@ -276,10 +663,9 @@ class JobQueue:
                 job.completed_at = datetime.utcnow().isoformat()
                 job.error = error
                 
-                await self._save_job(job)
-                
-                # Remove from processing set
-                await self.redis.srem(self.processing_set, job.id)
+                # Release lease and save the record, unless the lease was lost
+                if not await self._ack(job):
+                    return
                 
                 # Add to dead letter queue
                 await self.redis.rpush(self.dead_letter_queue, job.id)
@@ -299,13 +685,8 @@ class JobQueue:
             if job.status not in [JobStatus.PENDING, JobStatus.RETRYING]:
                 return False
             
-            job.status = JobStatus.CANCELLED
-            job.completed_at = datetime.utcnow().isoformat()
-            
-            await self._save_job(job)
-            
-            # Remove from scheduled set if present
-            await self.redis.zrem(self.scheduled_set, job_id)
+            if not await self._cancel([job]):
+                return False
             
             logger.info(f"Job {job_id} cancelled")
             return True
@@ -314,12 +695,38 @@ class JobQueue:
             logger.error(f"Error cancelling job {job_id}: {e}")
             return False
     
+    async def cancel_jobs(self, job_ids: List[str]) -> List[str]:
+        """Cancel many pending jobs; returns the ids actually cancelled."""
+        try:
+            jobs = await self._get_jobs(list(dict.fromkeys(job_ids)))
+            cancelled = await self._cancel(list(jobs.values()))
+            if cancelled:
+                logger.info(f"Cancelled {len(cancelled)}/{len(job_ids)} jobs")
+            return cancelled
+            
+        except Exception as e:
+            logger.error(f"Error cancelling {len(job_ids)} jobs: {e}")
+            return []
+    
+    async def cancel_jobs_by_tag(self, tag: str) -> int:
+        """Cancel every pending job carrying a tag; returns how many."""
+        try:
+            jobs = await self.get_jobs_by_tag(tag)
+            cancelled = await self._cancel(jobs)
+            if cancelled:
+                logger.info(f"Cancelled {len(cancelled)} jobs tagged {tag}")
+            return len(cancelled)
+            
+        except Exception as e:
+            logger.error(f"Error cancelling jobs tagged {tag}: {e}")
+            return 0
+    
     async def cancel_jobs_by_backtest_id(self, backtest_id: str) -> int:
         """
         Cancel all pending jobs related to a backtest.
         
-        Searches job args for job_id containing the backtest_id pattern.
-        This is used when deleting a backtest to stop all related fetch jobs.
+        Used when deleting a backtest to stop all related fetch jobs.
+        Only jobs enqueued with the backtest's tag are found.
         
         Args:
             backtest_id: The backtest UUID to cancel jobs for
@@ -327,53 +734,88 @@ class JobQueue:
         Returns:
             Number of jobs cancelled
         """
-        cancelled_count = 0
-        backtest_id_str = str(backtest_id)
-        
+        return await self.cancel_jobs_by_tag(backtest_tag(backtest_id))
+    
+    async def get_jobs_by_tag(self, tag: str) -> List[Job]:
+        """Get every job carrying a tag, in creation order."""
         try:
-            # Check all priority queues
-            for priority, queue_key in self.queues.items():
-                # Get all job IDs in queue (without removing)
-                job_ids = await self.redis.lrange(queue_key, 0, -1)
-                
-                for job_id in job_ids:
-                    job = await self.get_job(job_id)
-                    if not job:
-                        continue
-                    
-                    # Check if job belongs to this backtest
-                    # Jobs are identified by job_id containing backtest_id OR args containing backtest info
-                    job_arg_id = job.args.get('job_id', '')
-                    
-                    if backtest_id_str in str(job_arg_id) or backtest_id_str in str(job.id):
-                        # Cancel this job
-                        if await self.cancel_job(job_id):
-                            # Remove from queue
-                            await self.redis.lrem(queue_key, 1, job_id)
-                            cancelled_count += 1
-                            print(f"DEBUG [JobQueue]: Cancelled job {job_id} for backtest {backtest_id_str}")
-            
-            # Also check scheduled set
-            scheduled_jobs = await self.redis.zrange(self.scheduled_set, 0, -1)
-            for job_id in scheduled_jobs:
-                job = await self.get_job(job_id)
-                if not job:
-                    continue
-                
-                job_arg_id = job.args.get('job_id', '')
-                if backtest_id_str in str(job_arg_id) or backtest_id_str in str(job.id):
-                    if await self.cancel_job(job_id):
-                        cancelled_count += 1
-                        print(f"DEBUG [JobQueue]: Cancelled scheduled job {job_id} for backtest {backtest_id_str}")
+            tag_key = self.tag_key(tag)
+            job_ids = list(await self.redis.smembers(tag_key))
+            jobs = await self._get_jobs(job_ids)
             
-            if cancelled_count > 0:
-                logger.info(f"Cancelled {cancelled_count} jobs for backtest {backtest_id_str}")
+            # Jobs expire on their own; drop their ids from the tag lazily
+            expired = [job_id for job_id in job_ids if job_id not in jobs]
+            if expired:
+                await self.redis.srem(tag_key, *expired)
             
-            return cancelled_count
+            return sorted(jobs.values(), key=lambda job: job.created_at)
             
         except Exception as e:
-            logger.error(f"Error cancelling jobs for backtest {backtest_id}: {e}")
-            return cancelled_count
+            logger.error(f"Error getting jobs tagged {tag}: {e}")
+            return []
+    
+    async def get_tag_progress(self, tag: str) -> Dict[str, Any]:
+        """Aggregate status counts of the jobs carrying a tag."""
+        jobs = await self.get_jobs_by_tag(tag)
+        
+        by_status = {status.value: 0 for status in JobStatus}
+        for job in jobs:
+            by_status[job.status.value] += 1
+        
+        finished = (
+            by_status[JobStatus.COMPLETED.value]
+            + by_status[JobStatus.FAILED.value]
+            + by_status[JobStatus.CANCELLED.value]
+        )
+        return {
+            "tag": tag,
+            "total": len(jobs),
+            "by_status": by_status,
+            "finished": finished,
+            "progress": round(finished / len(jobs) * 100, 2) if jobs else 100.0,
+        }
+    
+    async def _get_jobs(self, job_ids: List[str]) -> Dict[str, Job]:
+        """Load several jobs in one round trip, skipping missing ones."""
+        if not job_ids:
+            return {}
+        
+        job_keys = [f"{self.job_data_prefix}:{job_id}" for job_id in job_ids]
+        jobs = {}
+        for job_id, job_data in zip(job_ids, await self.redis.mget(job_keys)):
+            if not job_data:
+                continue
+            try:
+                jobs[job_id] = Job.from_json(job_data)
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping malformed job {job_id}: {e}")
+        return jobs
+    
+    async def _cancel(self, jobs: List[Job]) -> List[str]:
+        """Atomically withdraw pending jobs and mark them cancelled."""
+        pending = [
+            job for job in jobs
+            if job.status in (JobStatus.PENDING, JobStatus.RETRYING)
+        ]
+        cancelled_at = datetime.utcnow().isoformat()
+        
+        cancelled: List[str] = []
+        for start in range(0, len(pending), CANCEL_BATCH_SIZE):
+            args: List[Any] = [self.queue_prefix, self.job_data_prefix]
+            for job in pending[start:start + CANCEL_BATCH_SIZE]:
+                record = Job.from_dict(job.to_dict())
+                record.status = JobStatus.CANCELLED
+                record.completed_at = cancelled_at
+                args.extend([job.id, self._queue_suffix(job), record.to_json()])
+            
+            result = await self.redis.run_script(
+                _CANCEL_SCRIPT,
+                keys=[self.scheduled_set, self.processing_set],
+                args=args,
+            )
+            cancelled.extend(result or [])
+        
+        return cancelled
     
     async def get_job_result(self, job_id: str) -> Optional[Any]:
         """Get job result."""
@@ -382,7 +824,7 @@ class JobQueue:
             result_data = await self.redis.get(result_key)
             
             if result_data:
-                return json.loads(result_data)
+                return json_loads(result_data)
             return None
             
         except Exception as e:
@@ -399,16 +841,22 @@ class JobQueue:
                 "dead_letter": 0,
             }
             
-            # Count jobs in each priority queue
-            for priority, queue_key in self.queues.items():
-                count = await self.redis.llen(queue_key)
-                stats["pending"][priority.value] = count
+            # Count jobs in each priority queue of every known queue
+            stats["queues"] = {}
+            for queue in self.known_queues():
+                counts = {}
+                for priority, queue_key in self.queue_keys(queue).items():
+                    counts[priority.value] = await self.redis.llen(queue_key)
+                stats["queues"][queue] = counts
+                for priority, count in counts.items():
+                    stats["pending"][priority] = stats["pending"].get(priority, 0) + count
             
             # Count scheduled jobs
             stats["scheduled"] = await self.redis.zcard(self.scheduled_set)
             
             # Count processing jobs
             stats["processing"] = await self.redis.scard(self.processing_set)
+            stats["leased"] = await self.redis.zcard(self.leases_set)
             
             # Count dead letter queue
             stats["dead_letter"] = await self.redis.llen(self.dead_letter_queue)
@@ -489,8 +937,7 @@ class JobQueue:
             await self.redis.lrem(self.dead_letter_queue, 1, job_id)
             
             # Add back to queue
-            queue_key = self.queues[job.priority]
-            await self.redis.rpush(queue_key, job_id)
+            await self._push(job.priority, job_id, job.queue)
             
             logger.info(f"Job {job_id} moved from DLQ to queue for retry")
             return True
@@ -1,18 +1,29 @@
 """Scheduled job execution using cron-like scheduling."""
 
 import asyncio
+import heapq
+import itertools
 import logging
-from typing import Optional, Dict, List, Callable, Awaitable, Any
+from typing import Optional, Dict, List, Callable, Awaitable, Any, Tuple
 from datetime import datetime, timedelta, UTC
 from dataclasses import dataclass, field
 from enum import Enum
 import re
 
 from .job_queue import job_queue, JobPriority
+from .leader_election import LeaderElection
+from .cron import compile_cron, parse_cron_field
 
 logger = logging.getLogger(__name__)
 
 
+def _naive_utc(value: datetime) -> datetime:
+    """Normalize to naive UTC so naive and aware run times compare."""
+    if value.tzinfo is not None:
+        return value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
+
 class ScheduleType(str, Enum):
     """Schedule type."""
     INTERVAL = "interval"
@@ -70,82 +81,67 @@ class ScheduledTask:
     def _parse_cron_next_run(self, from_time: datetime) -> Optional[datetime]:
         """Parse cron expression and calculate next run.
         
-        Simplified cron format: minute hour day month weekday
-        Supports: *, specific values, ranges (1-5), steps (*/5)
+        Format: minute hour day month weekday (weekday 0/7 = Sunday).
+        Supports: *, specific values, ranges (1-5), steps (*/5, 1-10/2),
+        lists (1,3,5) and @daily-style aliases. The expression is compiled
+        once and cached; each call is a constant-time field walk.
         """
         try:
-            parts = self.cron_expression.split()
-            if len(parts) != 5:
-                logger.error(f"Invalid cron expression: {self.cron_expression}")
-                return None
-            
-            minute, hour, day, month, weekday = parts
-            
-            # Start from next minute
-            next_time = from_time.replace(second=0, microsecond=0) + timedelta(minutes=1)
-            
-            # Try to find next matching time within 1 year
-            max_iterations = 525600  # Minutes in a year
-            for _ in range(max_iterations):
-                if (self._matches_cron_field(minute, next_time.minute, 0, 59) and
-                    self._matches_cron_field(hour, next_time.hour, 0, 23) and
-                    self._matches_cron_field(day, next_time.day, 1, 31) and
-                    self._matches_cron_field(month, next_time.month, 1, 12) and
-                    self._matches_cron_field(weekday, next_time.weekday(), 0, 6)):
-                    return next_time
-                
-                next_time += timedelta(minutes=1)
-            
+            return compile_cron(self.cron_expression).next_after(from_time)
+        except ValueError as e:
+            logger.error(f"Invalid cron expression {self.cron_expression}: {e}")
             return None
-            
         except Exception as e:
             logger.error(f"Error parsing cron expression {self.cron_expression}: {e}")
             return None
     
     def _matches_cron_field(self, pattern: str, value: int, min_val: int, max_val: int) -> bool:
         """Check if value matches cron field pattern."""
-        if pattern == "*":
-            return True
-        
-        # Handle step values (*/5)
-        if pattern.startswith("*/"):
-            try:
-                step = int(pattern[2:])
-                return value % step == 0
-            except ValueError:
-                return False
-        
-        # Handle ranges (1-5)
-        if "-" in pattern:
-            try:
-                start, end = pattern.split("-")
-                return int(start) <= value <= int(end)
-            except ValueError:
-                return False
-        
-        # Handle comma-separated values (1,3,5)
-        if "," in pattern:
-            try:
-                values = [int(v.strip()) for v in pattern.split(",")]
-                return value in values
-            except ValueError:
-                return False
-        
-        # Handle single value
         try:
-            return int(pattern) == value
+            return bool(parse_cron_field(pattern, min_val, max_val) >> value & 1)
         except ValueError:
             return False
 
 
 class JobScheduler:
-    """Scheduler for periodic and scheduled job execution."""
+    """Scheduler for periodic and scheduled job execution.
+    
+    Every process may run a scheduler, but only the holder of the
+    ``job_scheduler`` leader lease enqueues jobs, so scaling the API out
+    does not duplicate scheduled work. Next-fire times live in a heap; the
+    loop sleeps until the earliest one (bounded by lease renewal) and is
+    woken early when a task is registered or enabled.
+    """
     
-    def __init__(self):
+    def __init__(self, leader: Optional[LeaderElection] = None):
         self.tasks: Dict[str, ScheduledTask] = {}
         self._running = False
         self._scheduler_task: Optional[asyncio.Task] = None
-        self._check_interval = 30  # Check every 30 seconds
+        self._check_interval = 30  # Longest sleep between wake-ups
+        self.leader = leader or LeaderElection("job_scheduler")
+        self._renew_interval = self.leader.lease_ttl / 3
+        self._last_run_key = f"{job_queue.prefix}:scheduler:last_run"
+        
+        # (next_run, seq, task name); stale entries are skipped on pop
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+    
+    def _schedule(self, task: ScheduledTask):
+        """Push a task's next run onto the heap and wake the loop."""
+        if task.enabled and task.next_run:
+            heapq.heappush(self._heap, (_naive_utc(task.next_run), next(self._seq), task.name))
+            self._wakeup.set()
+    
+    def _is_current(self, run_time: datetime, name: str) -> bool:
+        """Whether a heap entry still matches its task's schedule."""
+        task = self.tasks.get(name)
+        return (
+            task is not None
+            and task.enabled
+            and task.next_run is not None
+            and _naive_utc(task.next_run) == run_time
+        )
     
     def register(
         self,
@@ -176,6 +172,7 @@ class JobScheduler:
         task.next_run = task.calculate_next_run()
         
         self.tasks[name] = task
+        self._schedule(task)
         logger.info(f"Registered scheduled task: {name} (next run: {task.next_run})")
         
         return task
@@ -193,6 +190,7 @@ class JobScheduler:
         if name in self.tasks:
             self.tasks[name].enabled = True
             self.tasks[name].next_run = self.tasks[name].calculate_next_run()
+            self._schedule(self.tasks[name])
             logger.info(f"Enabled scheduled task: {name}")
             return True
         return False
@@ -234,49 +232,101 @@ class JobScheduler:
                 pass
             self._scheduler_task = None
         
+        try:
+            await self.leader.release()
+        except Exception as e:
+            logger.error(f"Error releasing scheduler leadership: {e}")
+        
         logger.info("Job scheduler stopped")
     
     async def _scheduler_loop(self):
         """Main scheduler loop."""
         while self._running:
             try:
-                await self._check_and_enqueue_tasks()
-                await asyncio.sleep(self._check_interval)
+                was_leader = self.leader.is_leader
+                if await self.leader.try_acquire():
+                    if not was_leader:
+                        await self._load_last_runs()
+                    await self._check_and_enqueue_tasks()
+                    delay = min(self._seconds_until_next_run(), self._renew_interval)
+                else:
+                    # Follower: retry often enough to take over within one lease
+                    delay = self._renew_interval
+                
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in scheduler loop: {e}")
-                await asyncio.sleep(self._check_interval)
+                await asyncio.sleep(self._renew_interval)
+    
+    def _seconds_until_next_run(self) -> float:
+        """Seconds until the earliest live heap entry (capped)."""
+        while self._heap and not self._is_current(self._heap[0][0], self._heap[0][2]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return self._check_interval
+        delay = (self._heap[0][0] - datetime.utcnow()).total_seconds()
+        return max(0.0, min(delay, self._check_interval))
+    
+    async def _load_last_runs(self):
+        """Adopt the previous leader's last-run times on takeover.
+        
+        Without this a new leader would fire every task whose run the old
+        leader had already enqueued.
+        """
+        last_runs = await job_queue.redis.hgetall(self._last_run_key)
+        for name, value in (last_runs or {}).items():
+            task = self.tasks.get(name)
+            if not task:
+                continue
+            try:
+                last_run = datetime.fromisoformat(value)
+            except ValueError:
+                continue
+            if task.last_run is None or last_run > task.last_run:
+                task.last_run = last_run
+                task.next_run = task.calculate_next_run(last_run)
+                self._schedule(task)
     
     async def _check_and_enqueue_tasks(self):
-        """Check scheduled tasks and enqueue if ready."""
+        """Enqueue every task whose next run is due."""
         now = datetime.utcnow()
         
-        for task in self.tasks.values():
-            if not task.enabled:
+        while self._heap and self._heap[0][0] <= now:
+            run_time, _, name = heapq.heappop(self._heap)
+            if not self._is_current(run_time, name):
                 continue
             
-            if task.next_run and task.next_run <= now:
-                try:
-                    # Enqueue the job
-                    job_id = await job_queue.enqueue(
-                        name=task.job_name,
-                        args=task.args,
-                        priority=task.priority,
-                    )
-                    
-                    # Update task state
-                    task.last_run = now
-                    task.run_count += 1
-                    task.next_run = task.calculate_next_run(now)
-                    
-                    logger.info(
-                        f"Scheduled task {task.name} enqueued as job {job_id} "
-                        f"(run #{task.run_count}, next: {task.next_run})"
-                    )
-                    
-                except Exception as e:
-                    logger.error(f"Failed to enqueue scheduled task {task.name}: {e}")
+            task = self.tasks[name]
+            try:
+                # Enqueue the job
+                job_id = await job_queue.enqueue(
+                    name=task.job_name,
+                    args=task.args,
+                    priority=task.priority,
+                )
+                
+                # Update task state
+                task.last_run = now
+                task.run_count += 1
+                task.next_run = task.calculate_next_run(now)
+                await job_queue.redis.hset(self._last_run_key, task.name, now.isoformat())
+                
+                logger.info(
+                    f"Scheduled task {task.name} enqueued as job {job_id} "
+                    f"(run #{task.run_count}, next: {task.next_run})"
+                )
+                
+            except Exception as e:
+                logger.error(f"Failed to enqueue scheduled task {task.name}: {e}")
+                task.next_run = now + timedelta(seconds=self._renew_interval)
+            
+            self._schedule(task)
     
     async def run_task_now(self, name: str) -> Optional[str]:
         """Manually trigger a scheduled task to run now."""
@@ -307,6 +357,7 @@ class JobScheduler:
         
         return {
             "running": self._running,
+            "is_leader": self.leader.is_leader,
             "check_interval": self._check_interval,
             "total_tasks": len(self.tasks),
             "enabled_tasks": len(enabled_tasks),
@@ -101,6 +101,8 @@ class JobService:
         max_retries: int = 3,
         timeout: int = 300,
         user_id: str = None,
+        tags: List[str] = None,
+        queue: str = None,
     ) -> str:
         """Enqueue a new job."""
         return await job_queue.enqueue(
@@ -111,6 +113,8 @@ class JobService:
             max_retries=max_retries,
             timeout=timeout,
             user_id=user_id,
+            tags=tags,
+            queue=queue,
         )
     
     async def get_job(self, job_id: str) -> Optional[Job]:
@@ -121,6 +125,22 @@ class JobService:
         """Cancel a pending job."""
         return await job_queue.cancel_job(job_id)
     
+    async def cancel_jobs(self, job_ids: List[str]) -> List[str]:
+        """Cancel many pending jobs."""
+        return await job_queue.cancel_jobs(job_ids)
+    
+    async def cancel_jobs_by_tag(self, tag: str) -> int:
+        """Cancel every pending job carrying a tag."""
+        return await job_queue.cancel_jobs_by_tag(tag)
+    
+    async def get_jobs_by_tag(self, tag: str) -> List[Job]:
+        """Get jobs carrying a tag."""
+        return await job_queue.get_jobs_by_tag(tag)
+    
+    async def get_tag_progress(self, tag: str) -> Dict[str, Any]:
+        """Get status counts of jobs carrying a tag."""
+        return await job_queue.get_tag_progress(tag)
+    
     async def get_job_result(self, job_id: str) -> Optional[Any]:
         """Get job result."""
         return await job_queue.get_job_result(job_id)
@@ -2,14 +2,17 @@
 
 import asyncio
 import logging
+import os
 import signal
+import socket
 import sys
 from typing import Optional, Dict, Callable, Awaitable, Any, List
 from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
 
-from .job_queue import job_queue, Job, JobStatus
+from .job_queue import job_queue, Job, JobStatus, DEFAULT_QUEUE
+from ..config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +57,22 @@ class WorkerStats:
 TaskHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
 
 
+def parse_queue_spec(spec: str, default_concurrency: int = 1) -> Dict[str, int]:
+    """Parse ``"default,marketdata=4"`` into ``{queue: concurrency}``."""
+    queues: Dict[str, int] = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, concurrency = item.partition("=")
+        name = name.strip()
+        limit = int(concurrency) if concurrency.strip() else default_concurrency
+        if not name or limit < 1:
+            raise ValueError(f"Invalid queue spec: {item!r}")
+        queues[name] = limit
+    return queues
+
+
 class JobWorker:
     """Background worker that processes jobs from the queue."""
     
@@ -65,14 +84,22 @@ class JobWorker:
         worker_id: str = None,
         poll_interval: float = 1.0,
         max_concurrent_jobs: int = 1,
+        block_timeout: float = 5.0,
+        queues: Optional[List[str]] = None,
     ):
         self.worker_id = worker_id or f"worker-{id(self)}"
-        self.poll_interval = poll_interval
+        self.poll_interval = poll_interval  # Back-off after loop errors
         self.max_concurrent_jobs = max_concurrent_jobs
+        self.block_timeout = block_timeout
+        self.queues = list(queues or [DEFAULT_QUEUE])
+        
+        # Lease owner id, unique across hosts and processes
+        self.consumer_id = f"{socket.gethostname()}:{os.getpid()}:{self.worker_id}"
         
         self._running = False
         self._worker_task: Optional[asyncio.Task] = None
         self._current_jobs: Dict[str, asyncio.Task] = {}
+        self._slot_free = asyncio.Event()
         
         self.stats = WorkerStats(
             worker_id=self.worker_id,
@@ -107,36 +134,35 @@ class JobWorker:
         self._worker_task = asyncio.create_task(self._worker_loop())
         logger.info(f"Worker {self.worker_id} started")
     
-    async def stop(self, wait_for_jobs: bool = True):
-        """Stop the worker."""
+    async def stop(self, wait_for_jobs: bool = True, timeout: float = 30.0):
+        """Stop the worker.
+        
+        Leasing stops first, so draining never picks up new work; jobs
+        still running after ``timeout`` are cancelled and their leases
+        expire back onto the queue.
+        """
         self._running = False
         self.stats.status = WorkerStatus.STOPPING
         
+        if self._worker_task:
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            self._worker_task = None
+        
         # Wait for current jobs to finish
         if wait_for_jobs and self._current_jobs:
             logger.info(f"Worker {self.worker_id} waiting for {len(self._current_jobs)} jobs to finish")
-            try:
-                await asyncio.wait(
-                    list(self._current_jobs.values()),
-                    timeout=30.0
-                )
-            except asyncio.TimeoutError:
-                logger.warning(f"Worker {self.worker_id} timeout waiting for jobs")
+            await asyncio.wait(list(self._current_jobs.values()), timeout=timeout)
         
         # Cancel remaining tasks
-        for job_id, task in self._current_jobs.items():
+        for job_id, task in list(self._current_jobs.items()):
             if not task.done():
                 task.cancel()
                 logger.warning(f"Cancelled job {job_id}")
         
-        if self._worker_task:
-            self._worker_task.cancel()
-            try:
-                await self._worker_task
-            except asyncio.CancelledError:
-                pass
-            self._worker_task = None
-        
         self.stats.status = WorkerStatus.STOPPED
         logger.info(f"Worker {self.worker_id} stopped")
     
@@ -144,13 +170,20 @@ class JobWorker:
         """Main worker loop."""
         while self._running:
             try:
-                # Check if we can process more jobs
+                # Wait for a free slot instead of polling
                 if len(self._current_jobs) >= self.max_concurrent_jobs:
-                    await asyncio.sleep(self.poll_interval)
+                    self._slot_free.clear()
+                    await self._slot_free.wait()
                     continue
                 
-                # Try to get a job
-                job = await job_queue.dequeue()
+                await job_queue.maintain()
+                
+                # Lease a job, blocking on Redis while the queues are empty
+                job = await job_queue.dequeue(
+                    worker_id=self.consumer_id,
+                    timeout=self.block_timeout,
+                    queues=self.queues,
+                )
                 
                 if job:
                     print(f"DEBUG [JobWorker]: ========== JOB DEQUEUED ==========")
@@ -166,7 +199,6 @@ class JobWorker:
                     )
                 else:
                     self.stats.status = WorkerStatus.IDLE
-                    await asyncio.sleep(self.poll_interval)
                     
             except asyncio.CancelledError:
                 break
@@ -178,6 +210,7 @@ class JobWorker:
         """Callback when a job task is done."""
         if job_id in self._current_jobs:
             del self._current_jobs[job_id]
+        self._slot_free.set()
         
         if not self._current_jobs:
             self.stats.status = WorkerStatus.IDLE
@@ -241,6 +274,7 @@ class JobWorker:
         """Get worker statistics."""
         return {
             "worker_id": self.worker_id,
+            "queues": self.queues,
             "status": self.stats.status.value,
             "started_at": self.stats.started_at.isoformat() if self.stats.started_at else None,
             "jobs_processed": self.stats.jobs_processed,
@@ -267,7 +301,10 @@ def job_handler(job_name: str = None):
 
 
 # Global worker instance
-job_worker = JobWorker(worker_id="main-worker")
+job_worker = JobWorker(
+    worker_id="main-worker",
+    queues=list(parse_queue_spec(get_settings().JOB_WORKER_QUEUES)),
+)
 
 
 class WorkerPool:
@@ -0,0 +1,94 @@
+"""Redis lease-based leader election."""
+
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Optional
+
+from ..cache import redis_client
+
+logger = logging.getLogger(__name__)
+
+# Extend the lease only while we still hold it.
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# Give the lease up only if we still hold it.
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class LeaderElection:
+    """Elect one holder of a named role across processes.
+
+    The leader owns a Redis key (``SET NX PX``) holding a random token and
+    must ``renew`` it well within ``lease_ttl``. If the holder dies the key
+    expires and another candidate takes over on its next ``try_acquire``.
+    Any Redis error counts as not being leader, so a partitioned process
+    steps down rather than running alongside the new leader.
+    """
+
+    def __init__(self, name: str, lease_ttl: float = 15.0, prefix: str = "leader"):
+        self.key = f"{prefix}:{name}"
+        self.lease_ttl = lease_ttl
+        self.token = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+        self.redis = redis_client
+        self._lease_expires_at = 0.0
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this process holds an unexpired lease (by local clock)."""
+        return time.monotonic() < self._lease_expires_at
+
+    async def try_acquire(self) -> bool:
+        """Become leader if the role is free, or renew if already held."""
+        if self.is_leader:
+            return await self.renew()
+
+        started = time.monotonic()
+        acquired = await self.redis.set(
+            self.key, self.token, px=int(self.lease_ttl * 1000), nx=True
+        )
+        if acquired:
+            self._lease_expires_at = started + self.lease_ttl
+            logger.info(f"Acquired leadership of {self.key}")
+        return bool(acquired)
+
+    async def renew(self) -> bool:
+        """Extend the lease; returns False (and steps down) if it was lost."""
+        started = time.monotonic()
+        renewed = await self.redis.run_script(
+            _RENEW_SCRIPT,
+            keys=[self.key],
+            args=[self.token, int(self.lease_ttl * 1000)],
+        )
+        if renewed:
+            self._lease_expires_at = started + self.lease_ttl
+            return True
+
+        if self._lease_expires_at:
+            logger.warning(f"Lost leadership of {self.key}")
+        self._lease_expires_at = 0.0
+        return False
+
+    async def release(self):
+        """Step down so another candidate can take over immediately."""
+        was_leader = self._lease_expires_at > 0
+        self._lease_expires_at = 0.0
+        if was_leader:
+            await self.redis.run_script(_RELEASE_SCRIPT, keys=[self.key], args=[self.token])
+            logger.info(f"Released leadership of {self.key}")
+
+    async def current_leader(self) -> Optional[str]:
+        """Token of the current leader, if any."""
+        return await self.redis.get(self.key)
@@ -121,16 +121,24 @@ async def monitor_risk_task(args: Dict[str, Any]) -> Dict[str, Any]:
 
 @job_handler("evaluate_risk_limits")
 async def evaluate_risk_limits_task(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Evaluate all risk limits and trigger alerts if needed."""
+    """Resync the risk engine of this process and re-evaluate all limits.
+    
+    On-demand only: the engine is per process, and processes hosting the
+    Binance user stream resync their own engine on a loop
+    (``RiskEngine.start``), so a scheduled run on a worker would only
+    refresh an engine that receives no events.
+    """
+    from ..persistence.database import get_db_context
+    from ...application.services.risk_engine import risk_engine
+    
     logger.info("Evaluating risk limits for all users")
     
     try:
-        await asyncio.sleep(1)
+        async with get_db_context() as session:
+            result = await risk_engine.resync(session)
         
         return {
-            "users_checked": 0,
-            "limits_evaluated": 0,
-            "violations_found": 0,
+            **result,
             "completed_at": datetime.utcnow().isoformat(),
         }
         
@@ -210,6 +218,28 @@ async def vacuum_database_task(args: Dict[str, Any]) -> Dict[str, Any]:
         raise
 
 
+@job_handler("maintain_partitions")
+async def maintain_partitions_task(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Create upcoming monthly partitions and drop expired ones."""
+    from ..persistence.database import get_db_context
+    from ..persistence.partitions import partition_manager
+    
+    logger.info("Maintaining market data partitions")
+    
+    try:
+        async with get_db_context() as session:
+            summary = await partition_manager.maintain(session)
+        
+        return {
+            "tables": summary,
+            "completed_at": datetime.utcnow().isoformat(),
+        }
+        
+    except Exception as e:
+        logger.error(f"Partition maintenance failed: {e}")
+        raise
+
+
 # ============================================================================
 # Price Alert Tasks
 # ============================================================================
@@ -346,6 +376,111 @@ async def restart_unhealthy_bots_task(args: Dict[str, Any]) -> Dict[str, Any]:
         raise
 
 
+@job_handler("reconcile_bot_stats")
+async def reconcile_bot_stats_task(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Repair drift between incremental bot stats and the trades table.
+    
+    Args:
+        full: Also replay bots whose counters agree, to repair streaks
+    """
+    from ..persistence.database import get_db_context
+    from ...application.services.bot_stats_service import BotStatsService
+    
+    full = bool(args.get("full", False))
+    logger.info(f"Reconciling bot stats (full={full})")
+    
+    try:
+        async with get_db_context() as session:
+            result = await BotStatsService(session).reconcile(full=full)
+        
+        if result["drifted"]:
+            logger.warning(f"Repaired stats drift for {len(result['drifted'])} bots: {result['drifted']}")
+        
+        return {
+            **result,
+            "completed_at": datetime.utcnow().isoformat(),
+        }
+        
+    except Exception as e:
+        logger.error(f"Bot stats reconciliation failed: {e}")
+        raise
+
+
+@job_handler("rebuild_daily_pnl")
+async def rebuild_daily_pnl_task(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Recompute recent bot_daily_pnl rows from the trades table.
+    
+    Args:
+        since_days: Number of UTC days back to rebuild, including today (default 2)
+        bot_id: Restrict the rebuild to one bot (optional)
+    """
+    from uuid import UUID
+    from ..persistence.database import get_db_context
+    from ..persistence.repositories.daily_pnl_repository import DailyPnlRepository
+    
+    since_days = int(args.get("since_days", 2))
+    bot_id = args.get("bot_id")
+    since = datetime.utcnow().date() - timedelta(days=max(since_days, 1) - 1)
+    logger.info(f"Rebuilding daily P&L since {since}" + (f" for bot {bot_id}" if bot_id else ""))
+    
+    try:
+        async with get_db_context() as session:
+            rows = await DailyPnlRepository(session).rebuild(
+                since, bot_id=UUID(bot_id) if bot_id else None
+            )
+        
+        return {
+            "since": since.isoformat(),
+            "rows": rows,
+            "completed_at": datetime.utcnow().isoformat(),
+        }
+        
+    except Exception as e:
+        logger.error(f"Daily P&L rebuild failed: {e}")
+        raise
+
+
+@job_handler("snapshot_equity")
+async def snapshot_equity_task(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Record a 1m account equity snapshot for every user."""
+    from ..persistence.database import get_db_context
+    from ...application.services.equity_snapshot_service import EquitySnapshotService
+    
+    try:
+        async with get_db_context() as session:
+            recorded = await EquitySnapshotService(session).snapshot()
+        
+        return {
+            "users": recorded,
+            "completed_at": datetime.utcnow().isoformat(),
+        }
+        
+    except Exception as e:
+        logger.error(f"Equity snapshot failed: {e}")
+        raise
+
+
+@job_handler("downsample_equity")
+async def downsample_equity_task(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold equity snapshots into the 1h and 1d tiers and apply retention."""
+    from ..persistence.database import get_db_context
+    from ...application.services.equity_snapshot_service import EquitySnapshotService
+    
+    try:
+        async with get_db_context() as session:
+            result = await EquitySnapshotService(session).downsample()
+        
+        logger.info(f"Equity downsampling: {result}")
+        return {
+            **result,
+            "completed_at": datetime.utcnow().isoformat(),
+        }
+        
+    except Exception as e:
+        logger.error(f"Equity downsampling failed: {e}")
+        raise
+
+
 # ============================================================================
 # Market Data Tasks
 # ============================================================================
@@ -460,23 +595,63 @@ def register_default_scheduled_tasks():
         enabled=True,
     )
     
-    # Risk monitoring - every minute
+    # Bot health check - every 2 minutes
     job_scheduler.register(
-        name="scheduled_risk_monitoring",
-        job_name="evaluate_risk_limits",
+        name="scheduled_bot_health_check",
+        job_name="bot_health_check",
         schedule_type=ScheduleType.INTERVAL,
-        interval_seconds=60,  # 1 minute
+        interval_seconds=120,  # 2 minutes
         priority=JobPriority.HIGH,
         enabled=True,
     )
     
-    # Bot health check - every 2 minutes
+    # Bot stats reconciliation - every 15 minutes, full replay daily at 2 AM
     job_scheduler.register(
-        name="scheduled_bot_health_check",
-        job_name="bot_health_check",
+        name="scheduled_bot_stats_reconciliation",
+        job_name="reconcile_bot_stats",
         schedule_type=ScheduleType.INTERVAL,
-        interval_seconds=120,  # 2 minutes
-        priority=JobPriority.HIGH,
+        interval_seconds=900,  # 15 minutes
+        priority=JobPriority.LOW,
+        enabled=True,
+    )
+    
+    job_scheduler.register(
+        name="scheduled_bot_stats_full_reconciliation",
+        job_name="reconcile_bot_stats",
+        schedule_type=ScheduleType.CRON,
+        cron_expression="0 2 * * *",
+        priority=JobPriority.LOW,
+        args={"full": True},
+        enabled=True,
+    )
+    
+    # Daily P&L rollup repair - yesterday and today, daily at 2:30 AM
+    job_scheduler.register(
+        name="scheduled_daily_pnl_rebuild",
+        job_name="rebuild_daily_pnl",
+        schedule_type=ScheduleType.CRON,
+        cron_expression="30 2 * * *",
+        priority=JobPriority.LOW,
+        args={"since_days": 2},
+        enabled=True,
+    )
+    
+    # Equity snapshots - every minute, downsampled to 1h/1d every 5 minutes
+    job_scheduler.register(
+        name="scheduled_equity_snapshot",
+        job_name="snapshot_equity",
+        schedule_type=ScheduleType.INTERVAL,
+        interval_seconds=60,
+        priority=JobPriority.NORMAL,
+        enabled=True,
+    )
+    
+    job_scheduler.register(
+        name="scheduled_equity_downsample",
+        job_name="downsample_equity",
+        schedule_type=ScheduleType.INTERVAL,
+        interval_seconds=300,  # 5 minutes
+        priority=JobPriority.LOW,
         enabled=True,
     )
     
@@ -491,6 +666,16 @@ def register_default_scheduled_tasks():
         enabled=True,
     )
     
+    # Market data partitions - daily at 3:15 AM
+    job_scheduler.register(
+        name="scheduled_partition_maintenance",
+        job_name="maintain_partitions",
+        schedule_type=ScheduleType.CRON,
+        cron_expression="15 3 * * *",
+        priority=JobPriority.LOW,
+        enabled=True,
+    )
+    
     # Database vacuum - weekly on Sunday at 4 AM
     job_scheduler.register(
         name="scheduled_database_vacuum",
@@ -0,0 +1,265 @@
+"""Capture of aggTrade and bookTicker streams into market_trades / market_quotes"""
+import asyncio
+import json
+import logging
+import random
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import websockets
+
+from ..config.settings import get_settings
+from ..jobs.leader_election import LeaderElection
+from ..persistence.partitions import partition_manager
+from ..persistence.repositories.market_data_repository import QUOTE_COLUMNS, TRADE_COLUMNS, copy_rows
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+STREAM_URL = "wss://stream.binance.com:9443/stream"
+TRADES_TABLE = "market_trades"
+QUOTES_TABLE = "market_quotes"
+WRITE_ATTEMPTS = 5
+
+RowWriter = Callable[[str, Sequence[str], List[tuple]], Awaitable[None]]
+
+
+def parse_agg_trade(data: Dict[str, Any]) -> tuple:
+    """``market_trades`` row of an aggTrade event."""
+    return (
+        data["s"],
+        datetime.fromtimestamp(data["T"] / 1000, timezone.utc),
+        data["a"],
+        Decimal(data["p"]),
+        Decimal(data["q"]),
+        data["m"],
+    )
+
+
+def parse_book_ticker(data: Dict[str, Any], received_at: datetime) -> tuple:
+    """``market_quotes`` row of a bookTicker event.
+
+    Spot book tickers carry no timestamp, so the receive time is used;
+    futures ones carry the transaction time ``T``.
+    """
+    ts = datetime.fromtimestamp(data["T"] / 1000, timezone.utc) if "T" in data else received_at
+    return (
+        data["s"],
+        ts,
+        data["u"],
+        Decimal(data["b"]),
+        Decimal(data["B"]),
+        Decimal(data["a"]),
+        Decimal(data["A"]),
+    )
+
+
+async def write_rows(table: str, columns: Sequence[str], rows: List[tuple]):
+    """Write one batch with COPY in its own transaction."""
+    from ..persistence.database import AsyncSessionLocal
+
+    timestamps = [row[1] for row in rows]
+    async with AsyncSessionLocal() as session:
+        await partition_manager.ensure(session, table, min(timestamps), max(timestamps))
+        await copy_rows(session, table, columns, rows)
+        await session.commit()
+
+
+class TradeCaptureService:
+    """
+    Records aggregated trades and best bid/ask of a set of symbols
+
+    Parsed rows accumulate in memory and are handed to a single writer
+    task as one batch per ``flush_rows`` rows or ``flush_interval``
+    seconds, whichever comes first. At most ``max_pending_batches``
+    batches wait for the writer; past that the receive loop blocks, which
+    stops reading the socket instead of growing memory. A batch that still
+    fails after ``WRITE_ATTEMPTS`` writes is dropped and logged.
+
+    Every API process starts the service, but only the holder of the
+    ``trade_capture`` leader lease connects: two capturing replicas would
+    COPY the same trade ids and fail each other's batches on the primary
+    key. Messages are only taken while the lease is held (local clock), so
+    a replica taking over after expiry never overlaps the previous owner.
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        flush_rows: int = settings.TRADE_CAPTURE_FLUSH_ROWS,
+        flush_interval: float = settings.TRADE_CAPTURE_FLUSH_INTERVAL,
+        max_pending_batches: int = settings.TRADE_CAPTURE_MAX_PENDING_BATCHES,
+        writer: Optional[RowWriter] = None,
+        stream_url: str = STREAM_URL,
+        leader: Optional[LeaderElection] = None,
+    ):
+        self.symbols = [symbol.upper() for symbol in symbols]
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.writer = writer or write_rows
+        self.stream_url = stream_url
+        self.leader = leader or LeaderElection("trade_capture")
+        self.running = False
+        self._trades: List[tuple] = []
+        self._quotes: List[tuple] = []
+        self._batches: asyncio.Queue = asyncio.Queue(maxsize=max_pending_batches)
+        self._tasks: List[asyncio.Task] = []
+        self._receive_task: Optional[asyncio.Task] = None
+        self.stats = {"received": 0, "written": 0, "dropped": 0}
+
+    @property
+    def url(self) -> str:
+        streams = [f"{symbol.lower()}@{kind}" for symbol in self.symbols for kind in ("aggTrade", "bookTicker")]
+        return f"{self.stream_url}?streams={'/'.join(streams)}"
+
+    async def start(self):
+        """Connect and start capturing."""
+        if self.running or not self.symbols:
+            return
+        self.running = True
+        self._tasks = [
+            asyncio.create_task(self._write_loop()),
+            asyncio.create_task(self._flush_loop()),
+            asyncio.create_task(self._ownership_loop()),
+        ]
+
+    async def stop(self, timeout: float = 10.0):
+        """Stop receiving and write what was captured so far."""
+        if not self.running:
+            return
+        self.running = False
+        writer, *others = self._tasks
+        for task in others:
+            task.cancel()
+        await asyncio.gather(*others, return_exceptions=True)
+        await self._stop_receiving()
+        try:
+            await self.leader.release()
+        except Exception as e:
+            logger.error(f"Error releasing trade capture leadership: {e}")
+
+        try:
+            await asyncio.wait_for(self._drain(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Trade capture stopped with {self._batches.qsize()} batches unwritten")
+        writer.cancel()
+        await asyncio.gather(writer, return_exceptions=True)
+        self._tasks = []
+
+    async def _drain(self):
+        await self.flush()
+        await self._batches.join()
+
+    async def handle_message(self, raw: str, received_at: Optional[datetime] = None):
+        """Parse one combined-stream message into the row buffers."""
+        message = json.loads(raw)
+        data = message.get("data", message)
+        if data.get("e") == "aggTrade":
+            self._trades.append(parse_agg_trade(data))
+            if len(self._trades) >= self.flush_rows:
+                await self._flush_trades()
+        elif "b" in data and "B" in data:
+            self._quotes.append(parse_book_ticker(data, received_at or datetime.now(timezone.utc)))
+            if len(self._quotes) >= self.flush_rows:
+                await self._flush_quotes()
+        else:
+            return
+        self.stats["received"] += 1
+
+    async def flush(self):
+        """Queue whatever is buffered (waits when the writer is behind)."""
+        await self._flush_trades()
+        await self._flush_quotes()
+
+    async def _flush_trades(self):
+        if self._trades:
+            rows, self._trades = self._trades, []
+            await self._batches.put((TRADES_TABLE, TRADE_COLUMNS, rows))
+
+    async def _flush_quotes(self):
+        if self._quotes:
+            rows, self._quotes = self._quotes, []
+            await self._batches.put((QUOTES_TABLE, QUOTE_COLUMNS, rows))
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def _write_loop(self):
+        while True:
+            table, columns, rows = await self._batches.get()
+            try:
+                await self._write(table, columns, rows)
+            finally:
+                self._batches.task_done()
+
+    async def _write(self, table: str, columns: Sequence[str], rows: List[tuple]):
+        for attempt in range(WRITE_ATTEMPTS):
+            try:
+                await self.writer(table, columns, rows)
+                self.stats["written"] += len(rows)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Writing {len(rows)} rows to {table} failed (attempt {attempt + 1}): {e}")
+                await asyncio.sleep(min(10.0, 0.5 * 2 ** attempt))
+        self.stats["dropped"] += len(rows)
+        logger.error(f"Dropped {len(rows)} captured rows for {table} after {WRITE_ATTEMPTS} attempts")
+
+    async def _ownership_loop(self):
+        """Capture while holding the lease; hand over when it is lost."""
+        while True:
+            try:
+                leader = await self.leader.try_acquire()
+            except Exception as e:
+                logger.warning(f"Trade capture leader check failed: {e}")
+                leader = False
+            if leader and (self._receive_task is None or self._receive_task.done()):
+                logger.info(f"Capturing trades and quotes for {', '.join(self.symbols)}")
+                self._receive_task = asyncio.create_task(self._receive_loop())
+            elif not leader and self._receive_task is not None:
+                logger.info("Trade capture handed over to another process")
+                await self._stop_receiving()
+            await asyncio.sleep(self.leader.lease_ttl / 3)
+
+    async def _stop_receiving(self):
+        task, self._receive_task = self._receive_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _receive_loop(self):
+        attempt = 0
+        while self.running and self.leader.is_leader:
+            try:
+                async with websockets.connect(self.url) as connection:
+                    attempt = 0
+                    async for raw in connection:
+                        if not self.leader.is_leader:
+                            return
+                        await self.handle_message(raw)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Trade capture stream disconnected: {e}")
+            await asyncio.sleep(random.uniform(0, min(30.0, 2 ** attempt)))
+            attempt += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "capturing": self._receive_task is not None and not self._receive_task.done(),
+            "buffered": len(self._trades) + len(self._quotes),
+            "pending_batches": self._batches.qsize(),
+        }
+
+
+def _configured_symbols() -> List[str]:
+    return [symbol.strip() for symbol in settings.TRADE_CAPTURE_SYMBOLS.split(",") if symbol.strip()]
+
+
+# Global trade capture service (idle unless TRADE_CAPTURE_SYMBOLS is set)
+trade_capture_service = TradeCaptureService(_configured_symbols())
@@ -1,10 +1,10 @@
 """SQLAlchemy models package."""
 from .base import TimestampMixin, SoftDeleteMixin, UUIDPrimaryKeyMixin, generate_uuid7
 from .core_models import UserModel, ExchangeModel, APIConnectionModel, DatabaseConfigModel, SymbolModel
-from .trading_models import OrderModel, PositionModel, TradeModel
-from .bot_models import BotModel, StrategyModel, BacktestModel, BotPerformanceModel
+from .trading_models import OrderModel, PositionModel, TradeModel, EquitySnapshotModel
+from .bot_models import BotModel, StrategyModel, BacktestModel, BotPerformanceModel, BotDailyPnlModel
 from .backtest_models import BacktestRunModel, BacktestResultModel, BacktestTradeModel, BacktestEventModel
-from .market_data_models import MarketPriceModel, OrderBookSnapshotModel
+from .market_data_models import MarketPriceModel, OrderBookSnapshotModel, MarketTradeModel, MarketQuoteModel
 from .risk_models import RiskLimitModel, RiskAlertModel, AlertModel, EventQueueModel
 
 __all__ = [
@@ -25,12 +25,14 @@ __all__ = [
     "OrderModel",
     "PositionModel",
     "TradeModel",
+    "EquitySnapshotModel",
     
     # Bot models
     "BotModel",
     "StrategyModel",
     "BacktestModel",
     "BotPerformanceModel",
+    "BotDailyPnlModel",
     
     # Backtest models (Phase 5)
     "BacktestRunModel",
@@ -41,6 +43,8 @@ __all__ = [
     # Market data models
     "MarketPriceModel",
     "OrderBookSnapshotModel",
+    "MarketTradeModel",
+    "MarketQuoteModel",
     
     # Risk models
     "RiskLimitModel",
@@ -63,6 +63,7 @@ class BotModel(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
     current_loss_streak = Column(Integer, nullable=False, default=0, comment="Current consecutive losing trades")
     max_win_streak = Column(Integer, nullable=False, default=0, comment="Maximum win streak ever achieved")
     max_loss_streak = Column(Integer, nullable=False, default=0, comment="Maximum loss streak ever experienced")
+    stats_version = Column(Integer, nullable=False, default=0, server_default='0', comment="Optimistic lock for incremental stats updates")
     
     # Metadata
     meta_data = Column(JSONType, nullable=False, default={}, comment="Additional metadata JSON")
@@ -193,3 +194,29 @@ class BotPerformanceModel(Base, TimestampMixin):
     
     # Relationships
     bot = relationship("BotModel", back_populates="bot_performance")
+
+
+class BotDailyPnlModel(Base, TimestampMixin):
+    """Realized P&L rollup per bot per UTC day (maintained on trade insert)."""
+    
+    __tablename__ = "bot_daily_pnl"
+    __table_args__ = (
+        # NULLS NOT DISTINCT: trades without a bot roll up into one row per user/day
+        Index('uq_bot_daily_pnl_user_bot_day', 'user_id', 'bot_id', 'day', unique=True,
+              postgresql_nulls_not_distinct=True),
+        Index('idx_bot_daily_pnl_bot_day', 'bot_id', 'day'),
+        {'comment': 'Daily realized P&L rollup of trades'}
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True, comment="Auto-increment ID")
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    bot_id = Column(UUID(as_uuid=True), ForeignKey('bots.id', ondelete='CASCADE'), nullable=True, comment="NULL for trades not placed by a bot")
+    
+    day = Column(Date, nullable=False, comment="UTC day of trade execution")
+    pnl = Column(DECIMAL(20, 8), nullable=False, default=Decimal("0"), comment="Realized P&L")
+    trades = Column(Integer, nullable=False, default=0, comment="Number of trades")
+    wins = Column(Integer, nullable=False, default=0, comment="Trades with P&L > 0")
+    losses = Column(Integer, nullable=False, default=0, comment="Trades with P&L < 0")
+    breakeven = Column(Integer, nullable=False, default=0, comment="Trades with P&L = 0")
+    gross_profit = Column(DECIMAL(20, 8), nullable=False, default=Decimal("0"), comment="Sum of winning trades' P&L")
+    gross_loss = Column(DECIMAL(20, 8), nullable=False, default=Decimal("0"), comment="Sum of losing trades' |P&L|")
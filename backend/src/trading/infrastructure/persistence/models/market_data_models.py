@@ -74,14 +74,17 @@ class MarketPriceModel(Base):
     __table_args__ = (
         Index('idx_market_prices_symbol_interval_time', 'symbol', 'exchange_id', 'interval', 'timestamp', unique=True),
         CheckConstraint("interval IN ('1m', '5m', '15m', '1h', '4h', '1d', '1w')", name='ck_market_prices_interval'),
-        {'comment': 'OHLCV market data (partitioned by timestamp)'}
+        Index('idx_market_prices_timestamp_brin', 'timestamp', postgresql_using='brin'),
+        {'comment': 'OHLCV market data (monthly range partitions on timestamp)',
+         'postgresql_partition_by': 'RANGE (timestamp)'}
     )
     
+    # The partition key must be part of the primary key
     id = Column(BigInteger, primary_key=True, autoincrement=True, comment="Auto-increment ID")
     symbol = Column(String(20), nullable=False, comment="Trading symbol")
     exchange_id = Column(Integer, ForeignKey('exchanges.id', ondelete='RESTRICT'), nullable=False)
     interval = Column(String(10), nullable=False, comment="Candle interval")
-    timestamp = Column(TimestampMixin.created_at.type, nullable=False, comment="Candle open time (UTC)")
+    timestamp = Column(TimestampMixin.created_at.type, primary_key=True, comment="Candle open time (UTC)")
     
     # OHLCV data
     open = Column(DECIMAL(20, 8), nullable=False, comment="Open price")
@@ -108,13 +111,15 @@ class OrderBookSnapshotModel(Base):
     __tablename__ = "orderbook_snapshots"
     __table_args__ = (
         Index('idx_orderbook_symbol_time', 'symbol', 'exchange_id', 'timestamp'),
-        {'comment': 'Order book depth snapshots (partitioned by timestamp daily)'}
+        Index('idx_orderbook_timestamp_brin', 'timestamp', postgresql_using='brin'),
+        {'comment': 'Order book depth snapshots (monthly range partitions on timestamp)',
+         'postgresql_partition_by': 'RANGE (timestamp)'}
     )
     
     id = Column(BigInteger, primary_key=True, autoincrement=True, comment="Auto-increment ID")
     symbol = Column(String(20), nullable=False, comment="Trading symbol")
     exchange_id = Column(Integer, ForeignKey('exchanges.id', ondelete='RESTRICT'), nullable=False)
-    timestamp = Column(TimestampMixin.created_at.type, nullable=False, comment="Snapshot timestamp (UTC)")
+    timestamp = Column(TimestampMixin.created_at.type, primary_key=True, comment="Snapshot timestamp (UTC)")
     
     # Order book data (JSON arrays)
     bids = Column(JSONType, nullable=False, default=[], comment="Bid orders [[price, quantity], ...]")
@@ -130,3 +135,41 @@ class OrderBookSnapshotModel(Base):
     symbol_ref = relationship("SymbolModel", foreign_keys=[symbol, exchange_id],
                               primaryjoin="and_(OrderBookSnapshotModel.symbol==SymbolModel.symbol, OrderBookSnapshotModel.exchange_id==SymbolModel.exchange_id)",
                               viewonly=True)
+
+
+class MarketTradeModel(Base):
+    """Aggregated trades captured from the exchange stream (time-series, append only)."""
+    
+    __tablename__ = "market_trades"
+    __table_args__ = (
+        Index('idx_market_trades_ts_brin', 'ts', postgresql_using='brin'),
+        {'comment': 'Aggregated trades (aggTrade stream), written in COPY batches',
+         'postgresql_partition_by': 'RANGE (ts)'}
+    )
+    
+    # (symbol, ts) leads the key so range reads are index scans
+    symbol = Column(String(20), primary_key=True, comment="Trading symbol")
+    ts = Column(DateTime(timezone=True), primary_key=True, comment="Trade time (UTC)")
+    trade_id = Column(BigInteger, primary_key=True, comment="Aggregate trade ID")
+    price = Column(DECIMAL(20, 8), nullable=False, comment="Price")
+    quantity = Column(DECIMAL(20, 8), nullable=False, comment="Quantity in base asset")
+    is_buyer_maker = Column(Boolean, nullable=False, comment="True when the seller was the taker")
+
+
+class MarketQuoteModel(Base):
+    """Best bid/ask updates captured from the exchange stream (time-series, append only)."""
+    
+    __tablename__ = "market_quotes"
+    __table_args__ = (
+        Index('idx_market_quotes_ts_brin', 'ts', postgresql_using='brin'),
+        {'comment': 'Top of book (bookTicker stream), written in COPY batches',
+         'postgresql_partition_by': 'RANGE (ts)'}
+    )
+    
+    symbol = Column(String(20), primary_key=True, comment="Trading symbol")
+    ts = Column(DateTime(timezone=True), primary_key=True, comment="Receive time (UTC)")
+    update_id = Column(BigInteger, primary_key=True, comment="Order book update ID")
+    bid_price = Column(DECIMAL(20, 8), nullable=False, comment="Best bid price")
+    bid_quantity = Column(DECIMAL(20, 8), nullable=False, comment="Best bid quantity")
+    ask_price = Column(DECIMAL(20, 8), nullable=False, comment="Best ask price")
+    ask_quantity = Column(DECIMAL(20, 8), nullable=False, comment="Best ask quantity")
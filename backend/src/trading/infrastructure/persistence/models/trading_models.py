@@ -1,5 +1,5 @@
-"""SQLAlchemy models for trading tables: Orders, Positions, Trades."""
-from sqlalchemy import Column, String, Integer, ForeignKey, Index, CheckConstraint, Numeric, DECIMAL, JSON
+"""SQLAlchemy models for trading tables: Orders, Positions, Trades, Equity snapshots."""
+from sqlalchemy import Column, String, Integer, ForeignKey, Index, CheckConstraint, Numeric, DECIMAL, JSON, DateTime
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from decimal import Decimal
@@ -144,6 +144,7 @@ class TradeModel(Base, UUIDPrimaryKeyMixin):
     __table_args__ = (
         Index('idx_trades_position_executed', 'position_id', 'executed_at'),
         Index('idx_trades_order_id', 'order_id'),
+        Index('idx_trades_bot_executed', 'bot_id', 'executed_at'),
         Index('idx_trades_exchange_trade_id', 'exchange_trade_id', unique=True),
         CheckConstraint("side IN ('BUY', 'SELL')", name='ck_trades_side'),
         CheckConstraint("status IN ('SUCCESS', 'FAILED')", name='ck_trades_status'),
@@ -180,3 +181,28 @@ class TradeModel(Base, UUIDPrimaryKeyMixin):
     # Relationships
     position = relationship("PositionModel", back_populates="trades")
     order = relationship("OrderModel", back_populates="trades")
+
+
+class EquitySnapshotModel(Base):
+    """Account equity time series per user, stored in resolution tiers.
+    
+    ``1m`` rows are written by the snapshotter and downsampled to ``1h``
+    and ``1d`` (last value per bucket); each tier has its own retention.
+    """
+    
+    __tablename__ = "equity_snapshots"
+    __table_args__ = (
+        CheckConstraint("resolution IN ('1m', '1h', '1d')", name='ck_equity_snapshots_resolution'),
+        # Downsampling and retention scan one tier by time
+        Index('idx_equity_snapshots_resolution_ts', 'resolution', 'ts'),
+        {'comment': 'Account equity snapshots (1m -> 1h -> 1d tiers)'}
+    )
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+    resolution = Column(String(3), primary_key=True, comment="Tier: 1m, 1h or 1d")
+    ts = Column(DateTime(timezone=True), primary_key=True, comment="Bucket start (UTC)")
+    
+    equity = Column(DECIMAL(20, 8), nullable=False, comment="Balance + unrealized P&L")
+    balance = Column(DECIMAL(20, 8), nullable=False, comment="Allocated capital + realized P&L")
+    unrealized_pnl = Column(DECIMAL(20, 8), nullable=False, default=Decimal("0"), comment="Unrealized P&L of open positions")
+    margin_used = Column(DECIMAL(20, 8), nullable=False, default=Decimal("0"), comment="Margin held by open positions")
@@ -0,0 +1,152 @@
+"""Monthly range partitions of the time-series market data tables."""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+import logging
+import re
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class PartitionedTable:
+    """A table range partitioned by month on ``column``."""
+    name: str
+    column: str
+    retention_months: int = 0  # 0 = keep every partition
+
+
+PARTITIONED_TABLES: Dict[str, PartitionedTable] = {
+    table.name: table
+    for table in (
+        PartitionedTable("market_prices", "timestamp", settings.CANDLE_RETENTION_MONTHS),
+        PartitionedTable("orderbook_snapshots", "timestamp", settings.ORDERBOOK_RETENTION_MONTHS),
+        PartitionedTable("market_trades", "ts", settings.TICK_RETENTION_MONTHS),
+        PartitionedTable("market_quotes", "ts", settings.TICK_RETENTION_MONTHS),
+    )
+}
+
+# Months created ahead of the current one by maintenance
+MONTHS_AHEAD = 3
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant (UTC) of the month containing moment."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    moment = moment.astimezone(timezone.utc)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """month (a month start) moved by a number of months."""
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    return f"{table}_{month:%Y%m}"
+
+
+def partition_ddl(table: str, month: datetime) -> str:
+    """CREATE statement of the partition holding month."""
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(table, month)}" PARTITION OF "{table}" '
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+class PartitionManager:
+    """Creates and retires the monthly partitions of ``PARTITIONED_TABLES``.
+
+    Statements run on the caller's session, so partitions created for a
+    batch commit or roll back with it, and no second connection ends up
+    waiting for locks the caller holds. Retention detaches and drops whole
+    partitions instead of deleting rows.
+    """
+
+    def __init__(self, tables: Optional[Dict[str, PartitionedTable]] = None, months_ahead: int = MONTHS_AHEAD):
+        self.tables = tables or PARTITIONED_TABLES
+        self.months_ahead = months_ahead
+
+    async def ensure(self, session: AsyncSession, table: str, start: datetime, end: Optional[datetime] = None) -> List[str]:
+        """Create missing partitions covering start..end; returns those created."""
+        created = []
+        month, last = month_start(start), month_start(end or start)
+        while month <= last:
+            name = partition_name(table, month)
+            exists = await session.scalar(text("SELECT to_regclass(:name)"), {"name": name})
+            if exists is None:
+                # A savepoint keeps a concurrent creator's win from aborting the caller
+                try:
+                    async with session.begin_nested():
+                        await session.execute(text(partition_ddl(table, month)))
+                    created.append(name)
+                    logger.info(f"Created partition {name}")
+                except Exception:
+                    if await session.scalar(text("SELECT to_regclass(:name)"), {"name": name}) is None:
+                        raise
+            month = add_months(month, 1)
+        return created
+
+    async def partitions(self, session: AsyncSession, table: str) -> List[Tuple[str, datetime]]:
+        """Monthly partitions of a table with their month, oldest first."""
+        result = await session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": table},
+        )
+        pattern = re.compile(rf"^{re.escape(table)}_(\d{{4}})(\d{{2}})$")
+        found = []
+        for (name,) in result.all():
+            match = pattern.match(name)
+            if match:
+                found.append((name, datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=timezone.utc)))
+        return sorted(found, key=lambda item: item[1])
+
+    async def drop_before(self, session: AsyncSession, table: str, cutoff: datetime) -> Tuple[List[str], int]:
+        """Detach and drop partitions entirely older than cutoff.
+
+        Returns the dropped partitions and their estimated row count.
+        """
+        boundary = month_start(cutoff)
+        dropped, rows = [], 0
+        for name, month in await self.partitions(session, table):
+            if add_months(month, 1) > boundary:
+                break
+            estimate = await session.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE relname = :name"), {"name": name}
+            )
+            await session.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"'))
+            await session.execute(text(f'DROP TABLE "{name}"'))
+            dropped.append(name)
+            rows += max(estimate or 0, 0)
+        if dropped:
+            logger.info(f"Dropped {len(dropped)} partitions of {table}: {', '.join(dropped)}")
+        return dropped, rows
+
+    async def maintain(self, session: AsyncSession, now: Optional[datetime] = None) -> Dict[str, Dict[str, List[str]]]:
+        """Create upcoming partitions and apply retention for every table."""
+        current = month_start(now or datetime.now(timezone.utc))
+        summary = {}
+        for table in self.tables.values():
+            created = await self.ensure(session, table.name, current, add_months(current, self.months_ahead))
+            dropped: List[str] = []
+            if table.retention_months > 0:
+                dropped, _ = await self.drop_before(session, table.name, add_months(current, -table.retention_months))
+            summary[table.name] = {"created": created, "dropped": dropped}
+        return summary
+
+
+# Global partition manager
+partition_manager = PartitionManager()
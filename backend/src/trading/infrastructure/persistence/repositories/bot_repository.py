@@ -1,8 +1,10 @@
 """Bot and Strategy repository SQLAlchemy implementation."""
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, inspect
 from sqlalchemy.orm import selectinload
+from types import SimpleNamespace
+import copy
 import logging
 import uuid
 from decimal import Decimal
@@ -21,6 +23,8 @@ from ....domain.bot import (
 )
 from ....domain.bot.repository import IBotRepository, IStrategyRepository
 from ..models.bot_models import BotModel, StrategyModel
+from ...cache.cached_repository import CachedRepository, CacheInvalidationMixin
+from ...config.settings import get_settings
 
 
 class BotRepository(IBotRepository):
@@ -379,6 +383,9 @@ class StrategyRepository(IStrategyRepository):
     
     async def find_by_user(self, user_id: uuid.UUID) -> List[Strategy]:
         """Find all strategies for a user."""
+        return [self._model_to_domain(model) for model in await self._find_user_models(user_id)]
+
+    async def _find_user_models(self, user_id: uuid.UUID) -> List[StrategyModel]:
         stmt = select(StrategyModel).where(
             and_(
                 or_(
@@ -391,9 +398,7 @@ class StrategyRepository(IStrategyRepository):
         ).order_by(StrategyModel.created_at.desc())
         
         result = await self._session.execute(stmt)
-        models = result.scalars().all()
-        
-        return [self._model_to_domain(model) for model in models]
+        return list(result.scalars().all())
     
     async def find_by_type(self, strategy_type: StrategyType) -> List[Strategy]:
         """Find strategies by type."""
@@ -447,4 +452,83 @@ class StrategyRepository(IStrategyRepository):
             await self._session.commit()
 
 
-__all__ = ["BotRepository", "StrategyRepository"]
+_STRATEGY_COLUMNS = tuple(attr.key for attr in inspect(StrategyModel).column_attrs)
+
+
+class CachedStrategyRepository(CacheInvalidationMixin, StrategyRepository):
+    """StrategyRepository whose reads by id and by user go through the L1/Redis cache.
+
+    Rows are cached as plain column dicts and a fresh Strategy is built on
+    every read, so callers may mutate what they get back. ``save`` and
+    ``delete`` invalidate the whole ``strategy`` prefix in every process.
+    """
+
+    cache_prefix = "strategy"
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+        settings = get_settings()
+        self._cache = CachedRepository(
+            repository=self,
+            default_ttl=settings.REDIS_CACHE_TTL,
+            cache_prefix=self.cache_prefix,
+            local_cache_size=settings.REPOSITORY_L1_CACHE_SIZE,
+            local_cache_ttl=settings.REPOSITORY_L1_CACHE_TTL,
+        )
+
+    @staticmethod
+    def _to_row(model: StrategyModel) -> Dict[str, Any]:
+        return {key: getattr(model, key) for key in _STRATEGY_COLUMNS}
+
+    def _row_to_domain(self, row: Dict[str, Any]) -> Strategy:
+        """Build a Strategy from a cached row (UUIDs and datetimes may come back as strings)."""
+        row = copy.deepcopy(row)  # L1 returns the same dict on every hit
+        for key in ("id", "user_id"):
+            if isinstance(row[key], str):
+                row[key] = uuid.UUID(row[key])
+        for key in ("created_at", "updated_at"):
+            if isinstance(row[key], str):
+                row[key] = datetime.fromisoformat(row[key])
+        return self._model_to_domain(SimpleNamespace(**row))
+
+    async def _load_row(self, strategy_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+        stmt = select(StrategyModel).where(
+            and_(StrategyModel.id == strategy_id, StrategyModel.deleted_at.is_(None))
+        )
+        model = (await self._session.execute(stmt)).scalar_one_or_none()
+        return self._to_row(model) if model else None
+
+    async def _load_user_rows(self, user_id: uuid.UUID) -> List[Dict[str, Any]]:
+        return [self._to_row(model) for model in await self._find_user_models(user_id)]
+
+    async def find_by_id(self, strategy_id: uuid.UUID) -> Optional[Strategy]:
+        """Find strategy by ID (cached)."""
+        row = await self._cache.cached_call(
+            "_load_row", cache_key_override=f"{self.cache_prefix}:id:{strategy_id}", strategy_id=strategy_id
+        )
+        if not row:
+            return None
+        try:
+            return self._row_to_domain(row)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Failed to convert strategy row to domain: {e}", exc_info=True)
+            return None
+
+    async def find_by_user(self, user_id: uuid.UUID) -> List[Strategy]:
+        """Find all strategies for a user, system strategies included (cached)."""
+        rows = await self._cache.cached_call(
+            "_load_user_rows", cache_key_override=f"{self.cache_prefix}:user:{user_id}", user_id=user_id
+        )
+        return [self._row_to_domain(row) for row in rows]
+
+    async def save(self, strategy: Strategy) -> Strategy:
+        result = await super().save(strategy)
+        await self._invalidate_cache_after_write(result.id)
+        return result
+
+    async def delete(self, strategy_id: uuid.UUID) -> None:
+        await super().delete(strategy_id)
+        await self._invalidate_cache_after_write(strategy_id)
+
+
+__all__ = ["BotRepository", "StrategyRepository", "CachedStrategyRepository"]
@@ -0,0 +1,187 @@
+"""Daily P&L rollup repository (bot_daily_pnl)."""
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+import logging
+
+from sqlalchemy import select, func, case, and_, delete, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.bot_models import BotDailyPnlModel
+from ..models.trading_models import TradeModel
+
+logger = logging.getLogger(__name__)
+
+_ROLLUP_KEY = ['user_id', 'bot_id', 'day']
+
+
+def utc_day(moment: datetime) -> date:
+    """UTC calendar day of a timestamp (naive timestamps are taken as UTC)."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.date()
+
+
+class DailyPnlRepository:
+    """Per bot, per UTC day sums of trade P&L.
+
+    ``record_trade`` adds one trade to its day with an upsert and is meant
+    to run in the same transaction as the trade insert. ``rebuild``
+    recomputes days from the trades table (backfill / drift repair).
+    Readers sum a handful of rows instead of scanning trades.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def record_trade(
+        self,
+        user_id: UUID,
+        bot_id: Optional[UUID],
+        executed_at: datetime,
+        pnl: Optional[Decimal],
+    ) -> None:
+        """Add one trade to its (user, bot, day) row."""
+        is_win = 1 if pnl is not None and pnl > 0 else 0
+        is_loss = 1 if pnl is not None and pnl < 0 else 0
+        is_breakeven = 1 if pnl is not None and pnl == 0 else 0
+
+        stmt = pg_insert(BotDailyPnlModel).values(
+            user_id=user_id,
+            bot_id=bot_id,
+            day=utc_day(executed_at),
+            pnl=pnl or Decimal("0"),
+            trades=1,
+            wins=is_win,
+            losses=is_loss,
+            breakeven=is_breakeven,
+            gross_profit=pnl if is_win else Decimal("0"),
+            gross_loss=-pnl if is_loss else Decimal("0"),
+        )
+        table = BotDailyPnlModel.__table__
+        stmt = stmt.on_conflict_do_update(
+            index_elements=_ROLLUP_KEY,
+            set_={
+                "pnl": table.c.pnl + stmt.excluded.pnl,
+                "trades": table.c.trades + 1,
+                "wins": table.c.wins + stmt.excluded.wins,
+                "losses": table.c.losses + stmt.excluded.losses,
+                "breakeven": table.c.breakeven + stmt.excluded.breakeven,
+                "gross_profit": table.c.gross_profit + stmt.excluded.gross_profit,
+                "gross_loss": table.c.gross_loss + stmt.excluded.gross_loss,
+                "updated_at": func.now(),
+            },
+        )
+        await self._session.execute(stmt)
+
+    async def rebuild(self, since: date, bot_id: Optional[UUID] = None) -> int:
+        """Recompute rows for days >= ``since`` from the trades table.
+
+        Returns the number of (user, bot, day) rows written.
+        """
+        day = func.date(func.timezone('UTC', TradeModel.executed_at))
+        filters = [TradeModel.executed_at >= datetime.combine(since, datetime.min.time(), timezone.utc)]
+        stale = [BotDailyPnlModel.day >= since]
+        if bot_id is not None:
+            filters.append(TradeModel.bot_id == bot_id)
+            stale.append(BotDailyPnlModel.bot_id == bot_id)
+
+        # Days whose trades are all gone must not keep their old totals
+        await self._session.execute(delete(BotDailyPnlModel).where(and_(*stale)))
+
+        totals = select(
+            TradeModel.user_id,
+            TradeModel.bot_id,
+            day.label("day"),
+            func.coalesce(func.sum(TradeModel.pnl), 0).label("pnl"),
+            func.count(TradeModel.id).label("trades"),
+            func.coalesce(func.sum(case((TradeModel.pnl > 0, 1), else_=0)), 0).label("wins"),
+            func.coalesce(func.sum(case((TradeModel.pnl < 0, 1), else_=0)), 0).label("losses"),
+            func.coalesce(func.sum(case((TradeModel.pnl == 0, 1), else_=0)), 0).label("breakeven"),
+            func.coalesce(func.sum(case((TradeModel.pnl > 0, TradeModel.pnl), else_=0)), 0).label("gross_profit"),
+            func.coalesce(func.sum(case((TradeModel.pnl < 0, -TradeModel.pnl), else_=0)), 0).label("gross_loss"),
+        ).where(and_(*filters)).group_by(TradeModel.user_id, TradeModel.bot_id, day)
+
+        stmt = pg_insert(BotDailyPnlModel).from_select(
+            ['user_id', 'bot_id', 'day', 'pnl', 'trades', 'wins', 'losses', 'breakeven',
+             'gross_profit', 'gross_loss'],
+            totals,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=_ROLLUP_KEY,
+            set_={
+                column: getattr(stmt.excluded, column)
+                for column in ('pnl', 'trades', 'wins', 'losses', 'breakeven', 'gross_profit', 'gross_loss')
+            },
+        ).returning(literal_column("1"))
+        result = await self._session.execute(stmt)
+        rows = len(result.all())
+
+        logger.info(f"Rebuilt {rows} daily P&L rows since {since}" + (f" for bot {bot_id}" if bot_id else ""))
+        return rows
+
+    async def get_days(
+        self,
+        start: date,
+        end: date,
+        bot_id: Optional[UUID] = None,
+        user_id: Optional[UUID] = None,
+    ) -> List[Dict[str, Any]]:
+        """Rows for ``start`` <= day <= ``end``, summed over bots when by user."""
+        filters = [BotDailyPnlModel.day >= start, BotDailyPnlModel.day <= end]
+        if bot_id is not None:
+            filters.append(BotDailyPnlModel.bot_id == bot_id)
+        if user_id is not None:
+            filters.append(BotDailyPnlModel.user_id == user_id)
+
+        stmt = select(
+            BotDailyPnlModel.day,
+            func.sum(BotDailyPnlModel.pnl).label("pnl"),
+            func.sum(BotDailyPnlModel.trades).label("trades"),
+            func.sum(BotDailyPnlModel.wins).label("wins"),
+            func.sum(BotDailyPnlModel.losses).label("losses"),
+            func.sum(BotDailyPnlModel.breakeven).label("breakeven"),
+        ).where(and_(*filters)).group_by(BotDailyPnlModel.day).order_by(BotDailyPnlModel.day)
+
+        result = await self._session.execute(stmt)
+        return [
+            {
+                "day": row.day,
+                "pnl": row.pnl or Decimal("0"),
+                "trades": int(row.trades or 0),
+                "wins": int(row.wins or 0),
+                "losses": int(row.losses or 0),
+                "breakeven": int(row.breakeven or 0),
+            }
+            for row in result.all()
+        ]
+
+    async def get_months(self, user_id: UUID, start: date) -> List[Dict[str, Any]]:
+        """Per-month totals for a user from ``start`` on."""
+        month = func.date_trunc('month', BotDailyPnlModel.day)
+        stmt = select(
+            month.label("month"),
+            func.sum(BotDailyPnlModel.pnl).label("pnl"),
+            func.sum(BotDailyPnlModel.trades).label("trades"),
+            func.sum(BotDailyPnlModel.wins).label("wins"),
+            func.sum(BotDailyPnlModel.losses).label("losses"),
+        ).where(
+            and_(
+                BotDailyPnlModel.user_id == user_id,
+                BotDailyPnlModel.day >= start,
+            )
+        ).group_by(month).order_by(month)
+
+        result = await self._session.execute(stmt)
+        return [
+            {
+                "month": row.month,
+                "pnl": row.pnl or Decimal("0"),
+                "trades": int(row.trades or 0),
+                "wins": int(row.wins or 0),
+                "losses": int(row.losses or 0),
+            }
+            for row in result.all()
+        ]
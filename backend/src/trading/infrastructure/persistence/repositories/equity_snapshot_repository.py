@@ -0,0 +1,246 @@
+"""Equity snapshot repository (equity_snapshots tiers)."""
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+import logging
+
+from sqlalchemy import select, func, and_, or_, delete, exists, literal, literal_column, values
+from sqlalchemy import column as sql_column
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.trading_models import EquitySnapshotModel
+
+logger = logging.getLogger(__name__)
+
+# Bucket width of each tier
+RESOLUTIONS: Dict[str, timedelta] = {
+    "1m": timedelta(minutes=1),
+    "1h": timedelta(hours=1),
+    "1d": timedelta(days=1),
+}
+
+# How long each tier is kept (None = forever)
+RETENTION: Dict[str, Optional[timedelta]] = {
+    "1m": timedelta(days=2),
+    "1h": timedelta(days=90),
+    "1d": None,
+}
+
+# Tier each coarser tier is built from, and its date_trunc unit
+_DOWNSAMPLE_SOURCE = {"1h": ("1m", "hour"), "1d": ("1h", "day")}
+
+# Finest first
+_TIERS = ("1m", "1h", "1d")
+
+_VALUE_COLUMNS = ("equity", "balance", "unrealized_pnl", "margin_used")
+
+# Rows per multi-row INSERT: 7 bind parameters each stays under asyncpg's 32767 limit
+INSERT_BATCH_ROWS = 4000
+
+
+def bucket_start(moment: datetime, resolution: str) -> datetime:
+    """Start (UTC) of the tier bucket containing moment."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    moment = moment.astimezone(timezone.utc)
+    if resolution == "1d":
+        return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    if resolution == "1h":
+        return moment.replace(minute=0, second=0, microsecond=0)
+    return moment.replace(second=0, microsecond=0)
+
+
+def resolution_for_range(span: timedelta) -> str:
+    """Coarsest tier that still gives a useful number of points for span."""
+    if span <= timedelta(days=1):
+        return "1m"
+    if span <= timedelta(days=31):
+        return "1h"
+    return "1d"
+
+
+class EquitySnapshotRepository:
+    """Tiered account equity time series.
+
+    The snapshotter ``record``s ``1m`` rows; ``downsample`` folds recent
+    buckets into the next tier (last value per bucket, so re-running it
+    over a partial bucket just overwrites that bucket) and
+    ``purge_expired`` enforces each tier's retention. Rows backfilled
+    from trade history are only ``insert_missing``, never overwriting.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def record(self, snapshots: List[Dict[str, Any]], taken_at: datetime) -> int:
+        """Upsert one ``1m`` row per user; returns the number of rows."""
+        if not snapshots:
+            return 0
+
+        ts = bucket_start(taken_at, "1m")
+        for start in range(0, len(snapshots), INSERT_BATCH_ROWS):
+            stmt = pg_insert(EquitySnapshotModel).values([
+                {
+                    "user_id": snapshot["user_id"],
+                    "resolution": "1m",
+                    "ts": ts,
+                    **{column: snapshot[column] for column in _VALUE_COLUMNS},
+                }
+                for snapshot in snapshots[start:start + INSERT_BATCH_ROWS]
+            ])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['user_id', 'resolution', 'ts'],
+                set_={column: getattr(stmt.excluded, column) for column in _VALUE_COLUMNS},
+            )
+            await self._session.execute(stmt)
+        return len(snapshots)
+
+    async def insert_missing(self, snapshots: List[Dict[str, Any]], resolution: str) -> int:
+        """Insert rows (each with its own ``ts``) where the bucket is still empty."""
+        if not snapshots:
+            return 0
+
+        inserted = 0
+        for start in range(0, len(snapshots), INSERT_BATCH_ROWS):
+            stmt = pg_insert(EquitySnapshotModel).values([
+                {
+                    "user_id": snapshot["user_id"],
+                    "resolution": resolution,
+                    "ts": bucket_start(snapshot["ts"], resolution),
+                    **{column: snapshot[column] for column in _VALUE_COLUMNS},
+                }
+                for snapshot in snapshots[start:start + INSERT_BATCH_ROWS]
+            ])
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=['user_id', 'resolution', 'ts'],
+            ).returning(literal_column("1"))
+            result = await self._session.execute(stmt)
+            inserted += len(result.all())
+        return inserted
+
+    async def last_bucket(self, resolution: str) -> Optional[datetime]:
+        """Latest bucket written to a tier (any user), None when it is empty."""
+        return await self._session.scalar(
+            select(func.max(EquitySnapshotModel.ts)).where(EquitySnapshotModel.resolution == resolution)
+        )
+
+    async def first_timestamp(self, user_id: UUID) -> Optional[datetime]:
+        """Oldest point of a user in any tier."""
+        return await self._session.scalar(
+            select(func.min(EquitySnapshotModel.ts)).where(EquitySnapshotModel.user_id == user_id)
+        )
+
+    async def without_points(self, user_ids: List[UUID]) -> List[UUID]:
+        """Users among user_ids that have no point in any tier yet."""
+        missing: List[UUID] = []
+        for start in range(0, len(user_ids), INSERT_BATCH_ROWS):
+            ids = values(sql_column("user_id", PG_UUID(as_uuid=True)), name="ids").data(
+                [(user_id,) for user_id in user_ids[start:start + INSERT_BATCH_ROWS]]
+            )
+            # Primary key probe per user: (user_id, resolution, ts) leads with user_id
+            stmt = select(ids.c.user_id).where(
+                ~exists().where(EquitySnapshotModel.user_id == ids.c.user_id)
+            )
+            result = await self._session.execute(stmt)
+            missing.extend(row.user_id for row in result.all())
+        return missing
+
+    async def downsample(self, resolution: str, since: Optional[datetime] = None) -> int:
+        """Rebuild ``resolution`` buckets starting at or after ``since`` (all when None).
+
+        Returns the number of buckets written.
+        """
+        source, unit = _DOWNSAMPLE_SOURCE[resolution]
+        source_ts = EquitySnapshotModel.ts
+        bucket = func.timezone('UTC', func.date_trunc(unit, func.timezone('UTC', source_ts)))
+        filters = [EquitySnapshotModel.resolution == source]
+        if since is not None:
+            filters.append(source_ts >= bucket_start(since, resolution))
+
+        # Last snapshot of each (user, bucket)
+        last_in_bucket = (
+            select(
+                EquitySnapshotModel.user_id,
+                literal(resolution).label("resolution"),
+                bucket.label("ts"),
+                *[getattr(EquitySnapshotModel, column) for column in _VALUE_COLUMNS],
+            )
+            .where(and_(*filters))
+            .distinct(EquitySnapshotModel.user_id, bucket)
+            .order_by(EquitySnapshotModel.user_id, bucket, source_ts.desc())
+        )
+
+        stmt = pg_insert(EquitySnapshotModel).from_select(
+            ['user_id', 'resolution', 'ts', *_VALUE_COLUMNS],
+            last_in_bucket,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['user_id', 'resolution', 'ts'],
+            set_={column: getattr(stmt.excluded, column) for column in _VALUE_COLUMNS},
+        ).returning(literal_column("1"))
+        result = await self._session.execute(stmt)
+        return len(result.all())
+
+    async def purge_expired(self, now: Optional[datetime] = None) -> int:
+        """Delete rows older than their tier's retention."""
+        now = now or datetime.now(timezone.utc)
+        expired = [
+            and_(EquitySnapshotModel.resolution == resolution, EquitySnapshotModel.ts < now - keep)
+            for resolution, keep in RETENTION.items()
+            if keep is not None
+        ]
+        result = await self._session.execute(delete(EquitySnapshotModel).where(or_(*expired)))
+        return result.rowcount or 0
+
+    async def get_series(
+        self,
+        user_id: UUID,
+        resolution: str,
+        start: datetime,
+        end: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Points of one tier for a user, oldest first."""
+        filters = [
+            EquitySnapshotModel.user_id == user_id,
+            EquitySnapshotModel.resolution == resolution,
+            EquitySnapshotModel.ts >= start,
+        ]
+        if end is not None:
+            filters.append(EquitySnapshotModel.ts <= end)
+
+        stmt = (
+            select(EquitySnapshotModel.ts, *[getattr(EquitySnapshotModel, column) for column in _VALUE_COLUMNS])
+            .where(and_(*filters))
+            .order_by(EquitySnapshotModel.ts)
+        )
+        result = await self._session.execute(stmt)
+        return [
+            {"ts": row.ts, **{column: getattr(row, column) for column in _VALUE_COLUMNS}}
+            for row in result.all()
+        ]
+
+    async def get_stitched_series(
+        self,
+        user_id: UUID,
+        finest: str,
+        start: datetime,
+        end: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Points from ``finest`` back to ``start``, oldest first.
+
+        Each tier only reaches back as far as its retention, so the stretch
+        before the first point of a tier is filled from the next coarser
+        one: a year read from ``1m`` is 1m for 2 days, hourly to 90 days
+        and daily beyond.
+        """
+        points: List[Dict[str, Any]] = []
+        for resolution in _TIERS[_TIERS.index(finest):]:
+            series = await self.get_series(user_id, resolution, start, points[0]["ts"] if points else end)
+            if points:
+                # A coarse bucket holds its last value, so drop the one overlapping the finer data
+                cutoff = bucket_start(points[0]["ts"], resolution)
+                series = [point for point in series if point["ts"] < cutoff]
+            points = series + points
+        return points
@@ -1,15 +1,15 @@
 """SQLAlchemy implementations of market data repositories."""
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
-from typing import List, Optional, Dict, Any
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, or_, desc
-from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import select, and_, func, or_, desc, delete
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert as pg_insert
 
 from ....domain.market_data import (
-    MarketDataSubscription, Candle, Tick, Trade, OrderBook, MarketStats
+    MarketDataSubscription, Candle, Tick, Trade, TradeType, OrderBook, MarketStats
 )
 from ....domain.market_data.repository import (
     IMarketDataSubscriptionRepository,
@@ -27,9 +27,12 @@ from ..models.market_data_models import (
     MarketDataSubscriptionModel,
     MarketPriceModel,
     OrderBookSnapshotModel,
-    MarketMetadataModel
+    MarketMetadataModel,
+    MarketTradeModel,
+    MarketQuoteModel
 )
 from ..models.base import TimestampMixin
+from ..partitions import partition_manager
 from ..database import AsyncSession as DatabaseSession
 
 
@@ -208,6 +211,13 @@ class MarketDataSubscriptionRepository(IMarketDataSubscriptionRepository):
         )
 
 
+async def _delete_before(session: AsyncSession, model, column, older_than: datetime) -> int:
+    """Drop partitions entirely before older_than, then delete the rest of the boundary month."""
+    _, dropped = await partition_manager.drop_before(session, model.__tablename__, older_than)
+    result = await session.execute(delete(model).where(column < older_than))
+    return dropped + (result.rowcount or 0)
+
+
 class CandleRepository(ICandleRepository):
     """SQLAlchemy implementation of candle repository."""
 
@@ -230,6 +240,7 @@ class CandleRepository(ICandleRepository):
 
             if model is None:
                 # Create new candle
+                await partition_manager.ensure(self._session, MarketPriceModel.__tablename__, candle.open_time)
                 model = self._domain_to_model(candle)
                 self._session.add(model)
             else:
@@ -291,19 +302,12 @@ class CandleRepository(ICandleRepository):
         return self._model_to_domain(model) if model else None
 
     async def delete_old(self, older_than: datetime) -> int:
-        """Delete candles older than specified date."""
-        stmt = select(MarketPriceModel).where(
-            MarketPriceModel.timestamp < older_than
-        )
-        result = await self._session.execute(stmt)
-        models = result.scalars().all()
+        """Delete candles older than specified date.
         
-        count = len(models)
-        for model in models:
-            await self._session.delete(model)
-        
-        await self._session.flush()
-        return count
+        Whole months are dropped as partitions; the returned count is
+        estimated for those.
+        """
+        return await _delete_before(self._session, MarketPriceModel, MarketPriceModel.timestamp, older_than)
 
     async def save_batch(self, candles: List[Candle]) -> None:
         """Save multiple candles using efficient bulk upsert."""
@@ -330,6 +334,11 @@ class CandleRepository(ICandleRepository):
                     "taker_buy_quote_volume": candle.taker_buy_quote_volume if candle.taker_buy_quote_volume else None
                 })
             
+            open_times = [candle.open_time for candle in candles]
+            await partition_manager.ensure(
+                self._session, MarketPriceModel.__tablename__, min(open_times), max(open_times)
+            )
+            
             # Prepare upsert statement
             stmt = pg_insert(MarketPriceModel).values(values)
             
@@ -466,6 +475,9 @@ class OrderBookRepository(IOrderBookRepository):
     async def save(self, order_book: OrderBook) -> OrderBook:
         """Save an order book snapshot."""
         try:
+            await partition_manager.ensure(
+                self._session, OrderBookSnapshotModel.__tablename__, order_book.timestamp
+            )
             model = self._domain_to_model(order_book)
             self._session.add(model)
             await self._session.flush()
@@ -512,19 +524,10 @@ class OrderBookRepository(IOrderBookRepository):
         return [self._model_to_domain(model) for model in models]
 
     async def delete_old(self, older_than: datetime) -> int:
-        """Delete order book snapshots older than specified date."""
-        stmt = select(OrderBookSnapshotModel).where(
-            OrderBookSnapshotModel.timestamp < older_than
+        """Delete order book snapshots older than specified date (see ``CandleRepository.delete_old``)."""
+        return await _delete_before(
+            self._session, OrderBookSnapshotModel, OrderBookSnapshotModel.timestamp, older_than
         )
-        result = await self._session.execute(stmt)
-        models = result.scalars().all()
-        
-        count = len(models)
-        for model in models:
-            await self._session.delete(model)
-        
-        await self._session.flush()
-        return count
 
     def _domain_to_model(self, order_book: OrderBook) -> OrderBookSnapshotModel:
         """Convert domain entity to database model."""
@@ -567,43 +570,294 @@ class OrderBookRepository(IOrderBookRepository):
         )
 
 
-# Placeholder implementations for missing interfaces
+# Column order of COPY rows into market_trades / market_quotes
+TRADE_COLUMNS = ("symbol", "ts", "trade_id", "price", "quantity", "is_buyer_maker")
+QUOTE_COLUMNS = ("symbol", "ts", "update_id", "bid_price", "bid_quantity", "ask_price", "ask_quantity")
+
+
+async def copy_rows(session: AsyncSession, table: str, columns: Sequence[str], rows: Sequence[tuple]) -> int:
+    """Bulk load rows with PostgreSQL binary COPY in the session's transaction."""
+    if not rows:
+        return 0
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(table, records=rows, columns=list(columns))
+    return len(rows)
+
+
+def _require_trade_ids(items: Sequence[Any], kind: str) -> None:
+    """Reject a batch with rows lacking the exchange trade id.
+
+    The id is part of the market_trades primary key, so such rows are
+    rejected rather than all written under the same id.
+    """
+    missing = sum(1 for item in items if item.trade_id in (None, ""))
+    if missing:
+        raise ValueError(f"{missing} of {len(items)} {kind} have no trade_id")
+
+
+async def _copy_trades(session: AsyncSession, rows: List[tuple]) -> int:
+    """COPY rows into market_trades, creating the monthly partitions they fall in."""
+    if not rows:
+        return 0
+    timestamps = [row[1] for row in rows]
+    await partition_manager.ensure(session, MarketTradeModel.__tablename__, min(timestamps), max(timestamps))
+    return await copy_rows(session, MarketTradeModel.__tablename__, TRADE_COLUMNS, rows)
+
+
+def _trade_range(symbol: str, start_time: Optional[datetime], end_time: Optional[datetime]):
+    conditions = [MarketTradeModel.symbol == symbol]
+    if start_time:
+        conditions.append(MarketTradeModel.ts >= start_time)
+    if end_time:
+        conditions.append(MarketTradeModel.ts <= end_time)
+    return and_(*conditions)
+
+
+_TRADE_FIELDS = (
+    MarketTradeModel.symbol,
+    MarketTradeModel.ts,
+    MarketTradeModel.trade_id,
+    MarketTradeModel.price,
+    MarketTradeModel.quantity,
+    MarketTradeModel.is_buyer_maker,
+)
+
+
 class TickRepository(ITickRepository):
-    """Placeholder tick repository implementation."""
+    """Tick repository over captured aggregated trades (``market_trades``).
+    
+    Writes go through COPY; reads select plain columns (no ORM identity
+    map), and ``stream`` walks long ranges with a server-side cursor.
+    """
     
     def __init__(self, session: AsyncSession):
         self._session = session
     
-    async def save(self, tick: Tick) -> Tick:
+    async def save(self, tick: Tick) -> None:
         """Save tick data."""
-        raise NotImplementedError("Tick repository not implemented yet")
+        await self.save_batch([tick])
     
-    async def find_by_symbol(self, symbol: str, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None, limit: int = 1000) -> List[Tick]:
-        """Find ticks by symbol."""
-        raise NotImplementedError("Tick repository not implemented yet")
+    async def save_batch(self, ticks: List[Tick]) -> None:
+        """Save multiple ticks (ValueError if any has no trade_id)."""
+        _require_trade_ids(ticks, "ticks")
+        await _copy_trades(self._session, [
+            (tick.symbol, tick.timestamp, int(tick.trade_id), tick.price, tick.size, bool(tick.is_buyer_maker))
+            for tick in ticks
+        ])
+    
+    async def find_by_symbol(
+        self,
+        symbol: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = 1000
+    ) -> List[Tick]:
+        """Find ticks by symbol within time range, oldest first."""
+        stmt = select(*_TRADE_FIELDS).where(_trade_range(symbol, start_time, end_time)).order_by(MarketTradeModel.ts)
+        if limit:
+            stmt = stmt.limit(limit)
+        result = await self._session.execute(stmt)
+        return [self._row_to_domain(row) for row in result.all()]
+    
+    async def find_latest(self, symbol: str) -> Optional[Tick]:
+        """Find latest tick for symbol."""
+        stmt = select(*_TRADE_FIELDS).where(
+            MarketTradeModel.symbol == symbol
+        ).order_by(MarketTradeModel.ts.desc()).limit(1)
+        row = (await self._session.execute(stmt)).first()
+        return self._row_to_domain(row) if row else None
+    
+    async def stream(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        batch_size: int = 10000
+    ) -> AsyncIterator[List[Tick]]:
+        """Ticks of a range in batches of up to batch_size, oldest first."""
+        stmt = select(*_TRADE_FIELDS).where(
+            _trade_range(symbol, start_time, end_time)
+        ).order_by(MarketTradeModel.ts).execution_options(yield_per=batch_size)
+        result = await self._session.stream(stmt)
+        async for rows in result.partitions():
+            yield [self._row_to_domain(row) for row in rows]
+
+    async def stream_prices(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        batch_size: int = 100000
+    ) -> AsyncIterator[List[Tuple[datetime, Decimal]]]:
+        """Just (ts, price) of a range in batches, oldest first (no Tick objects)."""
+        stmt = select(MarketTradeModel.ts, MarketTradeModel.price).where(
+            _trade_range(symbol, start_time, end_time)
+        ).order_by(MarketTradeModel.ts, MarketTradeModel.trade_id).execution_options(yield_per=batch_size)
+        result = await self._session.stream(stmt)
+        async for rows in result.partitions():
+            yield [tuple(row) for row in rows]
+
+    async def stream_quotes(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        batch_size: int = 10000
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Captured best bid/ask updates of a range in batches, oldest first."""
+        stmt = select(
+            MarketQuoteModel.ts,
+            MarketQuoteModel.update_id,
+            MarketQuoteModel.bid_price,
+            MarketQuoteModel.bid_quantity,
+            MarketQuoteModel.ask_price,
+            MarketQuoteModel.ask_quantity,
+        ).where(
+            and_(
+                MarketQuoteModel.symbol == symbol,
+                MarketQuoteModel.ts >= start_time,
+                MarketQuoteModel.ts <= end_time
+            )
+        ).order_by(MarketQuoteModel.ts).execution_options(yield_per=batch_size)
+        result = await self._session.stream(stmt)
+        async for rows in result.partitions():
+            yield [dict(row._mapping) for row in rows]
+
+    async def get_price_history(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Dict[str, Any]]:
+        """Per-second OHLC and volume of the captured trades."""
+        second = func.date_trunc("second", MarketTradeModel.ts).label("second")
+        stmt = select(
+            second,
+            func.min(MarketTradeModel.price),
+            func.max(MarketTradeModel.price),
+            func.sum(MarketTradeModel.quantity),
+            func.count(),
+            func.array_agg(aggregate_order_by(MarketTradeModel.price, MarketTradeModel.ts))[1],
+            func.array_agg(aggregate_order_by(MarketTradeModel.price, MarketTradeModel.ts.desc()))[1],
+        ).where(_trade_range(symbol, start_time, end_time)).group_by(second).order_by(second)
+        result = await self._session.execute(stmt)
+        return [
+            {
+                "timestamp": timestamp,
+                "open": first,
+                "high": high,
+                "low": low,
+                "close": last,
+                "volume": volume,
+                "trades": trades,
+            }
+            for timestamp, low, high, volume, trades, first, last in result.all()
+        ]
     
     async def delete_old(self, older_than: datetime) -> int:
-        """Delete old ticks."""
-        raise NotImplementedError("Tick repository not implemented yet")
+        """Delete ticks older than specified date (see ``CandleRepository.delete_old``)."""
+        return await _delete_before(self._session, MarketTradeModel, MarketTradeModel.ts, older_than)
+    
+    def _row_to_domain(self, row) -> Tick:
+        """Convert a market_trades row to a tick."""
+        return Tick(
+            symbol=row.symbol,
+            price=row.price,
+            size=row.quantity,
+            timestamp=row.ts,
+            trade_id=str(row.trade_id),
+            is_buyer_maker=row.is_buyer_maker
+        )
 
 
 class TradeRepository(ITradeRepository):
-    """Placeholder trade repository implementation."""
+    """Trade repository over captured aggregated trades (``market_trades``)."""
     
     def __init__(self, session: AsyncSession):
         self._session = session
+        self._ticks = TickRepository(session)
     
-    async def save(self, trade: Trade) -> Trade:
+    async def save(self, trade: Trade) -> None:
         """Save trade data."""
-        raise NotImplementedError("Trade repository not implemented yet")
+        await self.save_batch([trade])
     
-    async def find_by_symbol(self, symbol: str, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None, limit: int = 1000) -> List[Trade]:
-        """Find trades by symbol."""
-        raise NotImplementedError("Trade repository not implemented yet")
+    async def save_batch(self, trades: List[Trade]) -> None:
+        """Save multiple trades (ValueError if any has no trade_id)."""
+        _require_trade_ids(trades, "trades")
+        await _copy_trades(self._session, [
+            (trade.symbol, trade.timestamp, int(trade.trade_id), trade.price, trade.quantity, trade.is_buyer_maker)
+            for trade in trades
+        ])
+    
+    async def find_by_symbol(
+        self,
+        symbol: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = 1000
+    ) -> List[Trade]:
+        """Find trades by symbol within time range, oldest first."""
+        stmt = select(*_TRADE_FIELDS).where(_trade_range(symbol, start_time, end_time)).order_by(MarketTradeModel.ts)
+        if limit:
+            stmt = stmt.limit(limit)
+        result = await self._session.execute(stmt)
+        return [self._row_to_domain(row) for row in result.all()]
+    
+    async def find_latest(self, symbol: str) -> Optional[Trade]:
+        """Find latest trade for symbol."""
+        stmt = select(*_TRADE_FIELDS).where(
+            MarketTradeModel.symbol == symbol
+        ).order_by(MarketTradeModel.ts.desc()).limit(1)
+        row = (await self._session.execute(stmt)).first()
+        return self._row_to_domain(row) if row else None
+    
+    async def get_volume_data(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Dict[str, Any]]:
+        """Per-minute taker buy and sell volume."""
+        minute = func.date_trunc("minute", MarketTradeModel.ts).label("minute")
+        # The buyer being the maker means the taker sold
+        sell_volume = func.sum(MarketTradeModel.quantity).filter(MarketTradeModel.is_buyer_maker.is_(True))
+        buy_volume = func.sum(MarketTradeModel.quantity).filter(MarketTradeModel.is_buyer_maker.is_(False))
+        stmt = select(
+            minute,
+            func.coalesce(buy_volume, 0),
+            func.coalesce(sell_volume, 0),
+            func.sum(MarketTradeModel.price * MarketTradeModel.quantity),
+            func.count(),
+        ).where(_trade_range(symbol, start_time, end_time)).group_by(minute).order_by(minute)
+        result = await self._session.execute(stmt)
+        return [
+            {
+                "timestamp": timestamp,
+                "buy_volume": buy,
+                "sell_volume": sell,
+                "quote_volume": quote,
+                "trades": trades,
+            }
+            for timestamp, buy, sell, quote, trades in result.all()
+        ]
     
     async def delete_old(self, older_than: datetime) -> int:
-        """Delete old trades."""
-        raise NotImplementedError("Trade repository not implemented yet")
+        """Delete trades older than specified date."""
+        return await self._ticks.delete_old(older_than)
+    
+    def _row_to_domain(self, row) -> Trade:
+        """Convert a market_trades row to a trade."""
+        return Trade(
+            symbol=row.symbol,
+            trade_id=str(row.trade_id),
+            price=row.price,
+            quantity=row.quantity,
+            quote_quantity=row.price * row.quantity,
+            timestamp=row.ts,
+            is_buyer_maker=row.is_buyer_maker,
+            trade_type=TradeType.SELL if row.is_buyer_maker else TradeType.BUY
+        )
 
 
 class MarketStatsRepository(IMarketStatsRepository):
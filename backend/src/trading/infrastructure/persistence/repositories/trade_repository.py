@@ -8,6 +8,7 @@ import logging
 from trading.domain.trade import Trade
 from trading.domain.order import OrderSide
 from ..models.trading_models import TradeModel
+from .daily_pnl_repository import DailyPnlRepository
 
 logger = logging.getLogger(__name__)
 
@@ -70,25 +71,44 @@ class TradeRepository:
         )
         
         self.session.add(model)
-        await self.session.commit()
         
-        # === REAL-TIME STATS UPDATE ===
-        # After trade is committed, recalculate stats and broadcast via WebSocket
+        # Fold the trade into the daily P&L rollup and the bot's stats in
+        # the same transaction, so neither can diverge from trade history
+        # on a crash in between
+        await DailyPnlRepository(self.session).record_trade(
+            user_id=trade.user_id,
+            bot_id=trade.bot_id,
+            executed_at=trade.executed_at,
+            pnl=trade.realized_pnl,
+        )
+        
+        stats_service = None
         if trade.bot_id:
+            from ....application.services.bot_stats_service import BotStatsService
+            
+            stats_service = BotStatsService(self.session)
+            await self.session.flush()
+            await stats_service.update_stats_on_trade_close(
+                bot_id=str(trade.bot_id),
+                realized_pnl=trade.realized_pnl,
+                commit=False,
+            )
+        
+        await self.session.commit()
+        
+        # Analytics reports of this user are now stale
+        try:
+            from ...cache.analytics_cache import analytics_cache
+            
+            await analytics_cache.invalidate(trade.user_id)
+        except Exception as e:
+            logger.error(f"Failed to invalidate analytics after trade creation: {e}")
+        
+        # === REAL-TIME STATS BROADCAST ===
+        if stats_service is not None:
             try:
-                # Use absolute imports to avoid path confusion
-                from trading.application.services.bot_stats_service import BotStatsService
-                from trading.infrastructure.websocket.websocket_manager import websocket_manager
-                from decimal import Decimal
-                
-                # Recalculate stats (self-healing aggregation from trades table)
-                stats_service = BotStatsService(self.session)
-                await stats_service.update_stats_on_trade_close(
-                    bot_id=str(trade.bot_id),
-                    realized_pnl=trade.realized_pnl or Decimal("0")
-                )
+                from ...websocket.websocket_manager import websocket_manager
                 
-                # Broadcast updated stats via WebSocket
                 stats = await stats_service.get_bot_stats(str(trade.bot_id))
                 if stats:
                     await websocket_manager.broadcast_bot_stats_update(
@@ -98,8 +118,8 @@ class TradeRepository:
                     )
                     logger.info(f"Real-time stats broadcasted for bot {trade.bot_id} after trade creation")
             except Exception as e:
-                # Don't fail trade creation if stats update fails
-                logger.error(f"Failed to update/broadcast stats after trade creation: {e}")
+                # Don't fail trade creation if the broadcast fails
+                logger.error(f"Failed to broadcast stats after trade creation: {e}")
         
         return trade
         
@@ -22,6 +22,13 @@ class SqlAlchemyRiskAlertRepository(IRiskAlertRepository):
         await self._session.refresh(model)
         return self._to_entity(model)
     
+    async def save_many(self, alerts: List[RiskAlert]) -> None:
+        """Save several risk alerts in one transaction."""
+        if not alerts:
+            return
+        self._session.add_all([self._to_model(alert) for alert in alerts])
+        await self._session.commit()
+    
     async def find_by_id(self, alert_id: UUID) -> Optional[RiskAlert]:
         """Find risk alert by ID."""
         stmt = select(RiskAlertModel).where(RiskAlertModel.id == alert_id)
@@ -1,4 +1,5 @@
-from typing import List, Optional
+from decimal import Decimal
+from typing import Dict, List, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
@@ -72,6 +73,26 @@ class SqlAlchemyRiskLimitRepository(IRiskLimitRepository):
         models = result.scalars().all()
         return [self._to_entity(model) for model in models]
     
+    async def find_enabled(self) -> List[RiskLimit]:
+        """Find all enabled risk limits of all users."""
+        stmt = select(RiskLimitModel).where(RiskLimitModel.enabled == True)
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+        return [self._to_entity(model) for model in models]
+    
+    async def find_exposure_limits_by_user(self, user_id: UUID) -> Dict[str, Decimal]:
+        """Find a user's enabled per-symbol exposure limits (one query), keyed by symbol."""
+        stmt = select(RiskLimitModel.symbol, RiskLimitModel.limit_value).where(
+            and_(
+                RiskLimitModel.user_id == user_id,
+                RiskLimitModel.limit_type == RiskLimitType.EXPOSURE.value,
+                RiskLimitModel.enabled == True,
+                RiskLimitModel.symbol.isnot(None)
+            )
+        )
+        result = await self._session.execute(stmt)
+        return {symbol: limit_value for symbol, limit_value in result.all()}
+    
     async def update(self, risk_limit: RiskLimit) -> RiskLimit:
         """Update a risk limit."""
         stmt = select(RiskLimitModel).where(RiskLimitModel.id == risk_limit.id)
@@ -0,0 +1,52 @@
+"""Cached read access to supported exchange metadata."""
+from typing import Any, Dict, Optional
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..cache.cached_repository import CachedRepository
+from ..config.settings import get_settings
+from ..persistence.models.core_models import ExchangeModel
+
+_EXCHANGE_COLUMNS = tuple(attr.key for attr in inspect(ExchangeModel).column_attrs)
+
+
+class ExchangeMetadataRepository:
+    """Rows of the ``exchanges`` table as plain dicts, served from the L1/Redis cache.
+
+    Exchanges are only inserted by seeding, so there is no write path to
+    invalidate from; misses are not cached and the TTLs bound staleness.
+    Callers must treat the returned dicts as read-only.
+    """
+
+    cache_prefix = "exchange_meta"
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        settings = get_settings()
+        self._cache = CachedRepository(
+            repository=self,
+            default_ttl=settings.REDIS_CACHE_TTL,
+            cache_prefix=self.cache_prefix,
+            local_cache_size=settings.REPOSITORY_L1_CACHE_SIZE,
+            local_cache_ttl=settings.REPOSITORY_L1_CACHE_TTL,
+        )
+
+    async def _load(self, **filters: Any) -> Optional[Dict[str, Any]]:
+        stmt = select(ExchangeModel).filter_by(**filters)
+        model = (await self._session.execute(stmt)).scalar_one_or_none()
+        if model is None:
+            return None
+        return {key: getattr(model, key) for key in _EXCHANGE_COLUMNS}
+
+    async def find_by_id(self, exchange_id: int) -> Optional[Dict[str, Any]]:
+        """Find exchange by ID."""
+        return await self._cache.cached_call(
+            "_load", cache_key_override=f"{self.cache_prefix}:id:{exchange_id}", id=exchange_id
+        )
+
+    async def find_by_code(self, code: str) -> Optional[Dict[str, Any]]:
+        """Find exchange by code (BINANCE, BYBIT, OKX)."""
+        return await self._cache.cached_call(
+            "_load", cache_key_override=f"{self.cache_prefix}:code:{code}", code=code
+        )
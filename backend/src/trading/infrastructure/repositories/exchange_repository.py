@@ -15,6 +15,8 @@ from ...domain.exchange import (
 )
 from ...domain.exchange.repository import IExchangeRepository
 from ..persistence.models.core_models import APIConnectionModel, ExchangeModel
+from .exchange_metadata_repository import ExchangeMetadataRepository
+from ..exchange.adapter_pool import exchange_adapter_pool
 
 
 from ..config.settings import get_settings
@@ -42,9 +44,7 @@ class ExchangeRepository(IExchangeRepository):
     async def save(self, connection: ExchangeConnection) -> None:
         """Save or update exchange connection."""
         # Get exchange_id from exchange_type
-        stmt = select(ExchangeModel).where(ExchangeModel.code == connection.exchange_type.value)
-        result = await self._session.execute(stmt)
-        exchange = result.scalar_one_or_none()
+        exchange = await ExchangeMetadataRepository(self._session).find_by_code(connection.exchange_type.value)
         
         if not exchange:
             raise ValueError(f"Exchange {connection.exchange_type.value} not found in database")
@@ -56,6 +56,16 @@ class ExchangeRepository(IExchangeRepository):
         
         if existing:
             # Update existing
+            credentials_changed = (
+                existing.is_active != connection.is_active
+                or bool(existing.is_testnet) != bool(connection.is_testnet)
+                or self._decrypt(existing.api_key_encrypted) != connection.credentials.api_key
+                or self._decrypt(existing.secret_key_encrypted) != connection.credentials.secret_key
+                or bool(connection.credentials.passphrase) and (
+                    not existing.passphrase_encrypted
+                    or self._decrypt(existing.passphrase_encrypted) != connection.credentials.passphrase
+                )
+            )
             existing.name = connection.name
             existing.is_testnet = connection.is_testnet
             existing.api_key_encrypted = self._encrypt(connection.credentials.api_key)
@@ -75,12 +85,16 @@ class ExchangeRepository(IExchangeRepository):
                 "withdraw": connection.permissions.withdraw,
             }
             existing.last_used_at = connection.last_used_at
+            # Pooled adapters must not keep using rotated or deactivated keys;
+            # a last_used update alone leaves them in place
+            if credentials_changed:
+                exchange_adapter_pool.invalidate_after_commit(self._session, connection.id)
         else:
             # Create new
             model = APIConnectionModel(
                 id=connection.id,
                 user_id=connection.user_id,
-                exchange_id=exchange.id,
+                exchange_id=exchange["id"],
                 name=connection.name,
                 is_testnet=connection.is_testnet,
                 api_key_encrypted=self._encrypt(connection.credentials.api_key),
@@ -210,6 +224,7 @@ class ExchangeRepository(IExchangeRepository):
         if model:
             model.soft_delete()
             await self._session.flush()
+            exchange_adapter_pool.invalidate_after_commit(self._session, connection_id)
     
     def _to_domain(self, model: APIConnectionModel, exchange_code: str) -> ExchangeConnection:
         """Convert model to domain entity."""
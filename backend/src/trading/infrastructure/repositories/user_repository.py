@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ...domain.user import User, Email, HashedPassword
 from ...domain.user.repository import IUserRepository
 from ..persistence.models.core_models import UserModel
+from ..cache.user_principal_cache import user_principal_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -31,9 +32,17 @@ class UserRepository(IUserRepository):
         existing = result.scalar_one_or_none()
         
         if existing:
+            principal_changed = (
+                existing.email != user.email.value
+                or existing.full_name != user.full_name
+                or existing.timezone != user.timezone
+                or existing.is_active != user.is_active
+                or existing.preferences != user.preferences
+            )
             # Update existing user
             existing.email = user.email.value
-            existing.password_hash = user.password.value
+            if user.password.value:  # empty for users served from the principal cache
+                existing.password_hash = user.password.value
             existing.full_name = user.full_name
             existing.timezone = user.timezone
             existing.preferences = user.preferences
@@ -52,8 +61,14 @@ class UserRepository(IUserRepository):
                 last_login=user.last_login_at,
             )
             self._session.add(user_model)
+            principal_changed = False  # not cached yet
         
         await self._session.flush()
+        
+        # Authenticated requests must not keep seeing the old user; a
+        # last_login update alone leaves the cached principal in place
+        if principal_changed:
+            user_principal_cache.invalidate_after_commit(self._session, user.id)
     
     async def find_by_id(self, user_id: uuid.UUID) -> Optional[User]:
         """
@@ -131,6 +146,7 @@ class UserRepository(IUserRepository):
         if user_model:
             user_model.soft_delete()
             await self._session.flush()
+            user_principal_cache.invalidate_after_commit(self._session, user_id)
     
     def _model_to_entity(self, model: UserModel) -> User:
         """
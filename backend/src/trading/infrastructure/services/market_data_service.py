@@ -5,7 +5,7 @@ from typing import List, Optional, Dict, Any, Tuple, Callable
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
-from ..jobs.job_queue import job_queue
+from ..jobs.job_queue import job_queue, candles_tag
 
 from ...domain.market_data import Candle, CandleInterval, StreamStatus
 from ...domain.market_data.gap_detector import GapDetector, TimeRange
@@ -45,6 +45,7 @@ class MarketDataService:
         max_wait_seconds: int = 600,  # NEW: Max wait time (10 mins default)
         poll_interval_seconds: int = 5,  # NEW: How often to check for data
         progress_callback: Optional[Callable[[int, str], None]] = None,  # NEW: Progress callback (percent, message)
+        job_tags: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Fetch historical candles as dicts (for backward compatibility)."""
         domain_candles = await self.get_historical_candles_domain(
@@ -58,6 +59,7 @@ class MarketDataService:
             max_wait_seconds=max_wait_seconds,
             poll_interval_seconds=poll_interval_seconds,
             progress_callback=progress_callback,
+            job_tags=job_tags,
         )
         return [self._candle_to_dict(c) for c in domain_candles]
 
@@ -73,6 +75,7 @@ class MarketDataService:
         max_wait_seconds: int = 600,  # NEW: Max wait time (10 mins default)
         poll_interval_seconds: int = 5,  # NEW: How often to check for data
         progress_callback: Optional[Callable[[int, str], None]] = None,  # NEW: Progress callback (percent, message)
+        job_tags: Optional[List[str]] = None,
     ) -> List[Candle]:
         """Fetch historical candles with auto-repair for missing data.
         
@@ -88,6 +91,8 @@ class MarketDataService:
             poll_interval_seconds: How often to check DB for new data (default 5s)
             progress_callback: Optional async callback function(percent: int, message: str) 
                               called during data fetching to report progress
+            job_tags: Extra tags for queued repair jobs (e.g. the requesting
+                      backtest), so they can be cancelled together
         """
         # Normalize symbol (BTC/USDT or BTC-USDT -> BTCUSDT)
         normalized_symbol = symbol.replace("/", "").replace("-", "")
@@ -224,6 +229,7 @@ class MarketDataService:
                 chunk_number += 1
             
             total_chunks = len(chunks)
+            tags = [candles_tag(normalized_symbol, interval.value), *(job_tags or [])]
             
             print(f"DEBUG [MarketDataService]: ========== QUEUING ALL JOBS (PARALLEL) ==========")
             print(f"DEBUG [MarketDataService]: Symbol: {normalized_symbol}, Interval: {interval.value}")
@@ -242,13 +248,15 @@ class MarketDataService:
                     'total_end': gap_end.isoformat(),
                     'chunk_number': chunk['chunk_number'],
                     'total_chunks': total_chunks,
-                    'parallel_mode': True  # Flag to skip queueing next job
+                    'parallel_mode': True,  # Flag to skip queueing next job
+                    'tags': tags,
                 }
                 
                 try:
                     await job_queue.enqueue(
                         name='fetch_missing_candles',
-                        args=job_params
+                        args=job_params,
+                        tags=tags,
                     )
                     jobs_queued += 1
                 except Exception as e:
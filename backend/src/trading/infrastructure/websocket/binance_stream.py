@@ -1,13 +1,16 @@
 import asyncio
 import json
 import logging
+import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import websockets
 from decimal import Decimal
 
+from .local_order_book import order_book_manager
 from .websocket_manager import websocket_manager
 from ..config.settings import get_settings
+from ...performance.profiling.latency_histogram import latency_registry
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -44,6 +47,7 @@ class BinanceWebSocketClient:
         
         self.connections.clear()
         self.subscriptions.clear()
+        await order_book_manager.stop()
     
     async def subscribe_ticker_streams(self, symbols: List[str]):
         """Subscribe to ticker streams for multiple symbols."""
@@ -99,7 +103,8 @@ class BinanceWebSocketClient:
             self.connections[stream_key] = connection
             self.subscriptions[stream_key] = [symbol]
             
-            # Start listening
+            # Start listening; the local book publishes throttled snapshots
+            order_book_manager.start()
             asyncio.create_task(self._listen_depth_stream(connection, symbol))
             
             logger.info(f"Subscribed to depth stream for {symbol}")
@@ -122,6 +127,7 @@ class BinanceWebSocketClient:
         try:
             while self.running:
                 message = await connection.recv()
+                received = time.perf_counter()
                 data = json.loads(message)
                 
                 # Handle individual ticker or combined stream
@@ -133,12 +139,15 @@ class BinanceWebSocketClient:
                     # Individual stream format
                     stream_data = data
                     symbol = stream_data["s"]
+                latency_registry.observe_event(stream_data.get("E"), symbol=symbol)
+                latency_registry.since("decode", received, symbol=symbol)
                 
                 # Process ticker data
                 ticker_data = self._process_ticker_data(stream_data)
                 
                 # Broadcast to subscribers
                 await websocket_manager.broadcast_price_update(symbol, ticker_data)
+                latency_registry.since("ui_publish", received, symbol=symbol)
                 
         except websockets.exceptions.ConnectionClosed:
             logger.info("Binance ticker stream connection closed")
@@ -167,25 +176,19 @@ class BinanceWebSocketClient:
             logger.error(f"Error in trade stream for {symbol}: {e}")
     
     async def _listen_depth_stream(self, connection: websockets.WebSocketServerProtocol, symbol: str):
-        """Listen to depth stream and broadcast updates."""
+        """Listen to depth stream and keep the local order book in sync."""
         try:
             while self.running:
                 message = await connection.recv()
-                data = json.loads(message)
-                
-                # Process depth data
-                depth_data = self._process_depth_data(data)
-                
-                # Broadcast to subscribers
-                await websocket_manager.broadcast_price_update(symbol, {
-                    "type": "orderbook",
-                    **depth_data
-                })
+                order_book_manager.on_diff(json.loads(message))
                 
         except websockets.exceptions.ConnectionClosed:
             logger.info(f"Binance depth stream connection closed for {symbol}")
         except Exception as e:
             logger.error(f"Error in depth stream for {symbol}: {e}")
+        finally:
+            # Diffs were missed from here on; the book must be rebuilt
+            order_book_manager.reset(symbol.upper())
     
     def _process_ticker_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Process ticker data from Binance."""
@@ -216,17 +219,6 @@ class BinanceWebSocketClient:
             "is_buyer_maker": data["m"],
             "timestamp": datetime.utcnow().isoformat()
         }
-    
-    def _process_depth_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process depth data from Binance."""
-        return {
-            "symbol": data["s"],
-            "first_update_id": int(data["U"]),
-            "final_update_id": int(data["u"]),
-            "bids": [[Decimal(price), Decimal(qty)] for price, qty in data["b"]],
-            "asks": [[Decimal(price), Decimal(qty)] for price, qty in data["a"]],
-            "timestamp": datetime.utcnow().isoformat()
-        }
 
 
 # Global Binance WebSocket client instance
@@ -1,7 +1,9 @@
 import asyncio
+import dataclasses
 import json
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, Set
 from datetime import datetime
 from decimal import Decimal
 import uuid
@@ -13,9 +15,10 @@ from ..config.settings import get_settings
 from ..persistence.database import get_db_context
 from ..persistence.repositories.order_repository import OrderRepository
 from ..persistence.repositories.trade_repository import TradeRepository
-from ...application.services.bot_stats_service import BotStatsService
 from ...application.use_cases.order.update_order_status import UpdateOrderStatusUseCase
+from ...application.services.risk_engine import risk_engine
 from ...domain.order import OrderStatus
+from ...performance.profiling.latency_histogram import latency_registry
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -38,17 +41,25 @@ class BinanceUserStreamService:
         # Position tracking for real-time PnL calculation
         self.cached_positions: Dict[str, Dict] = {} # bot_id -> {symbol: position_data}
         self.lifecycle_tasks: Dict[str, List[asyncio.Task]] = {} # bot_id -> [user_task, mark_price_task]
+        self._risk_alert_tasks: Set[asyncio.Task] = set()
         
     async def start(self):
         """Start the service."""
         logger.info("Starting Binance User Stream Service...")
         self.running = True
         
+        # The risk engine is fed from this process, so its limits are loaded here
+        risk_engine.subscribe(self._on_risk_event)
+        risk_engine.start()
+        
     async def stop(self):
         """Stop the service and close all streams."""
         logger.info("Stopping Binance User Stream Service...")
         self.running = False
         
+        risk_engine.unsubscribe(self._on_risk_event)
+        await risk_engine.stop()
+        
         # Cancel all lifecycle tasks
         for tasks in self.lifecycle_tasks.values():
             for task in tasks:
@@ -80,6 +91,23 @@ class BinanceUserStreamService:
         self.active_bots.clear()
         self.cached_positions.clear()
 
+    def _on_risk_event(self, event: Any):
+        """Push risk engine events (limit violations, critical breaches) to the user's websockets."""
+        data = {"event_type": event.event_type, **dataclasses.asdict(event)}
+        if data["event_type"] == "CriticalRiskBreachEvent":
+            logger.warning(
+                f"Critical risk breach for user {event.user_id}: {event.limit_type} "
+                f"{event.current_value} / {event.limit_value}"
+            )
+        try:
+            task = asyncio.get_running_loop().create_task(
+                websocket_manager.broadcast_risk_alert(str(event.user_id), data)
+            )
+        except RuntimeError:
+            return
+        self._risk_alert_tasks.add(task)
+        task.add_done_callback(self._risk_alert_tasks.discard)
+
     async def start_stream_for_bot(self, bot_id: str, adapter: BinanceAdapter, user_id: str, symbol: str):
         """
         Start individual user stream for a bot.
@@ -160,6 +188,7 @@ class BinanceUserStreamService:
                         while self.running:
                             message = await connection.recv()
                             data = json.loads(message)
+                            latency_registry.observe_event(data.get("E"), bot=bot_id)
                             
                             event_type = data.get("e")
                             if event_type == "ACCOUNT_UPDATE":
@@ -220,11 +249,15 @@ class BinanceUserStreamService:
                     try:
                         while self.running:
                             message = await connection.recv()
-                            # logger.info(f"[TRACE] MP Msg") 
+                            received = time.perf_counter()
                             data = json.loads(message)
                             
                             if data.get("e") == "markPriceUpdate":
+                                mark_symbol = data.get("s", "")
+                                latency_registry.observe_event(data.get("E"), bot_id, mark_symbol)
+                                latency_registry.since("decode", received, bot_id, mark_symbol)
                                 await self._handle_mark_price_update(bot_id, data)
+                                latency_registry.since("ui_publish", received, bot_id, mark_symbol)
                                 
                     except websockets.exceptions.ConnectionClosed:
                         logger.warning(f"Mark Price stream connection closed for bot {bot_id}")
@@ -303,6 +336,9 @@ class BinanceUserStreamService:
         symbol = data.get("s")  # Symbol
         mark_price = Decimal(data.get("p", "0"))  # Mark Price
         
+        # Re-mark every holder of the symbol in the risk engine
+        risk_engine.on_mark_price(symbol, mark_price)
+        
         bot_positions = self.cached_positions.get(bot_id, {})
         
         if not bot_positions:
@@ -616,6 +652,8 @@ class BinanceUserStreamService:
     async def _handle_order_update(self, bot_id: str, data: Dict):
         """Handle ORDER_TRADE_UPDATE event (Order status changes)."""
         order_data = data.get("o", {})
+        if order_data.get("X") in ("PARTIALLY_FILLED", "FILLED"):
+            latency_registry.mark_fill(order_data.get("i"))
         
         # Broadcast first
         await websocket_manager.broadcast_to_channel(
@@ -646,12 +684,24 @@ class BinanceUserStreamService:
             if not new_status:
                 logger.warning(f"Unknown order status: {status_raw}")
                 return
+            
+            # Feed the fill to the risk engine before the DB round trips
+            last_filled = Decimal(order_data.get("l", "0"))
+            user_id_str = self.active_bots.get(bot_id, {}).get("user_id")
+            if last_filled > 0 and user_id_str:
+                risk_engine.on_fill(
+                    uuid.UUID(user_id_str),
+                    symbol=order_data.get("s", ""),
+                    side=order_data.get("S", ""),
+                    quantity=last_filled,
+                    price=Decimal(order_data.get("L", "0")),
+                    fee=Decimal(order_data.get("n", "0")) if order_data.get("N", "USDT") == "USDT" else Decimal("0"),
+                )
 
             async with get_db_context() as session:
                 order_repository = OrderRepository(session)
                 trade_repository = TradeRepository(session)
-                bot_stats_service = BotStatsService(session)
-                use_case = UpdateOrderStatusUseCase(order_repository, trade_repository, bot_stats_service)
+                use_case = UpdateOrderStatusUseCase(order_repository, trade_repository)
                 
                 # We need to find the order ID (UUID) from Client Order ID or Exchange Order ID
                 # The use case requires UUID.
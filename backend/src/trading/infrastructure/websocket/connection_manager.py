@@ -2,9 +2,10 @@ from enum import Enum
 from typing import Dict, Set, List, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
-import json
 import logging
 
+from ...performance.json.codec import json_dumps
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,7 +43,7 @@ class StreamMessage:
     
     def to_json(self) -> str:
         """Convert message to JSON string."""
-        return json.dumps({
+        return json_dumps({
             "stream_type": self.stream_type.value,
             "symbol": self.symbol,
             "data": self.data,
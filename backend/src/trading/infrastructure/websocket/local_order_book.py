@@ -0,0 +1,325 @@
+"""Local order books kept in sync from a REST snapshot and depth diffs"""
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Sequence
+
+from .websocket_manager import websocket_manager
+from ..config.settings import get_settings
+from ...domain.market_data import OrderBook, OrderBookLevel
+from ...performance.datastructures.fast_orderbook import FastOrderBook
+from ...performance.http.async_pool import get_http_pool
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+SPOT_REST_URL = "https://api.binance.com"
+# Binance sends prices and quantities with at most 8 decimals
+DEFAULT_SCALE = 8
+DEFAULT_DEPTH_BANDS_BPS = (10, 50, 100)
+MAX_BUFFERED_EVENTS = 10000
+
+Publisher = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+class OrderBookSyncError(Exception):
+    """A depth diff does not continue the local book; it must be resynced."""
+
+
+def to_units(text: str, scale: int) -> int:
+    """Decimal string as an integer number of 10**-scale units."""
+    whole, _, fraction = text.partition(".")
+    return int(whole + fraction[:scale].ljust(scale, "0"))
+
+
+def format_units(value: int, scale: int) -> str:
+    """Inverse of ``to_units``."""
+    return format(Decimal(value).scaleb(-scale), "f")
+
+
+class LocalOrderBook:
+    """Order book of one symbol maintained from depth diffs.
+
+    Prices and quantities are held as integers scaled by ``price_scale``
+    and ``quantity_scale`` in a ``FastOrderBook``. A book is only usable
+    after ``load_snapshot``; from then on every diff must continue the
+    update id sequence (``U == previous u + 1`` on spot, ``pu == previous
+    u`` on futures) or ``apply_diff`` raises ``OrderBookSyncError``.
+    """
+
+    def __init__(self, symbol: str, price_scale: int = DEFAULT_SCALE, quantity_scale: int = DEFAULT_SCALE):
+        self.symbol = symbol
+        self.price_scale = price_scale
+        self.quantity_scale = quantity_scale
+        self.book = FastOrderBook()
+        self.last_update_id: Optional[int] = None
+        self.version = 0
+        self.updated_at: Optional[datetime] = None
+        self._awaiting_first_diff = False
+
+    @property
+    def synced(self) -> bool:
+        return self.last_update_id is not None
+
+    def reset(self):
+        """Drop the book until the next snapshot."""
+        self.book.clear()
+        self.last_update_id = None
+        self._awaiting_first_diff = False
+
+    def load_snapshot(self, snapshot: Dict[str, Any]):
+        """Replace the book with a REST depth snapshot."""
+        self.book.clear()
+        self._apply_levels(snapshot.get("bids", []), snapshot.get("asks", []))
+        self.last_update_id = int(snapshot["lastUpdateId"])
+        self._awaiting_first_diff = True
+        self._touch()
+
+    def apply_diff(self, event: Dict[str, Any]) -> bool:
+        """Apply a depth diff event; False if the snapshot already covers it."""
+        if self.last_update_id is None:
+            raise OrderBookSyncError(f"{self.symbol}: no snapshot loaded")
+
+        first_id, final_id = int(event["U"]), int(event["u"])
+        if final_id <= self.last_update_id:
+            return False
+
+        if self._awaiting_first_diff:
+            if first_id > self.last_update_id + 1:
+                raise OrderBookSyncError(
+                    f"{self.symbol}: first diff starts at {first_id}, snapshot is at {self.last_update_id}"
+                )
+        elif "pu" in event:
+            if int(event["pu"]) != self.last_update_id:
+                raise OrderBookSyncError(
+                    f"{self.symbol}: diff follows {event['pu']}, book is at {self.last_update_id}"
+                )
+        elif first_id != self.last_update_id + 1:
+            raise OrderBookSyncError(f"{self.symbol}: diff starts at {first_id}, book is at {self.last_update_id}")
+
+        self._apply_levels(event.get("b", []), event.get("a", []))
+        self.last_update_id = final_id
+        self._awaiting_first_diff = False
+        self._touch()
+        return True
+
+    def _apply_levels(self, bids: Iterable[Sequence[str]], asks: Iterable[Sequence[str]]):
+        price_scale, quantity_scale = self.price_scale, self.quantity_scale
+        for price, quantity in bids:
+            self.book.update_bid(to_units(price, price_scale), to_units(quantity, quantity_scale))
+        for price, quantity in asks:
+            self.book.update_ask(to_units(price, price_scale), to_units(quantity, quantity_scale))
+
+    def _touch(self):
+        self.version += 1
+        self.updated_at = datetime.utcnow()
+
+    def _levels(self, levels: List[tuple]) -> List[List[str]]:
+        return [
+            [format_units(price, self.price_scale), format_units(quantity, self.quantity_scale)]
+            for price, quantity in levels
+        ]
+
+    def depth_bands(self, bands_bps: Sequence[int] = DEFAULT_DEPTH_BANDS_BPS) -> List[Dict[str, Any]]:
+        """Bid and ask quantity within each band (in bps) around the mid price."""
+        best_bid, best_ask = self.book.get_best_bid(), self.book.get_best_ask()
+        if not best_bid or not best_ask:
+            return []
+        mid_twice = best_bid[0] + best_ask[0]
+        return [
+            {
+                "bps": bps,
+                "bid_quantity": format_units(
+                    self.book.bid_volume(mid_twice * (10000 - bps) // 20000), self.quantity_scale
+                ),
+                "ask_quantity": format_units(
+                    self.book.ask_volume(mid_twice * (10000 + bps) // 20000), self.quantity_scale
+                ),
+            }
+            for bps in bands_bps
+        ]
+
+    def snapshot(self, levels: int = 20, bands_bps: Sequence[int] = DEFAULT_DEPTH_BANDS_BPS) -> Dict[str, Any]:
+        """Top ``levels`` of each side and banded depth, as published."""
+        depth = self.book.get_depth(levels)
+        return {
+            "type": "orderbook",
+            "symbol": self.symbol,
+            "last_update_id": self.last_update_id,
+            "bids": self._levels(depth["bids"]),
+            "asks": self._levels(depth["asks"]),
+            "depth": self.depth_bands(bands_bps),
+            "timestamp": (self.updated_at or datetime.utcnow()).isoformat(),
+        }
+
+    def to_domain(self, levels: int = 20) -> OrderBook:
+        """Top ``levels`` as a domain ``OrderBook``."""
+        depth = self.book.get_depth(levels)
+
+        def domain_levels(side):
+            return [
+                OrderBookLevel(
+                    price=Decimal(price).scaleb(-self.price_scale),
+                    quantity=Decimal(quantity).scaleb(-self.quantity_scale),
+                )
+                for price, quantity in side
+            ]
+
+        return OrderBook(
+            symbol=self.symbol,
+            bids=domain_levels(depth["bids"]),
+            asks=domain_levels(depth["asks"]),
+            timestamp=self.updated_at or datetime.utcnow(),
+            last_update_id=self.last_update_id,
+        )
+
+
+class OrderBookManager:
+    """
+    Local order books of every symbol with a depth stream
+
+    Diffs arriving while a book has no snapshot are buffered; a snapshot
+    is fetched from ``rest_url`` and the buffer replayed onto it. A
+    sequence gap drops the book and starts over the same way. Subscribers
+    get ``snapshot()`` of each changed book every ``publish_interval``
+    seconds rather than every diff.
+    """
+
+    def __init__(
+        self,
+        rest_url: str = SPOT_REST_URL,
+        snapshot_limit: int = 1000,
+        publish_interval: float = settings.ORDERBOOK_PUBLISH_INTERVAL,
+        levels: int = settings.ORDERBOOK_PUBLISH_LEVELS,
+        bands_bps: Sequence[int] = DEFAULT_DEPTH_BANDS_BPS,
+        publisher: Optional[Publisher] = None,
+        http=None,
+    ):
+        self.rest_url = rest_url.rstrip("/")
+        self.snapshot_limit = snapshot_limit
+        self.publish_interval = publish_interval
+        self.levels = levels
+        self.bands_bps = tuple(bands_bps)
+        self.publisher = publisher or websocket_manager.broadcast_orderbook_update
+        self._http = http
+        self.books: Dict[str, LocalOrderBook] = {}
+        self._buffers: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._sync_tasks: Dict[str, asyncio.Task] = {}
+        self._published: Dict[str, int] = {}
+        self._publish_task: Optional[asyncio.Task] = None
+
+    @property
+    def http(self):
+        return self._http or get_http_pool()
+
+    def get_book(self, symbol: str) -> Optional[LocalOrderBook]:
+        """Synced book of symbol, if any."""
+        book = self.books.get(symbol.upper())
+        return book if book is not None and book.synced else None
+
+    def start(self):
+        """Start publishing (idempotent)."""
+        if self._publish_task is None or self._publish_task.done():
+            self._publish_task = asyncio.create_task(self._publish_loop())
+
+    async def stop(self):
+        """Stop publishing and any pending snapshot fetches."""
+        tasks = [task for task in [self._publish_task, *self._sync_tasks.values()] if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._publish_task = None
+        self._sync_tasks.clear()
+        self._buffers.clear()
+
+    def on_diff(self, event: Dict[str, Any]):
+        """Feed one depth diff event of the stream."""
+        symbol = event["s"]
+        book = self.books.get(symbol)
+        if book is None:
+            book = self.books[symbol] = LocalOrderBook(symbol)
+
+        buffer = self._buffers.get(symbol)
+        if buffer is not None:
+            buffer.append(event)
+            return
+
+        try:
+            book.apply_diff(event)
+        except OrderBookSyncError as e:
+            if book.synced:
+                logger.warning(f"Order book out of sync, resyncing: {e}")
+            self.resync(symbol, pending=[event])
+
+    def reset(self, symbol: str):
+        """Forget a book, e.g. when its stream disconnected."""
+        task = self._sync_tasks.pop(symbol, None)
+        if task:
+            task.cancel()
+        self._buffers.pop(symbol, None)
+        book = self.books.get(symbol)
+        if book:
+            book.reset()
+
+    def resync(self, symbol: str, pending: Iterable[Dict[str, Any]] = ()):
+        """Buffer diffs and rebuild the book from a fresh snapshot."""
+        self.books[symbol].reset()
+        self._buffers[symbol] = deque(pending, maxlen=MAX_BUFFERED_EVENTS)
+        task = self._sync_tasks.get(symbol)
+        if task is None or task.done():
+            self._sync_tasks[symbol] = asyncio.create_task(self._sync(symbol))
+
+    async def fetch_snapshot(self, symbol: str) -> Dict[str, Any]:
+        response = await self.http.request(
+            "GET", f"{self.rest_url}/api/v3/depth",
+            params={"symbol": symbol, "limit": self.snapshot_limit},
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def _sync(self, symbol: str):
+        book = self.books[symbol]
+        attempt = 0
+        while True:
+            try:
+                book.load_snapshot(await self.fetch_snapshot(symbol))
+                # No await below: the buffer cannot grow while it is replayed
+                buffer = self._buffers.get(symbol, ())
+                for event in buffer:
+                    book.apply_diff(event)
+                self._buffers.pop(symbol, None)
+                self._sync_tasks.pop(symbol, None)
+                logger.info(f"Order book {symbol} synced at update {book.last_update_id}")
+                return
+            except asyncio.CancelledError:
+                raise
+            except OrderBookSyncError as e:
+                # Snapshot older than the buffered diffs; a newer one will fit
+                logger.info(f"Order book snapshot did not line up, retrying: {e}")
+            except Exception as e:
+                logger.error(f"Error fetching order book snapshot for {symbol}: {e}")
+            book.reset()
+            await asyncio.sleep(min(30.0, 0.5 * 2 ** attempt))
+            attempt += 1
+
+    async def publish_changed(self):
+        """Publish every synced book that changed since it was last published."""
+        for symbol, book in list(self.books.items()):
+            if not book.synced or self._published.get(symbol) == book.version:
+                continue
+            self._published[symbol] = book.version
+            try:
+                await self.publisher(symbol, book.snapshot(self.levels, self.bands_bps))
+            except Exception as e:
+                logger.error(f"Error publishing order book for {symbol}: {e}")
+
+    async def _publish_loop(self):
+        while True:
+            await asyncio.sleep(self.publish_interval)
+            await self.publish_changed()
+
+
+# Global order book manager (spot depth streams)
+order_book_manager = OrderBookManager()
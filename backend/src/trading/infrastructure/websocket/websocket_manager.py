@@ -1,6 +1,5 @@
 from fastapi import WebSocket, WebSocketDisconnect
 from typing import Dict, List, Optional, Any
-import json
 import asyncio
 import logging
 import uuid
@@ -9,6 +8,7 @@ from datetime import datetime
 from .connection_manager import ConnectionManager, StreamMessage, StreamType, Subscription, SubscriptionStatus
 from ..auth import verify_access_token
 from ..cache import cache_service, price_cache, user_session_cache
+from ...performance.json.codec import json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -185,12 +185,13 @@ class WebSocketManager:
                 
                 # Manual broadcast since ConnectionManager is sync and has stubbed method
                 subscribers = self.connection_manager.get_subscribers(stream_type, symbol)
+                payload = stream_message.to_json()
                 
                 for user_id in subscribers:
                     connections = self.connection_manager.get_user_connections(user_id)
                     for websocket in connections:
                         try:
-                            await websocket.send_text(stream_message.to_json())
+                            await websocket.send_text(payload)
                         except Exception as e:
                             logger.error(f"Error sending to user {user_id}: {e}")
         except Exception as e:
@@ -322,7 +323,7 @@ class WebSocketManager:
     async def _send_message(self, websocket: WebSocket, message: Dict[str, Any]):
         """Send message to WebSocket."""
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_text(json_dumps(message))
         except Exception as e:
             logger.error(f"Error sending WebSocket message: {e}")
     
@@ -345,16 +346,36 @@ class WebSocketManager:
         
         # Get subscribers for this symbol
         subscribers = self.connection_manager.get_subscribers(StreamType.PRICE, symbol)
+        if not subscribers:
+            return
         
-        # Send to all subscribers
+        # Serialize once, send to all subscribers
+        payload = message.to_json()
         for user_id in subscribers:
             connections = self.connection_manager.get_user_connections(user_id)
             for websocket in connections:
                 try:
-                    await websocket.send_text(message.to_json())
+                    await websocket.send_text(payload)
                 except Exception as e:
                     logger.error(f"Error broadcasting price to user {user_id}: {e}")
     
+    async def broadcast_orderbook_update(self, symbol: str, book_data: Dict[str, Any]):
+        """Broadcast an order book snapshot to subscribers."""
+        message = StreamMessage(
+            stream_type=StreamType.ORDERBOOK,
+            symbol=symbol,
+            data=book_data,
+            timestamp=datetime.utcnow()
+        )
+        payload = message.to_json()
+
+        for user_id in self.connection_manager.get_subscribers(StreamType.ORDERBOOK, symbol):
+            for websocket in self.connection_manager.get_user_connections(user_id):
+                try:
+                    await websocket.send_text(payload)
+                except Exception as e:
+                    logger.error(f"Error broadcasting order book to user {user_id}: {e}")
+
     async def broadcast_order_update(self, user_id: str, order_data: Dict[str, Any]):
         """Broadcast order update to specific user."""
         message = StreamMessage(
@@ -366,10 +387,11 @@ class WebSocketManager:
         )
         
         # Send to user's connections
+        payload = message.to_json()
         connections = self.connection_manager.get_user_connections(user_id)
         for websocket in connections:
             try:
-                await websocket.send_text(message.to_json())
+                await websocket.send_text(payload)
             except Exception as e:
                 logger.error(f"Error sending order update to user {user_id}: {e}")
     
@@ -384,10 +406,11 @@ class WebSocketManager:
         )
         
         # Send to user's connections
+        payload = message.to_json()
         connections = self.connection_manager.get_user_connections(user_id)
         for websocket in connections:
             try:
-                await websocket.send_text(message.to_json())
+                await websocket.send_text(payload)
             except Exception as e:
                 logger.error(f"Error sending risk alert to user {user_id}: {e}")
     
@@ -406,10 +429,11 @@ class WebSocketManager:
         )
         
         # Send to user's connections
+        payload = message.to_json()
         connections = self.connection_manager.get_user_connections(user_id)
         for websocket in connections:
             try:
-                await websocket.send_text(message.to_json())
+                await websocket.send_text(payload)
             except Exception as e:
                 logger.error(f"Error sending bot status to user {user_id}: {e}")
     
@@ -433,10 +457,11 @@ class WebSocketManager:
         )
         
         # Send to user's connections
+        payload = message.to_json()
         connections = self.connection_manager.get_user_connections(user_id)
         for websocket in connections:
             try:
-                await websocket.send_text(message.to_json())
+                await websocket.send_text(payload)
             except Exception as e:
                 logger.error(f"Error sending bot stats to user {user_id}: {e}")
     
@@ -4,6 +4,7 @@ from typing import Optional
 from fastapi import FastAPI
 
 from .binance_stream import binance_ws_client
+from ..marketdata.trade_capture import trade_capture_service
 from .binance_user_stream import binance_user_stream
 from .websocket_manager import websocket_manager
 
@@ -17,6 +18,7 @@ class WebSocketService:
         self.binance_client = binance_ws_client
         self.user_stream = binance_user_stream
         self.websocket_manager = websocket_manager
+        self.trade_capture = trade_capture_service
         self.running = False
     
     async def start(self):
@@ -36,6 +38,9 @@ class WebSocketService:
             await self.user_stream.start()
             logger.info("Binance User Data Stream service started")
             
+            # Start trade capture (no-op without configured symbols)
+            await self.trade_capture.start()
+            
             # Initialize WebSocket manager
             await self.websocket_manager.initialize()
             logger.info("WebSocket manager initialized")
@@ -63,6 +68,9 @@ class WebSocketService:
             await self.user_stream.stop()
             logger.info("Binance User Data Stream service stopped")
             
+            # Stop trade capture, writing what is buffered
+            await self.trade_capture.stop()
+            
             # Cleanup WebSocket manager
             await self.websocket_manager.cleanup()
             logger.info("WebSocket manager cleaned up")
@@ -90,6 +98,7 @@ class WebSocketService:
             "binance_connections": len(self.binance_client.connections),
             "active_websocket_connections": len(self.websocket_manager.active_connections),
             "user_connections": len(self.websocket_manager.user_connections),
+            "trade_capture": self.trade_capture.get_stats(),
             "subscriptions": {
                 user_id: len(subs) 
                 for user_id, subs in self.websocket_manager.user_subscriptions.items()
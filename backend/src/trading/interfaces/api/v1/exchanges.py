@@ -13,6 +13,7 @@ from .schemas.exchange import (
 from ....infrastructure.persistence.database import get_db
 from ....infrastructure.repositories.exchange_repository import ExchangeRepository
 from ....infrastructure.binance import BinanceClient
+from ....infrastructure.exchange.adapter_pool import exchange_adapter_pool
 from ...dependencies.auth import get_current_active_user
 from ....domain.user import User
 from ....domain.exchange import (
@@ -349,3 +350,5 @@ async def delete_connection(
     # Soft delete
     await exchange_repo.delete(UUID(connection_id))
     await db.commit()
+    # Stop serving the deleted keys from the pool before responding
+    await exchange_adapter_pool.invalidate(connection_id)
@@ -7,6 +7,7 @@ from jose import JWTError
 import uuid
 
 from ...infrastructure.auth import verify_access_token
+from ...infrastructure.cache.user_principal_cache import user_principal_cache
 from ...infrastructure.persistence.database import get_db
 from ...domain.user import User
 
@@ -44,6 +45,21 @@ async def get_current_user_id(
         )
 
 
+async def _resolve_user(user_id: uuid.UUID, db: AsyncSession) -> Optional[User]:
+    """Load user from the principal cache, falling back to the database."""
+    user = await user_principal_cache.get_user(user_id)
+    if user is not None:
+        return user
+    
+    from ...infrastructure.repositories.user_repository import UserRepository
+    
+    user_repo = UserRepository(db)
+    user = await user_repo.find_by_id(user_id)
+    if user is not None:
+        await user_principal_cache.set_user(user)
+    return user
+
+
 async def get_current_user(
     user_id: uuid.UUID = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
@@ -51,6 +67,9 @@ async def get_current_user(
     """
     Get current authenticated user.
     
+    The user is served from the principal cache when possible; the
+    database session is only used on a cache miss.
+    
     Args:
         user_id: User UUID from token
         db: Database session
@@ -61,10 +80,7 @@ async def get_current_user(
     Raises:
         HTTPException: If user not found or inactive
     """
-    from ...infrastructure.repositories.user_repository import UserRepository
-    
-    user_repo = UserRepository(db)
-    user = await user_repo.find_by_id(user_id)
+    user = await _resolve_user(user_id, db)
     
     if user is None:
         raise HTTPException(
@@ -125,11 +141,8 @@ async def get_optional_current_user(
         return None
     
     try:
-        from ...infrastructure.repositories.user_repository import UserRepository
-        
         user_id = verify_access_token(credentials.credentials)
-        user_repo = UserRepository(db)
-        user = await user_repo.find_by_id(user_id)
+        user = await _resolve_user(user_id, db)
         return user if user and user.is_active else None
     
     except JWTError:
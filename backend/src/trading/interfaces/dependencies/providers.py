@@ -7,7 +7,11 @@ from ...infrastructure.persistence.database import get_db
 from ...domain.user import User
 
 # Repository imports
-from ...infrastructure.persistence.repositories.bot_repository import BotRepository, StrategyRepository
+from ...infrastructure.persistence.repositories.bot_repository import (
+    BotRepository,
+    StrategyRepository,
+    CachedStrategyRepository,
+)
 from ...infrastructure.persistence.repositories.market_data_repository import (
     MarketDataSubscriptionRepository,
     CandleRepository,
@@ -59,7 +63,7 @@ from ...application.use_cases.market_data_use_cases import (
     GetMarketStatsUseCase,
     GetMarketOverviewUseCase
 )
-from src.application.services.connection_service import ConnectionService
+from application.services.connection_service import ConnectionService
 from ...application.services.position_service import PositionService
 from ...application.use_cases.risk import (
     CreateRiskLimitUseCase,
@@ -85,7 +89,7 @@ async def get_bot_repository(db: AsyncSession = Depends(get_db)) -> BotRepositor
 async def get_strategy_repository(db: AsyncSession = Depends(get_db)) -> StrategyRepository:
     """Provide strategy repository instance."""
     print("DEBUG: Instantiating StrategyRepository")
-    return StrategyRepository(db)
+    return CachedStrategyRepository(db)
 
 
 async def get_exchange_repository(db: AsyncSession = Depends(get_db)) -> ExchangeRepository:
@@ -176,10 +180,9 @@ async def get_bot_stats_service(db: AsyncSession = Depends(get_db)) -> BotStatsS
 async def get_update_order_status_use_case(
     order_repo: OrderRepository = Depends(get_order_repository),
     trade_repo: TradeRepository = Depends(get_trade_repository),
-    bot_stats_service: BotStatsService = Depends(get_bot_stats_service)
 ) -> UpdateOrderStatusUseCase:
     """Provide update order status use case instance."""
-    return UpdateOrderStatusUseCase(order_repo, trade_repo, bot_stats_service)
+    return UpdateOrderStatusUseCase(order_repo, trade_repo)
 
 
 async def get_position_service(
@@ -0,0 +1,10 @@
+"""Standalone background job workers (``python -m trading.interfaces.workers``)."""
+
+from .metrics import render_latency_metrics, render_metrics
+from .worker_process import WorkerProcess
+
+__all__ = [
+    "WorkerProcess",
+    "render_latency_metrics",
+    "render_metrics",
+]
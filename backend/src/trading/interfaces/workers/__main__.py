@@ -0,0 +1,102 @@
+"""Run standalone job workers.
+
+    python -m trading.interfaces.workers --queue marketdata=4 --queue default=2 --processes 2
+
+Each process serves ``/metrics`` and ``/healthz`` on ``--metrics-port``
+plus its index, and drains running jobs on SIGTERM/SIGINT.
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import signal
+import sys
+from typing import Dict, List, Optional
+
+from ...infrastructure.config.settings import get_settings
+from ...infrastructure.jobs import parse_queue_spec
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(prog="python -m trading.interfaces.workers", description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--queue", action="append", default=[], metavar="NAME[=N]",
+        help="queue to consume and its concurrency (repeatable; default: JOB_WORKER_QUEUES)",
+    )
+    parser.add_argument("--processes", type=int, default=1, help="worker processes to run")
+    parser.add_argument(
+        "--metrics-port", type=int, default=settings.WORKER_METRICS_PORT,
+        help="metrics port of the first process (0 disables the endpoint)",
+    )
+    parser.add_argument(
+        "--drain-timeout", type=float, default=settings.WORKER_DRAIN_TIMEOUT,
+        help="seconds to wait for running jobs on shutdown",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        args.queues = parse_queue_spec(",".join(args.queue) or settings.JOB_WORKER_QUEUES)
+    except ValueError as e:
+        parser.error(str(e))
+    if not args.queues:
+        parser.error("no queues to consume")
+    if args.processes < 1:
+        parser.error("--processes must be at least 1")
+    return args
+
+
+def run_process(index: int, queues: Dict[str, int], metrics_port: int, drain_timeout: float):
+    """Entry point of one worker process."""
+    from .worker_process import WorkerProcess
+
+    logging.basicConfig(level=get_settings().LOG_LEVEL, format="%(asctime)s %(processName)s %(name)s %(levelname)s %(message)s")
+    process = WorkerProcess(
+        queues=queues,
+        name=f"worker{index}",
+        metrics_port=metrics_port + index if metrics_port else None,
+        drain_timeout=drain_timeout,
+    )
+    asyncio.run(process.run())
+
+
+def supervise(args: argparse.Namespace) -> int:
+    """Run ``--processes`` workers and forward shutdown signals to them."""
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(
+            target=run_process,
+            args=(index, args.queues, args.metrics_port, args.drain_timeout),
+            name=f"worker{index}",
+        )
+        for index in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+
+    def forward(signum, frame):
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    signal.signal(signal.SIGTERM, forward)
+    signal.signal(signal.SIGINT, forward)
+
+    for process in processes:
+        process.join()
+    return int(any(process.exitcode for process in processes))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.processes == 1:
+        run_process(0, args.queues, args.metrics_port, args.drain_timeout)
+        return 0
+    return supervise(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
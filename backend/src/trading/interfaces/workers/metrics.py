@@ -0,0 +1,105 @@
+"""Prometheus text exposition of worker and queue statistics."""
+
+import hmac
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ...performance.profiling.latency_histogram import LatencyHistogram
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Prometheus buckets (seconds) of the latency histograms
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+LATENCY_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+# name -> (type, help, worker stats key)
+_WORKER_METRICS: Dict[str, Tuple[str, str, str]] = {
+    "trading_worker_jobs_processed_total": ("counter", "Jobs finished by the worker.", "jobs_processed"),
+    "trading_worker_jobs_succeeded_total": ("counter", "Jobs completed successfully.", "jobs_succeeded"),
+    "trading_worker_jobs_failed_total": ("counter", "Jobs failed or timed out.", "jobs_failed"),
+    "trading_worker_processing_seconds_total": ("counter", "Time spent running jobs.", "total_processing_time"),
+    "trading_worker_jobs_running": ("gauge", "Jobs currently running.", "current_jobs_count"),
+    "trading_worker_concurrency_limit": ("gauge", "Maximum concurrent jobs.", "max_concurrent_jobs"),
+}
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _family(name: str, kind: str, help_text: str, samples: Iterable[Tuple[Dict[str, Any], float]]) -> List[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    lines.extend(f"{name}{_labels(labels)} {float(value):g}" for labels, value in samples)
+    return lines
+
+
+def render_metrics(workers: List[Dict[str, Any]], queue_stats: Dict[str, Any]) -> str:
+    """Render ``JobWorker.get_stats()`` dicts and ``JobQueue.get_queue_stats()``."""
+    lines: List[str] = []
+
+    for name, (kind, help_text, key) in _WORKER_METRICS.items():
+        lines += _family(name, kind, help_text, (
+            ({"worker": stats["worker_id"], "queue": ",".join(stats["queues"])}, stats[key] or 0)
+            for stats in workers
+        ))
+    lines += _family("trading_worker_up", "gauge", "Whether the worker is leasing jobs.", (
+        ({"worker": stats["worker_id"], "queue": ",".join(stats["queues"])},
+         stats["status"] not in ("stopping", "stopped"))
+        for stats in workers
+    ))
+
+    if "error" not in queue_stats:
+        lines += _family("trading_job_queue_pending", "gauge", "Jobs waiting in a queue.", (
+            ({"queue": queue, "priority": priority}, count)
+            for queue, counts in queue_stats.get("queues", {}).items()
+            for priority, count in counts.items()
+        ))
+        for key, help_text in (
+            ("scheduled", "Jobs waiting for their scheduled time or retry."),
+            ("leased", "Jobs leased by a worker."),
+            ("dead_letter", "Jobs that exhausted their retries."),
+        ):
+            lines += _family(f"trading_job_queue_{key}", "gauge", help_text, [({}, queue_stats.get(key, 0))])
+
+    return "\n".join(lines) + "\n"
+
+
+def render_latency_metrics(series: Iterable[Tuple[Tuple[str, str], LatencyHistogram]]) -> str:
+    """Render ``LatencyRegistry.series_by_symbol()``: a histogram plus quantiles read off the full-resolution buckets.
+
+    Series are labelled by stage and symbol only; bot ids would expose
+    user resources and grow the label set with every bot.
+    """
+    series = [(dict(zip(("stage", "symbol"), key)), histogram) for key, histogram in series]
+    name = "trading_latency_seconds"
+    lines = [f"# HELP {name} Live trading path latency per stage.", f"# TYPE {name} histogram"]
+    for labels, histogram in series:
+        for bound, count in zip(LATENCY_BUCKETS, histogram.cumulative(list(LATENCY_BUCKETS))):
+            lines.append(f"{name}_bucket{_labels({**labels, 'le': f'{bound:g}'})} {count}")
+        lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {histogram.count}")
+        lines.append(f"{name}_sum{_labels(labels)} {histogram.total:.9g}")
+        lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+
+    lines += _family("trading_latency_quantile_seconds", "gauge", "Latency quantiles per stage (within 6.25%).", (
+        ({**labels, "quantile": f"{quantile:g}"}, histogram.percentile(quantile * 100))
+        for labels, histogram in series
+        for quantile in LATENCY_QUANTILES
+    ))
+    return "\n".join(lines) + "\n"
+
+
+def metrics_authorized(authorization: Optional[str], token: str, environment: str) -> bool:
+    """Whether a scrape may read /metrics.
+
+    With ``METRICS_TOKEN`` set it must be sent as a bearer token; without
+    one the endpoint is only served in development.
+    """
+    if not token:
+        return environment == "development"
+    scheme, _, credentials = (authorization or "").partition(" ")
+    return scheme.lower() == "bearer" and hmac.compare_digest(credentials.encode(), token.encode())
@@ -0,0 +1,137 @@
+"""Standalone job worker process.
+
+Runs one ``JobWorker`` per queue, each capped at that queue's
+concurrency, without the API, scheduler or bot manager. Scheduled jobs
+are still enqueued by the leader-elected scheduler in the API processes.
+"""
+
+import asyncio
+import logging
+import signal
+from typing import Dict, List, Optional
+
+from ...application.job_handlers import register_job_handlers
+from ...infrastructure.cache import cache_service
+from ...infrastructure.jobs import JobWorker, job_queue
+from ...infrastructure.persistence.database import async_engine
+from ...performance.http.async_pool import close_http_pool
+from .metrics import CONTENT_TYPE, render_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerProcess:
+    """Job workers for a set of queues, with drain and a metrics endpoint."""
+
+    def __init__(
+        self,
+        queues: Dict[str, int],
+        name: str = "worker",
+        metrics_port: Optional[int] = None,
+        metrics_host: str = "0.0.0.0",
+        drain_timeout: float = 30.0,
+    ):
+        self.name = name
+        self.metrics_port = metrics_port
+        self.metrics_host = metrics_host
+        self.drain_timeout = drain_timeout
+        self.workers: List[JobWorker] = [
+            JobWorker(
+                worker_id=f"{name}-{queue}",
+                max_concurrent_jobs=concurrency,
+                queues=[queue],
+            )
+            for queue, concurrency in queues.items()
+        ]
+        self._stopping = asyncio.Event()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def running(self) -> bool:
+        return not self._stopping.is_set() and all(worker._running for worker in self.workers)
+
+    async def start(self):
+        """Connect, register handlers and start every worker."""
+        await cache_service.start()
+        register_job_handlers()
+
+        for worker in self.workers:
+            await worker.start()
+
+        if self.metrics_port is not None:
+            self._server = await asyncio.start_server(self._serve_http, self.metrics_host, self.metrics_port)
+            logger.info(f"Worker metrics on {self.metrics_host}:{self.metrics_port}/metrics")
+
+        logger.info(
+            f"Worker process {self.name} started: "
+            + ", ".join(f"{w.queues[0]}={w.max_concurrent_jobs}" for w in self.workers)
+        )
+
+    def request_stop(self):
+        """Begin draining; safe to call from a signal handler."""
+        if not self._stopping.is_set():
+            logger.info(f"Worker process {self.name} draining")
+            self._stopping.set()
+
+    async def stop(self):
+        """Drain running jobs, then close connections."""
+        self._stopping.set()
+        await asyncio.gather(*(
+            worker.stop(wait_for_jobs=True, timeout=self.drain_timeout)
+            for worker in self.workers
+        ))
+
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        await close_http_pool()
+        await cache_service.stop()
+        await async_engine.dispose()
+        logger.info(f"Worker process {self.name} stopped")
+
+    async def run(self):
+        """Run until SIGTERM/SIGINT, then drain."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self.request_stop)
+
+        try:
+            await self.start()
+            await self._stopping.wait()
+        finally:
+            await self.stop()
+
+    async def render_metrics(self) -> str:
+        """Current metrics in Prometheus text format."""
+        return render_metrics(
+            [worker.get_stats() for worker in self.workers],
+            await job_queue.get_queue_stats(),
+        )
+
+    async def _serve_http(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Minimal HTTP/1.0 handler for ``/metrics`` and ``/healthz``."""
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+            parts = request_line.decode("latin-1").split()
+            path = parts[1].split("?", 1)[0] if len(parts) >= 2 else ""
+
+            if path == "/metrics":
+                status, content_type, body = "200 OK", CONTENT_TYPE, await self.render_metrics()
+            elif path == "/healthz":
+                status = "200 OK" if self.running else "503 Service Unavailable"
+                content_type, body = "text/plain", ("ok\n" if self.running else "draining\n")
+            else:
+                status, content_type, body = "404 Not Found", "text/plain", "not found\n"
+
+            payload = body.encode()
+            writer.write(
+                f"HTTP/1.0 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode() + payload
+            )
+            await writer.drain()
+        except Exception as e:
+            logger.debug(f"Metrics request failed: {e}")
+        finally:
+            writer.close()
@@ -2,14 +2,15 @@
 Optimized OrderBook data structure
 
 Usage:
-    from shared.performance.datastructures.fast_orderbook import FastOrderBook
-    
+    from src.trading.performance.datastructures.fast_orderbook import FastOrderBook
+
     ob = FastOrderBook()
-    ob.update_bid(50000.0, 1.5)
-    ob.update_ask(50100.0, 2.0)
+    ob.update_bid(5000000, 150)   # prices in ticks, quantities in units
+    ob.update_ask(5010000, 200)
     best_bid = ob.get_best_bid()
 """
 
+from itertools import islice
 from typing import Dict, List, Tuple, Optional
 from sortedcontainers import SortedDict
 
@@ -17,109 +18,119 @@ from sortedcontainers import SortedDict
 class FastOrderBook:
     """
     High-performance order book using SortedDict
-    
+
+    Prices and quantities are integers (scaled by the caller), so level
+    keys compare exactly and updates never allocate Decimals. Bids are
+    keyed by negated price, so both sides iterate best level first.
+
     Features:
     - O(log n) updates
     - O(1) best bid/ask access
-    - Efficient depth queries
-    - Memory-efficient
+    - Depth and volume queries touch only the levels returned
     """
-    
+
     def __init__(self):
         """Initialize order book"""
-        self.bids = SortedDict()  # price -> quantity (descending)
-        self.asks = SortedDict()  # price -> quantity (ascending)
-    
-    def update_bid(self, price: float, quantity: float) -> None:
+        self.bids = SortedDict()  # -price -> quantity
+        self.asks = SortedDict()  # price -> quantity
+
+    def update_bid(self, price: int, quantity: int) -> None:
         """
         Update bid level
-        
+
         Args:
             price: Bid price
             quantity: Bid quantity (0 to remove)
         """
-        if quantity <= 0 and price in self.bids:
-            del self.bids[price]
-        elif quantity > 0:
-            self.bids[price] = quantity
-    
-    def update_ask(self, price: float, quantity: float) -> None:
+        if quantity > 0:
+            self.bids[-price] = quantity
+        else:
+            self.bids.pop(-price, None)
+
+    def update_ask(self, price: int, quantity: int) -> None:
         """
         Update ask level
-        
+
         Args:
             price: Ask price
             quantity: Ask quantity (0 to remove)
         """
-        if quantity <= 0 and price in self.asks:
-            del self.asks[price]
-        elif quantity > 0:
+        if quantity > 0:
             self.asks[price] = quantity
-    
-    def get_best_bid(self) -> Optional[Tuple[float, float]]:
+        else:
+            self.asks.pop(price, None)
+
+    def get_best_bid(self) -> Optional[Tuple[int, int]]:
         """
         Get best bid (highest price)
-        
+
         Returns:
             (price, quantity) or None if no bids
         """
         if not self.bids:
             return None
-        price = self.bids.keys()[-1]  # Highest price
-        return (price, self.bids[price])
-    
-    def get_best_ask(self) -> Optional[Tuple[float, float]]:
+        price, quantity = self.bids.peekitem(0)
+        return (-price, quantity)
+
+    def get_best_ask(self) -> Optional[Tuple[int, int]]:
         """
         Get best ask (lowest price)
-        
+
         Returns:
             (price, quantity) or None if no asks
         """
         if not self.asks:
             return None
-        price = self.asks.keys()[0]  # Lowest price
-        return (price, self.asks[price])
-    
-    def get_spread(self) -> Optional[float]:
+        return self.asks.peekitem(0)
+
+    def get_spread(self) -> Optional[int]:
         """
         Get bid-ask spread
-        
+
         Returns:
             Spread or None if incomplete book
         """
         best_bid = self.get_best_bid()
         best_ask = self.get_best_ask()
-        
+
         if best_bid and best_ask:
             return best_ask[0] - best_bid[0]
         return None
-    
-    def get_depth(self, levels: int = 10) -> Dict[str, List[Tuple[float, float]]]:
+
+    def get_depth(self, levels: int = 10) -> Dict[str, List[Tuple[int, int]]]:
         """
         Get order book depth
-        
+
         Args:
             levels: Number of levels to return
-            
+
         Returns:
-            Dict with 'bids' and 'asks' lists
+            Dict with 'bids' and 'asks' lists, best level first
         """
-        bids = [(price, qty) for price, qty in reversed(list(self.bids.items())[:levels])]
-        asks = [(price, qty) for price, qty in list(self.asks.items())[:levels]]
-        
+        bids = [(-price, qty) for price, qty in islice(self.bids.items(), levels)]
+        asks = list(islice(self.asks.items(), levels))
+
         return {
             "bids": bids,
             "asks": asks
         }
-    
+
+    def bid_volume(self, min_price: int) -> int:
+        """Total bid quantity at or above min_price"""
+        return sum(self.bids[key] for key in self.bids.irange(maximum=-min_price))
+
+    def ask_volume(self, max_price: int) -> int:
+        """Total ask quantity at or below max_price"""
+        return sum(self.asks[key] for key in self.asks.irange(maximum=max_price))
+
     def clear(self) -> None:
         """Clear all orders"""
         self.bids.clear()
         self.asks.clear()
-    
+
     def snapshot(self) -> Dict:
         """Get full orderbook snapshot"""
         return {
-            "bids": list(self.bids.items()),
+            "bids": [(-price, qty) for price, qty in self.bids.items()],
             "asks": list(self.asks.items())
         }
@@ -2,4 +2,6 @@
 Optimized HTTP client utilities
 
 Connection pooling, timeouts, retry logic
+(``http_pool`` for sync callers, ``async_pool`` for asyncio) and the
+orjson-backed FastAPI response class (``responses``)
 """
@@ -0,0 +1,248 @@
+"""
+Async HTTP connection pool with DNS caching and retry
+
+Usage:
+    from trading.performance.http.async_pool import get_http_pool
+
+    pool = get_http_pool()
+    response = await pool.request("GET", "https://api.example.com/data")
+
+One keep-alive ``httpx.AsyncClient`` is kept per origin, so every caller
+in the process shares the same bounded set of connections to a host.
+"""
+
+import asyncio
+import logging
+import random
+import socket
+import time
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
+from urllib.parse import urlsplit
+
+import httpcore
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying; 418 (IP ban) never is
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RequestLimiter(Protocol):
+    """Rate limiter consulted around each attempt of a request."""
+
+    async def acquire(self, method: str, path: str, params: Dict[str, Any], account: Optional[str]) -> None:
+        ...
+
+    def update(self, response: httpx.Response, account: Optional[str]) -> None:
+        ...
+
+
+class CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that caches resolved addresses for ``ttl`` seconds.
+
+    TLS still verifies the original host name: httpcore passes it as
+    ``server_hostname`` independently of the address connected to.
+    """
+
+    def __init__(self, ttl: float = 300.0, backend: Optional[httpcore.AsyncNetworkBackend] = None):
+        self.ttl = ttl
+        self._backend = backend or httpcore.AnyIOBackend()
+        self._cache: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+
+    async def resolve(self, host: str, port: int) -> List[str]:
+        """Addresses of host, from cache when fresh."""
+        cached = self._cache.get((host, port))
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._cache[(host, port)] = (time.monotonic() + self.ttl, addresses)
+        return addresses
+
+    def forget(self, host: str, port: int):
+        self._cache.pop((host, port), None)
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        addresses = await self.resolve(host, port)
+        error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout=timeout, local_address=local_address, socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+        # Every cached address failed: resolve again next time
+        self.forget(host, port)
+        raise error or httpcore.ConnectError(f"No addresses for {host}")
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class _PooledTransport(httpx.AsyncHTTPTransport):
+    """``httpx`` transport whose connection pool uses a shared DNS cache."""
+
+    def __init__(self, limits: httpx.Limits, network_backend: httpcore.AsyncNetworkBackend):
+        super().__init__(limits=limits, trust_env=False)
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=network_backend,
+        )
+
+
+class AsyncHTTPPool:
+    """
+    Process-wide async HTTP client
+
+    Features:
+    - One bounded keep-alive connection pool per origin
+    - DNS cache shared by all pools
+    - Retry with exponential backoff and full jitter
+    - Optional rate limiter consulted before every attempt
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 20,
+        max_keepalive_per_host: int = 10,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 10.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.25,
+        backoff_cap: float = 8.0,
+        dns_ttl: float = 300.0,
+    ):
+        """
+        Initialize async HTTP pool
+
+        Args:
+            max_connections_per_host: Max open connections to one origin
+            max_keepalive_per_host: Idle connections kept per origin
+            keepalive_expiry: Seconds an idle connection is kept
+            timeout: Default request timeout
+            max_retries: Retries after the first attempt
+            backoff_base: First retry delay ceiling in seconds
+            backoff_cap: Largest retry delay ceiling in seconds
+            dns_ttl: Seconds a resolved host is cached
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections_per_host,
+            max_keepalive_connections=max_keepalive_per_host,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.dns = CachingDNSBackend(ttl=dns_ttl)
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def client(self, url: str) -> httpx.AsyncClient:
+        """Shared client of the origin of url."""
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        client = self._clients.get(origin)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                transport=_PooledTransport(self.limits, self.dns),
+                timeout=self.timeout,
+            )
+            self._clients[origin] = client
+        return client
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number ``attempt`` (from 0)."""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        limiter: Optional[RequestLimiter] = None,
+        account: Optional[str] = None,
+        sign: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """
+        Send a request, retrying transient failures
+
+        ``sign`` turns params into the params sent and runs after the
+        limiter on every attempt, so signed timestamps are always fresh.
+        Non-idempotent requests are only retried when the connection
+        could not be opened. The last response is returned whatever its
+        status; raises ``httpx.TransportError`` if no response came back.
+        """
+        method = method.upper()
+        client = self.client(url)
+        path = urlsplit(url).path
+        params = dict(params or {})
+
+        attempt = 0
+        while True:
+            if limiter is not None:
+                await limiter.acquire(method, path, params, account)
+            try:
+                response = await client.request(
+                    method,
+                    url,
+                    params=sign(dict(params)) if sign else params,
+                    headers=headers,
+                    timeout=timeout or self.timeout,
+                )
+            except httpx.TransportError as e:
+                retryable = isinstance(e, httpx.ConnectError) or method in IDEMPOTENT_METHODS
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                delay = self.backoff(attempt)
+                logger.warning(f"{method} {path} failed ({e!r}), retry {attempt + 1} in {delay:.2f}s")
+            else:
+                if limiter is not None:
+                    limiter.update(response, account)
+                retryable = response.status_code in RETRY_STATUSES and (
+                    method in IDEMPOTENT_METHODS or response.status_code == 429
+                )
+                if not retryable or attempt >= self.max_retries:
+                    return response
+                delay = self.backoff(attempt)
+                if response.status_code == 429 and limiter is not None:
+                    # The limiter already holds requests until Retry-After
+                    delay = 0.0
+                logger.warning(f"{method} {path} returned {response.status_code}, retry {attempt + 1} in {delay:.2f}s")
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def close(self):
+        """Close every pooled connection."""
+        clients, self._clients = list(self._clients.values()), {}
+        await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
+
+
+_http_pool: Optional[AsyncHTTPPool] = None
+
+
+def get_http_pool() -> AsyncHTTPPool:
+    """Process-wide async HTTP pool."""
+    global _http_pool
+    if _http_pool is None:
+        _http_pool = AsyncHTTPPool()
+    return _http_pool
+
+
+async def close_http_pool():
+    """Close the process-wide pool; the next ``get_http_pool`` makes a new one."""
+    global _http_pool
+    if _http_pool is not None:
+        pool, _http_pool = _http_pool, None
+        await pool.close()
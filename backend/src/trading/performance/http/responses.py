@@ -0,0 +1,26 @@
+"""
+FastAPI response class backed by the JSON codec
+
+Usage:
+    from src.trading.performance.http.responses import ORJSONResponse
+
+    app = FastAPI(default_response_class=ORJSONResponse)
+"""
+
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+from ..json.codec import json_dumpb
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson (stdlib json when orjson is unavailable).
+
+    Unlike ``fastapi.responses.ORJSONResponse`` it keeps working without
+    orjson and encodes Decimal, so large equity curves and trade lists
+    skip the slow stdlib encoder wherever orjson is installed.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json_dumpb(content)
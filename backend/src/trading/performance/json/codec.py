@@ -0,0 +1,172 @@
+"""
+Serialization codecs for API responses, cache values, job payloads and
+WebSocket frames
+
+JSON goes through orjson when it imports and stdlib json otherwise; both
+encode the same way: datetimes as ISO 8601, Decimal as a string (exact,
+as the ``default=str`` this replaces), UUIDs as strings, dataclasses as
+objects, enums by value and anything else via ``str``. Non-finite floats
+(NaN, Infinity) become ``null`` on both paths, as orjson writes them, so a
+value reads back the same whichever library encoded it; stdlib json would
+otherwise emit ``Infinity``, which is not JSON.
+
+msgpack (optional) is for Redis values only. Packed values start with
+MSGPACK_MARKER, a byte that never occurs in UTF-8 text, so ``decode_value``
+still reads JSON and plain strings written before the codec was switched.
+Both codecs decode to the same Python values.
+
+Usage:
+    from src.trading.performance.json.codec import decode_value, get_codec, json_dumps
+
+    payload = json_dumps({"at": datetime.utcnow(), "qty": Decimal("0.001")})
+    codec = get_codec("msgpack")
+    value = decode_value(codec.encode({"equity": [1, 2, 3]}))
+"""
+
+import dataclasses
+import json as stdlib_json
+import logging
+import math
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Union
+from uuid import UUID
+
+from .orjson_wrapper import ORJSON_AVAILABLE, orjson
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+# 0xc1 is unused by msgpack and invalid as a UTF-8 byte
+MSGPACK_MARKER = b"\xc1"
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    """Types json/orjson/msgpack do not encode natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return str(obj)
+
+
+def replace_non_finite(obj: Any) -> Any:
+    """``obj`` with NaN/Infinity floats replaced by None, as JSON reads them back."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [replace_non_finite(value) for value in obj]
+    return obj
+
+
+def _stdlib_dumpb(obj: Any) -> bytes:
+    try:
+        text = stdlib_json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    except ValueError:
+        # Rare: only payloads holding NaN/Infinity pay for the second pass
+        text = stdlib_json.dumps(
+            replace_non_finite(obj), default=lambda value: replace_non_finite(_default(value)),
+            ensure_ascii=False, separators=(",", ":"),
+        )
+    return text.encode()
+
+
+def json_dumpb(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass  # integers beyond 64 bits, nesting too deep: stdlib copes
+    return _stdlib_dumpb(obj)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string."""
+    return json_dumpb(obj).decode()
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON; raises ValueError when ``data`` is not JSON."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity written by stdlib json are still accepted below
+    return stdlib_json.loads(data)
+
+
+class JSONCodec:
+    """Text values, readable by redis-cli and Lua ``cjson``."""
+
+    name = "json"
+    binary = False
+
+    def encode(self, obj: Any) -> str:
+        return json_dumps(obj)
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        return decode_value(data)
+
+
+class MsgpackCodec:
+    """Compact binary values; read them back with ``RedisClient.get_bytes``."""
+
+    name = "msgpack"
+    binary = True
+
+    def encode(self, obj: Any) -> bytes:
+        return MSGPACK_MARKER + msgpack.packb(obj, default=_default, use_bin_type=True)
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        return decode_value(data)
+
+
+def decode_value(data: Union[str, bytes, None]) -> Any:
+    """Decode a stored value of any codec; text that is not JSON is returned as is."""
+    if data is None:
+        return None
+    if isinstance(data, bytes):
+        if data.startswith(MSGPACK_MARKER):
+            if not MSGPACK_AVAILABLE:
+                raise RuntimeError("msgpack value found but msgpack is not installed")
+            return msgpack.unpackb(data[1:], raw=False, strict_map_key=False)
+        data = data.decode()
+    try:
+        return json_loads(data)
+    except (ValueError, TypeError):
+        return data
+
+
+_CODECS: Dict[str, Any] = {"json": JSONCodec()}
+if MSGPACK_AVAILABLE:
+    _CODECS["msgpack"] = MsgpackCodec()
+
+
+def get_codec(name: str = "json"):
+    """Codec by name; falls back to JSON when it is unknown or not installed."""
+    codec = _CODECS.get(name.lower())
+    if codec is None:
+        logger.warning(f"Codec {name!r} unavailable, using json")
+        codec = _CODECS["json"]
+    return codec
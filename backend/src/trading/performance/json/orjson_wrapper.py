@@ -13,7 +13,7 @@ from typing import Any, Union
 try:
     import orjson
     ORJSON_AVAILABLE = True
-except ImportError:
+except Exception:  # missing, or a wheel built for another platform
     ORJSON_AVAILABLE = False
     orjson = None
 
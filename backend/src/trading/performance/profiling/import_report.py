@@ -0,0 +1,107 @@
+"""
+Import-time report for tracking cold start
+
+Runs ``python -X importtime`` on a module in a fresh interpreter and
+summarizes where the time goes (cumulative per module, so a package
+includes everything it imports).
+
+Usage (from backend/):
+    python -m src.trading.performance.profiling.import_report
+    python -m src.trading.performance.profiling.import_report src.trading.app --top 30
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+DEFAULT_MODULE = "src.trading.app"
+# Heavy optional libraries that should stay out of startup
+WATCHED = ("pandas", "pandas_ta", "numpy", "scipy", "matplotlib")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportReport:
+    module: str
+    records: List[ImportRecord]
+
+    @property
+    def total_ms(self) -> float:
+        """Cumulative import time of the target module."""
+        for record in reversed(self.records):
+            if record.module == self.module:
+                return record.cumulative_us / 1000
+        return sum(r.self_us for r in self.records) / 1000
+
+    def slowest(self, top: int = 20) -> List[ImportRecord]:
+        return sorted(self.records, key=lambda r: r.cumulative_us, reverse=True)[:top]
+
+    def watched(self) -> List[ImportRecord]:
+        """Watched heavy libraries that were imported (top-level package only)."""
+        return [r for r in self.records if r.module in WATCHED]
+
+
+def parse_importtime(lines: Iterable[str]) -> List[ImportRecord]:
+    """Records of ``-X importtime`` output; other stderr lines are skipped."""
+    records = []
+    for line in lines:
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(ImportRecord(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return records
+
+
+def import_report(module: str = DEFAULT_MODULE, cwd: Optional[str] = None) -> ImportReport:
+    """Import ``module`` in a fresh interpreter and collect its import times."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        error = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"Importing {module} failed:\n" + "\n".join(error[-5:]))
+    return ImportReport(module, parse_importtime(proc.stderr.splitlines()))
+
+
+def format_report(report: ImportReport, top: int = 20) -> List[str]:
+    lines = [f"{report.module}: {report.total_ms:.0f} ms", f"{'cumulative ms':>14} {'self ms':>8}  module"]
+    for record in report.slowest(top):
+        lines.append(f"{record.cumulative_us / 1000:>14.1f} {record.self_us / 1000:>8.1f}  {record.module}")
+    watched = report.watched()
+    if watched:
+        lines.append("heavy libraries imported: " + ", ".join(
+            f"{r.module} ({r.cumulative_us / 1000:.0f} ms)" for r in watched
+        ))
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Import-time report of a module")
+    parser.add_argument("module", nargs="?", default=DEFAULT_MODULE)
+    parser.add_argument("--top", type=int, default=20, help="slowest modules to list")
+    args = parser.parse_args(argv)
+
+    report = import_report(args.module)
+    print("\n".join(format_report(report, args.top)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
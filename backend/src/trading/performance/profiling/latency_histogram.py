@@ -0,0 +1,240 @@
+"""
+Fixed-memory latency histograms for the live trading path
+
+Values are bucketed HDR style: exact below 16 µs, then 16 linear
+sub-buckets per power of two, so any recorded latency is known to within
+~6% with 528 counters per series whatever the sample count.
+
+Stages of the live path, labelled by bot and symbol:
+
+    event_receive  exchange event time (``E``) -> message received
+    decode         message received -> parsed
+    ui_publish     message received -> pushed to UI subscribers
+    decision       klines response received -> strategy order call
+    submit         strategy order call -> order request sent
+    ack            order request sent -> exchange response
+    fill           exchange response -> first user-stream fill
+
+Usage:
+    from trading.performance.profiling.latency_histogram import latency_registry
+
+    started = latency_registry.mark_submit(symbol)
+    response = await send()
+    latency_registry.mark_ack(started, symbol, response.get("orderId"))
+"""
+
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+MAX_EXPONENT = 32  # values up to 2**36 µs (~19 hours); larger ones land in the last bucket
+BUCKET_COUNT = SUB_BUCKETS + MAX_EXPONENT * SUB_BUCKETS
+
+STAGES = ("event_receive", "decode", "ui_publish", "decision", "submit", "ack", "fill")
+
+# Orders waiting for their first fill (bounded: cancelled orders never fill)
+MAX_PENDING_ORDERS = 10000
+
+
+def bucket_index(micros: int) -> int:
+    """Bucket of a latency in whole microseconds."""
+    if micros < SUB_BUCKETS:
+        return max(micros, 0)
+    exponent = micros.bit_length() - SUB_BUCKET_BITS - 1
+    index = SUB_BUCKETS + exponent * SUB_BUCKETS + (micros >> exponent) - SUB_BUCKETS
+    return min(index, BUCKET_COUNT - 1)
+
+
+def bucket_upper_bound(index: int) -> int:
+    """Largest latency (µs) that falls in a bucket."""
+    if index < SUB_BUCKETS:
+        return index
+    exponent, offset = divmod(index - SUB_BUCKETS, SUB_BUCKETS)
+    return ((SUB_BUCKETS + offset + 1) << exponent) - 1
+
+
+class LatencyHistogram:
+    """Log-linear histogram of latencies in seconds."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bucket_index(round(seconds * 1_000_000))] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Upper bound (seconds) of the bucket holding the q-th percentile."""
+        if not self.count:
+            return 0.0
+        rank = max(1, int(self.count * q / 100 + 0.5))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bucket_upper_bound(index) / 1_000_000, self.max)
+        return self.max
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's samples to this one."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def cumulative(self, bounds: List[float]) -> List[int]:
+        """Counts at or below each bound (seconds, ascending), for Prometheus buckets."""
+        result, seen, index = [], 0, 0
+        for bound in bounds:
+            limit = bound * 1_000_000
+            while index < BUCKET_COUNT and bucket_upper_bound(index) <= limit:
+                seen += self.counts[index]
+                index += 1
+            result.append(seen)
+        return result
+
+    def reset(self) -> None:
+        self.__init__()
+
+
+@dataclass
+class LatencyTrace:
+    """Origin of the work the current task is doing for a bot."""
+    bot: str
+    symbol: str
+    origin: Optional[float] = None  # wall clock (epoch seconds) the market data arrived
+    decided_at: Optional[float] = None  # perf_counter of the strategy order call
+
+
+_current_trace: ContextVar[Optional[LatencyTrace]] = ContextVar("latency_trace", default=None)
+
+SeriesKey = Tuple[str, str, str]  # stage, bot, symbol
+
+
+class LatencyRegistry:
+    """Histograms per (stage, bot, symbol) plus the bookkeeping between stages.
+
+    Every method returns immediately while ``enabled`` is False.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._series: Dict[SeriesKey, LatencyHistogram] = {}
+        self._pending_fills: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
+
+    def observe(self, stage: str, seconds: float, bot: str = "", symbol: str = "") -> None:
+        if not self.enabled:
+            return
+        key = (stage, bot, symbol)
+        histogram = self._series.get(key)
+        if histogram is None:
+            histogram = self._series[key] = LatencyHistogram()
+        histogram.record(max(seconds, 0.0))
+
+    def observe_event(self, event_time_ms, bot: str = "", symbol: str = "") -> None:
+        """Exchange event time to now (includes clock skew with the exchange)."""
+        if self.enabled and event_time_ms:
+            self.observe("event_receive", time.time() - int(event_time_ms) / 1000, bot, symbol)
+
+    def since(self, stage: str, started: float, bot: str = "", symbol: str = "") -> None:
+        """Record perf_counter() - started."""
+        if self.enabled:
+            self.observe(stage, time.perf_counter() - started, bot, symbol)
+
+    # -- order path ---------------------------------------------------------
+
+    def begin_trace(self, bot: str, symbol: str, origin: Optional[float] = None):
+        """Attribute order stages in the current task to a bot; returns a reset token."""
+        return _current_trace.set(LatencyTrace(str(bot), symbol, origin) if self.enabled else None)
+
+    def end_trace(self, token) -> None:
+        _current_trace.reset(token)
+
+    def mark_decision(self) -> None:
+        """The strategy decided to place an order."""
+        trace = _current_trace.get()
+        if not self.enabled or trace is None:
+            return
+        trace.decided_at = time.perf_counter()
+        if trace.origin is not None:
+            self.observe("decision", time.time() - trace.origin, trace.bot, trace.symbol)
+
+    def mark_submit(self, symbol: str) -> float:
+        """The order request is about to be sent; returns the send time for ``mark_ack``."""
+        sent = time.perf_counter()
+        trace = _current_trace.get()
+        if self.enabled and trace is not None and trace.decided_at is not None:
+            self.observe("submit", sent - trace.decided_at, trace.bot, trace.symbol)
+        return sent
+
+    def mark_ack(self, sent: float, symbol: str, order_id=None) -> None:
+        """The exchange acknowledged the order sent at ``sent``."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        trace = _current_trace.get()
+        bot = trace.bot if trace is not None else ""
+        self.observe("ack", now - sent, bot, symbol)
+        if order_id is not None:
+            self._pending_fills[str(order_id)] = (bot, symbol, now)
+            if len(self._pending_fills) > MAX_PENDING_ORDERS:
+                self._pending_fills.popitem(last=False)
+
+    def mark_fill(self, order_id) -> None:
+        """First fill of an acknowledged order arrived on the user stream."""
+        if not self.enabled:
+            return
+        pending = self._pending_fills.pop(str(order_id), None)
+        if pending is not None:
+            bot, symbol, acked_at = pending
+            self.observe("fill", time.perf_counter() - acked_at, bot, symbol)
+
+    # -- reading ------------------------------------------------------------
+
+    def series(self) -> Iterator[Tuple[SeriesKey, LatencyHistogram]]:
+        return iter(sorted(self._series.items()))
+
+    def series_by_symbol(self) -> Iterator[Tuple[Tuple[str, str], LatencyHistogram]]:
+        """Series merged over bots, keyed (stage, symbol)."""
+        merged: Dict[Tuple[str, str], LatencyHistogram] = {}
+        for (stage, _bot, symbol), histogram in self._series.items():
+            merged.setdefault((stage, symbol), LatencyHistogram()).merge(histogram)
+        return iter(sorted(merged.items()))
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Summary per series, keyed ``stage|bot|symbol``."""
+        return {
+            "|".join(key): {
+                "count": histogram.count,
+                "avg": histogram.total / histogram.count,
+                "p50": histogram.percentile(50),
+                "p99": histogram.percentile(99),
+                "max": histogram.max,
+            }
+            for key, histogram in self.series()
+            if histogram.count
+        }
+
+    def reset(self) -> None:
+        self._series.clear()
+        self._pending_fills.clear()
+
+
+# Global registry of the live trading path (the app applies LATENCY_METRICS_ENABLED)
+latency_registry = LatencyRegistry()
@@ -14,31 +14,36 @@ import functools
 from typing import Callable, Optional, Dict
 import asyncio
 
+from .latency_histogram import LatencyHistogram
+
 
 class LatencyStats:
-    """Store and calculate latency statistics"""
+    """Store and calculate latency statistics (fixed memory per name)"""
     
     def __init__(self):
-        self.measurements: Dict[str, list] = {}
+        self.measurements: Dict[str, LatencyHistogram] = {}
     
     def record(self, name: str, duration: float) -> None:
         """Record a measurement"""
-        if name not in self.measurements:
-            self.measurements[name] = []
-        self.measurements[name].append(duration)
+        histogram = self.measurements.get(name)
+        if histogram is None:
+            histogram = self.measurements[name] = LatencyHistogram()
+        histogram.record(duration)
     
     def get_stats(self, name: str) -> Optional[Dict]:
         """Get statistics for a measurement"""
-        if name not in self.measurements or not self.measurements[name]:
+        histogram = self.measurements.get(name)
+        if histogram is None or not histogram.count:
             return None
         
-        data = self.measurements[name]
         return {
-            "count": len(data),
-            "min": min(data),
-            "max": max(data),
-            "avg": sum(data) / len(data),
-            "total": sum(data)
+            "count": histogram.count,
+            "min": histogram.min,
+            "max": histogram.max,
+            "avg": histogram.total / histogram.count,
+            "total": histogram.total,
+            "p50": histogram.percentile(50),
+            "p99": histogram.percentile(99),
         }
     
     def get_all_stats(self) -> Dict:
@@ -48,7 +53,7 @@ class LatencyStats:
     def reset(self, name: Optional[str] = None) -> None:
         """Reset measurements"""
         if name:
-            self.measurements[name] = []
+            self.measurements.pop(name, None)
         else:
             self.measurements.clear()
     
@@ -65,6 +70,8 @@ class LatencyStats:
                 print(f"  Min:   {stats['min']*1000:.2f}ms")
                 print(f"  Max:   {stats['max']*1000:.2f}ms")
                 print(f"  Avg:   {stats['avg']*1000:.2f}ms")
+                print(f"  P50:   {stats['p50']*1000:.2f}ms")
+                print(f"  P99:   {stats['p99']*1000:.2f}ms")
                 print(f"  Total: {stats['total']*1000:.2f}ms")
         
         print("="*60 + "\n")
@@ -262,6 +262,7 @@ async def run_backtest(
             market_fill_policy=request.config.market_fill_policy,
             limit_fill_policy=request.config.limit_fill_policy,
             price_path_assumption=request.config.price_path_assumption,
+            intrabar_mode=request.config.intrabar_mode,
             signal_timeframe=request.config.signal_timeframe,
             execution_delay_bars=request.config.execution_delay_bars,
             enable_setup_trigger_model=request.config.enable_setup_trigger_model,
@@ -247,29 +247,6 @@ async def get_bots(
             status=status_filter
         )
         
-        # === SELF-HEALING: Recalculate stats for each bot ===
-        # This ensures consistency between Bot Management and Bot Details pages
-        from ...application.services.bot_stats_service import BotStatsService
-        from ...infrastructure.persistence.database import AsyncSessionLocal
-        import logging
-        
-        try:
-            async with AsyncSessionLocal() as session:
-                stats_service = BotStatsService(session)
-                for bot in bots:
-                    try:
-                        await stats_service.update_stats_on_trade_close(str(bot.id), Decimal("0"))
-                    except Exception as e:
-                        logging.getLogger(__name__).warning(f"Stats recalc failed for bot {bot.id}: {e}")
-        except Exception as stats_err:
-            logging.getLogger(__name__).error(f"Stats recalculation session failed: {stats_err}")
-        
-        # Re-fetch bots to get updated stats
-        bots = await get_bots_use_case.execute(
-            user_id=current_user.id,
-            status=status_filter
-        )
-        
         return [bot_to_response(bot) for bot in bots]
     
     except Exception as e:
@@ -283,38 +260,12 @@ async def get_bot(
     get_bot_use_case: GetBotByIdUseCase = Depends(get_get_bot_by_id_use_case),
 ):
     """Get a specific bot."""
-    from sqlalchemy.ext.asyncio import AsyncSession
-    from ...infrastructure.persistence.database import get_db
-    from ...application.services.bot_stats_service import BotStatsService
-    
     try:
         bot = await get_bot_use_case.execute(
             user_id=current_user.id,
             bot_id=bot_id
         )
         
-        # === SELF-HEALING: Recalculate stats from Trade table ===
-        # This ensures that even if WebSocket updates failed, stats are always correct on page load.
-        try:
-            from ...interfaces.dependencies.providers import get_db as get_db_dep
-            # Create a fresh session for recalculation
-            from ...infrastructure.persistence.database import AsyncSessionLocal
-            async with AsyncSessionLocal() as session:
-                stats_service = BotStatsService(session)
-                # Call update_stats with a dummy PnL of 0 to trigger RECALCULATION
-                # (BotStatsService now uses self-healing aggregation instead of increments)
-                await stats_service.update_stats_on_trade_close(str(bot_id), Decimal("0"))
-        except Exception as stats_err:
-            # Don't fail the request if stats recalc fails, just log
-            import logging
-            logging.getLogger(__name__).error(f"Stats recalculation failed: {stats_err}")
-        
-        # Re-fetch bot to get updated stats
-        bot = await get_bot_use_case.execute(
-            user_id=current_user.id,
-            bot_id=bot_id
-        )
-        
         return bot_to_response(bot)
     
     except NotFoundError as e:
@@ -760,4 +711,48 @@ async def get_bot_period_stats(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
-        )
\ No newline at end of file
+        )
+
+class DailyStatsResponse(BaseModel):
+    """P&L for one UTC day."""
+    date: str
+    pnl: float
+    trades: int
+    wins: int
+    losses: int
+
+
+@router.get("/{bot_id}/stats/daily", response_model=List[DailyStatsResponse])
+async def get_bot_daily_stats(
+    bot_id: UUID,
+    days: int = 90,
+    current_user = Depends(get_current_user),
+):
+    """
+    Get bot's P&L per UTC day (for calendars and heatmaps).
+    
+    Query Params:
+        - days: Number of days back, including today (default 90, max 366)
+    
+    Only days with trades are returned.
+    """
+    from ...application.services.bot_stats_service import BotStatsService
+    from ...infrastructure.persistence.database import AsyncSessionLocal
+    
+    if days < 1 or days > 366:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="days must be between 1 and 366"
+        )
+    
+    async with AsyncSessionLocal() as session:
+        daily_stats = await BotStatsService(session).get_daily_stats(
+            str(bot_id), str(current_user.id), days=days
+        )
+    
+    if daily_stats is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to load daily stats"
+        )
+    return daily_stats
@@ -27,7 +27,8 @@ class EnqueueJobRequest(BaseModel):
             "args": {"user_id": "user-123", "exchange": "binance"},
             "priority": "high",
             "max_retries": 3,
-            "timeout": 300
+            "timeout": 300,
+            "tags": ["portfolio:user-123"]
         }
     })
     
@@ -37,6 +38,7 @@ class EnqueueJobRequest(BaseModel):
     scheduled_at: Optional[datetime] = Field(None, description="Schedule job for later execution")
     max_retries: int = Field(default=3, ge=0, le=10, description="Maximum retry attempts")
     timeout: int = Field(default=300, ge=10, le=3600, description="Job timeout in seconds")
+    tags: List[str] = Field(default_factory=list, description="Tags for lookup and bulk cancellation")
 
 
 class JobResponse(BaseModel):
@@ -54,6 +56,20 @@ class JobResponse(BaseModel):
     result: Optional[Any] = None
     retry_count: int
     max_retries: int
+    tags: List[str] = []
+
+
+class BulkCancelRequest(BaseModel):
+    """Request to cancel many pending jobs at once."""
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "job_ids": ["0f6c7d3e-...", "9b1e2a47-..."],
+            "tags": ["backtest:5d2c9f6a-..."]
+        }
+    })
+    
+    job_ids: List[str] = Field(default_factory=list, max_length=10000, description="Job IDs to cancel")
+    tags: List[str] = Field(default_factory=list, max_length=100, description="Cancel every pending job with these tags")
 
 
 class RegisterScheduledTaskRequest(BaseModel):
@@ -144,6 +160,7 @@ async def enqueue_job(request: EnqueueJobRequest):
             scheduled_at=request.scheduled_at,
             max_retries=request.max_retries,
             timeout=request.timeout,
+            tags=request.tags,
         )
         
         return {"job_id": job_id, "status": "enqueued"}
@@ -195,6 +212,25 @@ async def cancel_job(job_id: str):
     return {"job_id": job_id, "status": "cancelled"}
 
 
+@router.post("/cancel")
+async def bulk_cancel_jobs(request: BulkCancelRequest):
+    """Cancel pending jobs by ID and/or tag."""
+    if not request.job_ids and not request.tags:
+        raise HTTPException(status_code=400, detail="Provide job_ids and/or tags")
+    
+    cancelled_ids = await job_service.cancel_jobs(request.job_ids) if request.job_ids else []
+    by_tag = {
+        tag: await job_service.cancel_jobs_by_tag(tag)
+        for tag in request.tags
+    }
+    
+    return {
+        "cancelled": len(cancelled_ids) + sum(by_tag.values()),
+        "job_ids": cancelled_ids,
+        "by_tag": by_tag,
+    }
+
+
 @router.get("/pending")
 async def get_pending_jobs(
     priority: Optional[str] = Query(None, description="Filter by priority"),
@@ -219,6 +255,34 @@ async def get_pending_jobs(
     }
 
 
+# ============================================================================
+# Tag Endpoints
+# ============================================================================
+
+@router.get("/tags/{tag}")
+async def get_tag_progress(tag: str):
+    """Get status counts and progress of jobs carrying a tag."""
+    return await job_service.get_tag_progress(tag)
+
+
+@router.get("/tags/{tag}/jobs")
+async def get_jobs_by_tag(tag: str):
+    """Get jobs carrying a tag."""
+    jobs = await job_service.get_jobs_by_tag(tag)
+    
+    return {
+        "count": len(jobs),
+        "jobs": [j.to_dict() for j in jobs]
+    }
+
+
+@router.post("/tags/{tag}/cancel")
+async def cancel_jobs_by_tag(tag: str):
+    """Cancel every pending job carrying a tag."""
+    count = await job_service.cancel_jobs_by_tag(tag)
+    return {"tag": tag, "cancelled": count}
+
+
 # ============================================================================
 # Dead Letter Queue Endpoints
 # ============================================================================
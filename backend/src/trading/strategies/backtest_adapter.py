@@ -56,7 +56,7 @@ class BacktestStrategyAdapter:
                 self.strategy_instance = cls(MockExchange(), self.config)
                 logger.info(f"Initialized Backtest Adapter with real strategy: {strategy_name}")
             else:
-                msg = f"Strategy '{strategy_name}' not found. Available: {list(registry.strategies.keys())}"
+                msg = f"Strategy '{strategy_name}' not found. Available: {registry.names()}"
                 logger.error(msg)
                 raise ValueError(msg)
         except Exception as e:
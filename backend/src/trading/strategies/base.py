@@ -9,6 +9,7 @@ from decimal import Decimal
 import logging
 
 from ..infrastructure.exchange.exchange_gateway import ExchangeGateway
+from ..performance.profiling.latency_histogram import latency_registry
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +102,7 @@ class StrategyBase(ABC):
         """
         order_type = "LIMIT" if price else "MARKET"
         logger.info(f"[{self.name}] Placing BUY {order_type} on {symbol}: {quantity} @ {price or 'Market'}")
+        latency_registry.mark_decision()
         
         response = await self.exchange.create_order(
             symbol=symbol,
@@ -143,6 +145,7 @@ class StrategyBase(ABC):
         """
         order_type = "LIMIT" if price else "MARKET"
         logger.info(f"[{self.name}] Placing SELL {order_type} on {symbol}: {quantity} @ {price or 'Market'}")
+        latency_registry.mark_decision()
         
         response = await self.exchange.create_order(
             symbol=symbol,
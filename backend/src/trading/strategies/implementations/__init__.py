@@ -1,11 +1,70 @@
-"""Strategy implementations package."""
-from .scalping import ScalpingStrategy
-from .grid_trading import GridTradingStrategy
-from .trend_following import TrendFollowingStrategy
-from .mean_reversion import MeanReversionStrategy
-from .dca import DCAStrategy
-from .arbitrage import ArbitrageStrategy
-from .high_frequency_test import HighFrequencyTestStrategy
+"""Strategy implementations package.
+
+Modules are imported on first use. ``STRATEGY_MANIFEST`` records where
+each built-in strategy lives, so the registry can list them without
+importing pandas/pandas_ta; add new strategies there.
+"""
+import importlib
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass(frozen=True)
+class StrategySpec:
+    """Location and listing metadata of a built-in strategy."""
+    module: str
+    class_name: str
+    description: str
+
+
+# Keyed by the class's ``name`` attribute
+STRATEGY_MANIFEST: Dict[str, StrategySpec] = {
+    "Scalping": StrategySpec(
+        "scalping", "ScalpingStrategy",
+        "Executes multiple high-speed trades to capture small price changes using tight moving average crossovers.",
+    ),
+    "Grid Trading": StrategySpec(
+        "grid_trading", "GridTradingStrategy",
+        "Profits from volatility by placing a net of buy and sell orders at fixed price levels. Best for ranging markets.",
+    ),
+    "Trend Following": StrategySpec(
+        "trend_following", "TrendFollowingStrategy",
+        "Identifies and follows market momentum. Buys when the trend is up (Golden Cross) and sells when it reverses.",
+    ),
+    "Mean Reversion": StrategySpec(
+        "mean_reversion", "MeanReversionStrategy",
+        "Assumes high/low prices will return to the average. Buys when oversold (RSI < 30) and sells when overbought (RSI > 70).",
+    ),
+    "DCA": StrategySpec(
+        "dca", "DCAStrategy",
+        "Reduces the impact of volatility by buying a fixed amount of asset at regular intervals, regardless of price.",
+    ),
+    "Arbitrage": StrategySpec(
+        "arbitrage", "ArbitrageStrategy",
+        "Exploits price differences of the same asset across different markets or pairs to generate risk-free profit.",
+    ),
+    "HighFrequencyTest": StrategySpec(
+        "high_frequency_test", "HighFrequencyTestStrategy",
+        "Test strategy that alternates LONG/SHORT every few ticks to generate maximum trades quickly. FOR TESTING ONLY!",
+    ),
+}
+
+_CLASS_MODULES = {spec.class_name: spec.module for spec in STRATEGY_MANIFEST.values()}
+
+
+def load_strategy_class(spec: StrategySpec) -> type:
+    """Import the module of ``spec`` and return its strategy class."""
+    module = importlib.import_module(f"{__name__}.{spec.module}")
+    return getattr(module, spec.class_name)
+
+
+def __getattr__(name: str):
+    # ``from .implementations import ScalpingStrategy`` keeps working, lazily
+    module = _CLASS_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module}"), name)
+
 
 __all__ = [
     "ScalpingStrategy",
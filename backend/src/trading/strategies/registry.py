@@ -1,54 +1,38 @@
-import importlib
 import inspect
-import pkgutil
 import logging
-from typing import Dict, List, Type, Any
-from pathlib import Path
+from typing import Dict, List, Type, Any, Optional
 from .base import StrategyBase
+from .implementations import STRATEGY_MANIFEST, StrategySpec, load_strategy_class
 
 logger = logging.getLogger(__name__)
 
 class StrategyRegistry:
-    def __init__(self, strategies_dir: str = "implementations"):
+    def __init__(self, manifest: Optional[Dict[str, StrategySpec]] = None):
         """
         Initialize the registry.
         
+        Built-in strategies are only listed here; each module (and the
+        pandas/pandas_ta it pulls in) is imported the first time its class
+        is requested.
+        
         Args:
-            strategies_dir: Directory containing strategy implementations (relative to this file)
+            manifest: Built-in strategies by name (defaults to STRATEGY_MANIFEST)
         """
         self.strategies: Dict[str, Type[StrategyBase]] = {}
-        self._strategies_dir = strategies_dir
-        self._discover_strategies()
-
-    def _discover_strategies(self):
-        """Dynamically discover strategy classes in the implementations directory."""
-        current_dir = Path(__file__).parent
-        impl_dir = current_dir / self._strategies_dir
-        
-        if not impl_dir.exists():
-            print(f"DEBUG: Strategies directory {impl_dir} not found")
-            return
+        self._manifest = dict(STRATEGY_MANIFEST if manifest is None else manifest)
 
-        print(f"DEBUG: Scanning strategies in {impl_dir}")
-        # Import all modules in the directory
-        for item in impl_dir.iterdir():
-            if item.is_file() and item.suffix == ".py" and item.name != "__init__.py":
-                module_name = f"{__package__}.{self._strategies_dir}.{item.stem}"
-                # module_name = f"trading.strategies.{self._strategies_dir}.{item.stem}"
-                print(f"DEBUG: Loading module {module_name}")
-                try:
-                    module = importlib.import_module(module_name)
-                    # Scan for StrategyBase subclasses
-                    for name, obj in inspect.getmembers(module):
-                        if (inspect.isclass(obj) and 
-                            issubclass(obj, StrategyBase) and 
-                            obj is not StrategyBase):
-                            
-                            print(f"DEBUG: Registering {name}")
-                            self.register(obj)
-                except Exception as e:
-                    print(f"DEBUG: Failed to load strategy from {item.name}: {e}")
-                    logger.error(f"Failed to load strategy from {item.name}: {e}")
+    def _load(self, name: str) -> Optional[Type[StrategyBase]]:
+        """Import a built-in strategy from the manifest and register it."""
+        spec = self._manifest.get(name)
+        if spec is None:
+            return None
+        try:
+            strategy_cls = load_strategy_class(spec)
+        except Exception as e:
+            logger.error(f"Failed to load strategy {name!r} from {spec.module}: {e}")
+            return None
+        self.register(strategy_cls)
+        return strategy_cls
 
     def register(self, strategy_cls: Type[StrategyBase]):
         """Register a strategy class."""
@@ -58,6 +42,10 @@ class StrategyRegistry:
         else:
             logger.warning(f"Strategy class {strategy_cls} missing 'name' attribute")
 
+    def names(self) -> List[str]:
+        """Names of all strategies, loaded or not."""
+        return list(dict.fromkeys([*self._manifest, *self.strategies]))
+
     def list_strategies(self) -> List[Dict[str, Any]]:
         """List all available strategies with their metadata."""
         return [
@@ -65,7 +53,7 @@ class StrategyRegistry:
                 "id": name, # using name as ID for now
                 "name": name,
                 "type": name, # Type is same as name
-                "description": getattr(cls, 'description', 'No description available'),
+                "description": self._description(name),
                 # Add mock stats for now until true stats are implemented
                 "status": "inactive",
                 "activeBots": 0,
@@ -78,11 +66,16 @@ class StrategyRegistry:
                 "profitFactor": 0,
                 "avgHoldTime": "-"
             }
-            for name, cls in self.strategies.items()
+            for name in self.names()
         ]
 
-    def get_strategy_class(self, name: str) -> Type[StrategyBase]:
-        return self.strategies.get(name)
+    def _description(self, name: str) -> str:
+        if name in self.strategies:
+            return getattr(self.strategies[name], 'description', 'No description available')
+        return self._manifest[name].description
+
+    def get_strategy_class(self, name: str) -> Optional[Type[StrategyBase]]:
+        return self.strategies.get(name) or self._load(name)
 
     def register_dynamic_strategy(self, code: str, strategy_name: str = None) -> bool:
         """
@@ -118,7 +111,7 @@ class StrategyRegistry:
             exec_locals = {}
             
             # 2. Execute Code
-            print(f"DEBUG: Compiling dynamic strategy code...")
+            logger.debug("Compiling dynamic strategy code")
             exec(code, exec_globals, exec_locals)
             
             # 3. Find and Register Strategy Class
@@ -132,7 +125,7 @@ class StrategyRegistry:
                     
                     # If we expect a specific name, ensure it matches or force it?
                     # Ideally, strategy code defines correct name.
-                    print(f"DEBUG: Found dynamic strategy class: {name} (Name={found_name})")
+                    logger.debug(f"Found dynamic strategy class: {name} (Name={found_name})")
                     
                     self.register(obj)
                     found = True
@@ -145,7 +138,6 @@ class StrategyRegistry:
             
         except Exception as e:
             logger.error(f"Failed to register dynamic strategy: {e}", exc_info=True)
-            print(f"ERROR: Dynamic Strategy Compilation Failed: {e}")
             return False
 
 # Global registry instance
@@ -0,0 +1,20 @@
+"""
+Performance benchmarks for the backend hot paths.
+
+Skipped by the regular suite; run from backend/:
+
+    pytest tests/benchmarks --benchmark                  # compare with baseline.json
+    pytest tests/benchmarks --benchmark --benchmark-save  # record a new baseline
+
+Each benchmark repeats until at least half a second is measured and its
+throughput is that of the median round. Timings depend on the machine:
+each baseline entry records the host it was measured on (CPU model and
+cores, OS, Python) and a calibration loop time, throughput is only
+compared on that host, scaled by how much slower the calibration loop
+runs now, and elsewhere only allocations are checked. Timing regressions
+are reported but only fail the run with --benchmark-strict-timings (or
+BENCHMARK_STRICT_TIMINGS=1), meant for a pinned CI runner with its own
+baseline. The committed baseline comes from the development container
+(see the ``host`` of each entry). Allocation changes under 0.1 MB are ignored. Persistence benchmarks need Postgres
+(BENCHMARK_DATABASE_URL, else TEST_DATABASE_URL) and are skipped without it.
+"""
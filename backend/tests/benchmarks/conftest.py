@@ -0,0 +1,140 @@
+"""Benchmark fixtures: measurement, baseline comparison and local stand-ins."""
+
+import asyncio
+import os
+from typing import List
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.trading.infrastructure.persistence.database import Base
+from src.trading.infrastructure.persistence import models  # noqa: F401  (register tables)
+
+from ..conftest import TEST_DATABASE_URL
+from .data import alternating_strategy, candles_1m, run_backtest
+from .harness import (
+    MEMORY_METRICS,
+    TIMING_METRICS,
+    BenchResult,
+    format_table,
+    host_fingerprint,
+    load_baseline,
+    measure,
+    regressions,
+    save_baseline,
+)
+
+_results: List[BenchResult] = []
+_other_host: List[str] = []
+_timing_regressions: List[str] = []
+
+
+@pytest.fixture
+def bench(request):
+    """Measure a callable, record the result and fail on a baseline regression.
+
+    Timing regressions only fail with ``--benchmark-strict-timings``;
+    otherwise they are listed in the summary.
+    """
+    config = request.config
+    saving = config.getoption("--benchmark-save")
+    threshold = config.getoption("--benchmark-threshold")
+    strict_timings = config.getoption("--benchmark-strict-timings")
+    baseline = {} if saving else load_baseline()
+    host = host_fingerprint()
+
+    async def run(name: str, fn, **options) -> BenchResult:
+        result = await measure(name, fn, **options)
+        _results.append(result)
+        if name in baseline:
+            if baseline[name].get("host") != host:
+                _other_host.append(name)
+            found = regressions(result, baseline[name], threshold, host, metrics=MEMORY_METRICS)
+            timings = regressions(result, baseline[name], threshold, host, metrics=TIMING_METRICS)
+            if strict_timings:
+                found += timings
+            elif timings:
+                _timing_regressions.append(f"{name}: " + "; ".join(timings))
+            if found:
+                pytest.fail(f"{name} regressed: " + "; ".join(found))
+        return result
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _results:
+        return
+    terminalreporter.write_sep("=", "benchmarks")
+    for line in format_table(_results):
+        terminalreporter.write_line(line)
+    if _other_host:
+        terminalreporter.write_line(
+            f"timings not compared (baseline from another host): {', '.join(_other_host)}"
+        )
+    if _timing_regressions:
+        terminalreporter.write_line("timing regressions (not failed without --benchmark-strict-timings):")
+        for line in _timing_regressions:
+            terminalreporter.write_line(f"  {line}")
+    if config.getoption("--benchmark-save"):
+        save_baseline(_results)
+        terminalreporter.write_line(f"baseline updated for {len(_results)} benchmarks")
+
+
+@pytest.fixture(scope="session")
+def backtest_results():
+    """Results of a busy run (~1000 trades) for the metrics and persistence benchmarks."""
+    return asyncio.run(run_backtest(candles_1m(), alternating_strategy(hold=10, every=20)))
+
+
+@pytest.fixture
+async def pg_session():
+    """Session on Postgres inside a transaction that is rolled back.
+
+    Foreign key triggers are off in that transaction (needs a superuser,
+    as in the test container) so results and candles can be written
+    without seeding users, strategies and connections first.
+    """
+    url = os.getenv("BENCHMARK_DATABASE_URL", TEST_DATABASE_URL)
+    engine = create_async_engine(url, poolclass=NullPool)
+    try:
+        connection = await engine.connect()
+    except (OSError, SQLAlchemyError) as e:
+        await engine.dispose()
+        pytest.skip(f"Postgres unavailable: {e}")
+
+    transaction = await connection.begin()
+    try:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(text("SET LOCAL session_replication_role = replica"))
+    except DBAPIError as e:
+        await transaction.rollback()
+        await connection.close()
+        await engine.dispose()
+        pytest.skip(f"Cannot prepare benchmark database: {e}")
+
+    session = AsyncSession(bind=connection, expire_on_commit=False, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        await session.close()
+        await transaction.rollback()
+        await connection.close()
+        await engine.dispose()
+
+
+@pytest.fixture
+async def fake_redis_client():
+    """``RedisClient`` backed by fakeredis (with Lua support via lupa)."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    from src.trading.infrastructure.cache.redis_client import RedisClient
+
+    client = RedisClient()
+    client._redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    client._is_connected = True
+    yield client
+    await client._redis.aclose()
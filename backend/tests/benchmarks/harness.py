@@ -0,0 +1,224 @@
+"""Timing, memory and baseline comparison for the benchmarks."""
+
+import inspect
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from src.trading.performance.profiling.latency_histogram import LatencyHistogram
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+# metric -> (higher is better, multiple of the regression threshold allowed,
+# absolute change always allowed)
+COMPARED_METRICS = {
+    # Median round; the tail of a few rounds is too noisy to gate on, so p99 is only reported
+    "throughput": (True, 1, 0.0),
+    # A few KB more of a tiny peak is a large ratio but no regression
+    "alloc_peak_mb": (False, 1, 0.1),
+}
+# Only comparable on the machine the baseline was recorded on, and only
+# fail a run on a pinned runner (--benchmark-strict-timings); elsewhere they are reported
+TIMING_METRICS = ("throughput",)
+MEMORY_METRICS = tuple(metric for metric in COMPARED_METRICS if metric not in TIMING_METRICS)
+
+# Rounds repeat until this much time is measured, so fast benchmarks are
+# not judged on a few sub-millisecond samples
+MIN_MEASURE_TIME = 0.5  # seconds
+MAX_ROUNDS = 500
+
+
+@dataclass
+class BenchResult:
+    """One benchmark: ``throughput`` is units (candles, messages, jobs...) per second
+    of the median round."""
+    name: str
+    unit: str
+    rounds: int
+    throughput: float
+    p50_ms: float
+    p99_ms: float
+    alloc_peak_mb: float  # Python allocations during one round (tracemalloc)
+    rss_peak_mb: float  # process high-water mark after the benchmark
+    calibration_ms: float  # calibration loop right after the timed rounds (see ``calibrate``)
+
+
+def peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+
+async def _call(fn: Callable, args: tuple) -> Any:
+    result = fn(*args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def measure(
+    name: str,
+    fn: Callable,
+    *,
+    units: int = 1,
+    unit: str = "op",
+    rounds: int = 10,
+    warmup: int = 1,
+    setup: Optional[Callable[[], Any]] = None,
+    min_time: float = MIN_MEASURE_TIME,
+    max_rounds: int = MAX_ROUNDS,
+) -> BenchResult:
+    """Time ``fn`` (sync or async) over at least ``rounds`` calls.
+
+    Calls repeat until ``min_time`` seconds are measured (at most
+    ``max_rounds`` calls). ``setup`` runs untimed before each call and its
+    return value is passed to ``fn``, for inputs a call consumes or
+    mutates. Memory is measured in one extra traced round so tracing does
+    not skew the timings.
+    """
+    def arguments() -> tuple:
+        return (setup(),) if setup else ()
+
+    for _ in range(warmup):
+        await _call(fn, arguments())
+
+    histogram = LatencyHistogram()
+    timings = []
+    while len(timings) < rounds or (histogram.total < min_time and len(timings) < max_rounds):
+        args = arguments()
+        started = time.perf_counter()
+        await _call(fn, args)
+        timings.append(time.perf_counter() - started)
+        histogram.record(timings[-1])
+
+    calibration_ms = calibrate()
+
+    args = arguments()
+    tracemalloc.start()
+    try:
+        await _call(fn, args)
+        _, alloc_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchResult(
+        name=name,
+        unit=unit,
+        rounds=len(timings),
+        throughput=units / statistics.median(timings),
+        p50_ms=histogram.percentile(50) * 1000,
+        p99_ms=histogram.percentile(99) * 1000,
+        alloc_peak_mb=alloc_peak / 2 ** 20,
+        rss_peak_mb=peak_rss_mb(),
+        calibration_ms=calibration_ms,
+    )
+
+
+def host_fingerprint() -> str:
+    """CPU model, core count, OS and Python of this machine, as recorded with a baseline."""
+    cpu = platform.processor() or platform.machine()
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            cpu = next(line.split(":", 1)[1].strip() for line in cpuinfo if line.startswith("model name"))
+    except (OSError, StopIteration):
+        pass
+    return f"{cpu} x{os.cpu_count()}, {platform.system()} {platform.machine()}, Python {platform.python_version()}"
+
+
+def _calibration_workload() -> int:
+    total = 0
+    table = {}
+    for i in range(20000):
+        table[i % 512] = total
+        total += i * i % 7
+    return total + len(sorted(table.values()))
+
+
+def calibrate() -> float:
+    """Milliseconds of a fixed pure-Python workload on this machine right now.
+
+    Recorded with the baseline; the ratio to the current value scales the
+    expected timings, so a host that is uniformly slower today (frequency
+    scaling, noisy neighbours) is not read as a regression.
+    """
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < 5 or time.perf_counter() - started < MIN_MEASURE_TIME:
+        round_started = time.perf_counter()
+        _calibration_workload()
+        timings.append(time.perf_counter() - round_started)
+    return statistics.median(timings) * 1000
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, Dict[str, Any]]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baseline(results: List[BenchResult], path: Path = BASELINE_PATH) -> None:
+    """Merge results into the baseline file (benchmarks not run keep their entry)."""
+    baseline = load_baseline(path)
+    host = host_fingerprint()
+    for result in results:
+        baseline[result.name] = {metric: round(getattr(result, metric), 4) for metric in COMPARED_METRICS}
+        baseline[result.name]["host"] = host
+        baseline[result.name]["calibration_ms"] = round(result.calibration_ms, 4)
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def regressions(
+    result: BenchResult,
+    baseline: Dict[str, Any],
+    threshold: float,
+    host: Optional[str] = None,
+    metrics: Iterable[str] = tuple(COMPARED_METRICS),
+) -> List[str]:
+    """Those of ``metrics`` worse than the baseline by more than ``threshold`` (relative).
+
+    Timings are only compared when the baseline was recorded on ``host``;
+    on another machine only allocations are. Expected timings are scaled
+    by how much slower the calibration loop ran than when the baseline was
+    recorded.
+    """
+    speed = 1.0
+    if result.calibration_ms and baseline.get("calibration_ms"):
+        speed = baseline["calibration_ms"] / result.calibration_ms
+    found = []
+    for metric in metrics:
+        higher_is_better, scale, floor = COMPARED_METRICS[metric]
+        expected = baseline.get(metric)
+        if not expected:
+            continue
+        if metric in TIMING_METRICS:
+            if host is not None and baseline.get("host") != host:
+                continue
+            expected = expected * speed if higher_is_better else expected / speed
+        actual = getattr(result, metric)
+        if abs(actual - expected) <= floor:
+            continue
+        change = (actual - expected) / expected
+        if (-change if higher_is_better else change) > threshold * scale:
+            found.append(f"{metric} {actual:.4g} vs baseline {expected:.4g} ({change:+.0%})")
+    return found
+
+
+def format_table(results: List[BenchResult]) -> List[str]:
+    lines = [f"{'benchmark':<34} {'throughput':>21} {'p50 ms':>9} {'p99 ms':>9} {'alloc MB':>9} {'RSS MB':>8}"]
+    for r in results:
+        lines.append(
+            f"{r.name:<34} {r.throughput:>12.0f} {r.unit + '/s':<8} {r.p50_ms:>9.2f} {r.p99_ms:>9.2f}"
+            f" {r.alloc_peak_mb:>9.2f} {r.rss_peak_mb:>8.0f}"
+        )
+    return lines
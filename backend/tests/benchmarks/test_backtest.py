@@ -0,0 +1,55 @@
+"""Backtest engine, resampling and metrics benchmarks."""
+import pytest
+
+from src.trading.domain.backtesting import BacktestConfig, BacktestRun
+from src.trading.infrastructure.backtesting.backtest_engine import BacktestEngine
+from src.trading.infrastructure.backtesting.metrics_calculator import MetricsCalculator
+from src.trading.infrastructure.backtesting.timeframe_utils import resample_candles_to_htf
+
+from .data import CANDLE_COUNT, alternating_strategy, candles_1m
+
+CANDLES = candles_1m()
+
+
+def engine_run(**config):
+    """Fresh engine and candle copies per round, so rounds do not share state."""
+    def setup():
+        engine = BacktestEngine(BacktestConfig(symbol="BTCUSDT", **config))
+        return engine, [dict(candle) for candle in CANDLES]
+
+    async def run(state):
+        engine, candles = state
+        return await engine.run_backtest(candles, alternating_strategy(), BacktestRun(symbol="BTCUSDT"))
+
+    return setup, run
+
+
+async def test_engine_single_timeframe(bench):
+    setup, run = engine_run()
+    await bench("backtest_engine_1m", run, setup=setup, units=CANDLE_COUNT, unit="bar", rounds=5)
+
+
+async def test_engine_multi_timeframe(bench):
+    setup, run = engine_run(signal_timeframe="15m", condition_timeframes=["1h", "4h"])
+    await bench("backtest_engine_15m_1h_4h", run, setup=setup, units=CANDLE_COUNT, unit="bar", rounds=5)
+
+
+@pytest.mark.parametrize("timeframe", ["15m", "1h"])
+async def test_resample_candles_to_htf(bench, timeframe):
+    await bench(
+        f"resample_1m_to_{timeframe}", lambda: resample_candles_to_htf(CANDLES, timeframe),
+        units=CANDLE_COUNT, unit="bar",
+    )
+
+
+async def test_metrics_calculator(bench, backtest_results):
+    trades, curve = backtest_results.trades, backtest_results.equity_curve
+    calculator = MetricsCalculator()
+
+    await bench(
+        "metrics_calculator",
+        lambda: calculator.calculate_performance_metrics(
+            trades, curve, backtest_results.initial_capital, backtest_results.duration_days
+        ),
+        units=len(trades), unit="trade", rounds=20,
+    )
@@ -0,0 +1,42 @@
+"""Repository write benchmarks against Postgres (skipped when unreachable)."""
+import itertools
+from dataclasses import replace
+from datetime import timedelta
+from uuid import uuid4
+
+from src.trading.domain.backtesting import BacktestRun, BacktestStatus
+from src.trading.infrastructure.backtesting.repository import BacktestRepository
+from src.trading.infrastructure.persistence.repositories.market_data_repository import CandleRepository
+
+from .data import START, domain_candles
+
+BATCH = 2000  # 13 columns per row stays under the 32767 bind parameter limit
+
+
+async def test_candle_save_batch(bench, pg_session):
+    repository = CandleRepository(pg_session)
+    rounds = itertools.count()
+
+    def next_batch():
+        # A new time range each round: inserts, not conflict updates
+        return domain_candles(BATCH, start=START + timedelta(minutes=BATCH * next(rounds)))
+
+    await bench("candle_save_batch", repository.save_batch, setup=next_batch, units=BATCH, unit="row", rounds=5)
+
+
+async def test_backtest_save_results(bench, pg_session, backtest_results):
+    repository = BacktestRepository(pg_session)
+
+    def new_run():
+        # Trades are keyed by their own id, so each round saves fresh copies
+        results = replace(backtest_results, trades=[replace(trade, id=uuid4()) for trade in backtest_results.trades])
+        return BacktestRun(id=uuid4(), symbol="BTCUSDT", status=BacktestStatus.COMPLETED, results=results)
+
+    async def save(run):
+        await repository._save_results(run)
+        await pg_session.flush()
+
+    await bench(
+        "backtest_save_results", save, setup=new_run,
+        units=len(backtest_results.trades), unit="trade", rounds=5,
+    )
@@ -0,0 +1,53 @@
+"""WebSocket fan-out and job queue throughput benchmarks."""
+from datetime import datetime
+
+from src.trading.infrastructure.jobs.job_queue import JobQueue
+from src.trading.infrastructure.websocket.connection_manager import StreamType, Subscription, SubscriptionStatus
+from src.trading.infrastructure.websocket.websocket_manager import WebSocketManager
+
+SUBSCRIBERS = 500
+JOBS = 500
+
+
+class NullWebSocket:
+    """Connection that accepts frames without a network round trip."""
+
+    def __init__(self):
+        self.sent = 0
+
+    async def send_text(self, text: str):
+        self.sent += 1
+
+
+async def test_websocket_price_fan_out(bench):
+    manager = WebSocketManager()
+    sockets = [NullWebSocket() for _ in range(SUBSCRIBERS)]
+    for i, websocket in enumerate(sockets):
+        user_id = f"user-{i}"
+        manager.connection_manager.add_connection(f"conn-{i}", websocket, user_id)
+        manager.connection_manager.add_subscription(user_id, Subscription(
+            user_id=user_id, stream_type=StreamType.PRICE, symbol="BTCUSDT", filters={},
+            status=SubscriptionStatus.CONNECTED, created_at=datetime.utcnow(),
+        ))
+    ticker = {"symbol": "BTCUSDT", "price": 50000.0, "volume": 1234.5, "price_change_percent": 0.42}
+
+    result = await bench(
+        "websocket_price_fan_out", lambda: manager.broadcast_price_update("BTCUSDT", ticker),
+        units=SUBSCRIBERS, unit="msg", rounds=50,
+    )
+    assert sockets[0].sent == result.rounds + 2  # warmup + rounds + traced round
+
+
+async def test_job_queue_enqueue_dequeue(bench, fake_redis_client):
+    queue = JobQueue(prefix="bench")
+    queue.redis = fake_redis_client
+
+    async def cycle():
+        for i in range(JOBS):
+            await queue.enqueue("bench_job", {"i": i})
+        for _ in range(JOBS):
+            job = await queue.dequeue("bench-worker")
+            await queue.complete_job(job)
+
+    await bench("job_queue_enqueue_dequeue", cycle, units=JOBS, unit="job", rounds=5)
+    assert await queue.dequeue("bench-worker") is None
@@ -0,0 +1,21 @@
+"""Cold start benchmark: importing the application in a fresh interpreter."""
+import os
+from pathlib import Path
+
+from src.trading.performance.profiling.import_report import format_report, import_report
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+async def test_app_cold_import(bench, monkeypatch):
+    # Same module path as run.sh
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join([str(BACKEND_DIR), str(BACKEND_DIR / "src")]))
+    reports = []
+
+    def cold_import():
+        reports.append(import_report("src.trading.app", cwd=str(BACKEND_DIR)))
+
+    await bench("app_cold_import", cold_import, unit="start", rounds=5)
+
+    report = reports[-1]
+    assert not report.watched(), "\n".join(format_report(report, top=10))
@@ -40,6 +40,27 @@ TEST_REDIS_URL = os.getenv("TEST_REDIS_URL", "redis://localhost:6380/0")
 _test_run_data = set()
 
 
+def pytest_addoption(parser):
+    """Benchmark options (see tests/benchmarks)."""
+    group = parser.getgroup("benchmarks")
+    group.addoption("--benchmark", action="store_true", default=False,
+                    help="Run tests/benchmarks and compare with the stored baseline")
+    group.addoption("--benchmark-save", action="store_true", default=False,
+                    help="Rewrite the benchmark baseline instead of comparing")
+    group.addoption("--benchmark-threshold", type=float, default=0.25,
+                    help="Allowed relative regression before a benchmark fails")
+    group.addoption("--benchmark-strict-timings", action="store_true",
+                    default=bool(os.getenv("BENCHMARK_STRICT_TIMINGS")),
+                    help="Fail on timing regressions too (pinned runner); otherwise they are only reported")
+
+
+def pytest_ignore_collect(collection_path, config):
+    """Benchmarks are slow and only collected with --benchmark."""
+    if collection_path.name == "benchmarks" and not config.getoption("--benchmark"):
+        return True
+    return None
+
+
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
     """Create event loop for async tests."""
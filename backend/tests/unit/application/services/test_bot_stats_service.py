@@ -0,0 +1,180 @@
+"""
+Unit tests for incremental Bot Stats Service.
+"""
+import uuid
+import pytest
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from src.trading.application.services.bot_stats_service import (
+    BotStatsService,
+    STAT_FIELDS,
+    apply_trade,
+)
+
+
+def stats_row(version: int = 0, **overrides):
+    """Result row for the stats SELECT."""
+    values = {"stats_version": version, **{field: 0 for field in STAT_FIELDS}}
+    values["total_pnl"] = Decimal("0")
+    values.update(overrides)
+    row = MagicMock()
+    row._mapping = values
+    result = MagicMock()
+    result.one_or_none.return_value = row
+    return result
+
+
+def update_result(rowcount: int):
+    result = MagicMock()
+    result.rowcount = rowcount
+    return result
+
+
+@pytest.fixture
+def mock_db_session():
+    """Create mock database session."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def stats_service(mock_db_session):
+    return BotStatsService(mock_db_session)
+
+
+class TestApplyTrade:
+    """Test folding single trades into stats."""
+
+    def test_replay_matches_history_aggregation(self):
+        """Test counters and streaks over a sequence of trades."""
+        stats = {field: 0 for field in STAT_FIELDS}
+        for pnl in [Decimal("1"), Decimal("2"), Decimal("-1"), None, Decimal("0"), Decimal("5")]:
+            stats = apply_trade(stats, pnl)
+
+        assert stats["total_trades"] == 6
+        assert stats["total_pnl"] == Decimal("7")
+        assert stats["winning_trades"] == 3
+        # Zero P&L is a loss, missing P&L is neither
+        assert stats["losing_trades"] == 2
+        assert stats["current_win_streak"] == 1
+        assert stats["current_loss_streak"] == 0
+        assert stats["max_win_streak"] == 2
+        assert stats["max_loss_streak"] == 3
+
+    def test_does_not_mutate_input(self):
+        """Test that the input stats are left untouched."""
+        stats = {field: 0 for field in STAT_FIELDS}
+        apply_trade(stats, Decimal("10"))
+        assert stats["total_trades"] == 0
+
+
+class TestIncrementalUpdate:
+    """Test compare-and-set stats updates."""
+
+    @pytest.mark.asyncio
+    async def test_update_is_one_read_and_one_write(self, stats_service, mock_db_session):
+        """Test that a trade close no longer reads the trade history."""
+        mock_db_session.execute.side_effect = [
+            stats_row(version=7, total_trades=3, winning_trades=2, current_win_streak=2, max_win_streak=2),
+            update_result(1),
+        ]
+
+        ok = await stats_service.update_stats_on_trade_close(str(uuid.uuid4()), Decimal("4.5"))
+
+        assert ok is True
+        assert mock_db_session.execute.call_count == 2
+        params = mock_db_session.execute.call_args.args[0].compile().params
+        assert params["stats_version"] == 8
+        assert params["stats_version_1"] == 7
+        assert params["total_trades"] == 4
+        assert params["current_win_streak"] == 3
+        mock_db_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_conflict_is_retried_from_fresh_state(self, stats_service, mock_db_session):
+        """Test that a lost race re-reads and re-applies the trade."""
+        mock_db_session.execute.side_effect = [
+            stats_row(version=1, total_trades=1),
+            update_result(0),
+            stats_row(version=2, total_trades=2),
+            update_result(1),
+        ]
+
+        ok = await stats_service.update_stats_on_trade_close(str(uuid.uuid4()), Decimal("-1"))
+
+        assert ok is True
+        params = mock_db_session.execute.call_args.args[0].compile().params
+        assert params["total_trades"] == 3
+        assert params["stats_version"] == 3
+
+    @pytest.mark.asyncio
+    async def test_no_commit_inside_caller_transaction(self, stats_service, mock_db_session):
+        """Test that commit=False leaves the transaction to the caller."""
+        mock_db_session.execute.side_effect = [stats_row(), update_result(1)]
+
+        await stats_service.update_stats_on_trade_close(str(uuid.uuid4()), Decimal("1"), commit=False)
+
+        mock_db_session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_missing_bot(self, stats_service, mock_db_session):
+        """Test that an unknown bot is reported, not created."""
+        missing = MagicMock()
+        missing.one_or_none.return_value = None
+        mock_db_session.execute.side_effect = [missing]
+
+        assert await stats_service.update_stats_on_trade_close(str(uuid.uuid4()), Decimal("1")) is False
+
+
+class TestReconcile:
+    """Test drift detection against the trades table."""
+
+    @pytest.mark.asyncio
+    async def test_only_drifted_bots_are_replayed(self, stats_service, mock_db_session):
+        """Test that bots whose counters agree are not replayed."""
+        in_sync, drifted = uuid.uuid4(), uuid.uuid4()
+        totals = MagicMock()
+        totals.all.return_value = [
+            SimpleNamespace(bot_id=in_sync, total_trades=2, total_pnl=Decimal("3"), winning_trades=1, losing_trades=1),
+            SimpleNamespace(bot_id=drifted, total_trades=5, total_pnl=Decimal("1"), winning_trades=3, losing_trades=2),
+        ]
+        bots = MagicMock()
+        bots.all.return_value = [
+            SimpleNamespace(id=in_sync, total_trades=2, total_pnl=Decimal("3.00000000"), winning_trades=1, losing_trades=1),
+            SimpleNamespace(id=drifted, total_trades=4, total_pnl=Decimal("0"), winning_trades=2, losing_trades=2),
+        ]
+        mock_db_session.execute.side_effect = [totals, bots]
+        stats_service.recalculate_stats = AsyncMock(return_value={})
+
+        result = await stats_service.reconcile()
+
+        assert result == {"bots_checked": 2, "drifted": [str(drifted)]}
+        stats_service.recalculate_stats.assert_awaited_once_with(str(drifted), commit=False)
+        mock_db_session.commit.assert_awaited_once()
+
+
+class TestPeriodStats:
+    """Test period stats served from the daily P&L rollup."""
+
+    @pytest.mark.asyncio
+    async def test_periods_are_summed_from_one_rollup_read(self, stats_service, mock_db_session):
+        """Test that all periods come from a single query over day rows."""
+        from datetime import datetime, timedelta
+
+        today = datetime.utcnow().date()
+        yesterday = today - timedelta(days=1)
+        days = MagicMock()
+        days.all.return_value = [
+            SimpleNamespace(day=yesterday, pnl=Decimal("-2"), trades=2, wins=0, losses=1, breakeven=1),
+            SimpleNamespace(day=today, pnl=Decimal("5.5"), trades=3, wins=2, losses=1, breakeven=0),
+        ]
+        mock_db_session.execute.return_value = days
+
+        result = await stats_service.get_period_stats(str(uuid.uuid4()))
+
+        assert mock_db_session.execute.await_count == 1
+        assert result["today"] == {"pnl": 5.5, "trades": 3, "wins": 2, "losses": 1}
+        # Breakeven days count as losses, as in the bot's lifetime stats
+        assert result["yesterday"] == {"pnl": -2.0, "trades": 2, "wins": 0, "losses": 2}
+        assert result["this_month"]["trades"] == (5 if yesterday.month == today.month else 3)
@@ -0,0 +1,190 @@
+"""
+Unit tests for Equity Snapshot Service.
+"""
+import uuid
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from src.trading.application.services.equity_snapshot_service import (
+    EquitySnapshotService,
+    position_unrealized_pnl,
+)
+from src.trading.infrastructure.persistence.repositories.equity_snapshot_repository import (
+    bucket_start,
+    resolution_for_range,
+)
+
+
+def rows(values):
+    result = MagicMock()
+    result.all.return_value = values
+    return result
+
+
+def position(user_id, symbol, side, entry, quantity, stored_pnl="0", margin="0"):
+    return SimpleNamespace(
+        user_id=user_id,
+        symbol=symbol,
+        side=side,
+        entry_price=Decimal(entry),
+        quantity=Decimal(quantity),
+        unrealized_pnl=Decimal(stored_pnl),
+        margin_used=Decimal(margin),
+    )
+
+
+@pytest.fixture
+def mock_db_session():
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_prices():
+    prices = MagicMock()
+    prices.get_current_prices = AsyncMock(return_value={"BTCUSDT": {"price": 110.0}})
+    return prices
+
+
+class TestCollect:
+    """Test per-user equity computation."""
+
+    @pytest.mark.asyncio
+    async def test_equity_marks_positions_at_cached_price(self, mock_db_session, mock_prices):
+        """Test balance, unrealized P&L and margin per user."""
+        alice, bob = uuid.uuid4(), uuid.uuid4()
+        mock_db_session.execute.side_effect = [
+            rows([(alice, {"quote_quantity": 1000}), (alice, {"quote_quantity": "500"}), (bob, {})]),
+            rows([(alice, Decimal("-50")), (bob, Decimal("20"))]),
+            rows([
+                position(alice, "BTCUSDT", "LONG", "100", "2", margin="40"),
+                position(bob, "BTCUSDT", "SHORT", "100", "-1"),
+                # No cached price: keep the stored value
+                position(bob, "ETHUSDT", "LONG", "10", "1", stored_pnl="3"),
+            ]),
+        ]
+        service = EquitySnapshotService(mock_db_session, prices=mock_prices)
+
+        snapshots = {s["user_id"]: s for s in await service.collect()}
+
+        assert mock_db_session.execute.await_count == 3
+        mock_prices.get_current_prices.assert_awaited_once_with(["BTCUSDT", "ETHUSDT"])
+        assert snapshots[alice]["balance"] == Decimal("1450")
+        assert snapshots[alice]["unrealized_pnl"] == Decimal("20")
+        assert snapshots[alice]["equity"] == Decimal("1470")
+        assert snapshots[alice]["margin_used"] == Decimal("40")
+        assert snapshots[bob]["unrealized_pnl"] == Decimal("-7")
+        assert snapshots[bob]["equity"] == Decimal("13")
+
+    def test_short_position_gains_when_price_falls(self):
+        assert position_unrealized_pnl("SHORT", Decimal("100"), Decimal("2"), Decimal("90")) == Decimal("20")
+        assert position_unrealized_pnl("LONG", Decimal("100"), Decimal("2"), Decimal("90")) == Decimal("-20")
+
+
+class TestSnapshot:
+    """Test the periodic snapshot job."""
+
+    @pytest.mark.asyncio
+    async def test_first_snapshot_backfills_only_new_users(self, mock_db_session, mock_prices):
+        """Test that history is backfilled by the job once, when a user first appears."""
+        known, new = uuid.uuid4(), uuid.uuid4()
+        service = EquitySnapshotService(mock_db_session, prices=mock_prices)
+        service.collect = AsyncMock(return_value=[{"user_id": known}, {"user_id": new}])
+        service.backfill = AsyncMock(return_value=3)
+        service._repository = MagicMock()
+        service._repository.without_points = AsyncMock(return_value=[new])
+        service._repository.record = AsyncMock(return_value=2)
+
+        assert await service.snapshot(datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)) == 2
+
+        service._repository.without_points.assert_awaited_once_with([known, new])
+        service.backfill.assert_awaited_once_with(new)
+        mock_db_session.commit.assert_awaited_once()
+
+
+class TestDownsample:
+    """Test tier maintenance."""
+
+    @pytest.mark.asyncio
+    async def test_hour_tier_is_built_before_day_tier(self, mock_db_session, mock_prices):
+        """Test that 1d is folded from an up-to-date 1h tier."""
+        service = EquitySnapshotService(mock_db_session, prices=mock_prices)
+        service._repository = MagicMock()
+        service._repository.downsample = AsyncMock(return_value=1)
+        service._repository.purge_expired = AsyncMock(return_value=5)
+        now = datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+        service._repository.last_bucket = AsyncMock(return_value=now - timedelta(minutes=30))
+
+        result = await service.downsample(now)
+
+        calls = [call.args for call in service._repository.downsample.await_args_list]
+        assert calls == [("1h", now - timedelta(hours=1)), ("1d", now - timedelta(days=1))]
+        assert result == {"1h": 1, "1d": 1, "purged": 5}
+        mock_db_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_catches_up_from_last_bucket(self, mock_db_session, mock_prices):
+        """Test that missed buckets are rebuilt and a first run covers everything."""
+        service = EquitySnapshotService(mock_db_session, prices=mock_prices)
+        service._repository = MagicMock()
+        service._repository.downsample = AsyncMock(return_value=1)
+        service._repository.purge_expired = AsyncMock(return_value=0)
+        now = datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+        stale = now - timedelta(hours=6)
+        service._repository.last_bucket = AsyncMock(side_effect=[stale, None])
+
+        await service.downsample(now)
+
+        calls = [call.args for call in service._repository.downsample.await_args_list]
+        assert calls == [("1h", stale), ("1d", None)]
+
+
+class TestBackfill:
+    """Test equity history built from the daily P&L rollup."""
+
+    @pytest.mark.asyncio
+    async def test_days_before_first_snapshot_are_filled(self, mock_db_session, mock_prices):
+        """Test cumulative balances up to the first recorded day."""
+        user_id = uuid.uuid4()
+        mock_db_session.execute.side_effect = [
+            rows([(user_id, {"quote_quantity": 1000})]),
+            rows([
+                (date(2026, 2, 26), Decimal("10")),
+                (date(2026, 2, 27), Decimal("-30")),
+                # Already covered by snapshots
+                (date(2026, 2, 28), Decimal("5")),
+            ]),
+        ]
+        service = EquitySnapshotService(mock_db_session, prices=mock_prices)
+        service._repository = MagicMock()
+        service._repository.first_timestamp = AsyncMock(
+            return_value=datetime(2026, 2, 28, 9, tzinfo=timezone.utc)
+        )
+        service._repository.insert_missing = AsyncMock(return_value=2)
+
+        assert await service.backfill(user_id) == 2
+
+        snapshots, resolution = service._repository.insert_missing.await_args.args
+        assert resolution == "1d"
+        assert [(s["ts"].day, s["equity"], s["unrealized_pnl"]) for s in snapshots] == [
+            (26, Decimal("1010"), Decimal("0")),
+            (27, Decimal("980"), Decimal("0")),
+        ]
+        mock_db_session.commit.assert_not_awaited()
+
+
+class TestTiers:
+    """Test bucket and tier selection helpers."""
+
+    def test_bucket_start(self):
+        moment = datetime(2026, 3, 1, 12, 34, 56, tzinfo=timezone(timedelta(hours=7)))
+        assert bucket_start(moment, "1m") == datetime(2026, 3, 1, 5, 34, tzinfo=timezone.utc)
+        assert bucket_start(moment, "1h") == datetime(2026, 3, 1, 5, tzinfo=timezone.utc)
+        assert bucket_start(moment, "1d") == datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+    def test_resolution_for_range(self):
+        assert resolution_for_range(timedelta(hours=6)) == "1m"
+        assert resolution_for_range(timedelta(days=30)) == "1h"
+        assert resolution_for_range(timedelta(days=365)) == "1d"
@@ -0,0 +1,28 @@
+"""
+Unit tests for Portfolio Service.
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from application.services.portfolio_service import PortfolioService
+
+
+@pytest.mark.asyncio
+async def test_equity_curve_only_reads_snapshots():
+    """Test that a short history is served as is, without writing a backfill."""
+    ts = datetime.now(timezone.utc) - timedelta(hours=2)
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    session.execute.return_value.all.return_value = [
+        MagicMock(ts=ts, equity=Decimal("100"), balance=Decimal("100"),
+                  unrealized_pnl=Decimal("0"), margin_used=Decimal("0")),
+    ]
+
+    curve = await PortfolioService(session).get_equity_curve(str(uuid4()), days=30, resolution="1d")
+
+    assert curve == [{"timestamp": ts.isoformat(), "equity": 100.0, "unrealized_pnl": 0.0, "drawdown": 0.0}]
+    session.execute.assert_awaited_once()
+    session.commit.assert_not_awaited()
@@ -0,0 +1,295 @@
+"""
+Unit tests for the in-memory Risk Engine.
+"""
+import asyncio
+import uuid
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from src.trading.application.services.risk_engine import (
+    PositionState,
+    RiskEngine,
+    limit_level,
+)
+from src.trading.domain.risk import (
+    CriticalRiskBreachEvent,
+    RiskLimit,
+    RiskLimitType,
+    RiskLimitViolatedEvent,
+    RiskStatus,
+    RiskThreshold,
+)
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+def make_limit(user_id, limit_type, value, symbol=None):
+    return RiskLimit(
+        id=uuid.uuid4(),
+        user_id=user_id,
+        limit_type=limit_type,
+        limit_value=Decimal(value),
+        symbol=symbol,
+        enabled=True,
+        threshold=RiskThreshold(warning_threshold=Decimal("80"), critical_threshold=Decimal("95")),
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def rows(values):
+    result = MagicMock()
+    result.all.return_value = values
+    return result
+
+
+@pytest.fixture
+def user_id():
+    return uuid.uuid4()
+
+
+@pytest.fixture
+def engine():
+    return RiskEngine(prices=AsyncMock())
+
+
+@pytest.fixture
+def events(engine):
+    received = []
+    engine.subscribe(received.append)
+    return received
+
+
+class TestLimitLevel:
+    """Test severity against limit thresholds."""
+
+    def test_levels(self, user_id):
+        limit = make_limit(user_id, RiskLimitType.DAILY_LOSS, "1000")
+        assert limit_level(Decimal("500"), limit) == RiskStatus.NORMAL
+        assert limit_level(Decimal("800"), limit) == RiskStatus.WARNING
+        assert limit_level(Decimal("950"), limit) == RiskStatus.CRITICAL
+        assert limit_level(Decimal("1000"), limit) == RiskStatus.BREACHED
+
+
+class TestIncrementalState:
+    """Test running totals under fills and marks."""
+
+    def test_fills_net_into_one_position(self, engine, user_id):
+        engine.on_fill(user_id, "BTC/USDT", "BUY", Decimal("1"), Decimal("100"), now=NOW)
+        engine.on_fill(user_id, "BTCUSDT", "BUY", Decimal("1"), Decimal("200"), now=NOW)
+        engine.on_fill(user_id, "BTCUSDT", "SELL", Decimal("0.5"), Decimal("250"), now=NOW)
+
+        account = engine.get_account(user_id)
+        position = account.positions["BTCUSDT"]
+        assert position.quantity == Decimal("1.5")
+        assert position.entry_price == Decimal("150")
+        assert account.realized_today == Decimal("50")
+        assert account.balance == Decimal("50")
+
+    def test_margin_follows_position_size(self, engine, user_id):
+        engine.load_account(user_id, [], {
+            "BTCUSDT": PositionState(quantity=Decimal("2"), entry_price=Decimal("100"),
+                                     mark=Decimal("100"), margin_used=Decimal("20")),
+        }, balance=Decimal("1000"), today=NOW.date())
+
+        engine.on_fill(user_id, "BTCUSDT", "BUY", Decimal("1"), Decimal("200"), now=NOW)
+        account = engine.get_account(user_id)
+        assert account.positions["BTCUSDT"].margin_used == Decimal("40")
+        assert account.margin_used == Decimal("40")
+
+        engine.on_fill(user_id, "BTCUSDT", "SELL", Decimal("1.5"), Decimal("200"), now=NOW)
+        assert account.margin_used == Decimal("20")
+
+    def test_totals_follow_marks(self, engine, user_id):
+        engine.load_account(user_id, [], {
+            "BTCUSDT": PositionState(quantity=Decimal("2"), entry_price=Decimal("100"), mark=Decimal("100")),
+            "ETHUSDT": PositionState(quantity=Decimal("-10"), entry_price=Decimal("10"), mark=Decimal("10")),
+        }, balance=Decimal("1000"), today=NOW.date())
+
+        engine.on_mark_price("BTCUSDT", Decimal("110"), now=NOW)
+        engine.on_mark_price("ETHUSDT", Decimal("12"), now=NOW)
+
+        account = engine.get_account(user_id)
+        assert account.exposure == Decimal("340")
+        assert account.unrealized_pnl == Decimal("0")
+        assert account.equity == Decimal("1000")
+
+    def test_closing_fill_removes_holder(self, engine, user_id):
+        engine.on_fill(user_id, "BTCUSDT", "SELL", Decimal("1"), Decimal("100"), now=NOW)
+        engine.on_fill(user_id, "BTCUSDT", "BUY", Decimal("1"), Decimal("90"), now=NOW)
+
+        account = engine.get_account(user_id)
+        assert account.positions == {}
+        assert account.exposure == Decimal("0")
+        assert account.balance == Decimal("10")
+        assert engine.on_mark_price("BTCUSDT", Decimal("1")) == []
+
+
+class TestAlerts:
+    """Test edge-triggered alerts and events."""
+
+    def test_escalation_alerts_once_per_level(self, engine, events, user_id):
+        limit = make_limit(user_id, RiskLimitType.DAILY_LOSS, "100")
+        engine.load_account(user_id, [limit], {
+            "BTCUSDT": PositionState(quantity=Decimal("1"), entry_price=Decimal("1000"), mark=Decimal("1000")),
+        }, balance=Decimal("1000"), today=NOW.date())
+
+        assert [a.severity for a in engine.on_mark_price("BTCUSDT", Decimal("915"), now=NOW)] == [RiskStatus.WARNING]
+        assert engine.on_mark_price("BTCUSDT", Decimal("912"), now=NOW) == []
+        alerts = engine.on_mark_price("BTCUSDT", Decimal("890"), now=NOW)
+
+        assert [a.severity for a in alerts] == [RiskStatus.BREACHED]
+        assert alerts[0].alert_type == "DAILY_LOSS_LIMIT_EXCEEDED"
+        assert alerts[0].risk_limit_id == limit.id
+        assert [type(e) for e in events] == [
+            RiskLimitViolatedEvent, RiskLimitViolatedEvent, CriticalRiskBreachEvent,
+        ]
+        assert events[-1].requires_immediate_action is True
+        assert len(engine.pending_alerts) == 2
+
+    def test_limit_rearms_after_recovery(self, engine, user_id):
+        limit = make_limit(user_id, RiskLimitType.EXPOSURE, "50")
+        engine.load_account(user_id, [limit], {
+            "BTCUSDT": PositionState(quantity=Decimal("1"), entry_price=Decimal("100"), mark=Decimal("100")),
+        }, balance=Decimal("1000"), today=NOW.date())
+
+        assert len(engine.on_mark_price("BTCUSDT", Decimal("600"), now=NOW)) == 1
+        assert engine.on_mark_price("BTCUSDT", Decimal("100"), now=NOW) == []
+        assert len(engine.on_mark_price("BTCUSDT", Decimal("600"), now=NOW)) == 1
+
+    def test_account_position_limit_is_tracked_per_symbol(self, engine, user_id):
+        """Test that a small position does not re-arm a large one's alert."""
+        limit = make_limit(user_id, RiskLimitType.POSITION_SIZE, "1000")
+        engine.load_account(user_id, [limit], {
+            "BTCUSDT": PositionState(quantity=Decimal("1"), entry_price=Decimal("2000"), mark=Decimal("2000")),
+            "ETHUSDT": PositionState(quantity=Decimal("1"), entry_price=Decimal("10"), mark=Decimal("10")),
+        }, balance=Decimal("10000"), today=NOW.date())
+
+        first = engine.on_mark_price("BTCUSDT", Decimal("2001"), now=NOW)
+        engine.on_mark_price("ETHUSDT", Decimal("11"), now=NOW)
+        again = engine.on_mark_price("BTCUSDT", Decimal("2002"), now=NOW)
+
+        assert [a.symbol for a in first] == ["BTCUSDT"]
+        assert again == []
+
+    def test_symbol_limits_only_see_their_symbol(self, engine, user_id):
+        limit = make_limit(user_id, RiskLimitType.EXPOSURE, "10", symbol="ETH/USDT")
+        engine.load_account(user_id, [limit], {
+            "BTCUSDT": PositionState(quantity=Decimal("1"), entry_price=Decimal("500"), mark=Decimal("500")),
+            "ETHUSDT": PositionState(quantity=Decimal("1"), entry_price=Decimal("10"), mark=Decimal("10")),
+        }, balance=Decimal("1000"), today=NOW.date())
+
+        assert engine.on_mark_price("BTCUSDT", Decimal("600"), now=NOW) == []
+        alerts = engine.on_mark_price("ETHUSDT", Decimal("200"), now=NOW)
+        assert [a.symbol for a in alerts] == ["ETH/USDT"]
+
+
+class TestPersistenceAndResync:
+    """Test alert flushing and database resync."""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_alerts_in_one_batch(self, user_id):
+        session = AsyncMock()
+        session.add_all = MagicMock()
+
+        @asynccontextmanager
+        async def session_factory():
+            yield session
+
+        engine = RiskEngine(session_factory=session_factory, prices=AsyncMock())
+        engine.load_account(user_id, [make_limit(user_id, RiskLimitType.DAILY_LOSS, "10")], {}, today=NOW.date())
+        engine.on_fill(user_id, "BTCUSDT", "BUY", Decimal("1"), Decimal("100"), now=NOW)
+        engine.on_fill(user_id, "BTCUSDT", "SELL", Decimal("1"), Decimal("50"), now=NOW)
+
+        assert await engine.flush_alerts() == 1
+        assert len(session.add_all.call_args.args[0]) == 1
+        session.commit.assert_awaited_once()
+        assert engine.pending_alerts == []
+
+    @staticmethod
+    def resync_results(user_id, limit, alerts=None):
+        """Query results of one resync, in order; alerts only for accounts not yet loaded."""
+        limits = MagicMock()
+        limits.scalars.return_value.all.return_value = [SimpleNamespace(
+            id=limit.id, user_id=user_id, limit_type="EXPOSURE", limit_value=Decimal("50"), symbol=None,
+            enabled=True, warning_threshold=Decimal("80"), critical_threshold=Decimal("95"),
+            created_at=NOW, updated_at=NOW, violations_data=[],
+        )]
+        positions = [
+            SimpleNamespace(user_id=user_id, symbol="BTC/USDT", side="LONG", quantity=Decimal("1"),
+                            entry_price=Decimal("500"), margin_used=Decimal("50")),
+            SimpleNamespace(user_id=user_id, symbol="BTC/USDT", side="LONG", quantity=Decimal("1"),
+                            entry_price=Decimal("700"), margin_used=Decimal("50")),
+        ]
+        results = [
+            limits,
+            rows([(user_id, {"quote_quantity": 1500})]),
+            rows([(user_id, Decimal("500"), Decimal("-20"))]),
+            rows([]),
+            rows(positions),
+        ]
+        if alerts is not None:
+            results.append(rows(alerts))
+        return results
+
+    @pytest.mark.asyncio
+    async def test_resync_loads_state_and_keeps_levels(self, engine, user_id):
+        limit = make_limit(user_id, RiskLimitType.EXPOSURE, "50")
+        engine._prices.get_current_prices.return_value = {"BTC/USDT": {"price": 550}}
+        session = AsyncMock()
+        session.execute.side_effect = self.resync_results(user_id, limit, alerts=[])
+
+        result = await engine.resync(session, now=NOW)
+
+        account = engine.get_account(user_id)
+        assert result == {"users_checked": 1, "limits_evaluated": 1, "violations_found": 1}
+        assert account.balance == Decimal("2000")
+        assert account.realized_today == Decimal("-20")
+        assert account.positions["BTCUSDT"].quantity == Decimal("2")
+        assert account.positions["BTCUSDT"].entry_price == Decimal("600")
+        assert account.exposure == Decimal("1100")
+        assert len(engine.pending_alerts) == 1
+
+        session.execute.side_effect = self.resync_results(user_id, limit)
+        await engine.resync(session, now=NOW)
+        assert len(engine.pending_alerts) == 1
+
+    @pytest.mark.asyncio
+    async def test_restarted_engine_does_not_realert_breached_limits(self, engine, user_id):
+        """Test that levels are seeded from unacknowledged alerts on first load."""
+        limit = make_limit(user_id, RiskLimitType.EXPOSURE, "50")
+        engine._prices.get_current_prices.return_value = {"BTC/USDT": {"price": 550}}
+        session = AsyncMock()
+        session.execute.side_effect = self.resync_results(
+            user_id, limit, alerts=[(user_id, limit.id, None, "WARNING"), (user_id, limit.id, None, "BREACHED")]
+        )
+
+        result = await engine.resync(session, now=NOW)
+
+        assert result["violations_found"] == 1
+        assert engine.get_account(user_id).levels == {(limit.id, None): RiskStatus.BREACHED}
+        assert engine.pending_alerts == []
+
+    @pytest.mark.asyncio
+    async def test_start_resyncs_in_this_process_until_stopped(self):
+        """Test that the engine loads limits itself instead of relying on a worker job."""
+        session = AsyncMock()
+
+        @asynccontextmanager
+        async def session_factory():
+            yield session
+
+        engine = RiskEngine(session_factory=session_factory, prices=AsyncMock())
+        engine.resync = AsyncMock(return_value={})
+
+        engine.start(interval=3600)
+        engine.start(interval=3600)
+        await asyncio.sleep(0)
+        await engine.stop()
+
+        engine.resync.assert_awaited_once_with(session)
+        assert engine._resync_task is None
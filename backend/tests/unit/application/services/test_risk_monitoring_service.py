@@ -17,10 +17,10 @@ from application.services.risk_monitoring_service import (
     AlertSeverity,
     AlertType
 )
-from trading.infrastructure.persistence.models.core_models import (
+from trading.infrastructure.persistence.models import (
     PositionModel, BotModel, RiskLimitModel, RiskAlertModel
 )
-from trading.domain.bot.enums import BotStatus
+from trading.domain.bot import BotStatus
 
 
 @pytest.fixture
@@ -182,7 +182,7 @@ class TestExposureBreakdown:
         """Test successful exposure breakdown calculation."""
         risk_service._get_user_positions = AsyncMock(return_value=sample_positions)
         risk_service._get_portfolio_value = AsyncMock(return_value=200000.0)
-        risk_service._get_asset_exposure_limit = AsyncMock(return_value=25.0)
+        risk_service._get_asset_exposure_limits = AsyncMock(return_value={})
         
         result = await risk_service.get_exposure_breakdown(user_id=1)
         
@@ -217,7 +217,7 @@ class TestExposureBreakdown:
         """Test exposure breakdown with zero portfolio value."""
         risk_service._get_user_positions = AsyncMock(return_value=sample_positions)
         risk_service._get_portfolio_value = AsyncMock(return_value=0.0)
-        risk_service._get_asset_exposure_limit = AsyncMock(return_value=25.0)
+        risk_service._get_asset_exposure_limits = AsyncMock(return_value={})
         
         result = await risk_service.get_exposure_breakdown(user_id=1)
         
@@ -506,11 +506,11 @@ class TestEdgeCases:
         assert count == 0
     
     @pytest.mark.asyncio
-    async def test_get_asset_exposure_limit_no_custom_limit(self, risk_service):
-        """Test asset exposure limit with no custom limit set."""
+    async def test_get_asset_exposure_limits_no_custom_limit(self, risk_service):
+        """Test asset exposure limits with no custom limit set."""
         mock_result = Mock()
-        mock_result.scalars.return_value.first.return_value = None
+        mock_result.all.return_value = []
         risk_service.db.execute = AsyncMock(return_value=mock_result)
         
-        limit = await risk_service._get_asset_exposure_limit(user_id=1, asset="BTC")
-        assert limit == 25.0  # Default limit
\ No newline at end of file
+        limits = await risk_service._get_asset_exposure_limits(user_id=1)
+        assert limits == {}
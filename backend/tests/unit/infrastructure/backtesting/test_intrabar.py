@@ -0,0 +1,151 @@
+"""Unit tests for intrabar exit resolution."""
+
+import pytest
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+
+from src.trading.domain.backtesting import BacktestConfig, BacktestPosition, TradeDirection
+from src.trading.infrastructure.backtesting.backtest_engine import BacktestEngine
+from src.trading.infrastructure.backtesting import intrabar
+from src.trading.infrastructure.backtesting.intrabar import (
+    DailyIntrabarPath,
+    IntrabarPath,
+    cache_dir,
+    first_reach,
+    load_trade_path,
+)
+
+MINUTE = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def trades(*prices, start=MINUTE, step_seconds=5):
+    return IntrabarPath.from_rows(
+        (start + timedelta(seconds=i * step_seconds), price) for i, price in enumerate(prices)
+    )
+
+
+def long_engine(path, **position):
+    engine = BacktestEngine(
+        BacktestConfig(symbol="BTCUSDT", price_path_assumption="neutral", limit_fill_policy="touch"),
+        intrabar_path=path,
+    )
+    engine.current_position = BacktestPosition(
+        symbol="BTCUSDT",
+        direction=TradeDirection.LONG,
+        quantity=Decimal("1"),
+        avg_entry_price=Decimal("100"),
+        isolated_margin=Decimal("100"),
+        **position,
+    )
+    return engine
+
+
+class TestIntrabarPath:
+    """Test the columnar trade path."""
+
+    def test_window_selects_one_minute(self):
+        path = trades(1, 2, 3, start=MINUTE - timedelta(seconds=5), step_seconds=30)
+
+        assert path.window(MINUTE).tolist() == [2.0, 3.0]
+        assert path.window(MINUTE + timedelta(minutes=5)).tolist() == []
+
+    def test_save_and_load_memory_mapped(self, tmp_path):
+        trades(10, 11, 12).save(tmp_path / "BTCUSDT")
+
+        loaded = IntrabarPath.load(tmp_path / "BTCUSDT")
+
+        assert isinstance(loaded.price, np.memmap)
+        assert loaded.window(MINUTE).tolist() == [10.0, 11.0, 12.0]
+
+    def test_first_reach_touch_and_cross(self):
+        prices = np.array([100.0, 99.0, 98.0, 101.0])
+
+        assert first_reach(prices, Decimal("99"), below=True) == 1
+        assert first_reach(prices, Decimal("99"), below=True, strict=True) == 2
+        assert first_reach(prices, Decimal("101"), below=False) == 3
+        assert first_reach(prices, Decimal("102"), below=False) is None
+
+
+class TestDailyCache:
+    """Test the per-day trade path cache."""
+
+    def test_window_reads_the_day_of_the_minute(self):
+        path = DailyIntrabarPath({MINUTE.date(): trades(10, 11)})
+
+        assert path.window(MINUTE).tolist() == [10.0, 11.0]
+        assert path.window(MINUTE + timedelta(days=1)).tolist() == []
+        assert len(path) == 2
+
+    @pytest.mark.asyncio
+    async def test_complete_days_are_cached_once_and_shared_by_ranges(self, tmp_path):
+        @asynccontextmanager
+        async def session_factory():
+            yield None
+
+        read = AsyncMock(side_effect=lambda session, symbol, start, end: trades(10, 11, start=start))
+        with patch.object(intrabar.settings, "BACKTEST_INTRABAR_CACHE_DIR", str(tmp_path)), \
+                patch.object(intrabar, "_read_path", read), \
+                patch("src.trading.infrastructure.persistence.database.AsyncSessionLocal", session_factory):
+            first = await load_trade_path("btcusdt", datetime(2026, 3, 1, 6, tzinfo=timezone.utc),
+                                          datetime(2026, 3, 2, 6, tzinfo=timezone.utc))
+            # A different range over the same days reads nothing new
+            second = await load_trade_path("BTCUSDT", datetime(2026, 3, 1, 12, tzinfo=timezone.utc),
+                                           datetime(2026, 3, 2, 1, tzinfo=timezone.utc))
+            assert cache_dir("btcusdt", date(2026, 3, 1)) == tmp_path / "BTCUSDT" / "2026-03-01"
+
+        assert read.await_count == 2
+        assert [call.args[2] for call in read.await_args_list] == [
+            datetime(2026, 3, 1, tzinfo=timezone.utc), datetime(2026, 3, 2, tzinfo=timezone.utc),
+        ]
+        assert sorted(p.name for p in (tmp_path / "BTCUSDT").iterdir()) == ["2026-03-01", "2026-03-02"]
+        assert isinstance(second.days[date(2026, 3, 1)].price, np.memmap)
+        assert len(first) == len(second) == 4
+
+
+class TestIntrabarExits:
+    """Test SL/TP ordering inside a minute."""
+
+    def test_take_profit_hit_before_stop(self):
+        """Test that the path overrides the neutral SL-first assumption."""
+        engine = long_engine(trades(100, 104, 106, 97, 94), stop_loss=Decimal("95"), take_profit=Decimal("105"))
+
+        bar_only = long_engine(None, stop_loss=Decimal("95"), take_profit=Decimal("105"))
+        assert bar_only._check_exit(Decimal("106"), Decimal("94"), Decimal("100"), MINUTE)[0] == Decimal("95")
+        assert engine._check_exit(Decimal("106"), Decimal("94"), Decimal("100"), MINUTE) == (Decimal("105"), "Take Profit")
+
+    def test_stop_loss_hit_before_liquidation(self):
+        """Test that a stop above the liquidation price triggers first, at the print that reached it."""
+        engine = long_engine(trades(100, 96, 80), stop_loss=Decimal("95"))
+
+        assert engine._check_exit(Decimal("100"), Decimal("0.1"), Decimal("100"), MINUTE) == (Decimal("80"), "Stop Loss")
+        assert engine.intrabar_resolved_bars == 1
+
+    def test_stop_touched_exactly_fills_at_the_level(self):
+        engine = long_engine(trades(100, 95, 97), stop_loss=Decimal("95"))
+
+        assert engine._check_exit(Decimal("100"), Decimal("94"), Decimal("100"), MINUTE) == (Decimal("95"), "Stop Loss")
+
+    def test_take_profit_fills_at_the_level_not_the_print(self):
+        engine = long_engine(trades(100, 110), take_profit=Decimal("105"))
+
+        assert engine._check_exit(Decimal("110"), Decimal("99"), Decimal("100"), MINUTE) == (Decimal("105"), "Take Profit")
+
+    def test_minute_without_trades_keeps_bar_decision(self):
+        engine = long_engine(trades(100, 106, start=MINUTE - timedelta(minutes=2)),
+                             stop_loss=Decimal("95"), take_profit=Decimal("105"))
+
+        assert engine._check_exit(Decimal("106"), Decimal("94"), Decimal("100"), MINUTE) == (
+            Decimal("95"), "Stop Loss (Neutral assumption)"
+        )
+        assert engine.intrabar_resolved_bars == 0
+
+    def test_untouched_minute_skips_the_path(self):
+        engine = long_engine(None, stop_loss=Decimal("95"), take_profit=Decimal("105"))
+        engine.intrabar_path = IntrabarPath(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
+        engine.intrabar_path.window = pytest.fail
+
+        assert engine._check_exit(Decimal("101"), Decimal("99"), Decimal("100"), MINUTE) is None
@@ -0,0 +1,81 @@
+"""Test cases for the per-user analytics cache."""
+import json
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock
+
+from src.trading.infrastructure.cache.redis_client import RedisClient
+from src.trading.infrastructure.cache.analytics_cache import AnalyticsCache
+
+
+class TestAnalyticsCache:
+    """Test cases for report caching and per-user invalidation."""
+    
+    @pytest.fixture
+    def redis_client(self):
+        client = AsyncMock(spec=RedisClient)
+        client.get = AsyncMock(return_value=None)
+        client.set = AsyncMock(return_value=True)
+        client.index_add = AsyncMock(return_value=True)
+        client.delete_indexed = AsyncMock(return_value=3)
+        return client
+    
+    @pytest.fixture
+    def cache(self, redis_client):
+        cache = AnalyticsCache(default_ttl=120)
+        cache.redis = redis_client
+        return cache
+    
+    @pytest.mark.asyncio
+    async def test_miss_computes_and_indexes_under_user(self, cache, redis_client):
+        """Test that a computed report is stored and listed in the user's index."""
+        loader = AsyncMock(return_value={"win_rate": 50.0})
+        params = {"start": date(2024, 1, 1), "end": date(2024, 2, 1)}
+        
+        result = await cache.get_or_compute("u1", "overview", params, loader)
+        
+        assert result == {"win_rate": 50.0}
+        loader.assert_awaited_once()
+        index_key, cache_key, ttl = redis_client.index_add.call_args.args
+        assert index_key == "analytics:user:u1:__keys__"
+        assert cache_key.startswith("analytics:user:u1:overview:")
+        assert ttl == 120
+        assert redis_client.set.call_args.args[0] == cache_key
+    
+    @pytest.mark.asyncio
+    async def test_hit_skips_loader(self, cache, redis_client):
+        """Test that a cached report is returned without recomputing."""
+        redis_client.get.return_value = json.dumps([{"month": "2024-01"}])
+        loader = AsyncMock()
+        
+        result = await cache.get_or_compute("u1", "monthly", {"months": 12}, loader)
+        
+        assert result == [{"month": "2024-01"}]
+        loader.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_non_finite_ratios_match_on_hit_and_miss(self, cache, redis_client):
+        """Test that an infinite ratio comes back as None whether computed or cached."""
+        loader = AsyncMock(return_value={"profit_factor": float("inf"), "sortino_ratio": float("nan")})
+        
+        computed = await cache.get_or_compute("u1", "risk", {}, loader)
+        redis_client.get.return_value = redis_client.set.call_args.args[1]
+        cached = await cache.get_or_compute("u1", "risk", {}, loader)
+        
+        assert computed == cached == {"profit_factor": None, "sortino_ratio": None}
+    
+    @pytest.mark.asyncio
+    async def test_range_is_part_of_the_key(self, cache, redis_client):
+        """Test that different ranges are cached separately."""
+        loader = AsyncMock(return_value={})
+        await cache.get_or_compute("u1", "overview", {"start": date(2024, 1, 1)}, loader)
+        await cache.get_or_compute("u1", "overview", {"start": date(2024, 1, 2)}, loader)
+        
+        first, second = [call.args[1] for call in redis_client.index_add.call_args_list]
+        assert first != second
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_user_index(self, cache, redis_client):
+        """Test that invalidation deletes every key of the user."""
+        assert await cache.invalidate("u1") == 3
+        redis_client.delete_indexed.assert_awaited_once_with("analytics:user:u1:__keys__")
@@ -273,19 +273,18 @@ class TestBaseCache:
     @pytest.mark.asyncio
     async def test_clear_prefix(self, cache, mock_redis):
         """Test clear_prefix operation."""
-        mock_redis.keys.return_value = ["test:key1", "test:key2", "test:key3"]
-        mock_redis.delete.return_value = 3
+        mock_redis.delete_pattern = AsyncMock(return_value=3)
         
         count = await cache.clear_prefix("*")
         
         assert count == 3
-        mock_redis.keys.assert_called_once_with("test:*")
-        mock_redis.delete.assert_called_once_with("test:key1", "test:key2", "test:key3")
+        mock_redis.delete_pattern.assert_called_once_with("test:*")
+        mock_redis.keys.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_clear_prefix_no_keys(self, cache, mock_redis):
         """Test clear_prefix when no keys match."""
-        mock_redis.keys.return_value = []
+        mock_redis.delete_pattern = AsyncMock(return_value=0)
         
         count = await cache.clear_prefix("*")
         
@@ -295,7 +294,12 @@ class TestBaseCache:
     @pytest.mark.asyncio
     async def test_get_stats(self, cache, mock_redis):
         """Test get_stats operation."""
-        mock_redis.keys.return_value = ["test:key1", "test:key2", "test:key3"]
+        async def scan_iter(match="*", count=1000):
+            assert match == "test:*"
+            for key in ["test:key1", "test:key2", "test:key3"]:
+                yield key
+        
+        mock_redis.scan_iter = scan_iter
         
         async def mock_ttl_side_effect(key):
             if key == "test:key1":
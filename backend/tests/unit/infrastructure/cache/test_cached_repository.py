@@ -0,0 +1,82 @@
+"""Test cases for CachedRepository tag-based invalidation."""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.trading.infrastructure.cache.redis_client import RedisClient
+from src.trading.infrastructure.cache.cached_repository import (
+    CachedRepository,
+    CacheInvalidationMixin,
+)
+
+
+class TestCachedRepositoryInvalidation:
+    """Test cases for index-driven invalidation."""
+    
+    @pytest.fixture
+    def redis_client(self):
+        """Patch the shared Redis client used for tag sets."""
+        client = AsyncMock(spec=RedisClient)
+        client.set = AsyncMock(return_value=True)
+        client.get = AsyncMock(return_value=None)
+        client.index_add = AsyncMock(return_value=True)
+        client.delete_indexed = AsyncMock(return_value=2)
+        client.delete_pattern = AsyncMock(return_value=1)
+        with patch(
+            "src.trading.infrastructure.cache.cached_repository.cache_service.redis_client",
+            client,
+        ):
+            yield client
+    
+    @pytest.fixture
+    def cached_repo(self, redis_client):
+        repository = AsyncMock()
+        repository.get_by_id = AsyncMock(return_value={"id": "1"})
+        return CachedRepository(
+            repository=repository,
+            cache=redis_client,
+            cache_prefix="exchange",
+        )
+    
+    @pytest.mark.asyncio
+    async def test_cached_results_are_tagged(self, cached_repo, redis_client):
+        """Test that every cached key is recorded in the prefix tag set."""
+        await cached_repo.get_by_id_cached("1", ttl=120)
+        
+        redis_client.index_add.assert_called_once()
+        index_key, cache_key, ttl = redis_client.index_add.call_args[0]
+        assert index_key == "exchange:__keys__"
+        assert cache_key.startswith("exchange:get_by_id")
+        assert ttl == 120
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_all_uses_tag_set(self, cached_repo, redis_client):
+        """Test that full invalidation deletes tagged keys only."""
+        deleted = await cached_repo.invalidate_cache()
+        
+        assert deleted == 2
+        redis_client.delete_indexed.assert_called_once_with("exchange:__keys__")
+        redis_client.keys.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_pattern_uses_scan(self, cached_repo, redis_client):
+        """Test that narrower patterns fall back to SCAN."""
+        await cached_repo.invalidate_cache("find:*")
+        
+        redis_client.delete_pattern.assert_called_once_with("exchange:find:*")
+        redis_client.keys.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_write_invalidation_drops_tag_set(self, redis_client):
+        """Test that writes invalidate through the tag set."""
+        mixin = CacheInvalidationMixin()
+        mixin._cache_prefix = "exchange"
+        
+        with patch(
+            "src.trading.infrastructure.cache.cached_repository.invalidation_listener.publish",
+            AsyncMock(return_value=1),
+        ) as publish:
+            await mixin._invalidate_cache_after_write("1")
+        
+        redis_client.delete_indexed.assert_called_once_with("exchange:__keys__")
+        redis_client.keys.assert_not_called()
+        publish.assert_called_once_with("exchange")
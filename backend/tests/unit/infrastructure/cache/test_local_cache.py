@@ -0,0 +1,190 @@
+"""Test cases for the in-process L1 cache tier."""
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.trading.infrastructure.cache import local_cache as local_cache_module
+from src.trading.infrastructure.cache.local_cache import LocalCache, SingleFlight
+from src.trading.infrastructure.cache.cached_repository import CachedRepository
+from src.trading.infrastructure.cache.invalidation import CacheInvalidationListener
+
+
+class TestLocalCache:
+    """Test cases for LocalCache."""
+
+    def test_get_miss_and_hit(self):
+        """Test hit/miss accounting."""
+        cache = LocalCache(max_size=4, default_ttl=60)
+
+        assert cache.get("a") is None
+        cache.set("a", {"id": 1})
+        assert cache.get("a") == {"id": 1}
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = LocalCache(max_size=2, default_ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after their TTL."""
+        cache = LocalCache(max_size=4, default_ttl=60)
+        with patch.object(local_cache_module.time, "monotonic", return_value=100.0):
+            cache.set("a", 1, ttl=5)
+        with patch.object(local_cache_module.time, "monotonic", return_value=106.0):
+            assert cache.get("a") is None
+
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_ttl_capped_by_default_ttl(self):
+        """Test that L1 never holds an entry longer than its default TTL."""
+        cache = LocalCache(max_size=4, default_ttl=10)
+        with patch.object(local_cache_module.time, "monotonic", return_value=100.0):
+            cache.set("a", 1, ttl=600)
+        with patch.object(local_cache_module.time, "monotonic", return_value=111.0):
+            assert cache.get("a") is None
+
+    def test_set_skipped_after_invalidation(self):
+        """Test that a value loaded before an invalidation is not cached."""
+        cache = LocalCache(max_size=4, default_ttl=60)
+        generation = cache.generation
+        cache.clear()
+
+        assert cache.set("a", "stale", generation=generation) is False
+        assert cache.get("a") is None
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_collapse(self):
+        """Test that concurrent callers share one loader call."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*[flight.do("key", loader) for _ in range(10)])
+
+        assert results == ["value"] * 10
+        assert calls == 1
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_waiters(self):
+        """Test that a failed load raises for every waiter."""
+        flight = SingleFlight()
+
+        async def loader():
+            await asyncio.sleep(0.01)
+            raise ValueError("db down")
+
+        results = await asyncio.gather(
+            *[flight.do("key", loader) for _ in range(3)], return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+
+class TestCachedRepositoryLocalTier:
+    """Test cases for CachedRepository with an L1 tier."""
+
+    @pytest.fixture
+    def redis_cache(self):
+        cache = AsyncMock()
+        cache.get = AsyncMock(return_value=None)
+        cache.set = AsyncMock(return_value=True)
+        return cache
+
+    @pytest.fixture
+    def repository(self):
+        repo = AsyncMock()
+        repo.get_by_id = AsyncMock(return_value={"id": "s1", "name": "grid"})
+        return repo
+
+    @pytest.fixture
+    def cached_repo(self, repository, redis_cache):
+        local_cache_module._local_caches.pop("strategy_test", None)
+        return CachedRepository(
+            repository=repository,
+            cache=redis_cache,
+            cache_prefix="strategy_test",
+            local_cache_size=16,
+            local_cache_ttl=30,
+        )
+
+    @pytest.mark.asyncio
+    async def test_l1_hit_skips_redis(self, cached_repo, repository, redis_cache):
+        """Test that the second call is served from L1."""
+        first = await cached_repo.get_by_id_cached("s1")
+        second = await cached_repo.get_by_id_cached("s1")
+
+        assert first == {"id": "s1", "name": "grid"}
+        assert second == {"id": "s1", "name": "grid"}
+        repository.get_by_id.assert_called_once()
+        redis_cache.get.assert_called_once()
+        assert cached_repo.local_cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_populates_l1(self, cached_repo, repository, redis_cache):
+        """Test that an L2 hit is copied into L1."""
+        redis_cache.get.return_value = json.dumps({"id": "s1", "name": "cached"})
+
+        await cached_repo.get_by_id_cached("s1")
+        result = await cached_repo.get_by_id_cached("s1")
+
+        assert result == {"id": "s1", "name": "cached"}
+        redis_cache.get.assert_called_once()
+        repository.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cold_key_single_flight(self, cached_repo, repository):
+        """Test that concurrent misses hit the repository once."""
+        async def slow_get_by_id(**kwargs):
+            await asyncio.sleep(0.01)
+            return {"id": "s1"}
+
+        repository.get_by_id.side_effect = slow_get_by_id
+
+        await asyncio.gather(*[cached_repo.get_by_id_cached("s1") for _ in range(5)])
+
+        repository.get_by_id.assert_called_once()
+
+    def test_invalidation_message_clears_other_process_l1(self, cached_repo):
+        """Test that a message from another process clears the namespace."""
+        cached_repo.local_cache.set("strategy_test:get_by_id:x", {"id": "x"})
+        listener = CacheInvalidationListener()
+
+        listener.handle_message(json.dumps({"namespace": "strategy_test", "origin": "other"}))
+
+        assert len(cached_repo.local_cache) == 0
+        assert listener.messages_received == 1
+
+    def test_invalidation_message_from_self_ignored(self, cached_repo):
+        """Test that a process ignores its own broadcast."""
+        cached_repo.local_cache.set("strategy_test:get_by_id:x", {"id": "x"})
+        listener = CacheInvalidationListener()
+
+        listener.handle_message(
+            json.dumps({"namespace": "strategy_test", "origin": listener.origin})
+        )
+
+        assert len(cached_repo.local_cache) == 1
@@ -1,6 +1,6 @@
 """Test cases for PriceCache."""
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone, timedelta
 import json
 
@@ -233,3 +233,141 @@ class TestPriceCache:
         
         result = await price_cache.get_price_change("UNKNOWN", period_minutes=60)
         assert result is None
+    
+    @pytest.mark.asyncio
+    async def test_set_price_alert_indexes_by_target_price(self, price_cache, mock_redis):
+        """Test that new alerts are added to the symbol's trigger index."""
+        alert_id = await price_cache.set_price_alert(
+            user_id="user1",
+            symbol="BTCUSDT",
+            target_price=50000.0,
+            condition="above"
+        )
+        
+        assert alert_id == "user1:BTCUSDT:above:50000.0"
+        mock_redis.sorted_index_add.assert_called_once_with(
+            "price:alert_index:BTCUSDT:above", {alert_id: 50000.0}, 86400
+        )
+    
+    @pytest.mark.asyncio
+    async def test_shorter_alert_does_not_shorten_index_ttl(self):
+        """Test that the trigger index lives as long as its longest alert."""
+        fakeredis = pytest.importorskip("fakeredis")
+        from src.trading.infrastructure.cache.redis_client import RedisClient
+        
+        client = RedisClient()
+        client._redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        client._is_connected = True
+        cache = PriceCache()
+        cache.redis = client
+        try:
+            await cache.set_price_alert("user1", "BTCUSDT", 50000.0, "above", ttl=30 * 86400)
+            await cache.set_price_alert("user1", "BTCUSDT", 51000.0, "above", ttl=86400)
+            
+            assert await client._redis.ttl("price:alert_index:BTCUSDT:above") > 29 * 86400
+            assert await client._redis.ttl("price:user_alerts:user1") > 29 * 86400
+        finally:
+            await client._redis.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_alerts_stored_before_the_index_still_fire(self):
+        """Test that alerts without an index entry are backfilled on first check."""
+        fakeredis = pytest.importorskip("fakeredis")
+        from src.trading.infrastructure.cache.redis_client import RedisClient
+        
+        client = RedisClient()
+        client._redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        client._is_connected = True
+        cache = PriceCache()
+        cache.redis = client
+        try:
+            # Written the pre-index way: alert key and user set only
+            for condition, target, triggered in (("above", 50000.0, False), ("below", 40000.0, False),
+                                                 ("above", 45000.0, True)):
+                alert_id = f"user1:BTCUSDT:{condition}:{target}"
+                await cache.set(f"alert:{alert_id}", {
+                    "user_id": "user1", "symbol": "BTCUSDT", "target_price": target,
+                    "condition": condition, "triggered": triggered,
+                }, 3600)
+            
+            assert await cache.check_price_alerts("BTCUSDT", 50100.0) == ["user1:BTCUSDT:above:50000.0"]
+            assert await client._redis.zscore("price:alert_index:BTCUSDT:below", "user1:BTCUSDT:below:40000.0") == 40000.0
+            assert await client._redis.ttl("price:alert_index:BTCUSDT:below") > 3500
+            
+            # Another process sees the marker and does not scan again
+            other = PriceCache(alert_mirror_size=0)
+            other.redis = client
+            with patch.object(client, "scan_iter") as scan_iter:
+                assert await other.check_price_alerts("BTCUSDT", 39000.0) == ["user1:BTCUSDT:below:40000.0"]
+            scan_iter.assert_not_called()
+        finally:
+            await client._redis.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_check_price_alerts_range_queries_index(self, price_cache, mock_redis):
+        """Test that only crossed alerts are read when checking a tick."""
+        price_cache.alert_mirror_size = 0
+        alert = {
+            "user_id": "user1",
+            "symbol": "BTCUSDT",
+            "target_price": 50000.0,
+            "condition": "above",
+            "triggered": False
+        }
+        
+        async def zrangebyscore(key, min_score, max_score, withscores=False):
+            if key.endswith(":above"):
+                return [("user1:BTCUSDT:above:50000.0", 50000.0)]
+            return []
+        
+        mock_redis.zrangebyscore.side_effect = zrangebyscore
+        mock_redis.zrem = AsyncMock(return_value=1)
+        mock_redis.get.return_value = json.dumps(alert)
+        
+        triggered = await price_cache.check_price_alerts("BTCUSDT", 50100.0)
+        
+        assert triggered == ["user1:BTCUSDT:above:50000.0"]
+        mock_redis.keys.assert_not_called()
+        mock_redis.get.assert_called_once_with("price:alert:user1:BTCUSDT:above:50000.0")
+        stored = json.loads(mock_redis.set.call_args[0][1])
+        assert stored["triggered"] is True
+        assert stored["triggered_price"] == 50100.0
+    
+    @pytest.mark.asyncio
+    async def test_check_price_alerts_mirror_skips_redis_when_nothing_crossed(
+        self, price_cache, mock_redis
+    ):
+        """Test that the in-process mirror answers ticks that cross nothing."""
+        async def zrange(key, start, end, withscores=False):
+            if key.endswith(":above"):
+                return [("user1:BTCUSDT:above:60000.0", 60000.0)]
+            return [("user1:BTCUSDT:below:40000.0", 40000.0)]
+        
+        mock_redis.zrange = AsyncMock(side_effect=zrange)
+        mock_redis.zrem = AsyncMock(return_value=1)
+        
+        assert await price_cache.check_price_alerts("BTCUSDT", 50000.0) == []
+        assert await price_cache.check_price_alerts("BTCUSDT", 51000.0) == []
+        
+        # Mirror was loaded once and no alert was read or claimed
+        assert mock_redis.zrange.call_count == 2
+        mock_redis.zrem.assert_not_called()
+        mock_redis.get.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_check_price_alerts_skips_alert_claimed_elsewhere(self, price_cache, mock_redis):
+        """Test that an alert already removed from the index is not fired again."""
+        async def zrange(key, start, end, withscores=False):
+            if key.endswith(":below"):
+                return [("user1:BTCUSDT:below:40000.0", 40000.0)]
+            return []
+        
+        mock_redis.zrange = AsyncMock(side_effect=zrange)
+        mock_redis.zrem = AsyncMock(return_value=0)
+        
+        triggered = await price_cache.check_price_alerts("BTCUSDT", 39000.0)
+        
+        assert triggered == []
+        mock_redis.get.assert_not_called()
+        # The local mirror no longer holds the crossed alert
+        assert price_cache._alert_mirror["BTCUSDT"].below == []
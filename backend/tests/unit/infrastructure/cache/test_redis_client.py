@@ -0,0 +1,72 @@
+"""Test cases for RedisClient key iteration helpers."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.trading.infrastructure.cache.redis_client import RedisClient
+
+
+class TestRedisClientScan:
+    """Test cases for SCAN-based helpers."""
+    
+    @pytest.fixture
+    def client(self):
+        """Create RedisClient with a mocked connection."""
+        client = RedisClient()
+        client._is_connected = True
+        client._redis = MagicMock()
+        client._redis.unlink = AsyncMock(side_effect=lambda *keys: len(keys))
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_delete_pattern_unlinks_in_batches(self, client):
+        """Test that matching keys are unlinked in bounded batches."""
+        keys = [f"price:series:S{i}" for i in range(5)]
+        
+        async def scan_iter(match, count):
+            assert match == "price:series:*"
+            for key in keys:
+                yield key
+        
+        client._redis.scan_iter = scan_iter
+        
+        deleted = await client.delete_pattern("price:series:*", batch_size=2)
+        
+        assert deleted == 5
+        assert [len(call.args) for call in client._redis.unlink.call_args_list] == [2, 2, 1]
+        client._redis.keys.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_delete_indexed_removes_listed_keys_and_index(self, client):
+        """Test that an index set drives deletion without scanning the keyspace."""
+        async def sscan_iter(name, match=None, count=1000):
+            assert name == "strategy:__keys__"
+            for key in ["strategy:get_by_id:1", "strategy:get_all"]:
+                yield key
+        
+        client._redis.sscan_iter = sscan_iter
+        
+        deleted = await client.delete_indexed("strategy:__keys__")
+        
+        assert deleted == 2
+        client._redis.unlink.assert_any_call("strategy:get_by_id:1", "strategy:get_all")
+        client._redis.unlink.assert_called_with("strategy:__keys__")
+        client._redis.scan_iter.assert_not_called()
+
+
+class TestRedisClientScripts:
+    """Test cases for Lua script helpers."""
+    
+    @pytest.mark.asyncio
+    async def test_script_registered_once(self):
+        """Test that a script is registered once and reused by SHA."""
+        client = RedisClient()
+        client._is_connected = True
+        client._redis = MagicMock()
+        script = AsyncMock(return_value=1)
+        client._redis.register_script = MagicMock(return_value=script)
+        
+        await client.run_script("return 1", keys=["a"], args=[1])
+        await client.run_script("return 1", keys=["b"], args=[2])
+        
+        client._redis.register_script.assert_called_once_with("return 1")
+        script.assert_called_with(keys=["b"], args=[2])
@@ -0,0 +1,231 @@
+"""Test cases for UserPrincipalCache and cached token verification."""
+import asyncio
+import json
+import uuid
+import pytest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from jose import JWTError
+from sqlalchemy.orm import Session
+
+from src.trading.domain.user import User, Email, HashedPassword
+from src.trading.infrastructure.auth import jwt as jwt_module
+from src.trading.infrastructure.auth.jwt import create_access_token, verify_access_token
+from src.trading.infrastructure.cache import local_cache as local_cache_module
+from src.trading.infrastructure.cache.invalidation import CacheInvalidationListener
+from src.trading.infrastructure.cache.user_principal_cache import UserPrincipalCache
+from src.trading.infrastructure.repositories import user_repository as user_repository_module
+
+
+def make_user(is_active: bool = True) -> User:
+    return User(
+        id=uuid.uuid4(),
+        email=Email("trader@example.com"),
+        password=HashedPassword(value="$2b$12$hash"),
+        full_name="Trader",
+        is_active=is_active,
+        preferences={"theme": "dark"},
+    )
+
+
+class TestUserPrincipalCache:
+    """Test cases for UserPrincipalCache."""
+
+    @pytest.fixture
+    def mock_redis(self):
+        redis_mock = AsyncMock()
+        redis_mock.get = AsyncMock(return_value=None)
+        redis_mock.set = AsyncMock(return_value=True)
+        redis_mock.delete = AsyncMock(return_value=1)
+        return redis_mock
+
+    @pytest.fixture
+    def cache(self, mock_redis):
+        local_cache_module._local_caches.pop(UserPrincipalCache.NAMESPACE, None)
+        cache = UserPrincipalCache()
+        cache.redis = mock_redis
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_miss_returns_none(self, cache):
+        """Test that an unknown user is a miss."""
+        assert await cache.get_user(uuid.uuid4()) is None
+
+    @pytest.mark.asyncio
+    async def test_set_then_get_served_from_l1(self, cache, mock_redis):
+        """Test that a cached user is rebuilt without touching Redis."""
+        user = make_user()
+        await cache.set_user(user)
+
+        cached = await cache.get_user(user.id)
+
+        assert cached.id == user.id
+        assert cached.email.value == "trader@example.com"
+        assert cached.preferences == {"theme": "dark"}
+        mock_redis.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_returns_independent_entities(self, cache):
+        """Test that mutating a returned user does not alter the cache."""
+        user = make_user()
+        await cache.set_user(user)
+
+        first = await cache.get_user(user.id)
+        first.update_profile(full_name="Changed")
+        second = await cache.get_user(user.id)
+
+        assert second.full_name == "Trader"
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_populates_l1(self, cache, mock_redis):
+        """Test that an L2 hit is copied into L1."""
+        user = make_user()
+        mock_redis.get.return_value = json.dumps(UserPrincipalCache._to_dict(user))
+
+        await cache.get_user(user.id)
+        await cache.get_user(user.id)
+
+        mock_redis.get.assert_called_once_with(f"principal:user:{user.id}")
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_both_tiers(self, cache, mock_redis):
+        """Test that invalidation removes the user everywhere."""
+        user = make_user()
+        await cache.set_user(user)
+
+        with patch(
+            "src.trading.infrastructure.cache.user_principal_cache.invalidation_listener.publish",
+            AsyncMock(return_value=1),
+        ) as publish:
+            await cache.invalidate(user.id)
+
+        assert await cache.get_user(user.id) is None
+        mock_redis.delete.assert_called_once_with(f"principal:user:{user.id}")
+        publish.assert_called_once_with("principal", f"user:{user.id}")
+
+    @pytest.mark.asyncio
+    async def test_password_hash_is_not_cached(self, cache, mock_redis):
+        """Test that neither tier holds the password hash."""
+        user = make_user()
+        await cache.set_user(user)
+
+        stored = mock_redis.set.call_args.args[1]
+        assert "password_hash" not in stored and "$2b$" not in stored
+        cached = await cache.get_user(user.id)
+        assert cached.password.value == ""
+        assert not cached.password.verify("anything")
+
+    @pytest.mark.asyncio
+    async def test_invalidate_after_commit_waits_for_commit(self, cache, mock_redis):
+        """Test that invalidation runs on commit, not when registered."""
+        user = make_user()
+        await cache.set_user(user)
+        session = Session()
+
+        with patch(
+            "src.trading.infrastructure.cache.user_principal_cache.invalidation_listener.publish",
+            AsyncMock(return_value=1),
+        ) as publish:
+            cache.invalidate_after_commit(session, user.id)
+            cache.invalidate_after_commit(session, user.id)
+            assert await cache.get_user(user.id) is not None
+
+            session.commit()
+            await asyncio.gather(*cache._tasks)
+
+        assert await cache.get_user(user.id) is None
+        mock_redis.delete.assert_called_once_with(f"principal:user:{user.id}")
+        publish.assert_called_once()
+
+    def test_key_invalidation_message_drops_one_user(self, cache):
+        """Test that another process's message drops only the named user."""
+        cache.local.set("user:a", {"id": "a"})
+        cache.local.set("user:b", {"id": "b"})
+
+        CacheInvalidationListener().handle_message(
+            json.dumps({"namespace": "principal", "key": "user:a", "origin": "other"})
+        )
+
+        assert cache.local.get("user:a") is None
+        assert cache.local.get("user:b") == {"id": "b"}
+
+
+class TestUserRepositoryInvalidation:
+    """Test cases for principal invalidation on user saves."""
+
+    @pytest.fixture
+    def stored(self):
+        user = make_user()
+        return SimpleNamespace(
+            id=user.id, email=user.email.value, password_hash="$2b$12$stored", full_name=user.full_name,
+            timezone=user.timezone, preferences=dict(user.preferences), is_active=True, last_login=None,
+        ), user
+
+    @pytest.fixture
+    def session(self, stored):
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = stored[0]
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        session.flush = AsyncMock()
+        return session
+
+    @pytest.mark.asyncio
+    async def test_last_login_update_keeps_principal(self, stored, session):
+        """Test that a login-only save does not invalidate."""
+        _, user = stored
+        user.last_login_at = datetime.now(timezone.utc)
+
+        with patch.object(user_repository_module, "user_principal_cache") as cache:
+            await user_repository_module.UserRepository(session).save(user)
+
+        cache.invalidate_after_commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cached_user_save_keeps_password_and_invalidates(self, stored, session):
+        """Test that saving a cached principal keeps the hash and invalidates after commit."""
+        model, user = stored
+        cached = UserPrincipalCache._to_entity(UserPrincipalCache._to_dict(user))
+        cached.is_active = False
+
+        with patch.object(user_repository_module, "user_principal_cache") as cache:
+            await user_repository_module.UserRepository(session).save(cached)
+
+        assert model.password_hash == "$2b$12$stored"
+        assert model.is_active is False
+        cache.invalidate_after_commit.assert_called_once_with(session, user.id)
+
+
+class TestVerifyAccessTokenMemo:
+    """Test cases for memoized access-token verification."""
+
+    def test_repeat_verification_skips_decode(self):
+        """Test that a verified token is not decoded again."""
+        user_id = uuid.uuid4()
+        token = create_access_token(user_id)
+
+        assert verify_access_token(token) == user_id
+        with patch.object(jwt_module, "decode_token") as decode:
+            assert verify_access_token(token) == user_id
+        decode.assert_not_called()
+
+    def test_expired_memo_entry_is_rechecked(self):
+        """Test that a memoized token stops verifying once expired."""
+        token = create_access_token(uuid.uuid4(), expires_delta=timedelta(seconds=5))
+        verify_access_token(token)
+        user_id, _ = jwt_module._verified_access_tokens[token]
+        jwt_module._verified_access_tokens[token] = (user_id, 0.0)
+
+        with pytest.raises(JWTError):
+            with patch.object(jwt_module, "decode_token", side_effect=JWTError("expired")):
+                verify_access_token(token)
+        assert token not in jwt_module._verified_access_tokens
+
+    def test_refresh_token_rejected(self):
+        """Test that refresh tokens are still rejected."""
+        token = jwt_module.create_refresh_token(uuid.uuid4())
+
+        with pytest.raises(JWTError):
+            verify_access_token(token)
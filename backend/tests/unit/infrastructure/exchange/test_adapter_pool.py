@@ -0,0 +1,192 @@
+"""Test cases for the pooled exchange adapters."""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.trading.infrastructure.cache import local_cache as local_cache_module
+from src.trading.infrastructure.exchange.adapter_pool import (
+    CREDENTIALS_NAMESPACE,
+    ExchangeAdapterPool,
+)
+
+
+def make_credentials(api_key: str = "key", api_secret: str = "secret") -> dict:
+    return {
+        "api_key": api_key,
+        "api_secret": api_secret,
+        "api_passphrase": None,
+        "is_testnet": True,
+        "exchange_id": 1,
+    }
+
+
+class TestExchangeAdapterPool:
+    """Test cases for ExchangeAdapterPool."""
+
+    @pytest.fixture
+    def factory(self):
+        def build(credentials):
+            adapter = MagicMock()
+            adapter.api_key = credentials["api_key"]
+            adapter.close = AsyncMock()
+            return adapter
+        return MagicMock(side_effect=build)
+
+    @pytest.fixture
+    def pool(self, factory):
+        local_cache_module._local_caches.pop(CREDENTIALS_NAMESPACE, None)
+        return ExchangeAdapterPool(max_concurrency=2, rate_limit=100, adapter_factory=factory)
+
+    @pytest.mark.asyncio
+    async def test_credentials_loaded_once(self, pool):
+        """Test that decrypted credentials are served from memory."""
+        loader = AsyncMock(return_value=make_credentials())
+
+        first = await pool.get_credentials("conn-1", "user-1", loader)
+        second = await pool.get_credentials("conn-1", "user-1", loader)
+
+        assert first == second
+        loader.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_credentials_bound_to_owner(self, pool):
+        """Test that another user's lookup goes back to the loader."""
+        await pool.get_credentials("conn-1", "user-1", AsyncMock(return_value=make_credentials()))
+        loader = AsyncMock(side_effect=ValueError("Connection conn-1 not found"))
+
+        with pytest.raises(ValueError):
+            await pool.get_credentials("conn-1", "user-2", loader)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_credential_loads_collapse(self, pool):
+        """Test that concurrent cold lookups decrypt once."""
+        async def slow_loader():
+            await asyncio.sleep(0.01)
+            return make_credentials()
+
+        loader = AsyncMock(side_effect=slow_loader)
+
+        await asyncio.gather(*[pool.get_credentials("conn-1", "user-1", loader) for _ in range(5)])
+
+        loader.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_adapter_reused_across_leases(self, pool, factory):
+        """Test that the same adapter serves every lease and is not closed."""
+        async with pool.lease("conn-1", make_credentials()) as first:
+            pass
+        async with pool.lease("conn-1", make_credentials()) as second:
+            pass
+
+        assert first is second
+        factory.assert_called_once()
+        first.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rotated_credentials_replace_adapter(self, pool):
+        """Test that new credentials retire the old adapter."""
+        async with pool.lease("conn-1", make_credentials()) as old:
+            pass
+        async with pool.lease("conn-1", make_credentials(api_secret="rotated")) as new:
+            pass
+        await asyncio.sleep(0)
+
+        assert new is not old
+        old.close.assert_called_once()
+        assert len(pool) == 1
+
+    @pytest.mark.asyncio
+    async def test_retired_adapter_closed_after_in_flight_lease(self, pool):
+        """Test that an adapter in use is closed only once released."""
+        async with pool.lease("conn-1", make_credentials()) as adapter:
+            with patch(
+                "src.trading.infrastructure.exchange.adapter_pool.invalidation_listener.publish",
+                AsyncMock(return_value=1),
+            ):
+                await pool.invalidate("conn-1")
+            adapter.close.assert_not_called()
+
+        adapter.close.assert_called_once()
+        assert len(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_credentials_and_broadcasts(self, pool):
+        """Test that invalidation forces a reload everywhere."""
+        loader = AsyncMock(return_value=make_credentials())
+        await pool.get_credentials("conn-1", "user-1", loader)
+
+        with patch(
+            "src.trading.infrastructure.exchange.adapter_pool.invalidation_listener.publish",
+            AsyncMock(return_value=1),
+        ) as publish:
+            await pool.invalidate("conn-1")
+        await pool.get_credentials("conn-1", "user-1", loader)
+
+        assert loader.call_count == 2
+        publish.assert_called_once_with(CREDENTIALS_NAMESPACE)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_after_commit_waits_for_the_commit(self, pool):
+        """Test that a repository write drops the pooled adapter only once committed."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with pool.lease("conn-1", make_credentials()) as adapter:
+            pass
+
+        with patch(
+            "src.trading.infrastructure.exchange.adapter_pool.invalidation_listener.publish",
+            AsyncMock(return_value=1),
+        ):
+            async with AsyncSession(engine) as session:
+                await session.execute(text("SELECT 1"))
+                pool.invalidate_after_commit(session, "conn-1")
+                assert len(pool) == 1
+
+                await session.commit()
+                await asyncio.gather(*pool._tasks)
+
+        adapter.close.assert_called_once()
+        assert len(pool) == 0
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limited_per_connection(self, pool):
+        """Test that leases beyond max_concurrency wait for a slot."""
+        active = 0
+        peak = 0
+
+        async def call():
+            nonlocal active, peak
+            async with pool.lease("conn-1", make_credentials()):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*[call() for _ in range(6)])
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_close_all(self, pool):
+        """Test that shutdown closes every adapter."""
+        async with pool.lease("conn-1", make_credentials()) as first:
+            pass
+        async with pool.lease("conn-2", make_credentials(api_key="other")) as second:
+            pass
+
+        await pool.close_all()
+
+        first.close.assert_called_once()
+        second.close.assert_called_once()
+        assert len(pool) == 0
+
+
+def test_position_service_uses_the_app_pool():
+    """Test that the pool positions lease from is the one the app closes on shutdown."""
+    from trading.application.services import position_service
+    from trading.infrastructure.exchange.adapter_pool import exchange_adapter_pool
+
+    assert position_service.exchange_adapter_pool is exchange_adapter_pool
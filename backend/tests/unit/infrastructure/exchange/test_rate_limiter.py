@@ -0,0 +1,203 @@
+"""Test cases for the Binance rate limiter and the shared async HTTP pool."""
+import sys
+import time
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.trading.infrastructure.exchange.rate_limiter import (
+    BinanceRateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+    request_weight,
+)
+from src.trading.infrastructure.exchange.binance_adapter import BinanceAdapter
+from src.trading.performance.http.async_pool import AsyncHTTPPool, CachingDNSBackend
+from src.trading.shared.errors.infrastructure_errors import ExternalAPIError
+
+BASE_URL = "https://fapi.example.test"
+
+
+def mock_pool(handler, **kwargs) -> AsyncHTTPPool:
+    pool = AsyncHTTPPool(backoff_base=0.0, **kwargs)
+    pool._clients[BASE_URL] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return pool
+
+
+class TestRequestWeight:
+    """Test endpoint weights."""
+
+    def test_klines_scale_with_limit(self):
+        assert request_weight("GET", "/fapi/v1/klines", {"limit": 99}) == 1
+        assert request_weight("GET", "/fapi/v1/klines", {"limit": 500}) == 5
+        assert request_weight("GET", "/fapi/v1/klines", {"limit": 1500}) == 10
+
+    def test_all_symbol_variants_are_heavier(self):
+        assert request_weight("GET", "/fapi/v1/openOrders", {"symbol": "BTCUSDT"}) == 1
+        assert request_weight("GET", "/fapi/v1/openOrders", {}) == 40
+        assert request_weight("GET", "/fapi/v2/account") == 5
+
+
+class TestBinanceRateLimiter:
+    """Test proactive throttling from usage headers."""
+
+    def test_used_weight_header_drains_bucket(self):
+        limiter = BinanceRateLimiter(weight_per_minute=1000, headroom=0.9)
+        response = httpx.Response(200, headers={"X-MBX-USED-WEIGHT-1M": "850"})
+
+        limiter.update(response)
+
+        assert limiter.weight[60].tokens == pytest.approx(50, abs=1)
+        assert limiter.weight[60].delay_for(110) > 0
+
+    def test_order_counts_are_per_account(self):
+        limiter = BinanceRateLimiter(orders_per_10s=100, headroom=1.0)
+
+        limiter.update(httpx.Response(200, headers={"X-MBX-ORDER-COUNT-10S": "100"}), account="a")
+
+        assert limiter.order_buckets("a")[10].tokens <= 0.1
+        assert limiter.order_buckets("b")[10].tokens == 100
+
+    @pytest.mark.asyncio
+    async def test_ban_pauses_every_request(self):
+        limiter = BinanceRateLimiter()
+        limiter.update(httpx.Response(418, headers={"Retry-After": "120"}))
+
+        with patch("src.trading.infrastructure.exchange.rate_limiter.asyncio.sleep", new=AsyncMock()) as sleep:
+            await limiter.acquire("GET", "/fapi/v1/time", {})
+
+        assert sleep.await_args.args[0] == pytest.approx(120, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_bucket_waits_for_refill(self):
+        bucket = TokenBucket(capacity=10, period=1.0)
+        bucket.tokens = 0
+
+        with patch("src.trading.infrastructure.exchange.rate_limiter.asyncio.sleep", new=AsyncMock()) as sleep:
+            await bucket.acquire(5)
+
+        assert sleep.await_args.args[0] == pytest.approx(0.5, abs=0.01)
+
+    def test_limiter_shared_per_host(self):
+        assert get_rate_limiter("https://fapi.binance.com") is get_rate_limiter("https://fapi.binance.com/x")
+        assert get_rate_limiter("https://fapi.binance.com") is not get_rate_limiter("https://demo-fapi.binance.com")
+
+
+class TestAsyncHTTPPool:
+    """Test retry, signing and limiter hooks of the shared pool."""
+
+    @pytest.mark.asyncio
+    async def test_retries_server_errors_and_resigns(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.url.params["attempt"])
+            return httpx.Response(503 if len(seen) < 3 else 200, json={"ok": True})
+
+        attempts = iter(range(10))
+        pool = mock_pool(handler)
+        response = await pool.request(
+            "GET", f"{BASE_URL}/fapi/v1/time",
+            sign=lambda params: {**params, "attempt": next(attempts)},
+        )
+
+        assert response.status_code == 200
+        assert seen == ["0", "1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_post_not_retried_on_server_error(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(502)
+
+        response = await mock_pool(handler).request("POST", f"{BASE_URL}/fapi/v1/order")
+
+        assert response.status_code == 502
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_ban_is_not_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(418, headers={"Retry-After": "60"})
+
+        limiter = BinanceRateLimiter()
+        response = await mock_pool(handler).request("GET", f"{BASE_URL}/fapi/v1/time", limiter=limiter)
+
+        assert response.status_code == 418
+        assert len(calls) == 1
+        assert limiter.blocked_until > time.monotonic() + 50
+
+    @pytest.mark.asyncio
+    async def test_dns_cache_reuses_addresses(self):
+        backend = CachingDNSBackend(ttl=60)
+        loop_getaddrinfo = AsyncMock(return_value=[(2, 1, 6, "", ("10.0.0.1", 443))])
+
+        with patch("asyncio.get_running_loop") as get_loop:
+            get_loop.return_value.getaddrinfo = loop_getaddrinfo
+            assert await backend.resolve("fapi.example.test", 443) == ["10.0.0.1"]
+            assert await backend.resolve("fapi.example.test", 443) == ["10.0.0.1"]
+
+        loop_getaddrinfo.assert_awaited_once()
+
+
+class TestBinanceAdapterTransport:
+    """Test that the adapter goes through the shared pool."""
+
+    @pytest.mark.asyncio
+    async def test_signed_request_uses_pool_and_limiter(self):
+        def handler(request):
+            assert request.headers["X-MBX-APIKEY"] == "key"
+            assert "signature" in request.url.params
+            return httpx.Response(200, json={"listenKey": "abc"}, headers={"X-MBX-USED-WEIGHT-1M": "10"})
+
+        adapter = BinanceAdapter(api_key="key", api_secret="secret", base_url=BASE_URL)
+        adapter._http = mock_pool(handler)
+        adapter._limiter = BinanceRateLimiter()
+
+        assert await adapter.start_user_data_stream() == "abc"
+        assert adapter._limiter.weight[60].tokens <= adapter._limiter.weight[60].capacity - 10
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self):
+        adapter = BinanceAdapter(api_key="", api_secret="", base_url=BASE_URL)
+        adapter._http = mock_pool(lambda request: httpx.Response(400, text='{"code":-1121}'))
+
+        with pytest.raises(ExternalAPIError, match="400"):
+            await adapter.get_ticker_price("BTC/USDT")
+
+
+class TestSingleWeightBudget:
+    """Every Binance caller on the app path shares one limiter and one HTTP pool."""
+
+    def test_bot_adapter_and_client_share_limiter_and_pool(self):
+        """Test that the bot path and the REST client resolve to the same singletons."""
+        from trading.application.services import bot_manager
+        from trading.infrastructure.binance import client
+
+        adapter = sys.modules[bot_manager.BinanceAdapter.__module__]
+        assert adapter.get_rate_limiter is client.get_rate_limiter
+        assert adapter.get_http_pool is client.get_http_pool
+
+    @pytest.mark.asyncio
+    async def test_connection_check_uses_the_app_adapter(self):
+        """Test that credential checks build the adapter whose pool is closed on shutdown."""
+        from application.services.connection_service import ConnectionService
+
+        adapter = AsyncMock()
+        adapter.test_connectivity.return_value = False
+        with patch(
+            "trading.infrastructure.exchange.binance_adapter.BinanceAdapter", return_value=adapter
+        ) as adapter_class, patch(
+            "application.services.connection_service.ExchangeMetadataRepository.find_by_id",
+            AsyncMock(return_value={"code": "BINANCE", "name": "Binance"}),
+        ):
+            result = await ConnectionService(AsyncMock()).test_connection(1, "key", "secret", is_testnet=True)
+
+        adapter_class.assert_called_once()
+        adapter.close.assert_awaited_once()
+        assert result["success"] is False
@@ -0,0 +1,165 @@
+"""Test cases for the symbol registry and quantizers."""
+import asyncio
+import json
+import time
+import pytest
+from decimal import Decimal, ROUND_CEILING
+from unittest.mock import AsyncMock, patch
+
+from src.trading.application.services.order_validator import OrderValidator
+from src.trading.infrastructure.exchange.binance_adapter import BinanceAdapter
+from src.trading.infrastructure.exchange.symbol_registry import (
+    Quantizer,
+    SymbolFilters,
+    SymbolRegistry,
+    is_filter_error,
+)
+from src.trading.shared.errors.infrastructure_errors import ExternalAPIError
+
+BASE_URL = "https://fapi.example.test"
+
+BTCUSDT = {
+    "symbol": "BTCUSDT",
+    "status": "TRADING",
+    "quantityPrecision": 3,
+    "pricePrecision": 2,
+    "filters": [
+        {"filterType": "PRICE_FILTER", "minPrice": "261.10", "maxPrice": "809484", "tickSize": "0.10"},
+        {"filterType": "LOT_SIZE", "minQty": "0.001", "maxQty": "1000", "stepSize": "0.001"},
+        {"filterType": "MARKET_LOT_SIZE", "minQty": "0.001", "maxQty": "120", "stepSize": "0.001"},
+        {"filterType": "MIN_NOTIONAL", "notional": "100"},
+    ],
+}
+DOGEUSDT = {
+    "symbol": "DOGEUSDT",
+    "filters": [
+        {"filterType": "PRICE_FILTER", "tickSize": "0.00005"},
+        {"filterType": "LOT_SIZE", "minQty": "10", "maxQty": "1000000", "stepSize": "10"},
+    ],
+}
+
+
+@pytest.fixture
+def redis():
+    mock = AsyncMock()
+    mock.get.return_value = None
+    return mock
+
+
+@pytest.fixture
+def loader():
+    return AsyncMock(return_value={"symbols": [BTCUSDT, DOGEUSDT]})
+
+
+class TestQuantizer:
+    """Test integer step rounding."""
+
+    def test_fractional_and_whole_steps(self):
+        assert Quantizer.from_step("0.00005").quantize(Decimal("0.123456")) == Decimal("0.12345")
+        assert Quantizer.from_step("0.00005").quantize(Decimal("0.123456"), ROUND_CEILING) == Decimal("0.12350")
+        assert Quantizer.from_step("10").quantize(Decimal("129.9")) == Decimal("120")
+
+    def test_exact_multiples_unchanged(self):
+        quantizer = Quantizer.from_step("0.001")
+        assert quantizer.quantize(Decimal("1.234")) == Decimal("1.234")
+        assert str(quantizer.quantize(Decimal("2"))) == "2.000"
+
+
+class TestSymbolFilters:
+    """Test exchange info parsing."""
+
+    def test_from_exchange(self):
+        filters = SymbolFilters.from_exchange(BTCUSDT)
+
+        assert filters.min_notional == Decimal("100")
+        assert filters.round_quantity(Decimal("0.0129")) == Decimal("0.012")
+        assert filters.round_price(Decimal("65000.17")) == Decimal("65000.2")
+
+    def test_round_trip(self):
+        filters = SymbolFilters.from_exchange(DOGEUSDT)
+        assert SymbolFilters.from_exchange(filters.to_exchange()) == filters
+
+
+class TestSymbolRegistry:
+    """Test loading, sharing and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_loads_once_and_indexes(self, redis, loader):
+        registry = SymbolRegistry(redis=redis)
+
+        results = await asyncio.gather(*[registry.get(BASE_URL, "BTC/USDT", loader) for _ in range(5)])
+
+        assert all(result.symbol == "BTCUSDT" for result in results)
+        assert await registry.get(BASE_URL, "DOGEUSDT", loader) is not None
+        assert await registry.get(BASE_URL, "NOPEUSDT", loader) is None
+        loader.assert_awaited_once()
+        key, payload = redis.set.await_args.args
+        assert key == "exchange_info:fapi.example.test"
+        assert len(json.loads(payload)["symbols"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_uses_shared_copy(self, redis, loader):
+        redis.get.return_value = json.dumps({"loaded_at": time.time(), "symbols": [BTCUSDT]})
+        registry = SymbolRegistry(redis=redis)
+
+        assert (await registry.get(BASE_URL, "BTCUSDT", loader)).tick_size == Decimal("0.10")
+        loader.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_refreshes_after_ttl_and_invalidate(self, redis, loader):
+        registry = SymbolRegistry(ttl=60, redis=redis)
+        await registry.get(BASE_URL, "BTCUSDT", loader)
+
+        with patch("src.trading.infrastructure.exchange.symbol_registry.time.time", return_value=time.time() + 61):
+            await registry.get(BASE_URL, "BTCUSDT", loader)
+        await registry.invalidate(BASE_URL)
+        await registry.get(BASE_URL, "BTCUSDT", loader)
+
+        assert loader.await_count == 3
+        redis.delete.assert_awaited_once_with("exchange_info:fapi.example.test")
+
+    def test_filter_error_codes(self):
+        assert is_filter_error('Binance API error 400: {"code":-4014,"msg":"Price not increased by tick size."}')
+        assert not is_filter_error('Binance API error 400: {"code":-2019,"msg":"Margin is insufficient."}')
+
+
+class TestOrderPath:
+    """Test that orders and validation use the registry."""
+
+    @pytest.fixture
+    def registry(self, redis, loader):
+        registry = SymbolRegistry(redis=redis)
+        with patch("src.trading.infrastructure.exchange.binance_adapter.symbol_registry", registry):
+            yield registry
+
+    @pytest.mark.asyncio
+    async def test_adapter_rounds_order(self, registry, loader):
+        adapter = BinanceAdapter(api_key="k", api_secret="s", base_url=BASE_URL)
+        adapter.get_exchange_info = loader
+        adapter._signed_request = AsyncMock(return_value={"orderId": 1})
+
+        await adapter.create_order("BTC/USDT", "SELL", "LIMIT", Decimal("0.01234"), Decimal("65000.11"))
+
+        params = adapter._signed_request.await_args.args[2]
+        assert params["quantity"] == "0.012"
+        assert params["price"] == "65000.2"
+
+    @pytest.mark.asyncio
+    async def test_filter_rejection_invalidates(self, registry, loader):
+        adapter = BinanceAdapter(api_key="k", api_secret="s", base_url=BASE_URL)
+        adapter.get_exchange_info = loader
+        adapter._signed_request = AsyncMock(side_effect=ExternalAPIError('Binance API error 400: {"code":-4023}'))
+
+        with pytest.raises(ExternalAPIError):
+            await adapter.create_order("BTCUSDT", "BUY", "MARKET", Decimal("0.01"))
+        assert registry._exchanges == {}
+
+    @pytest.mark.asyncio
+    async def test_validator_uses_steps(self, redis, loader):
+        client = AsyncMock(base_url=BASE_URL, get_exchange_info=loader)
+        validator = OrderValidator(registry=SymbolRegistry(redis=redis))
+
+        adjusted = await validator.validate_order_constraints(client, "DOGEUSDT", Decimal("1234"), Decimal("0.123456"))
+
+        assert adjusted["quantity"] == Decimal("1230")
+        assert adjusted["price"] == Decimal("0.12345")
@@ -0,0 +1,83 @@
+"""Test cases for compiled cron expressions."""
+import pytest
+from datetime import datetime, timedelta
+
+from src.trading.infrastructure.jobs.cron import CronExpression, compile_cron, parse_cron_field
+
+
+class TestParseCronField:
+    """Test cron field compilation to bitsets."""
+    
+    def test_wildcard(self):
+        """Test that * sets every value in range."""
+        assert parse_cron_field("*", 0, 6) == 0b1111111
+    
+    def test_range_with_step(self):
+        """Test a stepped range."""
+        mask = parse_cron_field("1-10/3", 0, 59)
+        assert [v for v in range(60) if mask >> v & 1] == [1, 4, 7, 10]
+    
+    def test_step_starts_at_field_minimum(self):
+        """Test that */n counts from the field minimum, as in cron."""
+        mask = parse_cron_field("*/10", 1, 31)
+        assert [v for v in range(32) if mask >> v & 1] == [1, 11, 21, 31]
+    
+    def test_out_of_range_rejected(self):
+        """Test that out-of-range values raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_cron_field("60", 0, 59)
+
+
+class TestCronExpression:
+    """Test next-run computation."""
+    
+    def test_daily(self):
+        """Test a daily expression rolls over to the next day."""
+        cron = CronExpression("0 3 * * *")
+        assert cron.next_after(datetime(2024, 1, 15, 3, 0)) == datetime(2024, 1, 16, 3, 0)
+    
+    def test_weekday_zero_is_sunday(self):
+        """Test that weekday 0 and 7 both mean Sunday."""
+        after = datetime(2024, 1, 15, 12, 0)  # Monday
+        expected = datetime(2024, 1, 21, 4, 0)  # Sunday
+        assert CronExpression("0 4 * * 0").next_after(after) == expected
+        assert CronExpression("0 4 * * 7").next_after(after) == expected
+    
+    def test_day_or_weekday_when_both_restricted(self):
+        """Test that restricted day and weekday match either one."""
+        cron = CronExpression("0 0 15 * 5")  # 15th or any Friday
+        after = datetime(2024, 1, 13, 0, 0)
+        assert cron.next_after(after) == datetime(2024, 1, 15, 0, 0)
+        assert cron.next_after(datetime(2024, 1, 15, 0, 0)) == datetime(2024, 1, 19, 0, 0)
+    
+    def test_leap_day(self):
+        """Test that Feb 29 skips to the next leap year."""
+        cron = CronExpression("0 0 29 2 *")
+        assert cron.next_after(datetime(2024, 3, 1)) == datetime(2028, 2, 29)
+    
+    def test_never_firing_expression(self):
+        """Test that an impossible date returns None quickly."""
+        assert CronExpression("0 0 30 2 *").next_after(datetime(2024, 1, 1)) is None
+    
+    def test_matches_brute_force(self):
+        """Test next_after against a minute-by-minute walk."""
+        for expression in ["*/15 * * * *", "0 22 * * 1-5", "23 0-20/2 * * *", "59 23 31 * *"]:
+            cron = CronExpression(expression)
+            start = datetime(2024, 2, 27, 21, 7)
+            expected = start.replace(second=0) + timedelta(minutes=1)
+            while not cron.matches(expected):
+                expected += timedelta(minutes=1)
+            assert cron.next_after(start) == expected, expression
+    
+    def test_alias(self):
+        """Test @-style aliases."""
+        assert CronExpression("@hourly").next_after(datetime(2024, 1, 1, 5, 30)) == datetime(2024, 1, 1, 6, 0)
+    
+    def test_invalid_expression(self):
+        """Test that malformed expressions raise ValueError."""
+        with pytest.raises(ValueError):
+            CronExpression("0 0 * *")
+    
+    def test_compiled_once(self):
+        """Test that compile_cron caches compiled expressions."""
+        assert compile_cron("0 8 * * *") is compile_cron("0 8 * * *")
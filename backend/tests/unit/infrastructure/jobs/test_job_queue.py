@@ -1,4 +1,5 @@
 """Test cases for Job and JobQueue."""
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone, timedelta
@@ -192,6 +193,8 @@ class TestJobQueue:
         redis_mock.zrem = AsyncMock(return_value=1)
         redis_mock.sadd = AsyncMock(return_value=1)
         redis_mock.srem = AsyncMock(return_value=1)
+        redis_mock.run_script = AsyncMock(return_value=None)
+        redis_mock.blpop = AsyncMock(return_value=None)
         return redis_mock
     
     @pytest.fixture
@@ -220,8 +223,10 @@ class TestJobQueue:
         assert job_id is not None
         # Verify job data was saved
         mock_redis.set.assert_called_once()
-        # Verify job was added to queue
-        mock_redis.rpush.assert_called_once()
+        # Verify job was added to queue and workers signalled
+        mock_redis.run_script.assert_called_once()
+        keys = mock_redis.run_script.call_args.kwargs["keys"]
+        assert keys == ["test_jobs:queue:high", "test_jobs:signal"]
     
     @pytest.mark.asyncio
     async def test_enqueue_scheduled(self, job_queue, mock_redis):
@@ -241,7 +246,7 @@ class TestJobQueue:
             # Verify job was added to scheduled set
             mock_redis.zadd.assert_called_once()
             # Verify job was NOT added to immediate queue
-            mock_redis.rpush.assert_not_called()
+            mock_redis.run_script.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_enqueue_with_options(self, job_queue, mock_redis):
@@ -267,10 +272,6 @@ class TestJobQueue:
     @pytest.mark.asyncio
     async def test_dequeue_from_priority_queue(self, job_queue, mock_redis):
         """Test dequeuing job from priority queue."""
-        # Mock lpop to return job ID
-        mock_redis.lpop.return_value = "job-123"
-        
-        # Mock get_job to return job data
         job_data = Job(
             id="job-123",
             name="test_task",
@@ -279,23 +280,116 @@ class TestJobQueue:
             priority=JobPriority.HIGH,
             created_at=datetime.now(timezone.utc).isoformat()
         )
-        mock_redis.get.return_value = job_data.to_json()
+        # Dequeue script returns the leased job id and its data
+        mock_redis.run_script.return_value = ["job-123", job_data.to_json()]
         
-        job = await job_queue.dequeue()
+        job = await job_queue.dequeue(worker_id="w1")
         
         assert job is not None
         assert job.id == "job-123"
         assert job.status == JobStatus.RUNNING
-        # Verify job was marked as processing
-        mock_redis.sadd.assert_called_once()
+        assert job.worker_id == "w1"
+        # Verify the lease went to the worker's in-flight list
+        keys = mock_redis.run_script.call_args.kwargs["keys"]
+        assert keys[:4] == [
+            "test_jobs:queue:critical",
+            "test_jobs:queue:high",
+            "test_jobs:queue:normal",
+            "test_jobs:queue:low",
+        ]
+        assert keys[4] == "test_jobs:inflight:w1"
+        assert "test_jobs:processing" in keys
+        mock_redis.lpop.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_dequeue_empty_queue(self, job_queue, mock_redis):
         """Test dequeuing from empty queue."""
-        mock_redis.lpop.return_value = None
-        
         job = await job_queue.dequeue()
         assert job is None
+        mock_redis.blpop.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_dequeue_blocks_on_signal_when_empty(self, job_queue, mock_redis):
+        """Test that a blocking dequeue waits on the signal list, then retries."""
+        job_data = Job(
+            id="job-1",
+            name="test_task",
+            args={},
+            status=JobStatus.PENDING,
+            priority=JobPriority.NORMAL,
+            created_at=datetime.now(timezone.utc).isoformat()
+        )
+        mock_redis.run_script.side_effect = [None, ["job-1", job_data.to_json()]]
+        mock_redis.blpop.return_value = ("test_jobs:signal", "1")
+        
+        job = await job_queue.dequeue(worker_id="w1", timeout=5)
+        
+        assert job.id == "job-1"
+        mock_redis.blpop.assert_called_once_with(["test_jobs:signal"], timeout=5)
+    
+    @pytest.mark.asyncio
+    async def test_idle_waiters_share_one_blpop(self, job_queue, mock_redis):
+        """Test that concurrent idle workers hold a single blocking connection."""
+        async def slow_blpop(keys, timeout):
+            await asyncio.sleep(0.01)
+            return None
+        
+        mock_redis.blpop.side_effect = slow_blpop
+        
+        results = await asyncio.gather(
+            *[job_queue.dequeue(worker_id=f"w{i}", timeout=1) for i in range(5)]
+        )
+        
+        assert results == [None] * 5
+        mock_redis.blpop.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_malformed_job_released(self, job_queue, mock_redis):
+        """Test that unparseable job data is released instead of returned."""
+        mock_redis.run_script.side_effect = [["job-bad", "{not json"], 1]
+        
+        job = await job_queue.dequeue(worker_id="w1")
+        
+        assert job is None
+        ack_args = mock_redis.run_script.call_args.kwargs["args"]
+        assert ack_args == ["job-bad", "test_jobs:inflight:w1"]
+    
+    @pytest.mark.asyncio
+    async def test_reap_expired_leases(self, job_queue, mock_redis):
+        """Test that expired leases are requeued by the reaper script."""
+        mock_redis.run_script.return_value = ["job-1", "job-2"]
+        
+        requeued = await job_queue.reap_expired_leases(limit=10)
+        
+        assert requeued == ["job-1", "job-2"]
+        kwargs = mock_redis.run_script.call_args.kwargs
+        assert kwargs["keys"][0] == "test_jobs:leases"
+        assert kwargs["args"][:2] == [10, "test_jobs:queue:"]
+    
+    @pytest.mark.asyncio
+    async def test_maintain_throttled_per_process(self, job_queue, mock_redis):
+        """Test that maintenance runs once per interval however often called."""
+        await job_queue.maintain()
+        await job_queue.maintain()
+        await job_queue.maintain()
+        
+        # One promotion batch and one reap
+        assert mock_redis.run_script.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_promotion_batches_until_drained(self, job_queue, mock_redis):
+        """Test that due jobs are promoted in bounded atomic batches."""
+        mock_redis.run_script.side_effect = [2, 2, 1]
+        
+        moved = await job_queue._move_scheduled_jobs(batch_size=2)
+        
+        assert moved == 5
+        assert mock_redis.run_script.call_count == 3
+        assert mock_redis.run_script.call_args.kwargs["keys"] == [
+            "test_jobs:scheduled",
+            "test_jobs:signal",
+        ]
+        mock_redis.get.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_get_job_exists(self, job_queue, mock_redis):
@@ -324,6 +418,71 @@ class TestJobQueue:
         job = await job_queue.get_job("nonexistent")
         assert job is None
     
+    @pytest.mark.asyncio
+    async def test_enqueue_indexes_tags(self, job_queue, mock_redis):
+        """Test that tags are written to their sets before the job is queued."""
+        job_id = await job_queue.enqueue(
+            name="fetch_missing_candles",
+            tags=["backtest:bt-1", "candles:BTCUSDT:1h", "backtest:bt-1"],
+        )
+        
+        tag_call, push_call = mock_redis.run_script.call_args_list
+        assert tag_call.kwargs["keys"] == [
+            "test_jobs:tag:backtest:bt-1",
+            "test_jobs:tag:candles:BTCUSDT:1h",
+        ]
+        assert tag_call.kwargs["args"][0] == job_id
+        assert push_call.kwargs["keys"][0] == "test_jobs:queue:marketdata:normal"
+    
+    @pytest.mark.asyncio
+    async def test_cancel_by_backtest_reads_only_tagged_jobs(self, job_queue, mock_redis):
+        """Test that backtest cancellation is a tag lookup, not a queue scan."""
+        created_at = datetime.now(timezone.utc).isoformat()
+        pending = Job(id="job-1", name="f", args={}, status=JobStatus.PENDING,
+                      priority=JobPriority.NORMAL, created_at=created_at)
+        running = Job(id="job-2", name="f", args={}, status=JobStatus.RUNNING,
+                      priority=JobPriority.NORMAL, created_at=created_at)
+        mock_redis.smembers.return_value = {"job-1", "job-2", "job-gone"}
+        mock_redis.mget.side_effect = lambda keys: [
+            {"test_jobs:job:job-1": pending.to_json(),
+             "test_jobs:job:job-2": running.to_json()}.get(key)
+            for key in keys
+        ]
+        mock_redis.run_script.return_value = ["job-1"]
+        
+        cancelled = await job_queue.cancel_jobs_by_backtest_id("bt-1")
+        
+        assert cancelled == 1
+        mock_redis.smembers.assert_called_once_with("test_jobs:tag:backtest:bt-1")
+        mock_redis.srem.assert_called_once_with("test_jobs:tag:backtest:bt-1", "job-gone")
+        mock_redis.lrange.assert_not_called()
+        args = mock_redis.run_script.call_args.kwargs["args"]
+        assert args[2:4] == ["job-1", "normal"]
+        assert json.loads(args[4])["status"] == "cancelled"
+        assert len(args) == 5
+    
+    @pytest.mark.asyncio
+    async def test_tag_progress(self, job_queue, mock_redis):
+        """Test that tag progress aggregates job statuses."""
+        created_at = datetime.now(timezone.utc).isoformat()
+        statuses = [JobStatus.COMPLETED, JobStatus.COMPLETED, JobStatus.RUNNING, JobStatus.PENDING]
+        jobs = [
+            Job(id=f"job-{i}", name="f", args={}, status=status,
+                priority=JobPriority.NORMAL, created_at=created_at)
+            for i, status in enumerate(statuses)
+        ]
+        mock_redis.smembers.return_value = {job.id for job in jobs}
+        mock_redis.mget.side_effect = lambda keys: [
+            next(job.to_json() for job in jobs if key.endswith(job.id)) for key in keys
+        ]
+        
+        progress = await job_queue.get_tag_progress("candles:BTCUSDT:1h")
+        
+        assert progress["total"] == 4
+        assert progress["finished"] == 2
+        assert progress["progress"] == 50.0
+        assert progress["by_status"]["running"] == 1
+    
     @pytest.mark.asyncio
     async def test_complete_job(self, job_queue, mock_redis):
         """Test completing a job."""
@@ -336,15 +495,19 @@ class TestJobQueue:
             created_at=datetime.now(timezone.utc).isoformat()
         )
         
+        mock_redis.run_script.return_value = 1
+        
         await job_queue.complete_job(job, result={"output": "success"})
         
         assert job.status == JobStatus.COMPLETED
         assert job.completed_at is not None
         assert job.result == {"output": "success"}
-        # Verify job was saved
-        mock_redis.set.assert_called()
-        # Verify removed from processing set
-        mock_redis.srem.assert_called()
+        # Verify lease released from the owning worker's in-flight list, saving the record
+        ack_args = mock_redis.run_script.call_args.kwargs["args"]
+        assert ack_args[:3] == ["job-789", "test_jobs:inflight:default", "test_jobs:job:job-789"]
+        assert Job.from_json(ack_args[3]).status == JobStatus.COMPLETED
+        # Result stored separately
+        mock_redis.set.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_fail_job_with_retry(self, job_queue, mock_redis):
@@ -359,6 +522,7 @@ class TestJobQueue:
             retry_count=0,
             max_retries=3
         )
+        mock_redis.run_script.return_value = 1
         
         await job_queue.fail_job(job, error="Test error", retry=True)
         
@@ -381,6 +545,7 @@ class TestJobQueue:
             retry_count=3,
             max_retries=3
         )
+        mock_redis.run_script.return_value = 1
         
         await job_queue.fail_job(job, error="Final error", retry=True)
         
@@ -388,3 +553,127 @@ class TestJobQueue:
         assert job.completed_at is not None
         # Verify job was moved to dead letter queue
         assert mock_redis.rpush.call_count >= 1
+    
+    @pytest.mark.asyncio
+    async def test_enqueue_follows_route_and_override(self, job_queue, mock_redis):
+        """Test that routed job types push to their queue unless overridden."""
+        await job_queue.enqueue(name="fetch_missing_candles")
+        await job_queue.enqueue(name="fetch_missing_candles", queue="default")
+        
+        routed, overridden = mock_redis.run_script.call_args_list
+        assert routed.kwargs["keys"] == ["test_jobs:queue:marketdata:normal", "test_jobs:signal:marketdata"]
+        assert overridden.kwargs["keys"] == ["test_jobs:queue:normal", "test_jobs:signal"]
+        job_data = json.loads(mock_redis.set.call_args_list[0][0][1])
+        assert job_data["queue"] == "marketdata"
+    
+    @pytest.mark.asyncio
+    async def test_dequeue_multiple_queues(self, job_queue, mock_redis):
+        """Test that a multi-queue lease passes every queue's keys and signal."""
+        job = await job_queue.dequeue(worker_id="w1", timeout=5, queues=["default", "marketdata"])
+        
+        assert job is None
+        kwargs = mock_redis.run_script.call_args.kwargs
+        assert kwargs["keys"][4:8] == [
+            "test_jobs:queue:marketdata:critical",
+            "test_jobs:queue:marketdata:high",
+            "test_jobs:queue:marketdata:normal",
+            "test_jobs:queue:marketdata:low",
+        ]
+        assert kwargs["keys"][8] == "test_jobs:inflight:w1"
+        assert kwargs["keys"][-2:] == ["test_jobs:signal", "test_jobs:signal:marketdata"]
+        assert kwargs["args"][3] == 2
+        mock_redis.blpop.assert_called_once_with(
+            ["test_jobs:signal", "test_jobs:signal:marketdata"], timeout=5
+        )
+    
+    @pytest.mark.asyncio
+    async def test_queue_stats_per_queue(self, job_queue, mock_redis):
+        """Test that pending counts are reported per queue and summed."""
+        mock_redis.llen = AsyncMock(side_effect=lambda key: 2 if ":marketdata:" in key else 1)
+        mock_redis.zcard = AsyncMock(return_value=0)
+        mock_redis.scard = AsyncMock(return_value=0)
+        
+        stats = await job_queue.get_queue_stats()
+        
+        assert stats["queues"]["marketdata"]["normal"] == 2
+        assert stats["queues"]["default"]["normal"] == 1
+        assert stats["pending"]["normal"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_cancel_routed_job_uses_queue_suffix(self, job_queue, mock_redis):
+        """Test that cancelling a routed job removes it from its own list."""
+        job = Job(id="job-1", name="fetch_missing_candles", args={}, status=JobStatus.PENDING,
+                  priority=JobPriority.HIGH, created_at=datetime.now(timezone.utc).isoformat(),
+                  queue="marketdata")
+        mock_redis.mget = AsyncMock(return_value=[job.to_json()])
+        mock_redis.run_script.return_value = ["job-1"]
+        
+        assert await job_queue.cancel_jobs(["job-1"]) == ["job-1"]
+        args = mock_redis.run_script.call_args.kwargs["args"]
+        assert args[2:4] == ["job-1", "marketdata:high"]
+
+
+class TestLeaseLoss:
+    """Late acks after a lease expired, against Redis scripts (fakeredis)."""
+    
+    @pytest.fixture
+    async def job_queue(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        from src.trading.infrastructure.cache.redis_client import RedisClient
+        
+        client = RedisClient()
+        client._redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        client._is_connected = True
+        queue = JobQueue(prefix="lease_jobs")
+        queue.redis = client
+        yield queue
+        await client._redis.aclose()
+    
+    async def expire_lease(self, job_queue, job_id):
+        await job_queue.redis._redis.zadd(job_queue.leases_set, {job_id: 0})
+        assert await job_queue.reap_expired_leases() == [job_id]
+    
+    @pytest.mark.asyncio
+    async def test_late_ack_after_reap_is_discarded(self, job_queue):
+        """Test that a reaped job's late ack records nothing and the job runs once more."""
+        job_id = await job_queue.enqueue("slow_job")
+        first = await job_queue.dequeue("w1")
+        await self.expire_lease(job_queue, job_id)
+        
+        await job_queue.complete_job(first, result={"run": 1})
+        
+        assert (await job_queue.get_job(job_id)).status == JobStatus.RUNNING
+        second = await job_queue.dequeue("w2")
+        assert second.id == job_id
+        await job_queue.complete_job(second, result={"run": 2})
+        stored = await job_queue.get_job(job_id)
+        assert (stored.status, stored.result) == (JobStatus.COMPLETED, {"run": 2})
+        assert await job_queue.dequeue("w3") is None
+    
+    @pytest.mark.asyncio
+    async def test_late_ack_does_not_overwrite_new_lease(self, job_queue):
+        """Test that the original worker cannot finish a job another worker re-leased."""
+        job_id = await job_queue.enqueue("slow_job")
+        first = await job_queue.dequeue("w1")
+        await self.expire_lease(job_queue, job_id)
+        second = await job_queue.dequeue("w2")
+        
+        await job_queue.fail_job(first, "timed out", retry=False)
+        
+        stored = await job_queue.get_job(job_id)
+        assert (stored.status, stored.worker_id) == (JobStatus.RUNNING, "w2")
+        assert await job_queue.redis._redis.llen(job_queue.dead_letter_queue) == 0
+        await job_queue.complete_job(second)
+        assert (await job_queue.get_job(job_id)).status == JobStatus.COMPLETED
+    
+    @pytest.mark.asyncio
+    async def test_dequeue_drops_finished_ids(self, job_queue):
+        """Test that an id whose job already finished is dropped, not run again."""
+        job_id = await job_queue.enqueue("quick_job")
+        job = await job_queue.dequeue("w1")
+        await job_queue.complete_job(job)
+        await job_queue.redis._redis.rpush(job_queue.queues["normal"], job_id)
+        
+        assert await job_queue.dequeue("w2") is None
+        assert await job_queue.redis._redis.llen(job_queue.queues["normal"]) == 0
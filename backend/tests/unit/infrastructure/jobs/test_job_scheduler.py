@@ -1,4 +1,5 @@
 """Test cases for JobScheduler."""
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone, timedelta
@@ -9,6 +10,7 @@ from src.trading.infrastructure.jobs.job_scheduler import (
     ScheduleType
 )
 from src.trading.infrastructure.jobs.job_queue import JobPriority
+from src.trading.infrastructure.jobs.leader_election import LeaderElection
 
 
 class TestScheduleType:
@@ -375,3 +377,141 @@ class TestJobScheduler:
         
         # Cleanup
         await scheduler.stop()
+
+
+class TestLeaderElectedScheduler:
+    """Test leader election and heap-driven firing."""
+    
+    @pytest.fixture
+    def leader(self):
+        leader = MagicMock()
+        leader.lease_ttl = 15.0
+        leader.is_leader = True
+        leader.try_acquire = AsyncMock(return_value=True)
+        leader.release = AsyncMock()
+        return leader
+    
+    @pytest.fixture
+    def scheduler(self, leader):
+        return JobScheduler(leader=leader)
+    
+    @pytest.fixture
+    def mock_queue(self):
+        with patch('src.trading.infrastructure.jobs.job_scheduler.job_queue') as queue:
+            queue.enqueue = AsyncMock(return_value="job-1")
+            queue.redis.hset = AsyncMock(return_value=1)
+            queue.redis.hgetall = AsyncMock(return_value={})
+            yield queue
+    
+    @pytest.mark.asyncio
+    async def test_only_due_tasks_fire(self, scheduler, mock_queue):
+        """Test that only tasks at the top of the heap are enqueued."""
+        due = scheduler.register("due", "job_due", interval_seconds=60)
+        later = scheduler.register("later", "job_later", interval_seconds=60)
+        later.next_run = datetime.utcnow() + timedelta(hours=1)
+        scheduler._schedule(later)
+        
+        await scheduler._check_and_enqueue_tasks()
+        
+        mock_queue.enqueue.assert_called_once()
+        assert mock_queue.enqueue.call_args.kwargs["name"] == "job_due"
+        assert due.run_count == 1
+        assert later.run_count == 0
+        mock_queue.redis.hset.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_disabled_task_skipped(self, scheduler, mock_queue):
+        """Test that stale heap entries of disabled tasks are ignored."""
+        scheduler.register("task", "job", interval_seconds=60)
+        scheduler.disable("task")
+        
+        await scheduler._check_and_enqueue_tasks()
+        
+        mock_queue.enqueue.assert_not_called()
+    
+    def test_sleep_until_earliest_run(self, scheduler):
+        """Test that the loop sleeps until the earliest next run."""
+        task = scheduler.register("task", "job", interval_seconds=60)
+        task.next_run = datetime.utcnow() + timedelta(seconds=10)
+        scheduler._schedule(task)
+        
+        delay = scheduler._seconds_until_next_run()
+        
+        assert 9 <= delay <= 10
+    
+    @pytest.mark.asyncio
+    async def test_new_leader_adopts_last_runs(self, scheduler, mock_queue):
+        """Test that a takeover does not refire a run the old leader enqueued."""
+        scheduler.register("task", "job", interval_seconds=3600)
+        last_run = datetime.utcnow() - timedelta(minutes=5)
+        mock_queue.redis.hgetall.return_value = {"task": last_run.isoformat()}
+        
+        await scheduler._load_last_runs()
+        await scheduler._check_and_enqueue_tasks()
+        
+        mock_queue.enqueue.assert_not_called()
+        assert scheduler.get_task("task").next_run == last_run + timedelta(hours=1)
+    
+    @pytest.mark.asyncio
+    async def test_follower_does_not_enqueue(self, scheduler, leader, mock_queue):
+        """Test that a process without the lease never enqueues."""
+        leader.is_leader = False
+        leader.try_acquire.return_value = False
+        scheduler.register("task", "job", interval_seconds=60)
+        
+        await scheduler.start()
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+        
+        leader.try_acquire.assert_called()
+        mock_queue.enqueue.assert_not_called()
+
+
+class TestLeaderElection:
+    """Test Redis lease-based leader election."""
+    
+    @pytest.fixture
+    def election(self):
+        election = LeaderElection("test", lease_ttl=10)
+        election.redis = AsyncMock()
+        return election
+    
+    @pytest.mark.asyncio
+    async def test_acquire_sets_lease_nx(self, election):
+        """Test that acquiring uses SET NX with the lease TTL."""
+        election.redis.set.return_value = True
+        
+        assert await election.try_acquire() is True
+        assert election.is_leader
+        election.redis.set.assert_called_once_with(
+            "leader:test", election.token, px=10000, nx=True
+        )
+    
+    @pytest.mark.asyncio
+    async def test_acquire_fails_when_held(self, election):
+        """Test that a held lease is not taken."""
+        election.redis.set.return_value = False
+        
+        assert await election.try_acquire() is False
+        assert not election.is_leader
+    
+    @pytest.mark.asyncio
+    async def test_leader_renews_instead_of_reacquiring(self, election):
+        """Test that a leader extends its own lease."""
+        election.redis.set.return_value = True
+        election.redis.run_script.return_value = 1
+        await election.try_acquire()
+        
+        assert await election.try_acquire() is True
+        election.redis.set.assert_called_once()
+        assert election.redis.run_script.call_args.kwargs["args"] == [election.token, 10000]
+    
+    @pytest.mark.asyncio
+    async def test_lost_lease_steps_down(self, election):
+        """Test that failing to renew drops leadership."""
+        election.redis.set.return_value = True
+        election.redis.run_script.return_value = 0
+        await election.try_acquire()
+        
+        assert await election.renew() is False
+        assert not election.is_leader
@@ -0,0 +1,90 @@
+"""Test cases for JobWorker queue selection and draining."""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.trading.infrastructure.jobs.job_worker import JobWorker, WorkerStatus, parse_queue_spec
+
+
+class TestParseQueueSpec:
+    """Test queue spec parsing."""
+
+    def test_names_and_concurrency(self):
+        assert parse_queue_spec("default, marketdata=4,") == {"default": 1, "marketdata": 4}
+
+    def test_default_concurrency(self):
+        assert parse_queue_spec("backtest", default_concurrency=2) == {"backtest": 2}
+
+    @pytest.mark.parametrize("spec", ["=2", "default=0", "default=x"])
+    def test_invalid(self, spec):
+        with pytest.raises(ValueError):
+            parse_queue_spec(spec)
+
+
+class TestJobWorker:
+    """Test JobWorker against a mocked queue."""
+
+    @pytest.fixture
+    def queue(self):
+        with patch("src.trading.infrastructure.jobs.job_worker.job_queue") as queue:
+            queue.maintain = AsyncMock()
+            queue.complete_job = AsyncMock()
+            queue.fail_job = AsyncMock()
+            yield queue
+
+    @pytest.mark.asyncio
+    async def test_dequeues_from_its_queues(self, queue):
+        worker = JobWorker(worker_id="w", block_timeout=0.01, queues=["marketdata"])
+        dequeued = asyncio.Event()
+
+        async def dequeue(**kwargs):
+            dequeued.set()
+            await asyncio.sleep(0.01)
+
+        queue.dequeue = AsyncMock(side_effect=dequeue)
+        await worker.start()
+        await dequeued.wait()
+        await worker.stop()
+
+        assert queue.dequeue.call_args.kwargs["queues"] == ["marketdata"]
+        assert worker.get_stats()["queues"] == ["marketdata"]
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_without_leasing_more(self, queue):
+        """Test that stop lets running jobs finish and leases nothing new."""
+        worker = JobWorker(worker_id="w", max_concurrent_jobs=2)
+        release = asyncio.Event()
+        finished = []
+
+        async def run_job():
+            await release.wait()
+            finished.append(True)
+
+        async def dequeue(**kwargs):
+            await asyncio.sleep(0.001)
+
+        worker._current_jobs["job-1"] = asyncio.create_task(run_job())
+        queue.dequeue = AsyncMock(side_effect=dequeue)
+        await worker.start()
+        await asyncio.sleep(0)
+
+        stopping = asyncio.create_task(worker.stop(timeout=1.0))
+        await asyncio.sleep(0.01)
+        leases = queue.dequeue.call_count
+        release.set()
+        await stopping
+
+        assert finished == [True]
+        assert queue.dequeue.call_count == leases
+        assert worker.stats.status == WorkerStatus.STOPPED
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_jobs_after_timeout(self, queue):
+        worker = JobWorker(worker_id="w")
+        job = asyncio.create_task(asyncio.sleep(10))
+        worker._current_jobs["job-1"] = job
+
+        await worker.stop(timeout=0.01)
+        await asyncio.sleep(0)
+
+        assert job.cancelled()
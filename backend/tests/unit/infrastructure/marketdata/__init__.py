@@ -0,0 +1 @@
+"""Tests for market data capture."""
@@ -0,0 +1,234 @@
+"""Test cases for trade capture and the market_trades repositories."""
+import asyncio
+import json
+import pytest
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.trading.domain.market_data import Tick, Trade, TradeType
+from src.trading.infrastructure.marketdata.trade_capture import (
+    QUOTES_TABLE,
+    TRADES_TABLE,
+    TradeCaptureService,
+    parse_agg_trade,
+    parse_book_ticker,
+)
+from src.trading.infrastructure.persistence.repositories.market_data_repository import (
+    TRADE_COLUMNS,
+    TickRepository,
+    TradeRepository,
+)
+
+AGG_TRADE = {"e": "aggTrade", "E": 1760000000100, "s": "BTCUSDT", "a": 42, "p": "65000.10", "q": "0.015",
+             "f": 100, "l": 101, "T": 1760000000000, "m": True}
+BOOK_TICKER = {"u": 7, "s": "BTCUSDT", "b": "65000.00", "B": "1.2", "a": "65000.10", "A": "0.4"}
+
+
+def combined(data):
+    return json.dumps({"stream": "btcusdt@x", "data": data})
+
+
+def make_leader(acquired=True):
+    leader = MagicMock()
+    leader.lease_ttl = 15.0
+    leader.is_leader = acquired
+    leader.try_acquire = AsyncMock(return_value=acquired)
+    leader.release = AsyncMock()
+    return leader
+
+
+class TestParsing:
+    """Test stream events to rows."""
+
+    def test_agg_trade_row(self):
+        symbol, ts, trade_id, price, quantity, is_buyer_maker = parse_agg_trade(AGG_TRADE)
+
+        assert (symbol, trade_id, price, quantity, is_buyer_maker) == (
+            "BTCUSDT", 42, Decimal("65000.10"), Decimal("0.015"), True
+        )
+        assert ts == datetime(2025, 10, 9, 8, 53, 20, tzinfo=timezone.utc)
+
+    def test_book_ticker_uses_receive_time_without_timestamp(self):
+        received_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        assert parse_book_ticker(BOOK_TICKER, received_at)[1] == received_at
+        assert parse_book_ticker({**BOOK_TICKER, "T": 1760000000000}, received_at)[1].year == 2025
+
+
+class TestTradeCaptureService:
+    """Test batching, backpressure and draining."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_full_batches_per_table(self):
+        writer = AsyncMock()
+        capture = TradeCaptureService(["btcusdt"], flush_rows=2, writer=writer)
+        capture._tasks = [asyncio.create_task(capture._write_loop())]
+
+        for _ in range(3):
+            await capture.handle_message(combined(AGG_TRADE))
+        await capture.handle_message(combined(BOOK_TICKER))
+        await capture.handle_message(combined({"result": None, "id": 1}))
+        await capture._batches.join()
+
+        table, columns, rows = writer.await_args.args
+        assert (table, len(rows)) == (TRADES_TABLE, 2)
+        assert capture.get_stats() == {
+            "received": 4, "written": 2, "dropped": 0, "capturing": False, "buffered": 2, "pending_batches": 0,
+        }
+        capture._tasks[0].cancel()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_blocks_receiving(self):
+        capture = TradeCaptureService(["BTCUSDT"], flush_rows=1, max_pending_batches=1, writer=AsyncMock())
+
+        await capture.handle_message(combined(AGG_TRADE))
+        blocked = asyncio.create_task(capture.handle_message(combined(AGG_TRADE)))
+        await asyncio.sleep(0.01)
+
+        assert not blocked.done()
+        await capture._batches.get()
+        await asyncio.wait_for(blocked, 1)
+
+    @pytest.mark.asyncio
+    async def test_stop_writes_buffered_rows(self):
+        writer = AsyncMock()
+        capture = TradeCaptureService(["BTCUSDT"], flush_interval=60, writer=writer, leader=make_leader())
+        capture._receive_loop = AsyncMock()
+        await capture.start()
+
+        await capture.handle_message(combined(AGG_TRADE))
+        await capture.handle_message(combined(BOOK_TICKER))
+        await capture.stop()
+
+        assert [call.args[0] for call in writer.await_args_list] == [TRADES_TABLE, QUOTES_TABLE]
+        assert capture._tasks == []
+        capture.leader.release.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_only_the_lease_holder_receives(self):
+        """Test that a replica without the lease never connects."""
+        follower = TradeCaptureService(["BTCUSDT"], writer=AsyncMock(), leader=make_leader(acquired=False))
+        follower._receive_loop = AsyncMock()
+        owner = TradeCaptureService(["BTCUSDT"], writer=AsyncMock(), leader=make_leader())
+        owner._receive_loop = AsyncMock()
+
+        await follower.start()
+        await owner.start()
+        await asyncio.sleep(0.01)
+
+        follower._receive_loop.assert_not_awaited()
+        owner._receive_loop.assert_awaited_once()
+        await follower.stop()
+        await owner.stop()
+
+    @pytest.mark.asyncio
+    async def test_losing_the_lease_stops_receiving(self):
+        leader = make_leader()
+        leader.lease_ttl = 0.03
+        capture = TradeCaptureService(["BTCUSDT"], writer=AsyncMock(), leader=leader)
+        received = asyncio.Event()
+
+        async def receive():
+            received.set()
+            await asyncio.Event().wait()
+
+        capture._receive_loop = receive
+        await capture.start()
+        await asyncio.wait_for(received.wait(), 1)
+
+        leader.is_leader = False
+        leader.try_acquire.return_value = False
+        await asyncio.sleep(0.05)
+
+        assert capture._receive_task is None
+        assert capture.get_stats()["capturing"] is False
+        await capture.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried_then_dropped(self):
+        writer = AsyncMock(side_effect=[ConnectionError("down"), None, ConnectionError("down")] + [ConnectionError()] * 5)
+        capture = TradeCaptureService(["BTCUSDT"], writer=writer)
+
+        with patch("src.trading.infrastructure.marketdata.trade_capture.asyncio.sleep", new=AsyncMock()):
+            await capture._write(TRADES_TABLE, TRADE_COLUMNS, [("row",)])
+            await capture._write(TRADES_TABLE, TRADE_COLUMNS, [("row",)])
+
+        assert capture.stats["written"] == 1
+        assert capture.stats["dropped"] == 1
+
+
+class TestMarketTradesRepositories:
+    """Test COPY writes and row mapping."""
+
+    @pytest.fixture
+    def session(self):
+        session = AsyncMock()
+        driver = MagicMock(copy_records_to_table=AsyncMock())
+        raw = MagicMock(driver_connection=driver)
+        session.connection.return_value.get_raw_connection = AsyncMock(return_value=raw)
+        session.driver = driver
+        return session
+
+    @pytest.mark.asyncio
+    async def test_save_batch_uses_copy(self, session):
+        tick = Tick("BTCUSDT", Decimal("65000"), Decimal("0.5"), datetime(2026, 1, 1, tzinfo=timezone.utc), "9", False)
+
+        await TickRepository(session).save_batch([tick])
+
+        kwargs = session.driver.copy_records_to_table.await_args.kwargs
+        assert session.driver.copy_records_to_table.await_args.args == ("market_trades",)
+        assert kwargs["columns"] == list(TRADE_COLUMNS)
+        assert kwargs["records"] == [("BTCUSDT", tick.timestamp, 9, Decimal("65000"), Decimal("0.5"), False)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("repository", [TickRepository, TradeRepository])
+    async def test_save_batch_creates_missing_partitions(self, session, repository):
+        """Test that a batch for a month with no partition yet creates it before the COPY."""
+        session.scalar.return_value = None  # no partition exists
+        session.begin_nested = MagicMock(return_value=AsyncMock())
+        first, last = datetime(2031, 1, 31, 23, 59, tzinfo=timezone.utc), datetime(2031, 2, 1, tzinfo=timezone.utc)
+        if repository is TickRepository:
+            items = [Tick("BTCUSDT", Decimal("1"), Decimal("1"), at, str(i), False) for i, at in enumerate((first, last))]
+        else:
+            items = [Trade("BTCUSDT", str(i), Decimal("1"), Decimal("1"), Decimal("1"), at, False, TradeType.BUY)
+                     for i, at in enumerate((first, last))]
+
+        await repository(session).save_batch(items)
+
+        ddl = [str(call.args[0]) for call in session.execute.await_args_list]
+        assert any('"market_trades_203101" PARTITION OF "market_trades"' in sql for sql in ddl)
+        assert any('"market_trades_203102" PARTITION OF "market_trades"' in sql for sql in ddl)
+        session.driver.copy_records_to_table.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_ticks_without_trade_id_are_rejected(self, session):
+        """Test that id-less ticks are not all written under trade_id 0."""
+        at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        ticks = [Tick("BTCUSDT", Decimal("1"), Decimal("1"), at, "9", False), Tick("BTCUSDT", Decimal("1"), Decimal("1"), at)]
+
+        with pytest.raises(ValueError, match="1 of 2 ticks have no trade_id"):
+            await TickRepository(session).save_batch(ticks)
+
+        session.driver.copy_records_to_table.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_trades_without_trade_id_are_rejected(self, session):
+        """Test that id-less trades fail the batch up front, not mid-COPY."""
+        at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        trades = [Trade("BTCUSDT", trade_id, Decimal("1"), Decimal("1"), Decimal("1"), at, False, TradeType.BUY)
+                  for trade_id in ("9", None, "")]
+
+        with pytest.raises(ValueError, match="2 of 3 trades have no trade_id"):
+            await TradeRepository(session).save_batch(trades)
+
+        session.driver.copy_records_to_table.assert_not_awaited()
+
+    def test_rows_map_to_trades(self):
+        row = MagicMock(symbol="BTCUSDT", ts=datetime(2026, 1, 1), trade_id=5,
+                        price=Decimal("10"), quantity=Decimal("2"), is_buyer_maker=True)
+
+        trade = TradeRepository(AsyncMock())._row_to_domain(row)
+
+        assert trade.quote_quantity == Decimal("20")
+        assert trade.trade_type == TradeType.SELL
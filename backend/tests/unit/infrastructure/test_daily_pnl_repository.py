@@ -0,0 +1,41 @@
+"""
+Unit tests for the daily P&L rollup repository.
+"""
+import uuid
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+from sqlalchemy.dialects import postgresql
+
+from src.trading.infrastructure.persistence.repositories.daily_pnl_repository import (
+    DailyPnlRepository,
+    utc_day,
+)
+
+
+def test_utc_day_converts_aware_timestamps():
+    """Test that a late evening trade in UTC+7 lands on the UTC day."""
+    moment = datetime(2026, 3, 2, 5, 0, tzinfo=timezone(timedelta(hours=7)))
+    assert utc_day(moment) == date(2026, 3, 1)
+    assert utc_day(datetime(2026, 3, 2, 5, 0)) == date(2026, 3, 2)
+
+
+@pytest.mark.asyncio
+async def test_record_trade_is_a_single_upsert():
+    """Test that recording a trade increments its day row in one statement."""
+    session = AsyncMock()
+    repo = DailyPnlRepository(session)
+
+    await repo.record_trade(uuid.uuid4(), uuid.uuid4(), datetime(2026, 3, 1, 12, 0), Decimal("-3"))
+
+    assert session.execute.await_count == 1
+    compiled = session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "ON CONFLICT (user_id, bot_id, day) DO UPDATE" in sql
+    assert compiled.params["day"] == date(2026, 3, 1)
+    assert compiled.params["losses"] == 1
+    assert compiled.params["wins"] == 0
+    assert compiled.params["breakeven"] == 0
+    assert compiled.params["gross_loss"] == Decimal("3")
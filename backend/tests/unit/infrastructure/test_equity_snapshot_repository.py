@@ -0,0 +1,163 @@
+"""
+Unit tests for the equity snapshot repository SQL.
+"""
+import uuid
+import pytest
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from src.trading.infrastructure.persistence.repositories.equity_snapshot_repository import (
+    INSERT_BATCH_ROWS,
+    EquitySnapshotRepository,
+)
+
+NOW = datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+VALUES = {"equity": Decimal("1"), "balance": Decimal("1"), "unrealized_pnl": Decimal("0"), "margin_used": Decimal("0")}
+
+
+def compiled(session, call=-1):
+    statement = session.execute.await_args_list[call].args[0]
+    result = statement.compile(dialect=postgresql.dialect())
+    return " ".join(str(result).split()), result.params
+
+
+@pytest.fixture
+def session():
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    session.execute.return_value.all.return_value = []
+    return session
+
+
+@pytest.mark.asyncio
+async def test_record_upserts_minute_rows(session):
+    """Test that snapshots land in the 1m bucket and replace a same-minute row."""
+    user_id = uuid.uuid4()
+    await EquitySnapshotRepository(session).record([{"user_id": user_id, **VALUES}], NOW + timedelta(seconds=42))
+
+    sql, params = compiled(session)
+    assert "ON CONFLICT (user_id, resolution, ts) DO UPDATE SET equity = excluded.equity" in sql
+    assert params["ts_m0"] == NOW and params["resolution_m0"] == "1m"
+
+
+@pytest.mark.asyncio
+async def test_downsample_keeps_last_row_per_user_and_bucket(session):
+    """Test the DISTINCT ON fold from 1m into 1h since a bucket."""
+    await EquitySnapshotRepository(session).downsample("1h", NOW)
+
+    sql, params = compiled(session)
+    assert "INSERT INTO equity_snapshots (user_id, resolution, ts, equity, balance, unrealized_pnl, margin_used)" in sql
+    assert "SELECT DISTINCT ON (equity_snapshots.user_id, timezone(%(timezone_1)s::VARCHAR, date_trunc(" in sql
+    assert "ORDER BY equity_snapshots.user_id, timezone(" in sql and "equity_snapshots.ts DESC" in sql
+    assert "ON CONFLICT (user_id, resolution, ts) DO UPDATE" in sql
+    assert params["date_trunc_1"] == "hour"
+    assert params["resolution_1"] == "1m"
+    assert params["ts_1"] == datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_downsample_without_since_rebuilds_everything(session):
+    """Test that a first run is not limited to recent buckets."""
+    await EquitySnapshotRepository(session).downsample("1d")
+
+    sql, params = compiled(session)
+    assert "equity_snapshots.ts >=" not in sql
+    assert params["date_trunc_1"] == "day" and params["resolution_1"] == "1h"
+
+
+@pytest.mark.asyncio
+async def test_purge_expired_applies_each_tier_retention(session):
+    """Test that 1m and 1h rows expire and 1d rows are kept."""
+    session.execute.return_value.rowcount = 7
+
+    assert await EquitySnapshotRepository(session).purge_expired(NOW) == 7
+
+    sql, params = compiled(session)
+    assert sql.startswith("DELETE FROM equity_snapshots WHERE")
+    cutoffs = {params[f"resolution_{i}"]: params[f"ts_{i}"] for i in (1, 2)}
+    assert cutoffs == {"1m": NOW - timedelta(days=2), "1h": NOW - timedelta(days=90)}
+    assert "1d" not in params.values()
+
+
+@pytest.mark.asyncio
+async def test_get_series_filters_one_tier_oldest_first(session):
+    """Test the series query bounds and order."""
+    user_id = uuid.uuid4()
+    session.execute.return_value.all.return_value = [MagicMock(ts=NOW, **VALUES)]
+
+    points = await EquitySnapshotRepository(session).get_series(user_id, "1h", NOW - timedelta(days=1), NOW)
+
+    sql, params = compiled(session)
+    assert "equity_snapshots.ts >= %(ts_1)s::TIMESTAMP WITH TIME ZONE" in sql
+    assert "equity_snapshots.ts <= %(ts_2)s::TIMESTAMP WITH TIME ZONE ORDER BY equity_snapshots.ts" in sql
+    assert params["user_id_1"] == user_id and params["resolution_1"] == "1h"
+    assert points == [{"ts": NOW, **VALUES}]
+
+
+@pytest.mark.asyncio
+async def test_large_batches_stay_under_bind_parameter_limit(session):
+    """Test that many rows are split into statements of at most 32767 parameters."""
+    snapshots = [{"user_id": uuid.uuid4(), "ts": NOW, **VALUES} for _ in range(INSERT_BATCH_ROWS * 2 + 1)]
+    session.execute.return_value.all.return_value = [(1,)]
+    repository = EquitySnapshotRepository(session)
+
+    assert await repository.record(snapshots, NOW) == len(snapshots)
+    assert await repository.insert_missing(snapshots, "1d") == 3
+
+    assert session.execute.await_count == 6
+    for call in range(6):
+        assert len(compiled(session, call)[1]) <= 32767
+
+
+@pytest.mark.asyncio
+async def test_insert_missing_never_overwrites(session):
+    """Test that backfilled rows do not replace recorded ones."""
+    user_id = uuid.uuid4()
+    await EquitySnapshotRepository(session).insert_missing([{"user_id": user_id, "ts": NOW, **VALUES}], "1d")
+
+    sql, params = compiled(session)
+    assert "ON CONFLICT (user_id, resolution, ts) DO NOTHING" in sql
+    assert params["ts_m0"] == datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_stitched_series_fills_older_stretch_from_coarser_tiers(session):
+    """Test that each coarser tier only covers the time before the finer data."""
+    repo = EquitySnapshotRepository(session)
+    hour = datetime(2026, 3, 1, 10, tzinfo=timezone.utc)
+    series = {
+        "1m": [{"ts": hour + timedelta(minutes=30)}, {"ts": hour + timedelta(minutes=31)}],
+        # 10:00 holds the value of 10:59, after the first minute point
+        "1h": [{"ts": hour - timedelta(hours=1)}, {"ts": hour}],
+        "1d": [{"ts": datetime(2026, 2, 28, tzinfo=timezone.utc)}, {"ts": datetime(2026, 3, 1, tzinfo=timezone.utc)}],
+    }
+    repo.get_series = AsyncMock(side_effect=lambda user_id, resolution, start, end: series[resolution])
+    start = NOW - timedelta(days=5)
+
+    points = await repo.get_stitched_series(uuid.uuid4(), "1m", start)
+
+    assert [p["ts"] for p in points] == [
+        datetime(2026, 2, 28, tzinfo=timezone.utc),
+        hour - timedelta(hours=1),
+        hour + timedelta(minutes=30),
+        hour + timedelta(minutes=31),
+    ]
+    ends = [call.args[3] for call in repo.get_series.await_args_list]
+    assert ends == [None, hour + timedelta(minutes=30), hour - timedelta(hours=1)]
+
+
+@pytest.mark.asyncio
+async def test_without_points_probes_each_user(session):
+    """Test that users with no row in any tier are found by key lookup."""
+    new_user = uuid.uuid4()
+    session.execute.return_value.all.return_value = [MagicMock(user_id=new_user)]
+
+    missing = await EquitySnapshotRepository(session).without_points([new_user, uuid.uuid4()])
+
+    sql, params = compiled(session)
+    assert "FROM (VALUES (%(param_1)s::UUID), (%(param_2)s::UUID)) AS ids (user_id)" in sql
+    assert "WHERE NOT (EXISTS (SELECT * FROM equity_snapshots WHERE equity_snapshots.user_id = ids.user_id))" in sql
+    assert missing == [new_user]
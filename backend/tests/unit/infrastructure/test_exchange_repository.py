@@ -0,0 +1,105 @@
+"""Test cases for exchange connection writes dropping pooled credentials."""
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from cryptography.fernet import Fernet
+
+from src.trading.domain.exchange import (
+    APICredentials,
+    ConnectionStatus,
+    ExchangeConnection,
+    ExchangePermissions,
+    ExchangeType,
+)
+from src.trading.infrastructure.repositories.exchange_repository import ExchangeRepository
+
+MODULE = "src.trading.infrastructure.repositories.exchange_repository"
+
+
+@pytest.fixture
+def pool():
+    with patch(f"{MODULE}.get_settings", return_value=SimpleNamespace(ENCRYPTION_KEY=Fernet.generate_key().decode())), \
+            patch(f"{MODULE}.exchange_adapter_pool") as pool, \
+            patch(f"{MODULE}.ExchangeMetadataRepository") as metadata:
+        metadata.return_value.find_by_code = AsyncMock(return_value={"id": 1})
+        yield pool
+
+
+def connection(api_key: str = "key") -> ExchangeConnection:
+    return ExchangeConnection(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        exchange_type=ExchangeType.BINANCE,
+        name="main",
+        credentials=APICredentials(api_key=api_key, secret_key="secret"),
+        permissions=ExchangePermissions(),
+        is_testnet=False,
+        is_active=True,
+        status=ConnectionStatus.CONNECTED,
+        last_used_at=None,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def stored(repository: ExchangeRepository, current: ExchangeConnection):
+    return SimpleNamespace(
+        api_key_encrypted=repository._encrypt(current.credentials.api_key),
+        secret_key_encrypted=repository._encrypt(current.credentials.secret_key),
+        passphrase_encrypted=None,
+        is_testnet=False,
+        is_active=True,
+    )
+
+
+def session_returning(model):
+    session = AsyncMock()
+    session.add = MagicMock()
+    session.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=model))
+    return session
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("change", ["api_key", "deactivate"])
+async def test_credential_change_invalidates_after_commit(pool, change):
+    """Test that rotated or deactivated keys are dropped from the pool on commit."""
+    current = connection()
+    session = session_returning(None)
+    repository = ExchangeRepository(session)
+    session.execute.return_value.scalar_one_or_none.return_value = stored(repository, current)
+    updated = connection(api_key="rotated") if change == "api_key" else current
+    updated.id = current.id
+    updated.is_active = change != "deactivate"
+
+    await repository.save(updated)
+
+    pool.invalidate_after_commit.assert_called_once_with(session, current.id)
+
+
+@pytest.mark.asyncio
+async def test_last_used_update_keeps_pooled_adapter(pool):
+    """Test that saving unchanged credentials leaves the pool alone."""
+    current = connection()
+    session = session_returning(None)
+    repository = ExchangeRepository(session)
+    session.execute.return_value.scalar_one_or_none.return_value = stored(repository, current)
+    current.last_used_at = datetime.now(timezone.utc)
+
+    await repository.save(current)
+
+    pool.invalidate_after_commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delete_invalidates_after_commit(pool):
+    """Test that a soft delete drops the connection from the pool on commit."""
+    model = MagicMock()
+    session = session_returning(model)
+    connection_id = uuid.uuid4()
+
+    await ExchangeRepository(session).delete(connection_id)
+
+    model.soft_delete.assert_called_once()
+    pool.invalidate_after_commit.assert_called_once_with(session, connection_id)
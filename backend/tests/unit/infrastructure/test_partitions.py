@@ -0,0 +1,120 @@
+"""
+Unit tests for monthly market data partitions.
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.trading.infrastructure.persistence.partitions import (
+    PartitionManager,
+    PartitionedTable,
+    add_months,
+    month_start,
+    partition_ddl,
+)
+from src.trading.infrastructure.persistence.repositories.market_data_repository import CandleRepository
+
+
+def make_session(existing=(), children=()):
+    """Session mock knowing a set of existing relations and partition children."""
+    session = AsyncMock()
+    session.begin_nested = MagicMock(return_value=AsyncMock())
+
+    async def scalar(statement, params=None):
+        if "to_regclass" in str(statement):
+            return params["name"] if params["name"] in existing else None
+        return 1000
+
+    session.scalar.side_effect = scalar
+    session.execute.return_value.all = MagicMock(return_value=[(name,) for name in children])
+    return session
+
+
+def executed_sql(session):
+    return [str(call.args[0]) for call in session.execute.await_args_list]
+
+
+def test_month_arithmetic():
+    """Test month boundaries in UTC and across years."""
+    moment = datetime(2026, 3, 1, 2, 0, tzinfo=timezone(timedelta(hours=7)))
+    assert month_start(moment) == datetime(2026, 2, 1, tzinfo=timezone.utc)
+    assert add_months(datetime(2026, 11, 1), 3) == datetime(2027, 2, 1)
+    assert add_months(datetime(2026, 1, 1), -1) == datetime(2025, 12, 1)
+
+
+def test_partition_ddl_covers_one_month():
+    """Test that a partition spans its month start to the next."""
+    sql = partition_ddl("market_trades", datetime(2026, 12, 1, tzinfo=timezone.utc))
+    assert '"market_trades_202612" PARTITION OF "market_trades"' in sql
+    assert "FROM ('2026-12-01T00:00:00+00:00') TO ('2027-01-01T00:00:00+00:00')" in sql
+
+
+@pytest.mark.asyncio
+async def test_ensure_creates_only_missing_partitions():
+    """Test that a backfill range creates the months not there yet."""
+    session = make_session(existing={"market_prices_202601"})
+
+    created = await PartitionManager().ensure(
+        session, "market_prices", datetime(2026, 1, 20), datetime(2026, 3, 2)
+    )
+
+    assert created == ["market_prices_202602", "market_prices_202603"]
+    assert session.begin_nested.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_drop_before_keeps_the_boundary_month():
+    """Test that only partitions ending before the cutoff month are dropped."""
+    session = make_session(children=["orderbook_snapshots_202605", "orderbook_snapshots_202604",
+                                      "orderbook_snapshots_202606", "orderbook_snapshots_default"])
+
+    dropped, rows = await PartitionManager().drop_before(
+        session, "orderbook_snapshots", datetime(2026, 6, 15, tzinfo=timezone.utc)
+    )
+
+    assert dropped == ["orderbook_snapshots_202604", "orderbook_snapshots_202605"]
+    assert rows == 2000
+    statements = executed_sql(session)
+    assert 'ALTER TABLE "orderbook_snapshots" DETACH PARTITION "orderbook_snapshots_202604"' in statements
+    assert not any("202606" in statement for statement in statements)
+
+
+@pytest.mark.asyncio
+async def test_maintain_applies_retention_per_table():
+    """Test that tables without retention keep every partition."""
+    manager = PartitionManager(
+        tables={
+            "market_prices": PartitionedTable("market_prices", "timestamp"),
+            "market_trades": PartitionedTable("market_trades", "ts", retention_months=3),
+        },
+        months_ahead=1,
+    )
+    session = make_session(children=["market_trades_202606"])
+
+    summary = await manager.maintain(session, now=datetime(2026, 10, 18, tzinfo=timezone.utc))
+
+    assert summary["market_prices"] == {
+        "created": ["market_prices_202610", "market_prices_202611"], "dropped": []
+    }
+    assert summary["market_trades"]["dropped"] == ["market_trades_202606"]
+    assert not any("market_prices" in statement and "DROP" in statement for statement in executed_sql(session))
+
+
+@pytest.mark.asyncio
+async def test_candle_retention_is_set_based():
+    """Test that old candles go by partition drop plus one DELETE, not per row."""
+    session = make_session()
+    session.execute.return_value.rowcount = 7
+    cutoff = datetime(2026, 6, 15, tzinfo=timezone.utc)
+
+    with patch(
+        "src.trading.infrastructure.persistence.repositories.market_data_repository.partition_manager.drop_before",
+        AsyncMock(return_value=(["market_prices_202604"], 120)),
+    ) as drop_before:
+        deleted = await CandleRepository(session).delete_old(cutoff)
+
+    drop_before.assert_awaited_once_with(session, "market_prices", cutoff)
+    assert deleted == 127
+    assert session.execute.await_count == 1
+    assert executed_sql(session)[0].startswith("DELETE FROM market_prices")
+    session.delete.assert_not_called()
@@ -0,0 +1,34 @@
+"""
+Unit tests for the risk limit repository queries.
+"""
+import uuid
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from src.trading.infrastructure.persistence.sqlalchemy.repositories.risk.risk_limit_repository import (
+    SqlAlchemyRiskLimitRepository,
+)
+
+
+@pytest.mark.asyncio
+async def test_exposure_limits_are_read_in_one_query():
+    """Test that all per-symbol exposure limits come from one query, not one per asset."""
+    user_id = uuid.uuid4()
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    session.execute.return_value.all.return_value = [("BTC/USDT", Decimal("50")), ("ETHUSDT", Decimal("30"))]
+
+    limits = await SqlAlchemyRiskLimitRepository(session).find_exposure_limits_by_user(user_id)
+
+    assert limits == {"BTC/USDT": Decimal("50"), "ETHUSDT": Decimal("30")}
+    assert session.execute.await_count == 1
+    compiled = session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+    sql = " ".join(str(compiled).split())
+    assert sql.startswith("SELECT risk_limits.symbol, risk_limits.limit_value FROM risk_limits")
+    assert "risk_limits.enabled = true" in sql
+    assert "risk_limits.symbol IS NOT NULL" in sql
+    assert compiled.params["user_id_1"] == user_id
+    assert compiled.params["limit_type_1"] == "EXPOSURE"
@@ -0,0 +1,145 @@
+"""Test cases for the cached strategy and exchange metadata repositories."""
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.trading.infrastructure.cache import local_cache as local_cache_module
+from src.trading.infrastructure.cache.redis_client import RedisClient
+from src.trading.infrastructure.persistence.repositories.bot_repository import (
+    CachedStrategyRepository,
+    StrategyRepository,
+)
+from src.trading.infrastructure.repositories.exchange_metadata_repository import (
+    ExchangeMetadataRepository,
+)
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+def strategy_model(**overrides):
+    values = dict(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        name="Grid",
+        strategy_type="GRID",
+        description="grid strategy",
+        parameters={"levels": 10},
+        code_content=None,
+        is_active=True,
+        backtest_results=None,
+        live_performance={},
+        created_at=NOW,
+        updated_at=NOW,
+        deleted_at=None,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def scalar_result(model):
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = model
+    return result
+
+
+@pytest.fixture
+def redis_client():
+    """Shared Redis client, empty, with invalidation broadcasts swallowed."""
+    client = AsyncMock(spec=RedisClient)
+    client.get = AsyncMock(return_value=None)
+    client.set = AsyncMock(return_value=True)
+    client.index_add = AsyncMock(return_value=True)
+    client.delete_indexed = AsyncMock(return_value=1)
+    with patch(
+        "src.trading.infrastructure.cache.cached_repository.cache_service.redis_client", client
+    ), patch(
+        "src.trading.infrastructure.cache.cached_repository.invalidation_listener.redis", AsyncMock()
+    ):
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def fresh_local_caches():
+    for namespace in ("strategy", "exchange_meta"):
+        local_cache_module._local_caches.pop(namespace, None)
+    yield
+    for namespace in ("strategy", "exchange_meta"):
+        local_cache_module._local_caches.pop(namespace, None)
+
+
+class TestCachedStrategyRepository:
+    """Test cases for strategy reads served from the L1 tier."""
+
+    @pytest.mark.asyncio
+    async def test_find_by_id_served_from_l1(self, redis_client):
+        """Test that a repeated read skips Redis and the database."""
+        model = strategy_model()
+        session = AsyncMock()
+        session.execute.return_value = scalar_result(model)
+
+        first = await CachedStrategyRepository(session).find_by_id(model.id)
+        second = await CachedStrategyRepository(AsyncMock()).find_by_id(model.id)
+
+        assert session.execute.await_count == 1
+        redis_client.get.assert_awaited_once()
+        assert second.id == model.id and second.parameters.parameters == {"levels": 10}
+        # Each read builds its own entity, so mutating one leaves the cache intact
+        first.parameters.parameters["levels"] = 99
+        assert second.parameters.parameters == {"levels": 10}
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_restores_types(self, redis_client):
+        """Test that ids and timestamps come back typed from a JSON cache entry."""
+        model = strategy_model()
+        loaded = await CachedStrategyRepository(AsyncMock(execute=AsyncMock(
+            return_value=scalar_result(model)
+        ))).find_by_id(model.id)
+        cached = redis_client.set.call_args.args[1]
+        local_cache_module._local_caches.pop("strategy", None)
+        redis_client.get.return_value = cached
+
+        strategy = await CachedStrategyRepository(AsyncMock()).find_by_id(model.id)
+
+        assert strategy.id == loaded.id and isinstance(strategy.id, uuid.UUID)
+        assert strategy.created_at == NOW
+
+    @pytest.mark.asyncio
+    async def test_save_invalidates_every_process(self, redis_client):
+        """Test that a write drops the tag set and the L1 copies."""
+        model = strategy_model()
+        session = AsyncMock()
+        session.execute.return_value = scalar_result(model)
+        session.add = MagicMock()
+        repository = CachedStrategyRepository(session)
+        strategy = await repository.find_by_id(model.id)
+
+        with patch.object(StrategyRepository, "save", AsyncMock(return_value=strategy)):
+            await repository.save(strategy)
+        await repository.find_by_id(model.id)
+
+        redis_client.delete_indexed.assert_awaited_once_with("strategy:__keys__")
+        assert session.execute.await_count == 2
+
+
+class TestExchangeMetadataRepository:
+    """Test cases for cached exchange metadata."""
+
+    @pytest.mark.asyncio
+    async def test_lookups_cached_per_key(self, redis_client):
+        """Test that lookups by id and by code are each loaded once."""
+        model = SimpleNamespace(
+            id=1, code="BINANCE", name="Binance", api_base_url="https://fapi.binance.com",
+            supported_features={}, is_active=True, rate_limits={}, created_at=NOW, updated_at=NOW,
+        )
+        session = AsyncMock()
+        session.execute.return_value = scalar_result(model)
+        repository = ExchangeMetadataRepository(session)
+
+        for _ in range(3):
+            assert (await repository.find_by_code("BINANCE"))["id"] == 1
+            assert (await repository.find_by_id(1))["code"] == "BINANCE"
+
+        assert session.execute.await_count == 2
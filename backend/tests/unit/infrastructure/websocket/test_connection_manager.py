@@ -1,4 +1,5 @@
 """Test cases for WebSocket ConnectionManager."""
+import json
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import Mock, AsyncMock, patch
@@ -86,12 +87,12 @@ class TestStreamMessage:
             user_id="user123"
         )
         
-        json_str = message.to_json()
+        payload = json.loads(message.to_json())
         
-        assert '"stream_type": "PRICE"' in json_str
-        assert '"symbol": "BTCUSDT"' in json_str
-        assert '"user_id": "user123"' in json_str
-        assert "2024-01-01T12:00:00" in json_str
+        assert payload["stream_type"] == "PRICE"
+        assert payload["symbol"] == "BTCUSDT"
+        assert payload["user_id"] == "user123"
+        assert payload["timestamp"].startswith("2024-01-01T12:00:00")
 
 
 class TestSubscription:
@@ -0,0 +1,153 @@
+"""Test cases for local order books and their synchronization."""
+import asyncio
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+from src.trading.infrastructure.websocket.local_order_book import (
+    LocalOrderBook,
+    OrderBookManager,
+    OrderBookSyncError,
+    format_units,
+    to_units,
+)
+
+SNAPSHOT = {
+    "lastUpdateId": 100,
+    "bids": [["65000.00", "1.5"], ["64999.90", "2"], ["64990.00", "4"]],
+    "asks": [["65000.10", "0.5"], ["65001.00", "3"]],
+}
+
+
+def diff(first, final, bids=(), asks=(), symbol="BTCUSDT", **extra):
+    return {"e": "depthUpdate", "s": symbol, "U": first, "u": final, "b": list(bids), "a": list(asks), **extra}
+
+
+@pytest.fixture
+def book():
+    book = LocalOrderBook("BTCUSDT")
+    book.load_snapshot(SNAPSHOT)
+    return book
+
+
+class TestUnits:
+    """Test scaled integer conversion."""
+
+    def test_round_trip(self):
+        assert to_units("65000.10000000", 8) == 6500010000000
+        assert to_units("0.5", 8) == 50000000
+        assert to_units("3", 2) == 300
+        assert format_units(to_units("0.00000001", 8), 8) == "0.00000001"
+
+
+class TestLocalOrderBook:
+    """Test snapshot and diff sequencing."""
+
+    def test_snapshot_levels(self, book):
+        snapshot = book.snapshot(levels=2)
+
+        assert snapshot["bids"] == [["65000.00000000", "1.50000000"], ["64999.90000000", "2.00000000"]]
+        assert snapshot["asks"][0] == ["65000.10000000", "0.50000000"]
+        assert snapshot["last_update_id"] == 100
+
+    def test_diffs_update_and_remove_levels(self, book):
+        assert not book.apply_diff(diff(90, 100, bids=[["65000.00", "0"]]))
+        assert book.apply_diff(diff(95, 105, bids=[["65000.00", "0"]], asks=[["65000.05", "1"]]))
+        assert book.apply_diff(diff(106, 107, bids=[["65000.01", "0.1"]]))
+
+        assert book.book.get_best_bid() == (to_units("65000.01", 8), to_units("0.1", 8))
+        assert book.book.get_best_ask() == (to_units("65000.05", 8), to_units("1", 8))
+        assert book.last_update_id == 107
+
+    def test_first_diff_must_cover_snapshot(self, book):
+        with pytest.raises(OrderBookSyncError):
+            book.apply_diff(diff(102, 110))
+
+    def test_gap_raises(self, book):
+        book.apply_diff(diff(101, 105))
+
+        with pytest.raises(OrderBookSyncError):
+            book.apply_diff(diff(107, 108))
+
+    def test_futures_sequence_uses_previous_id(self, book):
+        book.apply_diff(diff(99, 105, pu=98))
+        assert book.apply_diff(diff(103, 110, pu=105))
+
+        with pytest.raises(OrderBookSyncError):
+            book.apply_diff(diff(111, 112, pu=109))
+
+    def test_depth_bands(self, book):
+        bands = {band["bps"]: band for band in book.depth_bands((1, 10))}
+
+        assert Decimal(bands[1]["bid_quantity"]) == Decimal("3.5")
+        assert Decimal(bands[10]["bid_quantity"]) == Decimal("7.5")
+        assert Decimal(bands[1]["ask_quantity"]) == Decimal("3.5")
+
+    def test_to_domain(self, book):
+        order_book = book.to_domain(levels=2)
+
+        assert order_book.best_bid_price == Decimal("65000")
+        assert order_book.get_bid_depth(Decimal("64999.90")) == Decimal("3.5")
+
+
+class TestOrderBookManager:
+    """Test buffering, resync and throttled publishing."""
+
+    @pytest.fixture
+    def manager(self):
+        manager = OrderBookManager(publisher=AsyncMock(), http=Mock())
+        manager.fetch_snapshot = AsyncMock(return_value=SNAPSHOT)
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_buffers_until_snapshot(self, manager):
+        manager.on_diff(diff(98, 101, bids=[["64999.90", "5"]]))
+        manager.on_diff(diff(102, 103, asks=[["65000.10", "0"]]))
+        assert manager.get_book("BTCUSDT") is None
+
+        await manager._sync_tasks["BTCUSDT"]
+        manager.on_diff(diff(104, 104))
+
+        book = manager.get_book("btcusdt")
+        assert book.last_update_id == 104
+        assert book.book.get_best_ask()[0] == to_units("65001.00", 8)
+        manager.fetch_snapshot.assert_awaited_once_with("BTCUSDT")
+
+    @pytest.mark.asyncio
+    async def test_gap_triggers_resync(self, manager):
+        manager.on_diff(diff(101, 101))
+        await manager._sync_tasks["BTCUSDT"]
+
+        manager.fetch_snapshot.return_value = {**SNAPSHOT, "lastUpdateId": 200}
+        manager.on_diff(diff(150, 201))
+        assert manager.get_book("BTCUSDT") is None
+
+        await manager._sync_tasks["BTCUSDT"]
+        assert manager.get_book("BTCUSDT").last_update_id == 201
+
+    @pytest.mark.asyncio
+    async def test_publishes_only_changed_books(self, manager):
+        manager.on_diff(diff(101, 101))
+        await manager._sync_tasks["BTCUSDT"]
+
+        await manager.publish_changed()
+        await manager.publish_changed()
+        manager.on_diff(diff(102, 102, bids=[["64000", "1"]]))
+        await manager.publish_changed()
+
+        assert manager.publisher.await_count == 2
+        symbol, payload = manager.publisher.await_args.args
+        assert symbol == "BTCUSDT"
+        assert payload["type"] == "orderbook"
+        assert payload["last_update_id"] == 102
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_tasks(self, manager):
+        manager.fetch_snapshot.side_effect = lambda symbol: asyncio.sleep(10)
+        manager.start()
+        manager.on_diff(diff(101, 101))
+
+        await manager.stop()
+
+        assert manager._publish_task is None
+        assert manager._sync_tasks == {}
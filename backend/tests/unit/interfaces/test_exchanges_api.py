@@ -0,0 +1,66 @@
+"""Test cases for the v1 exchange connection endpoints."""
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from trading.infrastructure.exchange.adapter_pool import exchange_adapter_pool
+from trading.infrastructure.persistence.database import get_db
+from trading.interfaces.api.v1 import exchanges
+from trading.interfaces.dependencies.auth import get_current_active_user
+
+
+@pytest.fixture
+def user():
+    return SimpleNamespace(id=uuid.uuid4())
+
+
+@pytest.fixture
+def db():
+    return AsyncMock()
+
+
+@pytest.fixture
+def client(user, db):
+    app = FastAPI()
+    app.include_router(exchanges.router, prefix="/api/v1")
+    app.dependency_overrides[get_current_active_user] = lambda: user
+    app.dependency_overrides[get_db] = lambda: db
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.fixture
+def pooled_adapter():
+    """A leased adapter and cached credentials for one connection in the app pool."""
+    adapter = MagicMock(close=AsyncMock())
+    with patch.object(exchange_adapter_pool, "_adapter_factory", MagicMock(return_value=adapter)), patch(
+        "trading.infrastructure.exchange.adapter_pool.invalidation_listener.publish", AsyncMock()
+    ):
+        yield adapter
+    exchange_adapter_pool._entries.clear()
+
+
+@pytest.mark.asyncio
+async def test_delete_connection_drops_pooled_adapter(client, user, db, pooled_adapter):
+    """Test that deleting a connection stops its keys being served from the pool."""
+    connection_id = str(uuid.uuid4())
+    credentials = {"api_key": "key", "api_secret": "secret", "is_testnet": True}
+    await exchange_adapter_pool.get_credentials(connection_id, user.id, AsyncMock(return_value=credentials))
+    async with exchange_adapter_pool.lease(connection_id, credentials):
+        pass
+
+    repository = MagicMock()
+    repository.find_by_id = AsyncMock(return_value=SimpleNamespace(user_id=user.id))
+    repository.delete = AsyncMock()
+    with patch.object(exchanges, "ExchangeRepository", return_value=repository):
+        async with client:
+            response = await client.delete(f"/api/v1/exchanges/connections/{connection_id}")
+
+    assert response.status_code == 204
+    db.commit.assert_awaited_once()
+    assert connection_id not in exchange_adapter_pool._entries
+    assert exchange_adapter_pool.credentials.get(connection_id) is None
+    pooled_adapter.close.assert_awaited_once()
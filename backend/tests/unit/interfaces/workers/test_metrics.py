@@ -0,0 +1,72 @@
+"""Test cases for the worker metrics exposition."""
+from src.trading.interfaces.workers.metrics import metrics_authorized, render_latency_metrics, render_metrics
+from src.trading.performance.profiling.latency_histogram import LatencyRegistry
+
+
+def worker_stats(**overrides):
+    stats = {
+        "worker_id": "worker0-marketdata",
+        "queues": ["marketdata"],
+        "status": "processing",
+        "jobs_processed": 5,
+        "jobs_succeeded": 4,
+        "jobs_failed": 1,
+        "total_processing_time": 2.5,
+        "current_jobs_count": 2,
+        "max_concurrent_jobs": 4,
+    }
+    stats.update(overrides)
+    return stats
+
+
+def test_worker_and_queue_samples():
+    text = render_metrics(
+        [worker_stats()],
+        {"queues": {"marketdata": {"high": 3}}, "scheduled": 1, "leased": 2, "dead_letter": 0},
+    )
+    lines = text.splitlines()
+
+    assert "# TYPE trading_worker_jobs_processed_total counter" in lines
+    assert 'trading_worker_jobs_failed_total{worker="worker0-marketdata",queue="marketdata"} 1' in lines
+    assert 'trading_worker_concurrency_limit{worker="worker0-marketdata",queue="marketdata"} 4' in lines
+    assert 'trading_worker_up{worker="worker0-marketdata",queue="marketdata"} 1' in lines
+    assert 'trading_job_queue_pending{queue="marketdata",priority="high"} 3' in lines
+    assert "trading_job_queue_leased 2" in lines
+    assert text.endswith("\n")
+
+
+def test_stopping_worker_is_down_and_queue_errors_skipped():
+    text = render_metrics([worker_stats(status="stopping")], {"error": "connection refused"})
+
+    assert 'trading_worker_up{worker="worker0-marketdata",queue="marketdata"} 0' in text
+    assert "trading_job_queue" not in text
+
+
+def test_latency_histogram_and_quantiles():
+    registry = LatencyRegistry()
+    for seconds, bot in ((0.002, "bot-1"), (0.004, "bot-2"), (0.3, "bot-1")):
+        registry.observe("ack", seconds, bot, "BTCUSDT")
+
+    lines = render_latency_metrics(registry.series_by_symbol()).splitlines()
+
+    # Bots are merged; their ids never become labels
+    labels = 'stage="ack",symbol="BTCUSDT"'
+    assert "# TYPE trading_latency_seconds histogram" in lines
+    assert f'trading_latency_seconds_bucket{{{labels},le="0.001"}} 0' in lines
+    assert f'trading_latency_seconds_bucket{{{labels},le="0.005"}} 2' in lines
+    assert f'trading_latency_seconds_bucket{{{labels},le="+Inf"}} 3' in lines
+    assert f"trading_latency_seconds_count{{{labels}}} 3" in lines
+    assert f'trading_latency_quantile_seconds{{{labels},quantile="0.999"}} 0.3' in lines
+    assert not any("bot-" in line for line in lines)
+
+
+def test_metrics_require_the_token_when_set():
+    assert metrics_authorized("Bearer s3cret", "s3cret", "production")
+    assert metrics_authorized("bearer s3cret", "s3cret", "development")
+    assert not metrics_authorized("Bearer wrong", "s3cret", "development")
+    assert not metrics_authorized(None, "s3cret", "development")
+
+
+def test_metrics_without_token_only_in_development():
+    assert metrics_authorized(None, "", "development")
+    assert not metrics_authorized(None, "", "production")
@@ -0,0 +1,110 @@
+"""Test cases for the serialization codecs."""
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+
+import pytest
+
+from src.trading.performance.json.codec import (
+    MSGPACK_MARKER,
+    JSONCodec,
+    decode_value,
+    get_codec,
+    json_dumpb,
+    json_dumps,
+    json_loads,
+)
+
+
+class Side(Enum):
+    BUY = "BUY"
+
+
+@dataclass
+class Fill:
+    side: Side
+    qty: Decimal
+
+
+def test_json_encodes_domain_types():
+    at = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    order_id = UUID("12345678-1234-5678-1234-567812345678")
+
+    payload = json_loads(json_dumps({
+        "at": at,
+        "id": order_id,
+        "price": Decimal("50000.10"),
+        "fill": Fill(Side.BUY, Decimal("0.001")),
+        "tags": ("a",),
+    }))
+
+    assert payload == {
+        "at": "2024-01-01T12:00:00+00:00",
+        "id": str(order_id),
+        "price": "50000.10",
+        "fill": {"side": "BUY", "qty": "0.001"},
+        "tags": ["a"],
+    }
+
+
+def test_json_is_compact_utf8():
+    assert json_dumpb({"a": [1, 2], "s": "é"}) == '{"a":[1,2],"s":"é"}'.encode()
+
+
+def test_non_finite_floats_encode_as_null():
+    payload = {"profit_factor": float("inf"), "sortino": [float("-inf"), 1.5], "fill": Fill(Side.BUY, float("nan"))}
+
+    assert json_loads(json_dumps(payload)) == {
+        "profit_factor": None,
+        "sortino": [None, 1.5],
+        "fill": {"side": "BUY", "qty": None},
+    }
+
+
+@pytest.mark.parametrize("stored, expected", [
+    ('{"price": 50000.0, "side": "BUY"}', {"price": 50000.0, "side": "BUY"}),  # stdlib json.dumps
+    (b'{"a":1}', {"a": 1}),
+    ("BTCUSDT", "BTCUSDT"),
+    ("42", 42),
+    (None, None),
+])
+def test_decode_value_reads_existing_entries(stored, expected):
+    assert decode_value(stored) == expected
+
+
+def test_decode_value_accepts_stdlib_nan():
+    value = decode_value(json.dumps({"sharpe": float("nan")}))
+    assert value["sharpe"] != value["sharpe"]
+
+
+def test_unknown_codec_falls_back_to_json():
+    assert isinstance(get_codec("bson"), JSONCodec)
+
+
+def test_msgpack_round_trip_and_legacy_json():
+    pytest.importorskip("msgpack")
+    codec = get_codec("msgpack")
+
+    encoded = codec.encode({"qty": Decimal("0.5"), "at": datetime(2024, 1, 1), "bars": [1, 2]})
+
+    assert codec.binary and encoded.startswith(MSGPACK_MARKER)
+    assert decode_value(encoded) == {"qty": "0.5", "at": "2024-01-01T00:00:00", "bars": [1, 2]}
+    assert codec.decode(json.dumps({"old": True}).encode()) == {"old": True}
+
+
+async def test_redis_get_bytes_returns_undecoded_value():
+    fakeredis = pytest.importorskip("fakeredis")
+    from src.trading.infrastructure.cache.redis_client import RedisClient
+
+    client = RedisClient()
+    client._redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    client._is_connected = True
+    try:
+        await client.set("k", MSGPACK_MARKER + b"\x01")
+        assert await client.get_bytes("k") == MSGPACK_MARKER + b"\x01"
+        assert await client.get_bytes("missing") is None
+    finally:
+        await client._redis.aclose()
@@ -0,0 +1,31 @@
+"""Test cases for the import-time report."""
+from src.trading.performance.profiling.import_report import ImportReport, format_report, parse_importtime
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     numpy.core
+import time:      3000 |       3120 |   numpy
+import time:       400 |        400 |   src.trading.strategies
+Some warning printed on stderr
+import time:       500 |       4020 | src.trading.app
+"""
+
+
+def test_parse_importtime_reads_records_and_depth():
+    records = parse_importtime(SAMPLE.splitlines())
+
+    assert [(r.module, r.self_us, r.cumulative_us, r.depth) for r in records] == [
+        ("numpy.core", 120, 120, 2),
+        ("numpy", 3000, 3120, 1),
+        ("src.trading.strategies", 400, 400, 1),
+        ("src.trading.app", 500, 4020, 0),
+    ]
+
+
+def test_report_totals_and_flags_heavy_libraries():
+    report = ImportReport("src.trading.app", parse_importtime(SAMPLE.splitlines()))
+
+    assert report.total_ms == 4.02
+    assert [r.module for r in report.slowest(2)] == ["src.trading.app", "numpy"]
+    assert [r.module for r in report.watched()] == ["numpy"]
+    assert format_report(report)[-1] == "heavy libraries imported: numpy (3 ms)"
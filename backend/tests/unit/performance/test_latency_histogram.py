@@ -0,0 +1,99 @@
+"""Test cases for the live path latency histograms."""
+import sys
+import time
+
+import pytest
+
+from src.trading.performance.profiling.latency_histogram import (
+    BUCKET_COUNT,
+    LatencyHistogram,
+    LatencyRegistry,
+    bucket_index,
+    bucket_upper_bound,
+)
+
+
+def test_buckets_are_exact_then_log_linear():
+    assert [bucket_index(micros) for micros in range(16)] == list(range(16))
+    assert bucket_index(16) == 16 and bucket_index(17) == 17
+    assert bucket_index(32) == bucket_index(33) == 32
+    assert bucket_index(2 ** 40) == BUCKET_COUNT - 1
+    for micros in (15, 16, 31, 33, 1000, 123_456, 5_000_000):
+        upper = bucket_upper_bound(bucket_index(micros))
+        assert micros <= upper <= micros * 1.0625 + 1
+
+
+def test_percentiles_stay_within_bucket_precision():
+    histogram = LatencyHistogram()
+    for millis in range(1, 1001):
+        histogram.record(millis / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.0625)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.0625)
+    assert histogram.percentile(100) == 1.0
+    # 99 ms falls in the 98.3-102.4 ms bucket, which straddles the 0.1 bound
+    assert histogram.cumulative([0.01, 0.1, 10]) == [9, 98, 1000]
+
+
+def test_disabled_registry_records_nothing():
+    registry = LatencyRegistry(enabled=False)
+    token = registry.begin_trace("bot", "BTCUSDT", time.time())
+    registry.mark_decision()
+    registry.mark_ack(registry.mark_submit("BTCUSDT"), "BTCUSDT", 1)
+    registry.end_trace(token)
+    registry.observe("decode", 0.001)
+
+    assert registry.snapshot() == {}
+
+
+def test_order_path_is_attributed_to_the_trace():
+    registry = LatencyRegistry()
+    token = registry.begin_trace("bot-1", "BTCUSDT", time.time() - 0.2)
+    registry.mark_decision()
+    sent = registry.mark_submit("BTCUSDT")
+    registry.mark_ack(sent, "BTCUSDT", 42)
+    registry.end_trace(token)
+    registry.mark_fill(42)
+    registry.mark_fill(42)  # later partial fills are not first fills
+
+    snapshot = registry.snapshot()
+    assert set(snapshot) == {f"{stage}|bot-1|BTCUSDT" for stage in ("decision", "submit", "ack", "fill")}
+    assert snapshot["decision|bot-1|BTCUSDT"]["p50"] >= 0.19
+    assert snapshot["fill|bot-1|BTCUSDT"]["count"] == 1
+
+
+def test_order_outside_a_trace_only_records_ack():
+    registry = LatencyRegistry()
+    registry.mark_decision()
+    registry.mark_ack(registry.mark_submit("ETHUSDT"), "ETHUSDT")
+
+    assert list(registry.snapshot()) == ["ack||ETHUSDT"]
+
+
+def test_bot_path_records_into_the_registry_metrics_reads():
+    # Import the bot path the way the app does so every stage resolves to
+    # the one registry behind /metrics and LATENCY_METRICS_ENABLED
+    from trading.application.services import bot_manager
+    from trading.infrastructure.websocket import binance_user_stream
+    from trading.performance.profiling.latency_histogram import latency_registry
+
+    engine = sys.modules[bot_manager.BotEngine.__module__]
+    strategy = sys.modules[bot_manager.StrategyBase.__module__]
+    adapter = sys.modules[bot_manager.BinanceAdapter.__module__]
+    for module in (engine, strategy, adapter, binance_user_stream):
+        assert module.latency_registry is latency_registry
+
+    latency_registry.reset()
+    try:
+        token = engine.latency_registry.begin_trace("bot-1", "BTCUSDT", time.time() - 0.05)
+        strategy.latency_registry.mark_decision()
+        sent = adapter.latency_registry.mark_submit("BTCUSDT")
+        adapter.latency_registry.mark_ack(sent, "BTCUSDT", 7)
+        engine.latency_registry.end_trace(token)
+        binance_user_stream.latency_registry.mark_fill(7)
+
+        stages = {stage for (stage, symbol), _ in latency_registry.series_by_symbol() if symbol == "BTCUSDT"}
+        assert stages == {"decision", "submit", "ack", "fill"}
+    finally:
+        latency_registry.reset()
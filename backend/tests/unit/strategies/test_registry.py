@@ -0,0 +1,40 @@
+"""Test cases for lazy strategy loading."""
+import importlib
+
+import pytest
+
+from src.trading.strategies.implementations import STRATEGY_MANIFEST, StrategySpec
+from src.trading.strategies.registry import StrategyRegistry
+
+
+@pytest.mark.parametrize("name", sorted(STRATEGY_MANIFEST))
+def test_manifest_matches_strategy_classes(name):
+    spec = STRATEGY_MANIFEST[name]
+    try:
+        module = importlib.import_module(f"src.trading.strategies.implementations.{spec.module}")
+    except ImportError as e:
+        pytest.skip(f"{spec.module} dependencies missing: {e}")
+
+    strategy_cls = getattr(module, spec.class_name)
+    assert strategy_cls.name == name
+    assert strategy_cls.description == spec.description
+
+
+def test_strategies_are_listed_without_importing():
+    registry = StrategyRegistry(manifest={"Missing": StrategySpec("not_a_module", "Missing", "Never imported")})
+
+    assert registry.names() == ["Missing"]
+    assert registry.list_strategies()[0]["description"] == "Never imported"
+    assert registry.strategies == {}
+    assert registry.get_strategy_class("Missing") is None
+
+
+def test_strategy_class_is_imported_on_first_use():
+    registry = StrategyRegistry(manifest={"DCA": STRATEGY_MANIFEST["DCA"]})
+    assert "DCA" not in registry.strategies
+
+    strategy_cls = registry.get_strategy_class("DCA")
+
+    assert strategy_cls.__name__ == "DCAStrategy"
+    assert registry.strategies["DCA"] is strategy_cls
+    assert registry.get_strategy_class("Unknown") is None